@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Script to benchmark i18n lookups and RTL output formatting.
+
+This script:
+- Measures gettext throughput for the bound current language and explicit languages
+- Measures catalog load time from sources vs. the compiled catalog
+- Measures formatting of a large Arabic report, cold and with the RTL reshape cache warm
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.app.core.platform_core import i18n
+from src.app.utils.output_handler import reshape_rtl
+
+def timed(label: str, func: Callable[[], int]) -> None:
+    """Run func, which returns the number of operations, and print throughput.
+
+    Args:
+        label: Name of the measurement
+        func: Callable performing the work
+    """
+    start = time.perf_counter()
+    operations = func()
+    elapsed = time.perf_counter() - start
+    rate = operations / elapsed if elapsed else float("inf")
+    print(f"{label:<45} {elapsed * 1000:10.1f} ms  {rate:14,.0f} ops/s")
+
+def bench_lookups(count: int) -> None:
+    """Benchmark gettext lookups."""
+    keys = list(i18n._load_translations("ar").keys()) or ["platform_info"]
+
+    def current_language() -> int:
+        gettext = i18n.gettext
+        for i in range(count):
+            gettext(keys[i % len(keys)])
+        return count
+
+    def explicit_language() -> int:
+        gettext = i18n.gettext
+        for i in range(count):
+            gettext(keys[i % len(keys)], "ar-SA")
+        return count
+
+    i18n.setup_language("ar")
+    timed(f"gettext current language x{count}", current_language)
+    timed(f"gettext explicit 'ar-SA' x{count}", explicit_language)
+    i18n.reset_missing_stats()
+
+def bench_catalog_load(rounds: int) -> None:
+    """Benchmark catalog loading from sources and from the compiled catalog."""
+    def load() -> int:
+        for _ in range(rounds):
+            i18n.reload_translations()
+            i18n._load_translations("ar")
+        return rounds
+
+    catalog_path = i18n._CATALOG_PATH
+    had_catalog = catalog_path.exists()
+    if had_catalog:
+        catalog_path.rename(catalog_path.with_suffix(".bak"))
+    try:
+        timed(f"load from JSON/.po sources x{rounds}", load)
+        i18n.compile_catalog()
+        timed(f"load from compiled catalog x{rounds}", load)
+    finally:
+        catalog_path.unlink(missing_ok=True)
+        if had_catalog:
+            catalog_path.with_suffix(".bak").rename(catalog_path)
+
+def bench_rtl_report(lines: int) -> None:
+    """Benchmark formatting a large translated Arabic report."""
+    labels = [i18n.gettext(key, "ar") for key in ("cpu_info", "memory_info", "disk_info", "network_info")]
+
+    def format_report() -> int:
+        report = [reshape_rtl(f"{labels[i % len(labels)]}: {i % 100}%") for i in range(lines)]
+        return len(report)
+
+    reshape_rtl.cache_clear()
+    timed(f"RTL report {lines} lines (cold cache)", format_report)
+    timed(f"RTL report {lines} lines (warm cache)", format_report)
+
+def main() -> None:
+    """Main function to run the i18n benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark i18n lookups and RTL formatting")
+    parser.add_argument("--lookups", type=int, default=1_000_000, help="Number of gettext calls")
+    parser.add_argument("--loads", type=int, default=50, help="Number of catalog loads")
+    parser.add_argument("--lines", type=int, default=10_000, help="Lines in the RTL report")
+    args = parser.parse_args()
+
+    bench_lookups(args.lookups)
+    bench_catalog_load(args.loads)
+    bench_rtl_report(args.lines)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Script to benchmark styled output rendering.
+
+This script:
+- Renders a large number of status lines through OutputStyleManager
+- Renders boxes with mixed ASCII, Arabic and emoji content
+- Measures display-width computation for long mixed-script lines
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.app.utils.output_style_manager import OutputStyleManager, display_widths
+
+def timed(label: str, func: Callable[[], int]) -> None:
+    """Run func, which returns the number of operations, and print throughput.
+
+    Args:
+        label: Name of the measurement
+        func: Callable performing the work
+    """
+    start = time.perf_counter()
+    operations = func()
+    elapsed = time.perf_counter() - start
+    rate = operations / elapsed if elapsed else float("inf")
+    print(f"{label:<45} {elapsed * 1000:10.1f} ms  {rate:14,.0f} ops/s")
+
+def main() -> None:
+    """Main function to run the output style benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark styled output rendering")
+    parser.add_argument("--lines", type=int, default=10_000, help="Number of status lines to render")
+    parser.add_argument("--boxes", type=int, default=1_000, help="Number of boxes to render")
+    parser.add_argument("--theme", default="default", help="Theme to render with")
+    args = parser.parse_args()
+
+    style_mgr = OutputStyleManager(
+        config_path=str(PROJECT_ROOT / "config" / "output_styles.json"),
+        theme=args.theme,
+        auto_detect=False
+    )
+    statuses = ["success", "error", "warning", "info"]
+    messages = ["done", "تم بنجاح", "✅ finished", "失败"]
+
+    def status_lines() -> int:
+        for i in range(args.lines):
+            style_mgr.format_status_line(f"Task {i}", statuses[i % 4], messages[i % 4])
+        return args.lines
+
+    def boxes() -> int:
+        content = "\n".join(messages * 5)
+        for i in range(args.boxes):
+            style_mgr.format_box(content, title=f"Result {i % 10}", width=60)
+        return args.boxes
+
+    def widths() -> int:
+        lines = [f"{messages[i % 4]} {i}" * 4 for i in range(args.lines)]
+        display_widths(lines)
+        return len(lines)
+
+    timed(f"status lines x{args.lines}", status_lines)
+    timed(f"boxes x{args.boxes}", boxes)
+    timed(f"display widths x{args.lines}", widths)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Script to benchmark cold-start time of the Labeeb entry point.
+
+This script:
+- Launches ``src/app/main.py --help`` in fresh interpreters
+- Reports min/median/mean wall-clock startup time
+- Optionally compares against a saved baseline and fails on regressions
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+ENTRY_POINT = PROJECT_ROOT / "src" / "app" / "main.py"
+
+def measure_startup(runs: int, entry_point: Path = ENTRY_POINT) -> List[float]:
+    """Measure cold-start time of an entry point.
+
+    ``--help`` makes argparse exit right after all module-level imports,
+    so the measurement is import and startup cost only.
+
+    Args:
+        runs: Number of fresh interpreter launches
+        entry_point: Script to launch
+
+    Returns:
+        List[float]: Wall-clock time of each run in seconds
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(entry_point), "--help"],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def summarize(timings: List[float]) -> Dict[str, Any]:
+    """Summarize startup timings.
+
+    Args:
+        timings: Wall-clock times in seconds
+
+    Returns:
+        Dict[str, Any]: Run count and min/median/mean in milliseconds
+    """
+    return {
+        "runs": len(timings),
+        "min_ms": round(min(timings) * 1000, 1),
+        "median_ms": round(statistics.median(timings) * 1000, 1),
+        "mean_ms": round(statistics.mean(timings) * 1000, 1)
+    }
+
+def main() -> None:
+    """Main function to run the startup benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark Labeeb cold-start time")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs")
+    parser.add_argument("--baseline", type=Path,
+                        help="JSON file from a previous --save run to compare against")
+    parser.add_argument("--save", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed median regression vs baseline (fraction, default 0.2)")
+    args = parser.parse_args()
+
+    results = summarize(measure_startup(args.runs))
+    print(f"Cold start of {ENTRY_POINT.relative_to(PROJECT_ROOT)} over {results['runs']} runs:")
+    print(f"  min    {results['min_ms']:8.1f} ms")
+    print(f"  median {results['median_ms']:8.1f} ms")
+    print(f"  mean   {results['mean_ms']:8.1f} ms")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        limit = baseline["median_ms"] * (1 + args.tolerance)
+        print(f"Baseline median: {baseline['median_ms']:.1f} ms (limit {limit:.1f} ms)")
+        if results["median_ms"] > limit:
+            print("Startup time regression detected")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
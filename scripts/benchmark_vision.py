@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Script to benchmark VisionProcessor CPU inference.
+
+This script:
+- Describes a set of images (given, or generated screenshots-sized test images)
+- Compares float32 and int8-quantized CPU inference
+- Reports images/sec for cold runs and for cached repeats
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PIL import Image, ImageDraw
+
+from src.app.core.ai.models.vision.processor import VisionProcessor, _ModelHolder
+
+def make_test_images(directory: Path, count: int) -> List[str]:
+    """Create simple 1920x1080 test images with distinct content."""
+    paths = []
+    for i in range(count):
+        image = Image.new("RGB", (1920, 1080), (30 + i * 20 % 200, 60, 90))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((100 + i * 40, 100, 900, 600), fill=(200, 200, 50))
+        draw.text((120, 120), f"Test image {i}", fill=(0, 0, 0))
+        path = directory / f"bench_{i}.png"
+        image.save(path)
+        paths.append(str(path))
+    return paths
+
+def bench(label: str, processor: VisionProcessor, images: List[str], batch_size: int) -> None:
+    """Run process_images once and print throughput."""
+    start = time.perf_counter()
+    processor.process_images(images, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.2f} s  {len(images) / elapsed:8.2f} images/s")
+
+def main() -> None:
+    """Main function to run the vision benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark VisionProcessor on CPU")
+    parser.add_argument("images", nargs="*", help="Images to describe (default: generated)")
+    parser.add_argument("--count", type=int, default=8, help="Number of generated images")
+    parser.add_argument("--batch-size", type=int, default=4, help="Images per generate call")
+    parser.add_argument("--max-new-tokens", type=int, default=64, help="Generation length")
+    parser.add_argument("--threads", type=int, default=None, help="Torch CPU threads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        images = args.images or make_test_images(Path(tmp), args.count)
+        for quantize in (False, True):
+            processor = VisionProcessor(device="cpu", quantize=quantize, num_threads=args.threads,
+                                        max_new_tokens=args.max_new_tokens)
+            name = "int8 dynamic" if quantize else "float32"
+            start = time.perf_counter()
+            processor.model
+            print(f"{'load ' + name:<40} {time.perf_counter() - start:8.2f} s")
+            bench(f"{name} batch={args.batch_size} (cold)", processor, images, args.batch_size)
+            bench(f"{name} batch={args.batch_size} (cached)", processor, images, args.batch_size)
+            _ModelHolder.clear()
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,14 @@
 
 This script:
 - Compiles .po files to .mo files
+- Compiles translation JSON and .po files into the runtime i18n catalog
 - Validates translation files
 - Updates translation files
 - Generates translation statistics
 """
 
 import os
+import sys
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Any
@@ -44,6 +46,16 @@ def compile_translations() -> None:
         except FileNotFoundError:
             print("msgfmt not found. Please install gettext tools.")
 
+def compile_i18n_catalog() -> None:
+    """Compile platform JSON translations and .po files into one binary catalog."""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    try:
+        from src.app.core.platform_core.i18n import compile_catalog
+        catalog_path = compile_catalog()
+        print(f"Successfully compiled i18n catalog to {catalog_path}")
+    except Exception as e:
+        print(f"Failed to compile i18n catalog: {e}")
+
 def validate_translations() -> None:
     """Validate all translation files."""
     locales_dir = Path("locales")
@@ -174,6 +186,7 @@ def main() -> None:
     
     print("\nCompiling translations...")
     compile_translations()
+    compile_i18n_catalog()
     
     print("\nGenerating statistics...")
     generate_stats()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Script to profile import time of Labeeb modules.
+
+This script:
+- Runs ``python -X importtime`` on a module in a fresh interpreter
+- Parses the per-module self/cumulative import times
+- Reports the slowest top-level packages and individual modules
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+@dataclass
+class ImportTiming:
+    """Import time of a single module, in microseconds."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse the stderr produced by ``python -X importtime``.
+
+    Args:
+        output: Raw ``-X importtime`` output
+
+    Returns:
+        List[ImportTiming]: One entry per imported module, in import order
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        if not self_us.strip().isdigit():
+            # Header line: "self [us] | cumulative | imported package"
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.append(ImportTiming(
+            module=name.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=depth
+        ))
+    return timings
+
+def summarize_by_package(timings: List[ImportTiming]) -> Dict[str, int]:
+    """Sum self import time per top-level package.
+
+    Args:
+        timings: Parsed import timings
+
+    Returns:
+        Dict[str, int]: Top-level package name to total self time in microseconds
+    """
+    totals: Dict[str, int] = {}
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        totals[package] = totals.get(package, 0) + timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+def run_importtime(module: str) -> str:
+    """Import a module in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        module: Module to import, e.g. ``src.app.main``
+
+    Returns:
+        str: The captured ``-X importtime`` output
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        last_line = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        print(f"Warning: importing {module} failed: {last_line[0]}", file=sys.stderr)
+    return result.stderr
+
+def print_report(timings: List[ImportTiming], top: int) -> None:
+    """Print the slowest packages and modules.
+
+    Args:
+        timings: Parsed import timings
+        top: Number of entries to show per table
+    """
+    total_us = sum(t.self_us for t in timings)
+    print(f"Total import time: {total_us / 1000:.1f} ms across {len(timings)} modules")
+
+    print(f"\nTop {top} packages by self time:")
+    print("-" * 50)
+    for package, self_us in list(summarize_by_package(timings).items())[:top]:
+        print(f"{self_us / 1000:10.1f} ms  {package}")
+
+    print(f"\nTop {top} modules by cumulative time:")
+    print("-" * 50)
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        print(f"{timing.cumulative_us / 1000:10.1f} ms  {timing.module}")
+
+def main() -> None:
+    """Main function to profile imports."""
+    parser = argparse.ArgumentParser(description="Summarize python -X importtime output")
+    parser.add_argument("module", nargs="?", default="src.app.main",
+                        help="Module to import (default: src.app.main)")
+    parser.add_argument("--input", type=Path,
+                        help="Read existing -X importtime output instead of running Python")
+    parser.add_argument("--top", type=int, default=20, help="Number of entries to show")
+    args = parser.parse_args()
+
+    if args.input:
+        output = args.input.read_text(encoding="utf-8")
+    else:
+        output = run_importtime(args.module)
+    print_report(parse_importtime(output), args.top)
+
+if __name__ == "__main__":
+    main()
@@ -33,18 +33,6 @@ Workflow Orchestration:
 from typing import Any, Dict, List, Optional, Callable, Union, Protocol, TypeVar, Generic
 from dataclasses import dataclass, field
 from datetime import datetime
-from src.app.core.ai.tools.file_tool import FileTool
-from src.app.core.ai.tools.system_resource_tool import SystemResourceTool
-from src.app.core.ai.tools.datetime_tool import DateTimeTool
-from src.app.core.ai.tools.weather_tool import WeatherTool
-from src.app.core.ai.tools.calculator_tool import CalculatorTool
-from src.app.core.ai.tools.keyboard_input_tool import KeyboardInputTool
-from src.app.core.ai.tools.browser_automation_tool import BrowserAutomationTool
-from src.app.core.ai.tools.web_surfing_tool import WebSurfingTool
-from src.app.core.ai.tools.web_searching_tool import WebSearchingTool
-from src.app.core.ai.tools.file_and_document_organizer_tool import FileAndDocumentOrganizerTool
-from src.app.core.ai.tools.code_path_updater_tool import CodePathUpdaterTool
-from src.app.core.platform_core.app_control_tool import AppControlTool
 from src.app.core.ai.tool_base import Tool, BaseTool
 import requests
 import json
@@ -54,20 +42,34 @@ from .smol_agent import SmolAgent, AgentState, AgentResult
 from smolagents import Tool
 import sys
 import re
-import gettext
 import logging
 from pathlib import Path
 from .base_agent import BaseAgent, Agent, AgentState, AgentResult
 from .a2a_protocol import A2AProtocol
 from .mcp_protocol import MCPProtocol
 from .smol_agent import SmolAgentProtocol
-from src.app.core.ai.tools.clipboard_tool import ClipboardTool
-from src.app.core.ai.tools.screen_control_tool import ScreenControlTool
 from src.app.core.ai.tools.tool_registry import ToolRegistry
+from src.app.core.language_id import match_intent
 import os
 
-# Setup translation (i18n)
-_ = gettext.gettext
+# Tools available to LabeebAgent: tool name -> (module path, class name).
+# Registered lazily so that e.g. a date query does not import pyautogui or mss.
+LABEEB_AGENT_TOOLS = {
+    "file": ("src.app.core.ai.tools.file_tool", "FileTool"),
+    "SystemResourceTool": ("src.app.core.ai.tools.system_resource_tool", "SystemResourceTool"),
+    "DateTimeTool": ("src.app.core.ai.tools.datetime_tool", "DateTimeTool"),
+    "weather": ("src.app.core.ai.tools.weather_tool", "WeatherTool"),
+    "calculator": ("src.app.core.ai.tools.calculator_tool", "CalculatorTool"),
+    "keyboard_input": ("src.app.core.ai.tools.keyboard_input_tool", "KeyboardInputTool"),
+    "file_and_document_organizer": (
+        "src.app.core.ai.tools.file_and_document_organizer_tool",
+        "FileAndDocumentOrganizerTool",
+    ),
+    "code_path_updater": ("src.app.core.ai.tools.code_path_updater_tool", "CodePathUpdaterTool"),
+    "app_control": ("src.app.core.platform_core.app_control_tool", "AppControlTool"),
+    "clipboard_tool": ("src.app.core.ai.tools.clipboard_tool", "ClipboardTool"),
+    "screen_control": ("src.app.core.ai.tools.screen_control_tool", "ScreenControlTool"),
+}
 
 def safe_path(filename: str, category: str = "test") -> str:
     """
@@ -231,7 +233,7 @@ class OllamaLLMPlanner(LLMPlanner):
             r"صف الصورة ['\"]?([^'\" ]+)['\"]?"
         ]
         for pattern in vision_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 image_path = match.groups()[-1].strip("'\"") if match.groups() else None
                 if image_path and not any(x in image_path for x in ["screen", "الشاشة"]):
@@ -267,7 +269,7 @@ class OllamaLLMPlanner(LLMPlanner):
             r"صوّر الشاشة( و(حفظها|خزنها) في ([^ ]+)( باسم ([^ ]+))?)?"
         ]
         for pattern in screenshot_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 folder = None
                 filename = None
@@ -316,7 +318,7 @@ class OllamaLLMPlanner(LLMPlanner):
             r"حرك الفأرة إلى (\d+),\s*(\d+)", r"انقر في (\d+),\s*(\d+)"
         ]
         for pattern in mouse_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 if 'move' in pattern or 'حرك' in pattern:
                     x, y = match.groups()[-2:]
@@ -349,7 +351,7 @@ class OllamaLLMPlanner(LLMPlanner):
             r"اكتب ['\"](.+?)['\"]", r"اضغط (زر|مفتاح) ['\"]?(\w+)['\"]?"
         ]
         for pattern in keyboard_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 if 'type' in pattern or 'اكتب' in pattern:
                     text = match.groups()[-1]
@@ -381,7 +383,7 @@ class OllamaLLMPlanner(LLMPlanner):
             r"ما الموجود في الحافظة", r"انسخ (.+)", r"ألصق"
         ]
         for pattern in clipboard_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 if 'copy' in pattern or 'انسخ' in pattern:
                     text = match.groups()[-1] if match.groups() else ''
@@ -435,7 +437,7 @@ class OllamaLLMPlanner(LLMPlanner):
             r"جهز لي ملف ([^ ]+) واكتب فيه ['\"]?([^'\"]+)['\"]?"
         ]
         for pattern in file_create_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 # English patterns
                 if 'create' in pattern or 'write' in pattern:
@@ -507,10 +509,10 @@ class OllamaLLMPlanner(LLMPlanner):
         # Last-chance fallback for file creation (Arabic/English)
         if ("ملف" in command or "file" in command) and ("اكتب" in command or "write" in command or "حط" in command or "ضع" in command or "contains" in command):
             # Try to extract filename and content
-            filename_match = re.search(r"ملف(?: اسمه)? ([^ ]+)", command)
+            filename_match = match_intent(r"ملف(?: اسمه)? ([^ ]+)", command, 0)
             if not filename_match:
-                filename_match = re.search(r"file(?: called| named)? ([^ ]+)", command)
-            content_match = re.search(r"(?:اكتب|حط|ضع|contains|with content|and write) ['\"]?([^'\"]+)['\"]?", command)
+                filename_match = match_intent(r"file(?: called| named)? ([^ ]+)", command, 0)
+            content_match = match_intent(r"(?:اكتب|حط|ضع|contains|with content|and write) ['\"]?([^'\"]+)['\"]?", command, 0)
             filename = filename_match.group(1) if filename_match else "untitled.txt"
             content = content_match.group(1) if content_match else ""
             path = f"{self.main_folder.rstrip('/')}/{filename}"
@@ -529,7 +531,7 @@ class OllamaLLMPlanner(LLMPlanner):
             r"calculate (.+)", r"what is (.+)", r"احسب (.+)"
         ]
         for pattern in calculator_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 expr = match.groups()[-1]
                 return MultiStepPlan(
@@ -637,18 +639,9 @@ class LabeebAgent(BaseAgent):
         self.name = "LabeebAgent"
         self.logger = logging.getLogger("LabeebAgent")
         self.main_folder = os.path.expanduser("~/Documents/Labeeb/files_and_folders_tests")
-        # Register all tools globally via ToolRegistry
-        ToolRegistry.register(FileTool)
-        ToolRegistry.register(SystemResourceTool)
-        ToolRegistry.register(DateTimeTool)
-        ToolRegistry.register(WeatherTool)
-        ToolRegistry.register(CalculatorTool)
-        ToolRegistry.register(KeyboardInputTool)
-        ToolRegistry.register(FileAndDocumentOrganizerTool)
-        ToolRegistry.register(CodePathUpdaterTool)
-        ToolRegistry.register(AppControlTool)
-        ToolRegistry.register(ClipboardTool)
-        ToolRegistry.register(ScreenControlTool)
+        # Register all tools globally via ToolRegistry; modules load on first use
+        for tool_name, (module_path, class_name) in LABEEB_AGENT_TOOLS.items():
+            ToolRegistry.register_lazy(tool_name, module_path, class_name)
 
     def set_main_folder(self, folder_path: str):
         self.main_folder = os.path.expanduser(folder_path)
@@ -672,7 +665,7 @@ class LabeebAgent(BaseAgent):
             r"صف الصورة ['\"]?([^'\" ]+)['\"]?"
         ]
         for pattern in vision_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 image_path = match.groups()[-1].strip("'\"") if match.groups() else None
                 if image_path and not any(x in image_path for x in ["screen", "الشاشة"]):
@@ -708,7 +701,7 @@ class LabeebAgent(BaseAgent):
             r"صوّر الشاشة( و(حفظها|خزنها) في ([^ ]+)( باسم ([^ ]+))?)?"
         ]
         for pattern in screenshot_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 folder = None
                 filename = None
@@ -757,7 +750,7 @@ class LabeebAgent(BaseAgent):
             r"حرك الفأرة إلى (\d+),\s*(\d+)", r"انقر في (\d+),\s*(\d+)"
         ]
         for pattern in mouse_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 if 'move' in pattern or 'حرك' in pattern:
                     x, y = match.groups()[-2:]
@@ -790,7 +783,7 @@ class LabeebAgent(BaseAgent):
             r"اكتب ['\"](.+?)['\"]", r"اضغط (زر|مفتاح) ['\"]?(\w+)['\"]?"
         ]
         for pattern in keyboard_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 if 'type' in pattern or 'اكتب' in pattern:
                     text = match.groups()[-1]
@@ -822,7 +815,7 @@ class LabeebAgent(BaseAgent):
             r"ما الموجود في الحافظة", r"انسخ (.+)", r"ألصق"
         ]
         for pattern in clipboard_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 if 'copy' in pattern or 'انسخ' in pattern:
                     text = match.groups()[-1] if match.groups() else ''
@@ -876,7 +869,7 @@ class LabeebAgent(BaseAgent):
             r"جهز لي ملف ([^ ]+) واكتب فيه ['\"]?([^'\"]+)['\"]?"
         ]
         for pattern in file_create_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 # English patterns
                 if 'create' in pattern or 'write' in pattern:
@@ -948,10 +941,10 @@ class LabeebAgent(BaseAgent):
         # Last-chance fallback for file creation (Arabic/English)
         if ("ملف" in command or "file" in command) and ("اكتب" in command or "write" in command or "حط" in command or "ضع" in command or "contains" in command):
             # Try to extract filename and content
-            filename_match = re.search(r"ملف(?: اسمه)? ([^ ]+)", command)
+            filename_match = match_intent(r"ملف(?: اسمه)? ([^ ]+)", command, 0)
             if not filename_match:
-                filename_match = re.search(r"file(?: called| named)? ([^ ]+)", command)
-            content_match = re.search(r"(?:اكتب|حط|ضع|contains|with content|and write) ['\"]?([^'\"]+)['\"]?", command)
+                filename_match = match_intent(r"file(?: called| named)? ([^ ]+)", command, 0)
+            content_match = match_intent(r"(?:اكتب|حط|ضع|contains|with content|and write) ['\"]?([^'\"]+)['\"]?", command, 0)
             filename = filename_match.group(1) if filename_match else "untitled.txt"
             content = content_match.group(1) if content_match else ""
             path = f"{self.main_folder.rstrip('/')}/{filename}"
@@ -970,7 +963,7 @@ class LabeebAgent(BaseAgent):
             r"calculate (.+)", r"what is (.+)", r"احسب (.+)"
         ]
         for pattern in calculator_patterns:
-            match = re.search(pattern, command, re.IGNORECASE)
+            match = match_intent(pattern, command)
             if match:
                 expr = match.groups()[-1]
                 return MultiStepPlan(
@@ -1077,6 +1070,7 @@ __all__ = [
     "LabeebAgent",
     "BaseAgent",
     "ToolRegistry",
+    "LABEEB_AGENT_TOOLS",
     "AgentMemory",
     "PlanStep",
     "MultiStepPlan",
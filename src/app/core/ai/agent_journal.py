@@ -0,0 +1,270 @@
+"""
+Append-only persistence for SmolAgent state.
+
+An agent's state is split in two:
+
+- history entries go to a JSON lines journal. Appending serializes one entry
+  and queues it; a background timer writes queued entries in one batch, so
+  the cost of an append does not depend on how long the history is.
+- the small remainder of the state (tools, context, timestamps) is written
+  as a compact snapshot, atomically (temp file plus os.replace), on the same
+  flush and only when it changed.
+
+Only the most recent entries are kept in memory. Older ones are paged in
+from the journal through a sparse index of byte offsets, one per
+INDEX_STRIDE entries, so any slice can be read with a single seek.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_STRIDE = 256
+
+_open_journals: 'weakref.WeakSet[AgentJournal]' = weakref.WeakSet()
+
+def _flush_all() -> None:
+    for journal in list(_open_journals):
+        try:
+            journal.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush agent journal {journal.path}: {e}")
+
+atexit.register(_flush_all)
+
+def write_atomic(path: str, data: Dict[str, Any]) -> None:
+    """Write data as compact JSON, replacing path atomically."""
+    directory = os.path.dirname(path) or '.'
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+class AgentJournal(Sequence):
+    """History entries of one agent: a bounded in-memory tail over a JSON lines file."""
+
+    def __init__(self, path: str, snapshot_path: Optional[str] = None,
+                 snapshot: Optional[Callable[[], Dict[str, Any]]] = None,
+                 max_memory: int = 1000, flush_interval: float = 0.5, batch_size: int = 512):
+        """
+        Open (or create) a journal.
+
+        Args:
+            path: JSON lines file for history entries
+            snapshot_path: File for the state snapshot
+            snapshot: Returns the state to snapshot; called on flush after mark_dirty
+            max_memory: Most recent entries kept in memory
+            flush_interval: Seconds queued writes wait before being flushed
+            batch_size: Queued entries that trigger a flush right away
+        """
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self._snapshot = snapshot
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._recent: deque = deque(maxlen=max(1, max_memory))
+        self._pending: List[bytes] = []
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._urgent = False
+        self._count = 0
+        self._flushed = 0
+        self._size = 0
+        self._index: List[int] = []
+        self._load()
+        _open_journals.add(self)
+
+    def _load(self) -> None:
+        """Index an existing journal and read its tail into memory."""
+        if not os.path.exists(self.path):
+            return
+        position = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn write from a crash: drop the partial entry
+                    break
+                if self._count % INDEX_STRIDE == 0:
+                    self._index.append(position)
+                position += len(line)
+                self._count += 1
+        if position != os.path.getsize(self.path):
+            logger.warning(f"Truncating incomplete entry at the end of {self.path}")
+            os.truncate(self.path, position)
+        self._size = position
+        self._flushed = self._count
+        self._recent.extend(self._read(max(0, self._count - self._recent.maxlen), self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._count)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._slice(start, stop)
+        if key < 0:
+            key += self._count
+        if not 0 <= key < self._count:
+            raise IndexError('journal index out of range')
+        return self._slice(key, key + 1)[0]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # Page through the file rather than materializing the whole history
+        for start in range(0, self._count, INDEX_STRIDE * 4):
+            yield from self._slice(start, min(self._count, start + INDEX_STRIDE * 4))
+
+    def _slice(self, start: int, stop: int) -> List[Any]:
+        if start >= stop:
+            return []
+        with self._lock:
+            first_recent = self._count - len(self._recent)
+            if start >= first_recent:
+                return list(itertools.islice(self._recent, start - first_recent, stop - first_recent))
+        return self._read(start, stop)
+
+    def _read(self, start: int, stop: int) -> List[Any]:
+        """Read entries [start, stop) from the file."""
+        if stop > self._flushed:
+            self.flush()
+        with self._write_lock:
+            entries = []
+            with open(self.path, 'rb') as f:
+                f.seek(self._index[start // INDEX_STRIDE])
+                lines = itertools.islice(f, start % INDEX_STRIDE, start % INDEX_STRIDE + stop - start)
+                for line in lines:
+                    entries.append(json.loads(line))
+            return entries
+
+    def page(self, offset: int = 0, limit: int = 50, newest_first: bool = True) -> List[Any]:
+        """
+        One page of history.
+
+        Args:
+            offset: Entries to skip
+            limit: Entries to return
+            newest_first: Count offset from the most recent entry
+
+        Returns:
+            List[Any]: Entries, in the requested order
+        """
+        if newest_first:
+            stop = max(0, self._count - offset)
+            return self._slice(max(0, stop - limit), stop)[::-1]
+        return self._slice(min(offset, self._count), min(self._count, offset + limit))
+
+    def append(self, entry: Any) -> None:
+        """Record an entry; it is written to disk on the next flush."""
+        line = (json.dumps(entry, separators=(',', ':'), ensure_ascii=False, default=str) + '\n').encode('utf-8')
+        with self._lock:
+            self._recent.append(entry)
+            self._pending.append(line)
+            self._count += 1
+            full = len(self._pending) >= self.batch_size
+        self._schedule(full)
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def mark_dirty(self) -> None:
+        """Note that the snapshot state changed; it is written on the next flush."""
+        with self._lock:
+            self._dirty = True
+        self._schedule(False)
+
+    def _schedule(self, now: bool) -> None:
+        """Start the flush timer, or bring it forward when a batch is full."""
+        if self.flush_interval <= 0:
+            self.flush()
+            return
+        with self._lock:
+            if self._timer is not None and (self._urgent or not now):
+                # Later writes ride along with the flush already scheduled
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._urgent = now
+            self._timer = threading.Timer(0 if now else self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write queued entries and the snapshot (if it changed) now."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                    self._urgent = False
+                lines, self._pending = self._pending, []
+                dirty, self._dirty = self._dirty, False
+            if lines:
+                offsets = []
+                position, number = self._size, self._flushed
+                for line in lines:
+                    if number % INDEX_STRIDE == 0:
+                        offsets.append(position)
+                    position += len(line)
+                    number += 1
+                try:
+                    with open(self.path, 'ab') as f:
+                        f.write(b''.join(lines))
+                except OSError:
+                    # Drop any partial write and keep the entries queued for the next flush
+                    try:
+                        os.truncate(self.path, self._size)
+                    except OSError:
+                        pass
+                    with self._lock:
+                        self._pending[:0] = lines
+                    raise
+                self._index.extend(offsets)
+                self._size, self._flushed = position, number
+            if dirty and self.snapshot_path and self._snapshot is not None:
+                try:
+                    write_atomic(self.snapshot_path, self._snapshot())
+                except Exception:
+                    with self._lock:
+                        self._dirty = True
+                    raise
+
+    def clear(self) -> None:
+        """Drop all history, in memory and on disk."""
+        with self._write_lock, self._lock:
+            self._recent.clear()
+            self._pending = []
+            self._count = self._flushed = self._size = 0
+            self._index = []
+            if os.path.exists(self.path):
+                os.truncate(self.path, 0)
+
+    def close(self) -> None:
+        """Flush and stop background writes."""
+        self.flush()
+        _open_journals.discard(self)
+
+__all__ = [
+    'INDEX_STRIDE',
+    'AgentJournal',
+    'write_atomic',
+]
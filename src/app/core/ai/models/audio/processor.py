@@ -2,16 +2,115 @@
 Audio processor module for Labeeb.
 
 This module provides audio processing capabilities using Whisper Tiny.
+
+The Whisper model is shared by all AudioProcessor instances. Audio is decoded
+in memory through an ffmpeg pipe (no temporary files), and long recordings and
+live streams are transcribed incrementally: a VAD splits the stream into
+windows, windows are transcribed on a worker pool, and partial results are
+yielded in order as soon as they are ready.
+
+Whisper models are not thread-safe (decoding installs kv-cache hooks on the
+shared model), so every transcribe call holds that model's lock: decoding and
+VAD of later audio overlap inference, but inference on one model is serial.
 """
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
-from pathlib import Path
-import whisper
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Union
+import numpy as np
 import ffmpeg
 from labeeb.core.logging_config import get_logger
+from src.app.core.lazy_import import lazy_import
+from .streaming import SAMPLE_RATE, AudioWindow, PCMDecoder, VoiceActivitySegmenter, merge_overlap
+
+whisper = lazy_import("whisper")
 
 logger = get_logger(__name__)
 
+_models: Dict[str, Any] = {}
+_model_locks: Dict[str, threading.Lock] = {}
+_models_lock = threading.Lock()
+
+def get_whisper_model(name: str = "tiny") -> Any:
+    """
+    Get a process-wide Whisper model, loading it on first use.
+
+    Args:
+        name: Whisper model name
+
+    Returns:
+        The loaded Whisper model
+    """
+    model = _models.get(name)
+    if model is None:
+        with _models_lock:
+            model = _models.get(name)
+            if model is None:
+                model = _models[name] = whisper.load_model(name)
+    return model
+
+def whisper_lock(name: str = "tiny") -> threading.Lock:
+    """
+    Get the lock that serializes inference on the shared Whisper model.
+
+    Args:
+        name: Whisper model name
+
+    Returns:
+        threading.Lock: Held around every transcribe call on that model
+    """
+    lock = _model_locks.get(name)
+    if lock is None:
+        with _models_lock:
+            lock = _model_locks.setdefault(name, threading.Lock())
+    return lock
+
+def decode_audio(data: bytes) -> np.ndarray:
+    """
+    Decode audio bytes in any ffmpeg-supported format to 16 kHz mono float32.
+
+    Args:
+        data: Encoded audio (wav, mp3, ogg, ...)
+
+    Returns:
+        np.ndarray: float32 samples
+    """
+    pcm, _ = (
+        ffmpeg.input("pipe:0")
+        .output("pipe:1", format="s16le", acodec="pcm_s16le", ac=1, ar=SAMPLE_RATE)
+        .run(input=data, capture_stdout=True, capture_stderr=True)
+    )
+    return PCMDecoder().decode(pcm)
+
+def iter_audio_file(audio_path: str, chunk_seconds: float = 1.0) -> Iterator[bytes]:
+    """
+    Stream a file as 16 kHz mono PCM16 chunks without decoding it all up front.
+
+    Args:
+        audio_path: Path to the audio file
+        chunk_seconds: Duration of each chunk
+
+    Yields:
+        bytes: PCM16 chunks
+    """
+    process = (
+        ffmpeg.input(audio_path)
+        .output("pipe:", format="s16le", acodec="pcm_s16le", ac=1, ar=SAMPLE_RATE)
+        .global_args("-loglevel", "error")
+        .run_async(pipe_stdout=True)
+    )
+    chunk_bytes = int(SAMPLE_RATE * chunk_seconds) * 2
+    try:
+        while True:
+            chunk = process.stdout.read(chunk_bytes)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        process.stdout.close()
+        process.wait()
+
 @dataclass
 class AudioResult:
     """Data class for audio processing results."""
@@ -21,11 +120,13 @@ class AudioResult:
 
 class AudioProcessor:
     """Audio processing using Whisper Tiny."""
-    
-    def __init__(self):
+
+    def __init__(self, model_name: str = "tiny"):
         """Initialize the audio processor."""
         try:
-            self.model = whisper.load_model("tiny")
+            self.model_name = model_name
+            self.model = get_whisper_model(model_name)
+            self._model_lock = whisper_lock(model_name)
             logger.info("Audio processor initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize audio processor: {str(e)}")
@@ -34,15 +135,15 @@ class AudioProcessor:
     def transcribe_audio(self, audio_path: str) -> AudioResult:
         """
         Transcribe audio file to text.
-        
+
         Args:
             audio_path: Path to the audio file
-            
+
         Returns:
             AudioResult containing the transcription and segments
         """
         try:
-            result = self.model.transcribe(audio_path)
+            result = self._transcribe(audio_path)
             return AudioResult(
                 text=result["text"],
                 segments=result["segments"],
@@ -55,50 +156,142 @@ class AudioProcessor:
     def process_audio_stream(self, stream_data: bytes) -> AudioResult:
         """
         Process audio stream data.
-        
+
+        The data is decoded in memory, so concurrent calls do not share any
+        files.
+
         Args:
             stream_data: Raw audio data bytes
-            
+
         Returns:
             AudioResult containing the transcription
         """
-        temp_path = Path("temp_audio.wav")
         try:
-            # Save stream to temporary file
-            with open(temp_path, "wb") as f:
-                f.write(stream_data)
-            
-            # Process the audio
-            result = self.transcribe_audio(str(temp_path))
-            return result
+            result = self._transcribe(decode_audio(stream_data), fp16=False)
+            return AudioResult(
+                text=result["text"],
+                segments=result["segments"],
+                metadata={"model": "Whisper-Tiny"}
+            )
         except Exception as e:
             logger.error(f"Error processing audio stream: {str(e)}")
             raise
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                temp_path.unlink()
+
+    def transcribe_stream(self, chunks: Iterable[Union[bytes, np.ndarray]], language: Optional[str] = None,
+                          max_workers: int = 2, max_pending: int = 4, **vad_options: Any) -> Iterator[AudioResult]:
+        """
+        Transcribe a stream of audio chunks incrementally.
+
+        Chunks are segmented by voice activity; each window is transcribed on a
+        worker pool and its result is yielded, in stream order, as soon as it
+        and all earlier windows are done. At most ``max_pending`` windows are
+        held at a time, which bounds memory for arbitrarily long streams.
+        Inference itself is serialized on the shared model, so the workers
+        overlap it with decoding, segmentation and result post-processing.
+
+        Args:
+            chunks: 16 kHz mono PCM16 bytes or float32/int16 sample arrays
+            language: Language code, or None to auto-detect per window
+            max_workers: Windows handled by the worker pool
+            max_pending: Maximum windows queued or in flight
+            **vad_options: Options for VoiceActivitySegmenter (e.g. max_window, overlap)
+
+        Yields:
+            AudioResult: One partial result per window, with start/end in metadata
+        """
+        decoder = PCMDecoder()
+        segmenter = VoiceActivitySegmenter(**vad_options)
+        pending = deque()
+        previous_text = ""
+
+        def ready(block_until: int) -> Iterator[AudioResult]:
+            nonlocal previous_text
+            while pending and (pending[0][1].done() or len(pending) > block_until):
+                window, future = pending.popleft()
+                result = future.result()
+                if window.overlap:
+                    result.text = merge_overlap(previous_text, result.text)
+                if result.text:
+                    previous_text = result.text
+                yield result
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="labeeb-whisper") as pool:
+            for chunk in chunks:
+                for window in segmenter.feed(decoder.decode(chunk)):
+                    pending.append((window, pool.submit(self._transcribe_window, window, language)))
+                yield from ready(max_pending)
+            for window in segmenter.flush():
+                pending.append((window, pool.submit(self._transcribe_window, window, language)))
+            yield from ready(0)
 
     def process_voice_command(self, audio_path: str) -> AudioResult:
         """
         Process a voice command.
-        
+
         Args:
             audio_path: Path to the voice command audio file
-            
+
         Returns:
             AudioResult containing the command transcription
         """
         return self.transcribe_audio(audio_path)
 
+    def stream_meeting_audio(self, audio_path: str, **options: Any) -> Iterator[AudioResult]:
+        """
+        Transcribe meeting/lecture audio incrementally.
+
+        Args:
+            audio_path: Path to the meeting audio file
+            **options: Options for transcribe_stream
+
+        Yields:
+            AudioResult: Partial results as they become available
+        """
+        return self.transcribe_stream(iter_audio_file(audio_path), **options)
+
     def process_meeting_audio(self, audio_path: str) -> AudioResult:
         """
         Process meeting/lecture audio.
-        
+
         Args:
             audio_path: Path to the meeting audio file
-            
+
         Returns:
             AudioResult containing the meeting transcription
         """
-        return self.transcribe_audio(audio_path) 
\ No newline at end of file
+        texts = []
+        segments = []
+        for partial in self.stream_meeting_audio(audio_path):
+            if partial.text:
+                texts.append(partial.text)
+            segments.extend(partial.segments)
+        return AudioResult(
+            text=" ".join(texts),
+            segments=segments,
+            metadata={"model": "Whisper-Tiny"}
+        )
+
+    def _transcribe(self, audio: Union[str, np.ndarray], **options: Any) -> Dict[str, Any]:
+        """Run the shared model while holding its lock."""
+        with self._model_lock:
+            return self.model.transcribe(audio, **options)
+
+    def _transcribe_window(self, window: AudioWindow, language: Optional[str]) -> AudioResult:
+        """Transcribe one window and shift its segment times to stream time."""
+        result = self._transcribe(
+            window.samples,
+            language=language,
+            fp16=False,
+            condition_on_previous_text=False
+        )
+        segments = []
+        for segment in result["segments"]:
+            segment = dict(segment)
+            segment["start"] = segment["start"] + window.start
+            segment["end"] = segment["end"] + window.start
+            segments.append(segment)
+        return AudioResult(
+            text=result["text"].strip(),
+            segments=segments,
+            metadata={"model": "Whisper-Tiny", "start": window.start, "end": window.end, "partial": True}
+        )
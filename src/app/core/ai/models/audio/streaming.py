@@ -0,0 +1,201 @@
+"""
+Streaming audio segmentation for Labeeb.
+
+This module splits a live stream of 16 kHz mono samples into transcription
+windows with an energy-based voice activity detector (VAD). Windows end at a
+pause in speech, or are cut at a maximum length with a short overlap carried
+into the next window. Silence before speech is dropped as it arrives, so memory
+stays bounded by the maximum window length regardless of stream length.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Union
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+@dataclass
+class AudioWindow:
+    """A segment of audio to transcribe."""
+    samples: np.ndarray
+    start: float
+    overlap: float = 0.0
+
+    @property
+    def end(self) -> float:
+        return self.start + len(self.samples) / SAMPLE_RATE
+
+class PCMDecoder:
+    """Converts 16-bit little-endian PCM byte chunks to float32 samples, across odd splits."""
+
+    def __init__(self):
+        self._leftover = b""
+
+    def decode(self, chunk: Union[bytes, bytearray, np.ndarray]) -> np.ndarray:
+        """
+        Convert a chunk to float32 samples in [-1, 1].
+
+        Args:
+            chunk: PCM16 bytes, or an array of samples (float or int16)
+
+        Returns:
+            np.ndarray: float32 samples
+        """
+        if isinstance(chunk, np.ndarray):
+            if chunk.dtype == np.int16:
+                return chunk.astype(np.float32) / 32768.0
+            return chunk.astype(np.float32, copy=False)
+        data = self._leftover + bytes(chunk)
+        usable = len(data) - (len(data) % 2)
+        self._leftover = data[usable:]
+        return np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+
+class VoiceActivitySegmenter:
+    """
+    Energy-based VAD that turns a sample stream into transcription windows.
+
+    A frame counts as speech when its RMS exceeds both ``min_threshold`` and
+    ``threshold_ratio`` times the running noise floor. A window is emitted after
+    ``min_silence`` seconds of silence following speech, or when it reaches
+    ``max_window`` seconds, in which case the last ``overlap`` seconds are kept
+    as the start of the next window.
+    """
+
+    def __init__(self, frame_ms: int = 30, min_silence: float = 0.5, min_speech: float = 0.25,
+                 max_window: float = 30.0, overlap: float = 1.0, pre_roll: float = 0.2,
+                 threshold_ratio: float = 3.0, min_threshold: float = 0.01):
+        self.frame_size = SAMPLE_RATE * frame_ms // 1000
+        frame_seconds = self.frame_size / SAMPLE_RATE
+        self.min_silence_frames = max(1, round(min_silence / frame_seconds))
+        self.min_speech_frames = max(1, round(min_speech / frame_seconds))
+        self.max_window_frames = max(1, int(max_window / frame_seconds))
+        self.overlap_frames = min(round(overlap / frame_seconds), self.max_window_frames - 1)
+        self.pre_roll_frames = round(pre_roll / frame_seconds)
+        self.threshold_ratio = threshold_ratio
+        self.min_threshold = min_threshold
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._frames: List[np.ndarray] = []
+        self._start_frame = 0
+        self._next_frame = 0
+        self._speech_frames = 0
+        self._silence_frames = 0
+        self._carried_overlap = 0
+        self._noise_floor = 0.0
+
+    def feed(self, samples: np.ndarray) -> List[AudioWindow]:
+        """
+        Add samples and return any windows that are complete.
+
+        Args:
+            samples: float32 mono samples at 16 kHz
+
+        Returns:
+            List[AudioWindow]: Completed windows, in order
+        """
+        data = np.concatenate([self._pending, samples]) if len(self._pending) else samples
+        count = len(data) // self.frame_size
+        self._pending = data[count * self.frame_size:].copy()
+        if not count:
+            return []
+        frames = data[:count * self.frame_size].reshape(count, self.frame_size)
+        energies = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+
+        windows = []
+        for frame, energy in zip(frames, energies):
+            window = self._add_frame(frame, float(energy))
+            if window is not None:
+                windows.append(window)
+        return windows
+
+    def flush(self) -> List[AudioWindow]:
+        """
+        End the stream and return the final window, if it contains speech.
+
+        Returns:
+            List[AudioWindow]: The remaining window, if any
+        """
+        if len(self._pending):
+            self._frames.append(self._pending)
+            self._pending = np.zeros(0, dtype=np.float32)
+        window = self._emit() if self._speech_frames >= self.min_speech_frames else None
+        self._reset(self._next_frame)
+        return [window] if window is not None else []
+
+    def _is_speech(self, energy: float) -> bool:
+        threshold = max(self.min_threshold, self._noise_floor * self.threshold_ratio)
+        # The noise floor follows quiet frames down immediately and creeps up
+        # slowly, so steady background noise is learned but speech is not
+        if energy < self._noise_floor:
+            self._noise_floor = energy
+        else:
+            self._noise_floor += 0.002 * (energy - self._noise_floor)
+        return energy > threshold
+
+    def _add_frame(self, frame: np.ndarray, energy: float) -> Optional[AudioWindow]:
+        self._frames.append(frame)
+        self._next_frame += 1
+
+        if self._is_speech(energy):
+            self._speech_frames += 1
+            self._silence_frames = 0
+        elif self._speech_frames:
+            self._silence_frames += 1
+        elif len(self._frames) > self.pre_roll_frames:
+            # No speech yet: keep only a short pre-roll so memory stays bounded
+            self._frames.pop(0)
+            self._start_frame += 1
+
+        if self._speech_frames and self._silence_frames >= self.min_silence_frames:
+            window = self._emit() if self._speech_frames >= self.min_speech_frames else None
+            self._reset(self._next_frame)
+            return window
+
+        if len(self._frames) >= self.max_window_frames:
+            window = self._emit()
+            keep = self._frames[len(self._frames) - self.overlap_frames:] if self.overlap_frames else []
+            self._reset(self._next_frame - len(keep))
+            self._frames = list(keep)
+            self._carried_overlap = len(keep)
+            # Still mid-speech: the next window continues the same utterance
+            self._speech_frames = 1
+            return window
+        return None
+
+    def _emit(self) -> Optional[AudioWindow]:
+        if not self._frames:
+            return None
+        return AudioWindow(
+            samples=np.concatenate(self._frames),
+            start=self._start_frame * self.frame_size / SAMPLE_RATE,
+            overlap=self._carried_overlap * self.frame_size / SAMPLE_RATE
+        )
+
+    def _reset(self, start_frame: int) -> None:
+        self._frames = []
+        self._start_frame = start_frame
+        self._speech_frames = 0
+        self._silence_frames = 0
+        self._carried_overlap = 0
+
+def merge_overlap(previous: str, current: str, max_words: int = 12) -> str:
+    """
+    Remove the words at the start of current that repeat the end of previous.
+
+    Windows cut mid-speech share ``overlap`` seconds of audio, so the same words
+    can be transcribed twice.
+
+    Args:
+        previous: Text of the previous window
+        current: Text of the current window
+        max_words: Longest overlap considered
+
+    Returns:
+        str: current without the duplicated prefix
+    """
+    prev_words = previous.split()
+    words = current.split()
+    normalize = lambda w: w.strip(".,!?؟،;:\"'").lower()
+    for size in range(min(max_words, len(prev_words), len(words)), 0, -1):
+        if [normalize(w) for w in prev_words[-size:]] == [normalize(w) for w in words[:size]]:
+            return " ".join(words[size:])
+    return current.strip()
@@ -1,8 +1,29 @@
-import torch
-from PIL import Image
+"""
+Vision processor module for Labeeb.
+
+This module provides image description using SmolVLM-256M. The model is held
+process-wide and loaded on first use, so creating several VisionProcessor
+instances does not reload the weights. On CPU the model runs in float32 with
+int8 dynamic quantization of its linear layers (bfloat16 is the slowest CPU
+path); on GPU it runs in bfloat16. Images are downscaled to the processor's
+native size before preprocessing, batches are generated together, and results
+are cached by image content hash and prompt.
+"""
+import io
+import os
+import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from transformers import AutoProcessor, AutoModelForVision2Seq
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from PIL import Image
+from src.app.core.lazy_import import lazy_import
+
+torch = lazy_import("torch")
+transformers = lazy_import("transformers")
+
+MODEL_ID = "HuggingFaceTB/SmolVLM-256M-Instruct"
+DEFAULT_IMAGE_SIZE = 512
 
 @dataclass
 class VisionResult:
@@ -10,29 +31,244 @@ class VisionResult:
     confidence: float = 1.0
     raw: Optional[str] = None
 
+class _ModelHolder:
+    """Process-wide, lazily loaded SmolVLM processor and model per device/precision."""
+
+    _lock = threading.Lock()
+    _loaded: Dict[Tuple[str, bool], Tuple[Any, Any]] = {}
+    _threads_configured = False
+
+    @classmethod
+    def get(cls, device: str, quantize: bool, num_threads: Optional[int] = None) -> Tuple[Any, Any]:
+        """
+        Get (processor, model), loading them on first use.
+
+        Args:
+            device: "cpu" or "cuda"
+            quantize: Apply int8 dynamic quantization (CPU only)
+            num_threads: Torch intra-op threads for CPU inference
+
+        Returns:
+            Tuple[Any, Any]: The processor and the model in eval mode
+        """
+        key = (device, quantize and device == "cpu")
+        loaded = cls._loaded.get(key)
+        if loaded is not None:
+            return loaded
+        with cls._lock:
+            loaded = cls._loaded.get(key)
+            if loaded is None:
+                cls._configure_threads(num_threads)
+                loaded = cls._loaded[key] = cls._load(device, key[1])
+            return loaded
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all loaded models (e.g. to free memory)."""
+        with cls._lock:
+            cls._loaded.clear()
+
+    @classmethod
+    def _configure_threads(cls, num_threads: Optional[int]) -> None:
+        if cls._threads_configured:
+            return
+        # Use every core for intra-op parallelism; inter-op parallelism only adds overhead here
+        torch.set_num_threads(num_threads or os.cpu_count() or 1)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set before any inter-op parallel work has started
+            pass
+        cls._threads_configured = True
+
+    @staticmethod
+    def _load(device: str, quantize: bool) -> Tuple[Any, Any]:
+        processor = transformers.AutoProcessor.from_pretrained(MODEL_ID)
+        dtype = torch.float32 if device == "cpu" else torch.bfloat16
+        model = transformers.AutoModelForVision2Seq.from_pretrained(MODEL_ID, torch_dtype=dtype)
+        model = model.to(device).eval()
+        if quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return processor, model
+
+class _ResultCache:
+    """Small thread-safe LRU cache of vision results."""
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._items: "OrderedDict[Tuple, VisionResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[VisionResult]:
+        with self._lock:
+            result = self._items.get(key)
+            if result is not None:
+                self._items.move_to_end(key)
+            return result
+
+    def put(self, key: Tuple, result: VisionResult) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._items[key] = result
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+def image_digest(data: bytes) -> str:
+    """Content hash used to key cached results."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def downscale(image: Image.Image, max_edge: int) -> Image.Image:
+    """
+    Convert an image to RGB and shrink it so its longest edge is at most max_edge.
+
+    Preprocessing cost grows with pixel count, and the processor resizes to its
+    native size anyway, so large screenshots are shrunk first.
+    """
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if max(image.size) > max_edge:
+        image = image.copy()
+        image.thumbnail((max_edge, max_edge), Image.BICUBIC)
+    return image
+
 class VisionProcessor:
-    def __init__(self):
-        self.processor = AutoProcessor.from_pretrained("HuggingFaceTB/SmolVLM-256M-Instruct")
-        self.model = AutoModelForVision2Seq.from_pretrained(
-            "HuggingFaceTB/SmolVLM-256M-Instruct",
-            torch_dtype=torch.bfloat16
-        )
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self.model = self.model.to(self.device)
-
-    def process_image(self, image_path: str, prompt: str = "Can you describe this image?") -> VisionResult:
-        image = Image.open(image_path)
-        inputs = self.processor(
-            text=prompt,
-            images=[image],
-            return_tensors="pt"
-        ).to(self.device)
-        generated_ids = self.model.generate(**inputs, max_new_tokens=500)
-        description = self.processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
-        return VisionResult(description=description, confidence=1.0, raw=description)
+    def __init__(self, device: Optional[str] = None, quantize: bool = True,
+                 num_threads: Optional[int] = None, max_new_tokens: int = 256,
+                 cache_size: int = 256):
+        """
+        Initialize the vision processor. The model is loaded on first use.
+
+        Args:
+            device: "cpu" or "cuda"; defaults to cuda when available
+            quantize: Use int8 dynamic quantization on CPU
+            num_threads: Torch CPU threads (defaults to the number of cores)
+            max_new_tokens: Default generation length
+            cache_size: Number of cached results (0 disables the cache)
+        """
+        self._device = device
+        self.quantize = quantize
+        self.num_threads = num_threads
+        self.max_new_tokens = max_new_tokens
+        self.cache = _ResultCache(cache_size)
+
+    @property
+    def device(self) -> str:
+        if self._device is None:
+            self._device = "cuda" if torch.cuda.is_available() else "cpu"
+        return self._device
+
+    @property
+    def processor(self) -> Any:
+        return _ModelHolder.get(self.device, self.quantize, self.num_threads)[0]
+
+    @property
+    def model(self) -> Any:
+        return _ModelHolder.get(self.device, self.quantize, self.num_threads)[1]
+
+    def process_image(self, image_path: str, prompt: str = "Can you describe this image?",
+                      max_new_tokens: Optional[int] = None) -> VisionResult:
+        return self.process_images([image_path], prompt, max_new_tokens=max_new_tokens)[0]
+
+    def process_images(self, image_paths: Sequence[str], prompt: str = "Can you describe this image?",
+                       batch_size: int = 4, max_new_tokens: Optional[int] = None) -> List[VisionResult]:
+        """
+        Describe several images, generating up to batch_size images per forward pass.
+
+        Args:
+            image_paths: Paths of the images
+            prompt: Prompt applied to every image
+            batch_size: Images generated together
+            max_new_tokens: Generation length (defaults to the instance setting)
+
+        Returns:
+            List[VisionResult]: One result per image, in input order
+        """
+        max_new_tokens = max_new_tokens or self.max_new_tokens
+        results: List[Optional[VisionResult]] = [None] * len(image_paths)
+        pending: List[Tuple[int, Tuple, Image.Image]] = []
+
+        for index, image_path in enumerate(image_paths):
+            with open(image_path, "rb") as f:
+                data = f.read()
+            key = (image_digest(data), prompt, max_new_tokens)
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[index] = cached
+                continue
+            # Decode from the bytes already read for hashing
+            image = Image.open(io.BytesIO(data))
+            image.load()
+            pending.append((index, key, downscale(image, self._native_size())))
+
+        for start in range(0, len(pending), max(1, batch_size)):
+            batch = pending[start:start + max(1, batch_size)]
+            descriptions = self._generate([image for _, _, image in batch], prompt, max_new_tokens)
+            for (index, key, _), description in zip(batch, descriptions):
+                result = VisionResult(description=description, confidence=1.0, raw=description)
+                self.cache.put(key, result)
+                results[index] = result
+        return results
+
+    def describe_image(self, image: Image.Image, prompt: str = "Can you describe this image?",
+                       max_new_tokens: Optional[int] = None) -> VisionResult:
+        """
+        Describe an in-memory image, such as a screen capture or a crop of one.
+
+        Args:
+            image: PIL image
+            prompt: Prompt for the model
+            max_new_tokens: Generation length (defaults to the instance setting)
+
+        Returns:
+            VisionResult: The description, cached by pixel content and prompt
+        """
+        max_new_tokens = max_new_tokens or self.max_new_tokens
+        key = (image_digest(f"{image.mode}{image.size}".encode() + image.tobytes()), prompt, max_new_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        description = self._generate([downscale(image, self._native_size())], prompt, max_new_tokens)[0]
+        result = VisionResult(description=description, confidence=1.0, raw=description)
+        self.cache.put(key, result)
+        return result
 
     def process_screenshot(self, image_path: str) -> VisionResult:
         return self.process_image(image_path, prompt="What is on the screen?")
 
     def analyze_document(self, image_path: str) -> VisionResult:
-        return self.process_image(image_path, prompt="Analyze this document.") 
\ No newline at end of file
+        return self.process_image(image_path, prompt="Analyze this document.")
+
+    def _native_size(self) -> int:
+        """Longest edge the processor resizes images to."""
+        size = getattr(getattr(self.processor, "image_processor", None), "size", None) or {}
+        return size.get("longest_edge") or max(size.get("height", 0), size.get("width", 0)) or DEFAULT_IMAGE_SIZE
+
+    def _build_prompt(self, prompt: str) -> str:
+        """Wrap the prompt in the model's chat template with an image slot."""
+        if not hasattr(self.processor, "apply_chat_template"):
+            return prompt
+        messages = [{"role": "user", "content": [{"type": "image"}, {"type": "text", "text": prompt}]}]
+        return self.processor.apply_chat_template(messages, add_generation_prompt=True)
+
+    def _generate(self, images: List[Image.Image], prompt: str, max_new_tokens: int) -> List[str]:
+        """Run one batched generate call and decode only the new tokens."""
+        text = self._build_prompt(prompt)
+        inputs = self.processor(
+            text=[text] * len(images),
+            images=[[image] for image in images],
+            return_tensors="pt",
+            padding=True
+        ).to(self.device)
+        with torch.inference_mode():
+            generated_ids = self.model.generate(**inputs, max_new_tokens=max_new_tokens)
+        new_tokens = generated_ids[:, inputs["input_ids"].shape[1]:]
+        return [decoded.strip() for decoded in self.processor.batch_decode(new_tokens, skip_special_tokens=True)]
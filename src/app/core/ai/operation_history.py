@@ -0,0 +1,204 @@
+"""
+Shared operation history for agent tools.
+
+Every tool records its operations into a bounded ring buffer (a deque with a
+maximum length, so appending is O(1) and the oldest entries fall off on their
+own). The buffers are owned by one process-wide OperationHistory, one per tool
+name: tools are often created per call, and every instance of a tool looks up
+the same buffer, so the audit trail outlives the instances that wrote it. The
+hub provides a single query API across tools and an optional sampled sink for
+persisting records (e.g. to a JSON lines audit file).
+
+Details can be passed as a callable; it is only evaluated when the record is
+read, so expensive summaries (sizes of serialized payloads, etc.) cost nothing
+unless the history is actually inspected.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from heapq import merge
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Details = Union[Dict[str, Any], Callable[[], Any], Any]
+
+class OperationRecord:
+    """One recorded tool operation."""
+
+    __slots__ = ('tool', 'operation', 'timestamp', '_details')
+
+    def __init__(self, tool: str, operation: str, details: Details, timestamp: Optional[float] = None):
+        self.tool = tool
+        self.operation = operation
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self._details = details
+
+    @property
+    def details(self) -> Any:
+        """Operation details, formatted on first access if given as a callable."""
+        if callable(self._details):
+            try:
+                self._details = self._details()
+            except Exception as e:
+                self._details = {'error': f'Failed to format details: {e}'}
+        return self._details
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'tool': self.tool,
+            'operation': self.operation,
+            'details': self.details,
+            'timestamp': self.timestamp
+        }
+
+class ToolHistory:
+    """Bounded, append-only history of one tool, shared by all its instances."""
+
+    def __init__(self, hub: "OperationHistory", tool: str, max_history: int = 100):
+        self._hub = hub
+        self.tool = tool
+        self._records: deque = deque(maxlen=max_history)
+
+    @property
+    def max_history(self) -> int:
+        return self._records.maxlen
+
+    def append(self, operation: str, details: Details = None) -> OperationRecord:
+        """
+        Record an operation.
+
+        Args:
+            operation: Operation performed
+            details: Operation details, or a callable returning them
+
+        Returns:
+            OperationRecord: The new record
+        """
+        record = OperationRecord(self.tool, operation, details)
+        self._records.append(record)
+        self._hub._emit(record)
+        return record
+
+    def resize(self, max_history: int) -> None:
+        """Change the number of records kept, dropping the oldest if it shrinks."""
+        self._records = deque(self._records, maxlen=max_history)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Return the records as dictionaries, oldest first."""
+        return [record.to_dict() for record in self._records]
+
+    def __iter__(self) -> Iterator[OperationRecord]:
+        # Iterate over a snapshot so concurrent appends do not break iteration
+        return iter(list(self._records))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+class OperationHistory:
+    """Owner of all tool histories, by tool name, with a query API and an optional sink."""
+
+    def __init__(self):
+        self._histories: Dict[str, ToolHistory] = {}
+        self._lock = threading.Lock()
+        self._sink: Optional[Callable[[OperationRecord], None]] = None
+        self._sample_rate = 1.0
+
+    def for_tool(self, tool: str, max_history: int = 100) -> ToolHistory:
+        """
+        Get the history buffer of a tool, creating it on first use.
+
+        Args:
+            tool: Tool name
+            max_history: Maximum number of records kept; a larger value than
+                the buffer's current size grows it
+
+        Returns:
+            ToolHistory: The tool's history buffer
+        """
+        with self._lock:
+            history = self._histories.get(tool)
+            if history is None:
+                history = self._histories[tool] = ToolHistory(self, tool, max_history)
+            elif max_history > history.max_history:
+                history.resize(max_history)
+        return history
+
+    def set_sink(self, sink: Optional[Callable[[OperationRecord], None]], sample_rate: float = 1.0) -> None:
+        """
+        Persist a sample of all records through sink.
+
+        Args:
+            sink: Callable receiving records, or None to disable persistence
+            sample_rate: Fraction of records passed to the sink (0-1)
+        """
+        self._sink = sink
+        self._sample_rate = sample_rate
+
+    def query(self, tool: Optional[str] = None, operation: Optional[str] = None,
+              since: Optional[float] = None, until: Optional[float] = None,
+              limit: Optional[int] = None) -> List[OperationRecord]:
+        """
+        Find records across all tools, oldest first.
+
+        Args:
+            tool: Only records of this tool
+            operation: Only records of this operation
+            since: Only records at or after this timestamp
+            until: Only records before this timestamp
+            limit: Return at most this many (the most recent) records
+
+        Returns:
+            List[OperationRecord]: Matching records
+        """
+        with self._lock:
+            histories = [h for name, h in self._histories.items() if tool is None or name == tool]
+        # Each buffer is already in time order, so a k-way merge keeps them sorted
+        records = [
+            record for record in merge(*histories, key=lambda r: r.timestamp)
+            if (operation is None or record.operation == operation)
+            and (since is None or record.timestamp >= since)
+            and (until is None or record.timestamp < until)
+        ]
+        return records[-limit:] if limit else records
+
+    def _emit(self, record: OperationRecord) -> None:
+        sink = self._sink
+        if sink is None or (self._sample_rate < 1.0 and random.random() >= self._sample_rate):
+            return
+        try:
+            sink(record)
+        except Exception as e:
+            logger.error(f"Operation history sink failed: {e}")
+
+class JsonLinesSink:
+    """Appends records to a JSON lines file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __call__(self, record: OperationRecord) -> None:
+        line = json.dumps(record.to_dict(), ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+            self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+operation_history = OperationHistory()
+
+__all__ = ["OperationRecord", "ToolHistory", "OperationHistory", "JsonLinesSink", "operation_history"]
@@ -25,7 +25,8 @@ Agent Lifecycle:
 
 State Management:
 - In-memory state for active operations
-- Persistent state for long-term storage
+- Persistent state for long-term storage: history in an append-only journal,
+  the rest in a compact snapshot, both flushed in the background
 - Clear state transitions
 - State validation and recovery
 
@@ -44,6 +45,7 @@ import logging
 import os
 import asyncio
 from pathlib import Path
+from .agent_journal import AgentJournal
 
 class SmolAgentProtocol(Protocol):
     """Protocol for SmolAgent compliance."""
@@ -55,7 +57,11 @@ class SmolAgentProtocol(Protocol):
 
 @dataclass
 class AgentState:
-    """Agent state structure."""
+    """Agent state structure.
+
+    In a SmolAgent, history is an AgentJournal: appendable and indexable
+    like a list, with older entries paged in from disk.
+    """
     name: str
     created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
@@ -71,7 +77,17 @@ class AgentState:
             "updated_at": self.updated_at,
             "tools": self.tools,
             "context": self.context,
-            "history": self.history
+            "history": list(self.history)
+        }
+    
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Convert state without history (which is journaled separately) to dictionary."""
+        return {
+            "name": self.name,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "tools": list(self.tools),
+            "context": dict(self.context)
         }
 
     @classmethod
@@ -83,7 +99,7 @@ class AgentState:
             updated_at=data["updated_at"],
             tools=data["tools"],
             context=data["context"],
-            history=data["history"]
+            history=data.get("history", [])
         )
 
 @dataclass
@@ -134,8 +150,16 @@ class SmolAgent:
     - Testing support
     """
     
-    def __init__(self, name: str, state_dir: Optional[str] = None):
-        """Initialize the agent."""
+    def __init__(self, name: str, state_dir: Optional[str] = None, history_limit: int = 1000,
+                 flush_interval: float = 0.5):
+        """Initialize the agent.
+        
+        Args:
+            name: Agent name, also used for its state files
+            state_dir: Directory for state files
+            history_limit: History entries kept in memory (older ones stay on disk)
+            flush_interval: Seconds state changes wait before being written
+        """
         self.name = name
         self.state_dir = state_dir or os.path.expanduser("~/Documents/labeeb/agents")
         os.makedirs(self.state_dir, exist_ok=True)
@@ -143,6 +167,13 @@ class SmolAgent:
         self.logger = logging.getLogger(f"SmolAgent.{name}")
         self.state = AgentState(name=name)
         self.tools: Dict[str, Tool] = {}
+        self._journal = AgentJournal(
+            os.path.join(self.state_dir, f"{self.name}.history.jsonl"),
+            os.path.join(self.state_dir, f"{self.name}.json"),
+            lambda: self.state.to_snapshot(),
+            max_memory=history_limit,
+            flush_interval=flush_interval
+        )
         
         # Load state if exists
         self._load_state()
@@ -152,7 +183,7 @@ class SmolAgent:
         self.tools[tool.name] = tool
         self.state.tools.append(tool.name)
         self.state.updated_at = datetime.utcnow().isoformat()
-        self._save_state()
+        self._journal.mark_dirty()
         self.logger.info(f"Registered tool: {tool.name}")
     
     def unregister_tool(self, tool_name: str):
@@ -161,7 +192,7 @@ class SmolAgent:
             del self.tools[tool_name]
             self.state.tools.remove(tool_name)
             self.state.updated_at = datetime.utcnow().isoformat()
-            self._save_state()
+            self._journal.mark_dirty()
             self.logger.info(f"Unregistered tool: {tool_name}")
     
     async def execute_tool(self, tool_name: str, **kwargs) -> AgentResult:
@@ -203,7 +234,7 @@ class SmolAgent:
                 "result": agent_result.to_dict()
             })
             self.state.updated_at = datetime.utcnow().isoformat()
-            self._save_state()
+            self._journal.mark_dirty()
             
             return agent_result
             
@@ -226,7 +257,7 @@ class SmolAgent:
                 "result": agent_result.to_dict()
             })
             self.state.updated_at = datetime.utcnow().isoformat()
-            self._save_state()
+            self._journal.mark_dirty()
             
             raise ToolExecutionError(f"Failed to execute tool {tool_name}: {str(e)}")
     
@@ -234,24 +265,38 @@ class SmolAgent:
         """Get current agent state."""
         return self.state.to_dict()
     
+    def get_history(self, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """Get a page of history, newest first."""
+        return self._journal.page(offset, limit)
+    
     def clear_state(self):
         """Clear agent state."""
-        self.state = AgentState(name=self.name)
+        self._journal.clear()
+        self.state = AgentState(name=self.name, history=self._journal)
         self._save_state()
         self.logger.info("Cleared agent state")
     
+    def flush_state(self):
+        """Write pending history entries and state changes now."""
+        self._journal.flush()
+    
     def _save_state(self):
         """Save agent state to disk."""
-        state_path = os.path.join(self.state_dir, f"{self.name}.json")
-        with open(state_path, 'w') as f:
-            json.dump(self.state.to_dict(), f, indent=2)
+        self._journal.mark_dirty()
+        self._journal.flush()
     
     def _load_state(self):
         """Load agent state from disk."""
         state_path = os.path.join(self.state_dir, f"{self.name}.json")
         if os.path.exists(state_path):
             with open(state_path, 'r') as f:
-                self.state = AgentState.from_dict(json.load(f))
+                data = json.load(f)
+            self.state = AgentState.from_dict(data)
+            if data.get("history") and not len(self._journal):
+                # Move history out of a full-dump state file into the journal
+                self._journal.extend(data["history"])
+                self._save_state()
+        self.state.history = self._journal
 
 class SmolAgentError(Exception):
     """Base class for SmolAgent errors."""
@@ -14,6 +14,7 @@ import logging
 from .a2a_protocol import A2AProtocol, Message, MessageRole
 from .mcp_protocol import MCPProtocol, MCPRequest, MCPResponse
 from .smol_agent import SmolAgent, AgentState, AgentResult
+from .operation_history import operation_history
 
 @dataclass
 class ToolState:
@@ -41,6 +42,7 @@ class BaseTool:
         self.config = config or {}
         self.state = ToolState(name=name)
         self.logger = logging.getLogger(f"Tool.{name}")
+        self._operation_history = operation_history.for_tool(name, self.config.get('max_history', 100))
         
         # Initialize protocols
         self._a2a_protocol = A2AProtocol()
@@ -149,6 +151,15 @@ class BaseTool:
             self.state.error_count += 1
             return {'error': str(e)}
     
+    def _add_to_history(self, operation: str, details: Any) -> None:
+        """Add an operation to the tool's history.
+        
+        Args:
+            operation: Operation performed
+            details: Operation details, or a callable returning them (evaluated only when read)
+        """
+        self._operation_history.append(operation, details)
+    
     async def _execute_command(self, command: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a specific command. Override this method in subclasses.
         
@@ -2,33 +2,42 @@
 Tools module for Labeeb AI system.
 
 This module provides various tools that can be used by AI agents to perform tasks.
+Tool modules are registered lazily: importing this package does not import the
+tools themselves (or their heavy dependencies) until they are first used.
 """
+from src.app.core.lazy_import import import_attribute
 from .tool_registry import ToolRegistry
 
-# Import tools
-from .file_tool import FileTool
-from .web_tool import WebTool
-from .system_tool import SystemTool
-from .datetime_tool import DateTimeTool
-from .file_and_document_organizer_tool import FileAndDocumentOrganizerTool
-from .code_path_updater_tool import CodePathUpdaterTool
-from .graph_maker_tool import GraphMakerTool
-from .clipboard_tool import ClipboardTool
-from .calculator_tools import CalculatorTool
-from src.app.core.platform_core.app_control_tool import AppControlTool
-from .vision_tool import VisionTool
-from .screen_control_tool import ScreenControlTool
+# Tool name -> (module path, class name), imported on first lookup
+DEFERRED_TOOLS = {
+    "file": ("src.app.core.ai.tools.file_tool", "FileTool"),
+    "WebTool": ("src.app.core.ai.tools.web_tool", "WebTool"),
+    "system_tool": ("src.app.core.ai.tools.system_tool", "SystemTool"),
+    "DateTimeTool": ("src.app.core.ai.tools.datetime_tool", "DateTimeTool"),
+    "file_and_document_organizer": (
+        "src.app.core.ai.tools.file_and_document_organizer_tool",
+        "FileAndDocumentOrganizerTool",
+    ),
+    "code_path_updater": ("src.app.core.ai.tools.code_path_updater_tool", "CodePathUpdaterTool"),
+    "graph_maker": ("src.app.core.ai.tools.graph_maker_tool", "GraphMakerTool"),
+    "clipboard_tool": ("src.app.core.ai.tools.clipboard_tool", "ClipboardTool"),
+    "calculator": ("src.app.core.ai.tools.calculator_tools", "CalculatorTool"),
+    "app_control": ("src.app.core.platform_core.app_control_tool", "AppControlTool"),
+    "vision": ("src.app.core.ai.tools.vision_tool", "VisionTool"),
+    "screen_control": ("src.app.core.ai.tools.screen_control_tool", "ScreenControlTool"),
+}
 
-# Re-register all tools to ensure correct .name registration after registry fix
-ToolRegistry.register(FileTool)
-ToolRegistry.register(WebTool)
-ToolRegistry.register(SystemTool)
-ToolRegistry.register(DateTimeTool)
-ToolRegistry.register(FileAndDocumentOrganizerTool)
-ToolRegistry.register(CodePathUpdaterTool)
-ToolRegistry.register(GraphMakerTool)
-ToolRegistry.register(ClipboardTool)
-ToolRegistry.register(CalculatorTool)
-ToolRegistry.register(AppControlTool)
-ToolRegistry.register(VisionTool)
-ToolRegistry.register(ScreenControlTool)
+for _tool_name, (_module_path, _class_name) in DEFERRED_TOOLS.items():
+    ToolRegistry.register_lazy(_tool_name, _module_path, _class_name)
+
+# Class name -> module path, for `from src.app.core.ai.tools import FileTool`
+_LAZY_CLASSES = {class_name: module_path for module_path, class_name in DEFERRED_TOOLS.values()}
+
+
+def __getattr__(name):
+    """Import tool classes on first attribute access (PEP 562)."""
+    if name in _LAZY_CLASSES:
+        value = import_attribute(_LAZY_CLASSES[name], name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
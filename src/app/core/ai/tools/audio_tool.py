@@ -37,7 +37,6 @@ class AudioTool(BaseTool):
         self._allowed_formats = config.get('allowed_formats', ['WAV', 'MP3', 'OGG', 'FLAC'])
         self._sample_rate = config.get('sample_rate', 44100)
         self._channels = config.get('channels', 2)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Audio cache
         self._cache_duration = config.get('cache_duration', 3600)  # 1 hour
@@ -61,7 +60,6 @@ class AudioTool(BaseTool):
         """Clean up resources used by the tool."""
         try:
             self._cache = {}
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up AudioTool: {e}")
@@ -133,21 +131,6 @@ class AudioTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _get_cache_key(self, audio_data: bytes, operation: str, **kwargs) -> str:
         """Generate a cache key for audio data.
         
@@ -535,7 +518,7 @@ class AudioTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -548,7 +531,7 @@ class AudioTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
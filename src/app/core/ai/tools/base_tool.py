@@ -7,6 +7,7 @@ implementing A2A (Agent-to-Agent), MCP (Model Context Protocol), and SmolAgents
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
+from src.app.core.ai.operation_history import operation_history
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +24,8 @@ class BaseTool(ABC):
         """
         self.name = name
         self.description = description
-        self._operation_history = []
         self._max_history = 100
+        self._operation_history = operation_history.for_tool(name, self._max_history)
     
     @abstractmethod
     async def execute(self, action: str, **kwargs) -> Dict[str, Any]:
@@ -100,15 +101,7 @@ class BaseTool(ABC):
             action (str): The action that was executed
             result (Dict[str, Any]): The result of the execution
         """
-        log_entry = {
-            "action": action,
-            "result": result,
-            "timestamp": self._get_timestamp()
-        }
-        
-        self._operation_history.append(log_entry)
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
+        self._operation_history.append(action, result)
     
     def get_execution_history(self) -> Dict[str, Any]:
         """
@@ -119,20 +112,28 @@ class BaseTool(ABC):
         """
         return {
             "tool": self.name,
-            "history": self._operation_history,
+            "history": [
+                {"action": record.operation, "result": record.details, "timestamp": self._get_timestamp(record.timestamp)}
+                for record in self._operation_history
+            ],
             "count": len(self._operation_history)
         }
     
     def clear_history(self) -> None:
         """Clear the execution history."""
-        self._operation_history = []
+        self._operation_history.clear()
     
-    def _get_timestamp(self) -> str:
+    def _get_timestamp(self, timestamp: Optional[float] = None) -> str:
         """
-        Get current timestamp in ISO format.
+        Get a timestamp (default: now) in ISO format.
         
+        Args:
+            timestamp (Optional[float]): POSIX timestamp to format
+            
         Returns:
-            str: Current timestamp
+            str: Timestamp in ISO format
         """
         from datetime import datetime
-        return datetime.utcnow().isoformat() 
\ No newline at end of file
+        if timestamp is None:
+            return datetime.utcnow().isoformat()
+        return datetime.utcfromtimestamp(timestamp).isoformat() 
\ No newline at end of file
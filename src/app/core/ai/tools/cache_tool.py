@@ -36,7 +36,6 @@ class CacheTool(BaseTool):
         self._default_ttl = config.get('default_ttl', 3600)  # 1 hour
         self._serializer = config.get('serializer', 'json')
         self._cache = {}
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
     
     async def initialize(self) -> bool:
@@ -59,7 +58,6 @@ class CacheTool(BaseTool):
         """Clean up resources used by the tool."""
         try:
             self._cache.clear()
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up CacheTool: {e}")
@@ -127,21 +125,6 @@ class CacheTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _serialize(self, data: Any) -> bytes:
         """Serialize data.
         
@@ -177,9 +160,9 @@ class CacheTool(BaseTool):
             int: Memory usage in bytes
         """
         total_size = 0
-        for key, value in self._cache.items():
+        for key, (_, _, value_size) in self._cache.items():
             total_size += len(key.encode())
-            total_size += len(self._serialize(value))
+            total_size += value_size
         return total_size
     
     async def _get(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -206,7 +189,7 @@ class CacheTool(BaseTool):
                 }
             
             # Get value
-            value, expiry = self._cache[key]
+            value, expiry, value_size = self._cache[key]
             
             # Check expiry
             if expiry and time.time() > expiry:
@@ -217,9 +200,10 @@ class CacheTool(BaseTool):
                     'error': f'Key expired: {key}'
                 }
             
+            # The size was measured on set, so history needs no reference to the value
             self._add_to_history('get', {
                 'key': key,
-                'value_size': len(self._serialize(value))
+                'value_size': value_size
             })
             
             return {
@@ -268,7 +252,7 @@ class CacheTool(BaseTool):
             
             # Set value
             expiry = time.time() + ttl if ttl > 0 else None
-            self._cache[key] = (value, expiry)
+            self._cache[key] = (value, expiry, value_size)
             
             self._add_to_history('set', {
                 'key': key,
@@ -383,7 +367,7 @@ class CacheTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -396,7 +380,7 @@ class CacheTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -5,12 +5,18 @@ This tool provides calculation functionality while following:
 - A2A (Agent-to-Agent) protocol for agent collaboration
 - MCP (Multi-Channel Protocol) for unified channel support
 - SmolAgents pattern for minimal, efficient implementation
+
+Expressions are compiled once by a whitelist-based AST evaluator and cached;
+'calculate_batch' evaluates many expressions, or one expression over arrays of
+variable values, vectorized with NumPy.
 """
 
 import logging
 import math
 from typing import Dict, Any, List, Optional, Union
+import numpy as np
 from src.app.core.ai.tool_base import BaseTool
+from src.app.core.expression_evaluator import compile_expression, evaluate, evaluate_many
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +38,6 @@ class CalculatorTool(BaseTool):
         )
         self._precision = config.get('precision', 10)
         self._angle_mode = config.get('angle_mode', 'radians')
-        self._history = []
         self._max_history = config.get('max_history', 100)
     
     async def initialize(self) -> bool:
@@ -55,7 +60,6 @@ class CalculatorTool(BaseTool):
     async def cleanup(self) -> None:
         """Clean up resources used by the tool."""
         try:
-            self._history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up CalculatorTool: {e}")
@@ -74,6 +78,7 @@ class CalculatorTool(BaseTool):
             'exponential': True,
             'statistical': True,
             'unit_conversion': True,
+            'batch': True,
             'history': True
         }
         return {**base_capabilities, **tool_capabilities}
@@ -88,7 +93,7 @@ class CalculatorTool(BaseTool):
         tool_status = {
             'precision': self._precision,
             'angle_mode': self._angle_mode,
-            'history_size': len(self._history),
+            'history_size': len(self._operation_history),
             'max_history': self._max_history
         }
         return {**base_status, **tool_status}
@@ -105,6 +110,8 @@ class CalculatorTool(BaseTool):
         """
         if command == 'calculate':
             return await self._calculate(args)
+        elif command == 'calculate_batch':
+            return await self._calculate_batch(args)
         elif command == 'convert_units':
             return await self._convert_units(args)
         elif command == 'get_history':
@@ -114,21 +121,6 @@ class CalculatorTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, result: Any) -> None:
-        """Add an operation and its result to history.
-        
-        Args:
-            operation: Operation performed
-            result: Result of the operation
-        """
-        self._history.append({
-            'operation': operation,
-            'result': result,
-            'timestamp': math.floor(time.time())
-        })
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
-    
     async def _calculate(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Perform a calculation.
         
@@ -145,20 +137,15 @@ class CalculatorTool(BaseTool):
             expression = args['expression']
             precision = args.get('precision', self._precision)
             
-            # Convert angle mode if needed
-            if self._angle_mode == 'degrees':
-                expression = expression.replace('sin', 'math.sin(math.radians')
-                expression = expression.replace('cos', 'math.cos(math.radians')
-                expression = expression.replace('tan', 'math.tan(math.radians')
-                expression = expression.replace('asin', 'math.degrees(math.asin')
-                expression = expression.replace('acos', 'math.degrees(math.acos')
-                expression = expression.replace('atan', 'math.degrees(math.atan')
-            
-            # Evaluate expression
-            result = eval(expression, {"__builtins__": {}}, {"math": math})
+            # Evaluate expression (compiled once per expression and angle mode)
+            result = compile_expression(expression, self._angle_mode).evaluate(args.get('variables'))
             
             # Round result if needed
-            if isinstance(result, (int, float)):
+            if isinstance(result, np.ndarray):
+                result = np.round(result, precision).tolist()
+            elif isinstance(result, np.generic):
+                result = round(result.item(), precision)
+            elif isinstance(result, (int, float)):
                 result = round(result, precision)
             
             # Add to history
@@ -175,6 +162,50 @@ class CalculatorTool(BaseTool):
             logger.error(f"Error calculating expression: {e}")
             return {'error': str(e)}
     
+    async def _calculate_batch(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Evaluate many expressions, or one expression over arrays of values.
+        
+        Args:
+            args: 'expressions' (list of constant expressions), or 'expression'
+                with 'variables' mapping names to lists of values
+            
+        Returns:
+            Dict[str, Any]: Results (None where evaluation failed) and errors by index
+        """
+        try:
+            if not args or ('expressions' not in args and 'expression' not in args):
+                return {'error': 'Missing expressions parameter'}
+            
+            precision = args.get('precision', self._precision)
+            if 'expressions' in args:
+                values, errors = evaluate_many(args['expressions'], self._angle_mode)
+            else:
+                values = np.atleast_1d(np.asarray(
+                    evaluate(args['expression'], args.get('variables'), self._angle_mode),
+                    dtype=np.float64
+                ))
+                errors = {
+                    int(index): 'Result is undefined (e.g. division by zero)'
+                    for index in np.flatnonzero(~np.isfinite(values))
+                }
+            
+            results = np.round(values, precision).astype(object)
+            if errors:
+                results[list(errors)] = None
+            
+            self._add_to_history('batch', lambda: {'count': len(results), 'error_count': len(errors)})
+            
+            return {
+                'status': 'success',
+                'action': 'calculate_batch',
+                'results': results.tolist(),
+                'errors': errors,
+                'precision': precision
+            }
+        except Exception as e:
+            logger.error(f"Error calculating batch: {e}")
+            return {'error': str(e)}
+    
     async def _convert_units(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Convert between units.
         
@@ -279,7 +310,10 @@ class CalculatorTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._history
+                'history': [
+                    {'operation': record.operation, 'result': record.details, 'timestamp': math.floor(record.timestamp)}
+                    for record in self._operation_history
+                ]
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -292,7 +326,7 @@ class CalculatorTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -10,9 +10,10 @@ This tool provides calendar capabilities while following:
 import logging
 import asyncio
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Any, List, Optional, Union
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core.calendar_store import CalendarStore
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +35,9 @@ class CalendarTool(BaseTool):
         self._timezone = config.get('timezone', 'UTC')
         self._max_events = config.get('max_events', 100)
         self._max_recurrence = config.get('max_recurrence', 52)  # weeks
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
-        self._events = {}  # In-memory event storage
+        self._db_path = config.get('db_path')  # SQLite file; None keeps events in memory
+        self._events = CalendarStore()
     
     async def initialize(self) -> bool:
         """Initialize the tool.
@@ -50,8 +51,9 @@ class CalendarTool(BaseTool):
                 logger.error("Calendar ID is required")
                 return False
             
-            # Initialize event storage
-            self._events = {}
+            # Initialize event storage, loading persisted events if configured
+            self._events.close()
+            self._events = CalendarStore(self._db_path)
             
             return await super().initialize()
         except Exception as e:
@@ -61,8 +63,7 @@ class CalendarTool(BaseTool):
     async def cleanup(self) -> None:
         """Clean up resources used by the tool."""
         try:
-            self._events = {}
-            self._operation_history = []
+            self._events.close()
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up CalendarTool: {e}")
@@ -129,21 +130,6 @@ class CalendarTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _validate_event(self, event: Dict[str, Any]) -> bool:
         """Validate an event.
         
@@ -213,29 +199,9 @@ class CalendarTool(BaseTool):
             if event['recurrence']:
                 if event['recurrence'].get('count', 0) > self._max_recurrence:
                     return {'error': f'Maximum recurrence count exceeded ({self._max_recurrence})'}
-                
-                # Create recurring events
-                start_time = datetime.fromisoformat(event['start_time'])
-                end_time = datetime.fromisoformat(event['end_time'])
-                duration = end_time - start_time
-                
-                for i in range(event['recurrence'].get('count', 1)):
-                    if i == 0:
-                        self._events[event_id] = event
-                    else:
-                        recur_id = f"{event_id}_recur_{i}"
-                        recur_start = start_time + timedelta(weeks=i)
-                        recur_end = recur_start + duration
-                        
-                        recur_event = event.copy()
-                        recur_event['id'] = recur_id
-                        recur_event['start_time'] = recur_start.isoformat()
-                        recur_event['end_time'] = recur_end.isoformat()
-                        recur_event['recurrence'] = None
-                        
-                        self._events[recur_id] = recur_event
-            else:
-                self._events[event_id] = event
+            
+            # Recurring events are stored once; instances are expanded on search
+            self._events.add(event)
             
             result = {
                 'status': 'success',
@@ -268,13 +234,14 @@ class CalendarTool(BaseTool):
                 return {'error': 'Missing event ID'}
             
             event_id = args['event_id']
-            if event_id not in self._events:
+            event = self._events.get(event_id)
+            if event is None:
                 return {'error': 'Event not found'}
             
             result = {
                 'status': 'success',
                 'action': 'read',
-                'event': self._events[event_id]
+                'event': event
             }
             
             self._add_to_history('read', {
@@ -300,12 +267,12 @@ class CalendarTool(BaseTool):
                 return {'error': 'Invalid update data'}
             
             event_id = args['event_id']
-            if event_id not in self._events:
+            if self._events.get(event_id) is None:
                 return {'error': 'Event not found'}
             
             # Update event
-            event = self._events[event_id]
-            event.update({
+            event = self._events.get(event_id)
+            event = self._events.update(event_id, {
                 'title': args['title'],
                 'description': args.get('description', event['description']),
                 'start_time': args['start_time'],
@@ -346,17 +313,11 @@ class CalendarTool(BaseTool):
                 return {'error': 'Missing event ID'}
             
             event_id = args['event_id']
-            if event_id not in self._events:
+            if self._events.get(event_id) is None:
                 return {'error': 'Event not found'}
             
-            # Delete event
-            event = self._events.pop(event_id)
-            
-            # Delete recurring events
-            if event.get('recurrence'):
-                for recur_id in list(self._events.keys()):
-                    if recur_id.startswith(f"{event_id}_recur_"):
-                        self._events.pop(recur_id)
+            # Delete event together with its recurrences
+            event = self._events.remove(event_id)
             
             result = {
                 'status': 'success',
@@ -388,41 +349,15 @@ class CalendarTool(BaseTool):
                 return {'error': 'Missing search criteria'}
             
             query = args.get('query', '').lower()
-            start_time = args.get('start_time')
-            end_time = args.get('end_time')
-            location = args.get('location', '').lower()
-            
-            # Convert time strings to datetime objects
-            if start_time:
-                start_time = datetime.fromisoformat(start_time)
-            if end_time:
-                end_time = datetime.fromisoformat(end_time)
-            
-            # Search events
-            matching_events = []
-            for event in self._events.values():
-                # Skip recurring event instances
-                if '_recur_' in event['id']:
-                    continue
-                
-                # Check query match
-                if query and query not in event['title'].lower() and query not in event['description'].lower():
-                    continue
-                
-                # Check time range
-                event_start = datetime.fromisoformat(event['start_time'])
-                event_end = datetime.fromisoformat(event['end_time'])
-                
-                if start_time and event_end < start_time:
-                    continue
-                if end_time and event_start > end_time:
-                    continue
-                
-                # Check location
-                if location and location not in event['location'].lower():
-                    continue
-                
-                matching_events.append(event)
+            
+            # Indexed search; with a time range, recurring events contribute
+            # the instances falling inside it
+            matching_events = self._events.search(
+                query=query,
+                start_time=args.get('start_time'),
+                end_time=args.get('end_time'),
+                location=args.get('location', '')
+            )
             
             result = {
                 'status': 'success',
@@ -450,7 +385,7 @@ class CalendarTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -463,7 +398,7 @@ class CalendarTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -9,12 +9,10 @@ This tool provides configuration operations while following:
 
 import logging
 import asyncio
-import time
-import json
-import yaml
 import os
 from typing import Dict, Any, List, Optional, Union, Tuple
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core.config_store import ConfigFile, config_service, thaw
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +33,7 @@ class ConfigTool(BaseTool):
         self._config_dir = config.get('config_dir', 'config')
         self._max_file_size = config.get('max_file_size', 1024 * 1024)  # 1MB
         self._default_format = config.get('default_format', 'json')
-        self._configs = {}
-        self._operation_history = []
+        self._configs: Dict[str, ConfigFile] = {}
         self._max_history = config.get('max_history', 100)
     
     async def initialize(self) -> bool:
@@ -56,8 +53,9 @@ class ConfigTool(BaseTool):
     async def cleanup(self) -> None:
         """Clean up resources used by the tool."""
         try:
+            for config_file in self._configs.values():
+                config_file.flush()
             self._configs.clear()
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up ConfigTool: {e}")
@@ -120,21 +118,6 @@ class ConfigTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _get_file_path(self, name: str, format: Optional[str] = None) -> str:
         """Get config file path.
         
@@ -148,49 +131,26 @@ class ConfigTool(BaseTool):
         format = format or self._default_format
         return os.path.join(self._config_dir, f'{name}.{format}')
     
-    def _load_config(self, name: str, format: Optional[str] = None) -> Dict[str, Any]:
-        """Load config from file.
+    def _open_config(self, name: str, format: Optional[str] = None) -> ConfigFile:
+        """Get the shared, in-memory config file.
+        
+        The file is parsed once; later changes on disk are picked up by the
+        config service watcher.
         
         Args:
             name: Config name
             format: Optional file format
             
         Returns:
-            Dict[str, Any]: Config data
-        """
-        file_path = self._get_file_path(name, format)
-        
-        # Check if file exists
-        if not os.path.exists(file_path):
-            return {}
-        
-        # Check file size
-        if os.path.getsize(file_path) > self._max_file_size:
-            raise ValueError(f'Config file too large: {name}')
-        
-        # Load config
-        with open(file_path, 'r') as f:
-            if format == 'yaml':
-                return yaml.safe_load(f) or {}
-            else:  # json
-                return json.load(f) or {}
-    
-    def _save_config(self, name: str, data: Dict[str, Any], format: Optional[str] = None) -> None:
-        """Save config to file.
-        
-        Args:
-            name: Config name
-            data: Config data
-            format: Optional file format
+            ConfigFile: Config file
         """
+        format = format or self._default_format
         file_path = self._get_file_path(name, format)
-        
-        # Save config
-        with open(file_path, 'w') as f:
-            if format == 'yaml':
-                yaml.safe_dump(data, f)
-            else:  # json
-                json.dump(data, f, indent=2)
+        config_file = self._configs.get(file_path)
+        if config_file is None:
+            config_file = config_service().open(file_path, format, self._max_file_size)
+            self._configs[file_path] = config_file
+        return config_file
     
     async def _get(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get config value.
@@ -211,7 +171,7 @@ class ConfigTool(BaseTool):
             
             # Load config
             try:
-                config = self._load_config(name, format)
+                config = self._open_config(name, format).snapshot
             except Exception as e:
                 return {
                     'status': 'error',
@@ -227,9 +187,9 @@ class ConfigTool(BaseTool):
                         'action': 'get',
                         'error': f'Key not found: {key}'
                     }
-                value = config[key]
+                value = thaw(config[key])
             else:
-                value = config
+                value = config.to_dict()
             
             self._add_to_history('get', {
                 'name': name,
@@ -268,7 +228,7 @@ class ConfigTool(BaseTool):
             
             # Load config
             try:
-                config = self._load_config(name, format)
+                config_file = self._open_config(name, format)
             except Exception as e:
                 return {
                     'status': 'error',
@@ -276,15 +236,12 @@ class ConfigTool(BaseTool):
                     'error': f'Failed to load config: {str(e)}'
                 }
             
-            # Set value
-            if key:
-                config[key] = value
-            else:
-                config = value
-            
-            # Save config
+            # Set value; the file is written once the debounce window closes
             try:
-                self._save_config(name, config, format)
+                if key:
+                    config_file.update({key: value})
+                else:
+                    config_file.replace(value)
             except Exception as e:
                 return {
                     'status': 'error',
@@ -327,7 +284,7 @@ class ConfigTool(BaseTool):
             
             # Load config
             try:
-                config = self._load_config(name, format)
+                config_file = self._open_config(name, format)
             except Exception as e:
                 return {
                     'status': 'error',
@@ -336,20 +293,17 @@ class ConfigTool(BaseTool):
                 }
             
             # Delete value
-            if key:
-                if key not in config:
-                    return {
-                        'status': 'error',
-                        'action': 'delete',
-                        'error': f'Key not found: {key}'
-                    }
-                del config[key]
-            else:
-                config = {}
-            
-            # Save config
+            if key and key not in config_file.snapshot:
+                return {
+                    'status': 'error',
+                    'action': 'delete',
+                    'error': f'Key not found: {key}'
+                }
             try:
-                self._save_config(name, config, format)
+                if key:
+                    config_file.update(remove=[key])
+                else:
+                    config_file.replace({})
             except Exception as e:
                 return {
                     'status': 'error',
@@ -415,7 +369,7 @@ class ConfigTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -428,7 +382,7 @@ class ConfigTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
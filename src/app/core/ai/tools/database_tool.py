@@ -9,10 +9,14 @@ This tool provides database operations while following:
 
 import logging
 import asyncio
-import time
-import aiomysql
 from typing import Dict, Any, List, Optional, Union, Tuple
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core.lazy_import import lazy_import
+from src.app.core.sql_pool import (
+    MeasuredPool, SQLitePool, insert_statement, prepare_statement, stream_rows, to_columns
+)
+
+aiomysql = lazy_import("aiomysql")
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +42,10 @@ class DatabaseTool(BaseTool):
         self._max_connections = config.get('max_connections', 10)
         self._max_query_time = config.get('max_query_time', 30)  # seconds
         self._max_results = config.get('max_results', 1000)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
+        self._driver = config.get('driver', 'mysql')  # 'mysql' or 'sqlite'
+        self._fetch_size = config.get('fetch_size', 500)  # rows per fetchmany
+        self._bulk_batch_size = config.get('bulk_batch_size', 1000)
         self._pool = None
     
     async def initialize(self) -> bool:
@@ -49,12 +55,23 @@ class DatabaseTool(BaseTool):
             bool: True if initialization was successful, False otherwise
         """
         try:
+            if self._driver == 'sqlite':
+                if not self._database:
+                    logger.error("Database path is required")
+                    return False
+                self._pool = MeasuredPool(
+                    SQLitePool(self._database, maxsize=self._max_connections),
+                    paramstyle='qmark',
+                    quote='"'
+                )
+                return await super().initialize()
+            
             if not all([self._user, self._password, self._database]):
                 logger.error("Database credentials are required")
                 return False
             
             # Initialize connection pool
-            self._pool = await aiomysql.create_pool(
+            pool = await aiomysql.create_pool(
                 host=self._host,
                 port=self._port,
                 user=self._user,
@@ -63,6 +80,7 @@ class DatabaseTool(BaseTool):
                 maxsize=self._max_connections,
                 autocommit=True
             )
+            self._pool = MeasuredPool(pool)
             
             return await super().initialize()
         except Exception as e:
@@ -77,7 +95,6 @@ class DatabaseTool(BaseTool):
                 await self._pool.wait_closed()
                 self._pool = None
             
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up DatabaseTool: {e}")
@@ -92,6 +109,7 @@ class DatabaseTool(BaseTool):
         tool_capabilities = {
             'query': True,
             'execute': True,
+            'bulk_insert': True,
             'transaction': True,
             'schema': True,
             'history': True
@@ -112,6 +130,8 @@ class DatabaseTool(BaseTool):
             'max_connections': self._max_connections,
             'max_query_time': self._max_query_time,
             'max_results': self._max_results,
+            'driver': self._driver,
+            'pool': self._pool.status() if self._pool else None,
             'history_size': len(self._operation_history),
             'max_history': self._max_history
         }
@@ -131,6 +151,8 @@ class DatabaseTool(BaseTool):
             return await self._query(args)
         elif command == 'execute':
             return await self._execute(args)
+        elif command == 'bulk_insert':
+            return await self._bulk_insert(args)
         elif command == 'transaction':
             return await self._transaction(args)
         elif command == 'schema':
@@ -142,21 +164,6 @@ class DatabaseTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _validate_query(self, query: str) -> Tuple[bool, Optional[str]]:
         """Validate SQL query.
         
@@ -166,24 +173,19 @@ class DatabaseTool(BaseTool):
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, error_message)
         """
-        # Basic SQL injection prevention
-        dangerous_keywords = [
-            'DROP', 'DELETE', 'TRUNCATE', 'ALTER', 'CREATE', 'INSERT',
-            'UPDATE', 'GRANT', 'REVOKE', 'SHUTDOWN', '--', ';'
-        ]
-        
-        query_upper = query.upper()
-        for keyword in dangerous_keywords:
-            if keyword in query_upper:
-                return False, f'Query contains dangerous keyword: {keyword}'
-        
-        return True, None
+        # Validation results are cached by query text
+        error = prepare_statement(query).error
+        return error is None, error
     
     async def _query(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a SELECT query.
         
+        The result limit is pushed into the query and rows are streamed from
+        a server-side cursor, so at most max_results rows are transferred.
+        
         Args:
-            args: Query arguments
+            args: Query arguments; 'format' is 'rows' (list of dicts, default)
+                or 'columnar' (one value list per column in 'data')
             
         Returns:
             Dict[str, Any]: Query results
@@ -194,41 +196,42 @@ class DatabaseTool(BaseTool):
             
             query = args['query']
             params = args.get('params', [])
+            limit = args.get('limit')
+            max_results = self._max_results if limit is None else min(limit, self._max_results)
+            columnar = args.get('format', 'rows') == 'columnar'
             
-            # Validate query
-            is_valid, error = self._validate_query(query)
-            if not is_valid:
-                return {'error': error}
+            # Validate query and push the limit down
+            statement = prepare_statement(query, max_results)
+            if statement.error:
+                return {'error': statement.error}
             
             if not self._pool:
                 return {'error': 'Database connection not initialized'}
             
             async with self._pool.acquire() as conn:
-                async with conn.cursor() as cur:
-                    await cur.execute(query, params)
-                    results = await cur.fetchall()
-                    
-                    # Get column names
-                    columns = [desc[0] for desc in cur.description]
-                    
-                    # Convert results to list of dictionaries
-                    rows = []
-                    for row in results[:self._max_results]:
-                        rows.append(dict(zip(columns, row)))
-                    
-                    self._add_to_history('query', {
-                        'query': query,
-                        'params': params,
-                        'rows_returned': len(rows)
-                    })
-                    
-                    return {
-                        'status': 'success',
-                        'action': 'query',
-                        'columns': columns,
-                        'rows': rows,
-                        'total': len(rows)
-                    }
+                async with self._stream_cursor(conn) as cur:
+                    await cur.execute(statement.sql, params)
+                    columns = [desc[0] for desc in cur.description] if cur.description else []
+                    rows, truncated = await stream_rows(cur, max_results, self._fetch_size)
+            
+            self._add_to_history('query', {
+                'query': query,
+                'params': params,
+                'rows_returned': len(rows)
+            })
+            
+            result = {
+                'status': 'success',
+                'action': 'query',
+                'columns': columns,
+                'total': len(rows),
+                'truncated': truncated
+            }
+            if columnar:
+                result['data'] = to_columns(columns, rows)
+            else:
+                result['rows'] = [dict(zip(columns, row)) for row in rows]
+            return result
         except Exception as e:
             logger.error(f"Error executing query: {e}")
             return {'error': str(e)}
@@ -277,6 +280,65 @@ class DatabaseTool(BaseTool):
             logger.error(f"Error executing query: {e}")
             return {'error': str(e)}
     
+    async def _bulk_insert(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Insert many rows in batches within one transaction.
+        
+        The INSERT statement is generated from the validated table and column
+        names; values are always passed as parameters.
+        
+        Args:
+            args: Bulk insert arguments ('table', 'columns', 'rows', optional 'batch_size')
+            
+        Returns:
+            Dict[str, Any]: Insert result
+        """
+        try:
+            if not args or not all(key in args for key in ('table', 'columns', 'rows')):
+                return {'error': 'Missing required arguments'}
+            
+            table = args['table']
+            columns = args['columns']
+            rows = args['rows']
+            batch_size = args.get('batch_size', self._bulk_batch_size)
+            
+            if any(len(row) != len(columns) for row in rows):
+                return {'error': 'Every row must have one value per column'}
+            
+            if not self._pool:
+                return {'error': 'Database connection not initialized'}
+            
+            query = insert_statement(table, columns, self._pool.paramstyle, self._pool.quote)
+            
+            inserted = 0
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cur:
+                    try:
+                        await conn.begin()
+                        # The MySQL driver rewrites each batch into one multi-row INSERT
+                        for start in range(0, len(rows), batch_size):
+                            await cur.executemany(query, rows[start:start + batch_size])
+                            inserted += cur.rowcount
+                        await conn.commit()
+                    except Exception:
+                        await conn.rollback()
+                        raise
+            
+            self._add_to_history('bulk_insert', {
+                'table': table,
+                'columns': columns,
+                'rows_inserted': inserted
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'bulk_insert',
+                'table': table,
+                'rows_inserted': inserted
+            }
+        except Exception as e:
+            logger.error(f"Error executing bulk insert: {e}")
+            return {'error': str(e)}
+    
     async def _transaction(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a transaction.
         
@@ -358,23 +420,26 @@ class DatabaseTool(BaseTool):
             
             async with self._pool.acquire() as conn:
                 async with conn.cursor() as cur:
-                    # Get tables
-                    await cur.execute("SHOW TABLES")
-                    tables = [row[0] for row in await cur.fetchall()]
-                    
-                    # Get table information
-                    table_info = {}
-                    for table in tables:
-                        await cur.execute(f"DESCRIBE {table}")
-                        columns = await cur.fetchall()
-                        table_info[table] = [{
-                            'field': col[0],
-                            'type': col[1],
-                            'null': col[2],
-                            'key': col[3],
-                            'default': col[4],
-                            'extra': col[5]
-                        } for col in columns]
+                    if self._driver == 'sqlite':
+                        tables, table_info = await self._sqlite_schema(cur)
+                    else:
+                        # Get tables
+                        await cur.execute("SHOW TABLES")
+                        tables = [row[0] for row in await cur.fetchall()]
+                        
+                        # Get table information
+                        table_info = {}
+                        for table in tables:
+                            await cur.execute(f"DESCRIBE {table}")
+                            columns = await cur.fetchall()
+                            table_info[table] = [{
+                                'field': col[0],
+                                'type': col[1],
+                                'null': col[2],
+                                'key': col[3],
+                                'default': col[4],
+                                'extra': col[5]
+                            } for col in columns]
                     
                     self._add_to_history('schema', {
                         'tables': tables,
@@ -391,6 +456,44 @@ class DatabaseTool(BaseTool):
             logger.error(f"Error getting schema: {e}")
             return {'error': str(e)}
     
+    async def _sqlite_schema(self, cur) -> Tuple[List[str], Dict[str, List[Dict[str, Any]]]]:
+        """Read tables and columns of a SQLite database in the DESCRIBE layout.
+        
+        Args:
+            cur: Open cursor
+            
+        Returns:
+            Tuple[List[str], Dict[str, List[Dict[str, Any]]]]: Tables and their columns
+        """
+        await cur.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")
+        tables = [row[0] for row in await cur.fetchall()]
+        table_info = {}
+        for table in tables:
+            await cur.execute(f'PRAGMA table_info("{table}")')
+            table_info[table] = [{
+                'field': col[1],
+                'type': col[2],
+                'null': 'NO' if col[3] else 'YES',
+                'key': 'PRI' if col[5] else '',
+                'default': col[4],
+                'extra': ''
+            } for col in await cur.fetchall()]
+        return tables, table_info
+    
+    def _stream_cursor(self, conn):
+        """Open a cursor that streams rows instead of buffering the whole result.
+        
+        Args:
+            conn: Pooled connection
+            
+        Returns:
+            Cursor context manager
+        """
+        if self._driver == 'sqlite':
+            # sqlite3 cursors already step through results lazily
+            return conn.cursor()
+        return conn.cursor(aiomysql.SSCursor)
+    
     async def _get_history(self) -> Dict[str, Any]:
         """Get operation history.
         
@@ -401,7 +504,7 @@ class DatabaseTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -414,7 +517,7 @@ class DatabaseTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -11,13 +11,12 @@ import logging
 import asyncio
 import aiosmtplib
 import aioimaplib
-import email
-import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 from typing import Dict, Any, List, Optional, Union
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core.email_index import ImapMailbox, MessageIndex
 
 logger = logging.getLogger(__name__)
 
@@ -45,10 +44,12 @@ class EmailTool(BaseTool):
         self._imap_password = config.get('imap_password')
         self._max_attachments = config.get('max_attachments', 5)
         self._max_attachment_size = config.get('max_attachment_size', 10 * 1024 * 1024)  # 10MB
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
+        self._index_path = config.get('index_path', ':memory:')  # SQLite message index
+        self._fetch_batch_size = config.get('fetch_batch_size', 500)
         self._smtp_client = None
         self._imap_client = None
+        self._mailbox = None
     
     async def initialize(self) -> bool:
         """Initialize the tool.
@@ -83,6 +84,13 @@ class EmailTool(BaseTool):
             await self._imap_client.wait_hello_from_server()
             await self._imap_client.login(self._imap_username, self._imap_password)
             
+            # Header listings and bodies go through the local index over this connection
+            self._mailbox = ImapMailbox(
+                self._imap_client,
+                MessageIndex(self._index_path),
+                batch_size=self._fetch_batch_size
+            )
+            
             return await super().initialize()
         except Exception as e:
             logger.error(f"Failed to initialize EmailTool: {e}")
@@ -99,7 +107,10 @@ class EmailTool(BaseTool):
                 await self._imap_client.logout()
                 self._imap_client = None
             
-            self._operation_history = []
+            if self._mailbox:
+                self._mailbox.index.close()
+                self._mailbox = None
+            
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up EmailTool: {e}")
@@ -114,6 +125,7 @@ class EmailTool(BaseTool):
         tool_capabilities = {
             'send': True,
             'receive': True,
+            'read': True,
             'search': True,
             'delete': True,
             'history': True
@@ -151,6 +163,8 @@ class EmailTool(BaseTool):
             return await self._send_email(args)
         elif command == 'receive':
             return await self._receive_emails(args)
+        elif command == 'read':
+            return await self._read_email(args)
         elif command == 'search':
             return await self._search_emails(args)
         elif command == 'delete':
@@ -162,21 +176,6 @@ class EmailTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     async def _send_email(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Send an email.
         
@@ -256,6 +255,9 @@ class EmailTool(BaseTool):
     async def _receive_emails(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Receive emails.
         
+        Only new messages' headers are fetched from the server; bodies are
+        loaded when include_body is set (or later with the read command).
+        
         Args:
             args: Receive arguments
             
@@ -263,54 +265,20 @@ class EmailTool(BaseTool):
             Dict[str, Any]: Result of receive operation
         """
         try:
+            args = args or {}
             folder = args.get('folder', 'INBOX')
             limit = args.get('limit', 10)
             
-            # Select folder
-            await self._imap_client.select(folder)
-            
-            # Search for all messages
-            _, message_numbers = await self._imap_client.search('ALL')
-            message_numbers = message_numbers[0].split()
-            
-            # Get the most recent messages
-            messages = []
-            for num in message_numbers[-limit:]:
-                _, msg_data = await self._imap_client.fetch(num, '(RFC822)')
-                email_body = msg_data[0][1]
-                email_message = email.message_from_bytes(email_body)
-                
-                # Parse message
-                message = {
-                    'id': num.decode(),
-                    'from': email_message['from'],
-                    'to': email_message['to'],
-                    'subject': email_message['subject'],
-                    'date': email_message['date'],
-                    'body': '',
-                    'attachments': []
-                }
-                
-                # Get body and attachments
-                if email_message.is_multipart():
-                    for part in email_message.walk():
-                        if part.get_content_type() == 'text/plain':
-                            message['body'] = part.get_payload(decode=True).decode()
-                        elif part.get_content_maintype() == 'application':
-                            message['attachments'].append({
-                                'filename': part.get_filename(),
-                                'content_type': part.get_content_type(),
-                                'size': len(part.get_payload(decode=True))
-                            })
-                else:
-                    message['body'] = email_message.get_payload(decode=True).decode()
-                
-                messages.append(message)
+            new_count = await self._mailbox.sync(folder)
+            messages = self._mailbox.index.latest(folder, limit)
+            if args.get('include_body', False):
+                await self._attach_bodies(folder, messages)
             
             result = {
                 'status': 'success',
                 'action': 'receive',
                 'folder': folder,
+                'new_messages': new_count,
                 'messages': messages
             }
             
@@ -324,6 +292,47 @@ class EmailTool(BaseTool):
             logger.error(f"Error receiving emails: {e}")
             return {'error': str(e)}
     
+    async def _read_email(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Read an email including its body.
+        
+        Args:
+            args: Read arguments
+            
+        Returns:
+            Dict[str, Any]: Result of read operation
+        """
+        try:
+            if not args or 'message_id' not in args:
+                return {'error': 'Missing message ID'}
+            
+            message_id = args['message_id']
+            folder = args.get('folder', 'INBOX')
+            
+            messages = self._mailbox.index.get(folder, [int(message_id)])
+            if not messages:
+                await self._mailbox.sync(folder)
+                messages = self._mailbox.index.get(folder, [int(message_id)])
+            if not messages:
+                return {'error': 'Message not found'}
+            await self._attach_bodies(folder, messages)
+            
+            result = {
+                'status': 'success',
+                'action': 'read',
+                'folder': folder,
+                'message': messages[0]
+            }
+            
+            self._add_to_history('read', {
+                'message_id': message_id,
+                'folder': folder
+            })
+            
+            return result
+        except Exception as e:
+            logger.error(f"Error reading email: {e}")
+            return {'error': str(e)}
+    
     async def _search_emails(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Search emails.
         
@@ -341,47 +350,14 @@ class EmailTool(BaseTool):
             folder = args.get('folder', 'INBOX')
             limit = args.get('limit', 10)
             
-            # Select folder
-            await self._imap_client.select(folder)
-            
-            # Search for messages
-            search_criteria = f'(SUBJECT "{query}" OR FROM "{query}" OR TO "{query}")'
-            _, message_numbers = await self._imap_client.search(search_criteria)
-            message_numbers = message_numbers[0].split()
-            
-            # Get the matching messages
-            messages = []
-            for num in message_numbers[-limit:]:
-                _, msg_data = await self._imap_client.fetch(num, '(RFC822)')
-                email_body = msg_data[0][1]
-                email_message = email.message_from_bytes(email_body)
-                
-                # Parse message
-                message = {
-                    'id': num.decode(),
-                    'from': email_message['from'],
-                    'to': email_message['to'],
-                    'subject': email_message['subject'],
-                    'date': email_message['date'],
-                    'body': '',
-                    'attachments': []
-                }
-                
-                # Get body and attachments
-                if email_message.is_multipart():
-                    for part in email_message.walk():
-                        if part.get_content_type() == 'text/plain':
-                            message['body'] = part.get_payload(decode=True).decode()
-                        elif part.get_content_maintype() == 'application':
-                            message['attachments'].append({
-                                'filename': part.get_filename(),
-                                'content_type': part.get_content_type(),
-                                'size': len(part.get_payload(decode=True))
-                            })
-                else:
-                    message['body'] = email_message.get_payload(decode=True).decode()
-                
-                messages.append(message)
+            # Make sure matches are indexed, then search on the server
+            await self._mailbox.sync(folder)
+            quoted = '"' + query.replace('\\', '\\\\').replace('"', '\\"') + '"'
+            search_criteria = f'OR OR SUBJECT {quoted} FROM {quoted} TO {quoted}'
+            uids = await self._mailbox.search(folder, search_criteria)
+            messages = self._mailbox.index.get(folder, uids[-limit:])
+            if args.get('include_body', False):
+                await self._attach_bodies(folder, messages)
             
             result = {
                 'status': 'success',
@@ -402,6 +378,17 @@ class EmailTool(BaseTool):
             logger.error(f"Error searching emails: {e}")
             return {'error': str(e)}
     
+    async def _attach_bodies(self, folder: str, messages: List[Dict[str, Any]]) -> None:
+        """Fill in the body of each message, fetching uncached ones in one batch.
+        
+        Args:
+            folder: Folder name
+            messages: Indexed messages
+        """
+        bodies = await self._mailbox.load_bodies(folder, [message['uid'] for message in messages])
+        for message in messages:
+            message['body'] = bodies.get(message['uid'], '')
+    
     async def _delete_email(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Delete an email.
         
@@ -418,12 +405,8 @@ class EmailTool(BaseTool):
             message_id = args['message_id']
             folder = args.get('folder', 'INBOX')
             
-            # Select folder
-            await self._imap_client.select(folder)
-            
-            # Delete message
-            await self._imap_client.store(message_id, '+FLAGS', '\\Deleted')
-            await self._imap_client.expunge()
+            # Delete message by UID
+            await self._mailbox.delete(folder, [int(message_id)])
             
             result = {
                 'status': 'success',
@@ -452,7 +435,7 @@ class EmailTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -465,7 +448,7 @@ class EmailTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -2,6 +2,7 @@ from src.app.core.ai.tool_base import Tool
 from src.app.core.ai.a2a_protocol import A2AProtocol
 from src.app.core.ai.mcp_protocol import MCPProtocol
 from src.app.core.ai.smol_agent import SmolAgentProtocol
+from src.app.core.duplicate_finder import find_duplicates, shared_cache
 from typing import Dict, Any
 
 """
@@ -14,6 +15,7 @@ Key features:
 - File organization and categorization
 - Document management and sorting
 - Automated file structure maintenance
+- Duplicate file detection with a persistent hash cache
 - Extensible action system for organization operations
 - A2A, MCP, and SmolAgents compliance for enhanced agent communication
 
@@ -35,6 +37,14 @@ class FileAndDocumentOrganizerTool(Tool, A2AProtocol, MCPProtocol, SmolAgentProt
             if action == "organize":
                 result = {"organized": True}
                 return result
+            elif action == "find_duplicates":
+                report = await find_duplicates(
+                    params.get("paths") or params["path"],
+                    min_size=params.get("min_size", 1),
+                    cache=shared_cache(self.config.get("hash_cache")),
+                    include_hidden=params.get("include_hidden", False)
+                )
+                return report.to_dict()
             else:
                 error_msg = f"Unknown file/document organizer tool action: {action}"
                 return error_msg
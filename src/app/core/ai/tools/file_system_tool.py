@@ -8,12 +8,15 @@ This tool provides file system operations while following:
 """
 
 import os
-import shutil
+import asyncio
 import logging
 import hashlib
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Tuple, Union
 from pathlib import Path
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core.fs_walk import WalkEntry, WalkFilter, iter_entries, list_page
+from src.app.core.file_transfer import copy_file, copy_many, move_file, read_range, write_chunks
+from src.app.core.duplicate_finder import find_duplicates, shared_cache
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +37,12 @@ class FileSystemTool(BaseTool):
         self._base_path = Path(config.get('base_path', os.getcwd()))
         self._allowed_extensions = config.get('allowed_extensions', [])
         self._max_file_size = config.get('max_file_size', 100 * 1024 * 1024)  # 100MB default
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
+        self._page_size = config.get('page_size', 1000)
+        self._walk_workers = config.get('walk_workers', 4)
+        self._copy_workers = config.get('copy_workers', 8)
+        self._offload_threshold = config.get('offload_threshold', 1024 * 1024)
+        self._hash_cache_path = config.get('hash_cache')
     
     async def initialize(self) -> bool:
         """Initialize the tool.
@@ -60,7 +67,6 @@ class FileSystemTool(BaseTool):
     async def cleanup(self) -> None:
         """Clean up resources used by the tool."""
         try:
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up FileSystemTool: {e}")
@@ -78,9 +84,12 @@ class FileSystemTool(BaseTool):
             'delete': True,
             'move': True,
             'copy': True,
+            'copy_many': True,
+            'ranged_read': True,
             'list': True,
             'search': True,
             'hash': True,
+            'find_duplicates': True,
             'history': True
         }
         return {**base_capabilities, **tool_capabilities}
@@ -97,7 +106,10 @@ class FileSystemTool(BaseTool):
             'allowed_extensions': self._allowed_extensions,
             'max_file_size': self._max_file_size,
             'history_size': len(self._operation_history),
-            'max_history': self._max_history
+            'max_history': self._max_history,
+            'page_size': self._page_size,
+            'walk_workers': self._walk_workers,
+            'copy_workers': self._copy_workers
         }
         return {**base_status, **tool_status}
     
@@ -121,12 +133,16 @@ class FileSystemTool(BaseTool):
             return await self._move_file(args)
         elif command == 'copy':
             return await self._copy_file(args)
+        elif command == 'copy_many':
+            return await self._copy_many(args)
         elif command == 'list':
             return await self._list_directory(args)
         elif command == 'search':
             return await self._search_files(args)
         elif command == 'hash':
             return await self._hash_file(args)
+        elif command == 'find_duplicates':
+            return await self._find_duplicates(args)
         elif command == 'get_history':
             return await self._get_history()
         elif command == 'clear_history':
@@ -134,21 +150,6 @@ class FileSystemTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _validate_path(self, path: Union[str, Path]) -> Path:
         """Validate and normalize a path.
         
@@ -175,11 +176,13 @@ class FileSystemTool(BaseTool):
         except Exception as e:
             raise ValueError(f"Invalid path: {e}")
     
-    def _validate_file(self, path: Path) -> None:
+    def _validate_file(self, path: Path, check_size: bool = True) -> None:
         """Validate a file.
         
         Args:
             path: Path to validate
+            check_size: Enforce max_file_size (skipped by operations that
+                never hold the whole file in memory)
             
         Raises:
             ValueError: If file is invalid
@@ -193,12 +196,37 @@ class FileSystemTool(BaseTool):
         if self._allowed_extensions and path.suffix.lower() not in self._allowed_extensions:
             raise ValueError(f"File extension not allowed: {path.suffix}")
         
-        if path.stat().st_size > self._max_file_size:
+        if check_size and path.stat().st_size > self._max_file_size:
             raise ValueError(f"File too large: {path}")
     
+    def _progress_callback(self, args: Dict[str, Any]) -> Optional[Callable[[int, int], None]]:
+        """Wrap a 'progress' argument so worker threads report on the event loop.
+        
+        Args:
+            args: Command arguments
+            
+        Returns:
+            Optional[Callable[[int, int], None]]: Thread-safe callback, if one was given
+        """
+        progress = args.get('progress')
+        if not callable(progress):
+            return None
+        loop = asyncio.get_running_loop()
+        return lambda done, total: loop.call_soon_threadsafe(progress, done, total)
+    
+    async def _offload(self, size: int, func: Callable, *func_args: Any) -> Any:
+        """Run blocking file I/O inline when small, on a worker thread when large."""
+        if size >= self._offload_threshold:
+            return await asyncio.to_thread(func, *func_args)
+        return func(*func_args)
+    
     async def _read_file(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Read a file.
         
+        With 'offset' and/or 'length' only that byte range is read (memory
+        mapped when large), and max_file_size applies to the range instead
+        of the whole file.
+        
         Args:
             args: File reading arguments
             
@@ -210,12 +238,23 @@ class FileSystemTool(BaseTool):
                 return {'error': 'Missing path parameter'}
             
             path = self._validate_path(args['path'])
-            self._validate_file(path)
+            ranged = 'offset' in args or 'length' in args
+            self._validate_file(path, check_size=not ranged)
             
             encoding = args.get('encoding', 'utf-8')
             mode = args.get('mode', 'text')
             
-            if mode == 'text':
+            if ranged:
+                offset = args.get('offset', 0)
+                length = args.get('length')
+                file_size = path.stat().st_size
+                span = max(0, (file_size if length is None else min(file_size, offset + length)) - offset)
+                if span > self._max_file_size:
+                    return {'error': f'Range too large: {span} bytes'}
+                content = await self._offload(span, read_range, str(path), offset, length)
+                if mode == 'text':
+                    content = content.decode(encoding, args.get('errors', 'strict'))
+            elif mode == 'text':
                 with open(path, 'r', encoding=encoding) as f:
                     content = f.read()
             else:  # binary
@@ -228,13 +267,16 @@ class FileSystemTool(BaseTool):
                 'size': len(content)
             })
             
-            return {
+            result = {
                 'status': 'success',
                 'action': 'read',
                 'path': str(path),
                 'content': content,
                 'mode': mode
             }
+            if ranged:
+                result.update({'offset': offset, 'file_size': file_size})
+            return result
         except Exception as e:
             logger.error(f"Error reading file: {e}")
             return {'error': str(e)}
@@ -242,6 +284,10 @@ class FileSystemTool(BaseTool):
     async def _write_file(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Write to a file.
         
+        'content' may be a str/bytes value or an iterable of chunks, which
+        are streamed to disk one at a time. 'append' and 'offset' write into
+        an existing file instead of replacing it.
+        
         Args:
             args: File writing arguments
             
@@ -257,25 +303,27 @@ class FileSystemTool(BaseTool):
             encoding = args.get('encoding', 'utf-8')
             mode = args.get('mode', 'text')
             overwrite = args.get('overwrite', False)
+            append = args.get('append', False)
+            offset = args.get('offset')
             
             # Check if file exists
-            if path.exists() and not overwrite:
+            if path.exists() and not (overwrite or append or offset is not None):
                 return {'error': f'File already exists: {path}'}
             
+            if mode != 'text' and isinstance(content, str):
+                return {'error': 'Binary mode requires bytes content'}
+            
             # Create parent directories if needed
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            if mode == 'text':
-                with open(path, 'w', encoding=encoding) as f:
-                    f.write(content)
-            else:  # binary
-                with open(path, 'wb') as f:
-                    f.write(content)
+            # Known-size payloads go to a thread only when large; chunk streams always do
+            size = len(content) if isinstance(content, (str, bytes, bytearray)) else self._offload_threshold
+            written = await self._offload(size, write_chunks, str(path), content, offset, append, encoding)
             
             self._add_to_history('write', {
                 'path': str(path),
                 'mode': mode,
-                'size': len(content)
+                'size': written
             })
             
             return {
@@ -342,36 +390,39 @@ class FileSystemTool(BaseTool):
             source = self._validate_path(args['source'])
             destination = self._validate_path(args['destination'])
             
-            self._validate_file(source)
+            self._validate_file(source, check_size=False)
             
-            # Check if destination exists
-            if destination.exists():
-                if not args.get('overwrite', False):
-                    return {'error': f'Destination already exists: {destination}'}
-                destination.unlink()
+            # Check if destination exists; it is replaced atomically below
+            if destination.exists() and not args.get('overwrite', False):
+                return {'error': f'Destination already exists: {destination}'}
             
             # Create parent directories if needed
             destination.parent.mkdir(parents=True, exist_ok=True)
             
             # Get file info before move
+            stat = source.stat()
             file_info = {
-                'size': source.stat().st_size,
-                'modified': source.stat().st_mtime
+                'size': stat.st_size,
+                'modified': stat.st_mtime
             }
             
-            shutil.move(str(source), str(destination))
+            # A rename is instant; only cross-device moves copy, off the event loop
+            method = await asyncio.to_thread(move_file, str(source), str(destination),
+                                             self._progress_callback(args))
             
             self._add_to_history('move', {
                 'source': str(source),
                 'destination': str(destination),
-                'info': file_info
+                'info': file_info,
+                'method': method
             })
             
             return {
                 'status': 'success',
                 'action': 'move',
                 'source': str(source),
-                'destination': str(destination)
+                'destination': str(destination),
+                'method': method
             }
         except Exception as e:
             logger.error(f"Error moving file: {e}")
@@ -393,7 +444,7 @@ class FileSystemTool(BaseTool):
             source = self._validate_path(args['source'])
             destination = self._validate_path(args['destination'])
             
-            self._validate_file(source)
+            self._validate_file(source, check_size=False)
             
             # Check if destination exists
             if destination.exists():
@@ -405,12 +456,14 @@ class FileSystemTool(BaseTool):
             destination.parent.mkdir(parents=True, exist_ok=True)
             
             # Get file info
+            stat = source.stat()
             file_info = {
-                'size': source.stat().st_size,
-                'modified': source.stat().st_mtime
+                'size': stat.st_size,
+                'modified': stat.st_mtime
             }
             
-            shutil.copy2(str(source), str(destination))
+            await self._offload(stat.st_size, copy_file, str(source), str(destination),
+                                self._progress_callback(args))
             
             self._add_to_history('copy', {
                 'source': str(source),
@@ -428,9 +481,138 @@ class FileSystemTool(BaseTool):
             logger.error(f"Error copying file: {e}")
             return {'error': str(e)}
     
+    async def _copy_many(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Copy many files concurrently.
+        
+        Args:
+            args: Copy arguments ('items' is a list of {'source', 'destination'})
+            
+        Returns:
+            Dict[str, Any]: Per-item results, in order
+        """
+        try:
+            if not args or not isinstance(args.get('items'), list):
+                return {'error': 'Missing items parameter'}
+            
+            results: List[Optional[Dict[str, Any]]] = [None] * len(args['items'])
+            pairs, indexes = [], []
+            for i, item in enumerate(args['items']):
+                if not isinstance(item, dict) or not all(k in item for k in ['source', 'destination']):
+                    results[i] = {'status': 'error', 'error': 'Missing required parameters'}
+                    continue
+                try:
+                    source = self._validate_path(item['source'])
+                    destination = self._validate_path(item['destination'])
+                    self._validate_file(source, check_size=False)
+                except ValueError as e:
+                    results[i] = {'status': 'error', 'error': str(e)}
+                    continue
+                pairs.append((str(source), str(destination)))
+                indexes.append(i)
+            
+            outcomes = await copy_many(pairs, self._copy_workers, args.get('overwrite', False),
+                                       args.get('progress'))
+            for i, (source, destination), (ok, value) in zip(indexes, pairs, outcomes):
+                results[i] = ({'status': 'success', 'source': source, 'destination': destination, 'size': value}
+                              if ok else {'status': 'error', 'source': source, 'error': value})
+            
+            copied = sum(1 for result in results if result['status'] == 'success')
+            self._add_to_history('copy_many', {
+                'count': len(results),
+                'copied': copied
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'copy_many',
+                'copied': copied,
+                'failed': len(results) - copied,
+                'results': results
+            }
+        except Exception as e:
+            logger.error(f"Error copying files: {e}")
+            return {'error': str(e)}
+    
+    def _walk_filter(self, args: Dict[str, Any], recursive: bool, pattern: Optional[str] = None) -> WalkFilter:
+        """Build the walk filter for list/search arguments.
+        
+        Args:
+            args: Command arguments
+            recursive: Whether to descend into subdirectories
+            pattern: Name pattern; globs (containing *, ? or [) are matched
+                against the whole name, anything else as a substring
+            
+        Returns:
+            WalkFilter: Filter pushed down into the directory walk
+        """
+        is_glob = pattern is not None and any(c in pattern for c in '*?[')
+        return WalkFilter(
+            pattern=args.get('glob') or (pattern if is_glob else None),
+            contains=None if is_glob else pattern,
+            kind=args.get('type'),
+            min_size=args.get('min_size'),
+            max_size=args.get('max_size'),
+            modified_after=args.get('modified_after'),
+            modified_before=args.get('modified_before'),
+            include_hidden=args.get('include_hidden', False),
+            max_depth=args.get('max_depth') if recursive else 0
+        )
+    
+    def _entry_info(self, entry: WalkEntry) -> Dict[str, Any]:
+        """Describe a walk entry the way list and search report items."""
+        base = os.path.join(str(self._base_path), '')
+        return {
+            'name': entry.name,
+            'path': entry.path[len(base):] if entry.path.startswith(base) else entry.path,
+            'type': 'directory' if entry.is_dir else 'file',
+            'size': entry.size,
+            'modified': entry.mtime
+        }
+    
+    async def iter_directory(self, args: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Stream matching items under a directory without collecting them.
+        
+        Accepts the same arguments, with the same defaults, as the list
+        command (plus 'pattern'), but yields every item as soon as it is
+        found instead of returning a page.
+        
+        Args:
+            args: Directory listing arguments
+            
+        Yields:
+            Dict[str, Any]: One item per matching entry
+        """
+        path = self._validate_path(args['path'])
+        spec = self._walk_filter(args, args.get('recursive', False), args.get('pattern'))
+        async for entry in iter_entries(str(path), spec, args.get('cursor'), max_workers=self._walk_workers):
+            yield self._entry_info(entry)
+    
+    async def _walk_page(self, path: Path, spec: WalkFilter, args: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Collect one page of a directory walk.
+        
+        Args:
+            path: Validated directory
+            spec: Walk filter
+            args: Command arguments ('limit' and 'cursor' are used)
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: Items and the cursor
+            for the next page (None on the last page)
+        """
+        entries, next_cursor = await list_page(
+            str(path), spec,
+            limit=args.get('limit', self._page_size),
+            cursor=args.get('cursor'),
+            max_workers=self._walk_workers
+        )
+        return [self._entry_info(entry) for entry in entries], next_cursor
+    
     async def _list_directory(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List directory contents.
         
+        Results are paginated: pass the returned 'next_cursor' back as
+        'cursor' to get the following page.
+        
         Args:
             args: Directory listing arguments
             
@@ -452,36 +634,7 @@ class FileSystemTool(BaseTool):
             recursive = args.get('recursive', False)
             include_hidden = args.get('include_hidden', False)
             
-            items = []
-            if recursive:
-                for root, dirs, files in os.walk(path):
-                    # Filter hidden items
-                    if not include_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith('.')]
-                        files = [f for f in files if not f.startswith('.')]
-                    
-                    for item in dirs + files:
-                        item_path = Path(root) / item
-                        items.append({
-                            'name': item,
-                            'path': str(item_path.relative_to(self._base_path)),
-                            'type': 'directory' if item_path.is_dir() else 'file',
-                            'size': item_path.stat().st_size if item_path.is_file() else None,
-                            'modified': item_path.stat().st_mtime
-                        })
-            else:
-                for item in path.iterdir():
-                    # Skip hidden items
-                    if not include_hidden and item.name.startswith('.'):
-                        continue
-                    
-                    items.append({
-                        'name': item.name,
-                        'path': str(item.relative_to(self._base_path)),
-                        'type': 'directory' if item.is_dir() else 'file',
-                        'size': item.stat().st_size if item.is_file() else None,
-                        'modified': item.stat().st_mtime
-                    })
+            items, next_cursor = await self._walk_page(path, self._walk_filter(args, recursive), args)
             
             self._add_to_history('list', {
                 'path': str(path),
@@ -494,7 +647,8 @@ class FileSystemTool(BaseTool):
                 'status': 'success',
                 'action': 'list',
                 'path': str(path),
-                'items': items
+                'items': items,
+                'next_cursor': next_cursor
             }
         except Exception as e:
             logger.error(f"Error listing directory: {e}")
@@ -503,6 +657,8 @@ class FileSystemTool(BaseTool):
     async def _search_files(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Search for files.
         
+        Results are paginated like list.
+        
         Args:
             args: File search arguments
             
@@ -524,38 +680,7 @@ class FileSystemTool(BaseTool):
             if not path.is_dir():
                 return {'error': f'Path is not a directory: {path}'}
             
-            matches = []
-            if recursive:
-                for root, dirs, files in os.walk(path):
-                    # Filter hidden items
-                    if not include_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith('.')]
-                        files = [f for f in files if not f.startswith('.')]
-                    
-                    for item in dirs + files:
-                        if pattern in item:
-                            item_path = Path(root) / item
-                            matches.append({
-                                'name': item,
-                                'path': str(item_path.relative_to(self._base_path)),
-                                'type': 'directory' if item_path.is_dir() else 'file',
-                                'size': item_path.stat().st_size if item_path.is_file() else None,
-                                'modified': item_path.stat().st_mtime
-                            })
-            else:
-                for item in path.iterdir():
-                    # Skip hidden items
-                    if not include_hidden and item.name.startswith('.'):
-                        continue
-                    
-                    if pattern in item.name:
-                        matches.append({
-                            'name': item.name,
-                            'path': str(item.relative_to(self._base_path)),
-                            'type': 'directory' if item.is_dir() else 'file',
-                            'size': item.stat().st_size if item.is_file() else None,
-                            'modified': item.stat().st_mtime
-                        })
+            matches, next_cursor = await self._walk_page(path, self._walk_filter(args, recursive, pattern), args)
             
             self._add_to_history('search', {
                 'path': str(path),
@@ -570,7 +695,8 @@ class FileSystemTool(BaseTool):
                 'action': 'search',
                 'path': str(path),
                 'pattern': pattern,
-                'matches': matches
+                'matches': matches,
+                'next_cursor': next_cursor
             }
         except Exception as e:
             logger.error(f"Error searching files: {e}")
@@ -620,6 +746,50 @@ class FileSystemTool(BaseTool):
             logger.error(f"Error calculating file hash: {e}")
             return {'error': str(e)}
     
+    async def _find_duplicates(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Find files with identical content.
+        
+        Hashes are cached in a database shared by the whole process (the
+        'hash_cache' path from config, or one under the app data directory),
+        so repeated searches only hash files that changed.
+        
+        Args:
+            args: Search arguments ('path' or 'paths', 'min_size', 'include_hidden')
+            
+        Returns:
+            Dict[str, Any]: Duplicate groups and per-stage counts
+        """
+        try:
+            if not args or not ('path' in args or 'paths' in args):
+                return {'error': 'Missing path parameter'}
+            
+            paths = [self._validate_path(p) for p in args.get('paths') or [args['path']]]
+            for path in paths:
+                if not path.is_dir():
+                    return {'error': f'Path is not a directory: {path}'}
+            
+            report = await find_duplicates(
+                [str(path) for path in paths],
+                min_size=args.get('min_size', 1),
+                cache=shared_cache(self._hash_cache_path),
+                include_hidden=args.get('include_hidden', False)
+            )
+            
+            self._add_to_history('find_duplicates', {
+                'paths': [str(path) for path in paths],
+                'groups': len(report.groups),
+                'wasted_bytes': report.wasted_bytes
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'find_duplicates',
+                **report.to_dict()
+            }
+        except Exception as e:
+            logger.error(f"Error finding duplicates: {e}")
+            return {'error': str(e)}
+    
     async def _get_history(self) -> Dict[str, Any]:
         """Get operation history.
         
@@ -630,7 +800,7 @@ class FileSystemTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -643,7 +813,7 @@ class FileSystemTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -36,7 +36,6 @@ class ImageTool(BaseTool):
         self._max_dimensions = config.get('max_dimensions', (4096, 4096))
         self._allowed_formats = config.get('allowed_formats', ['JPEG', 'PNG', 'GIF', 'BMP'])
         self._quality = config.get('quality', 85)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Image cache
         self._cache_duration = config.get('cache_duration', 3600)  # 1 hour
@@ -60,7 +59,6 @@ class ImageTool(BaseTool):
         """Clean up resources used by the tool."""
         try:
             self._cache = {}
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up ImageTool: {e}")
@@ -131,21 +129,6 @@ class ImageTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _get_cache_key(self, image_data: bytes, operation: str, **kwargs) -> str:
         """Generate a cache key for image data.
         
@@ -487,7 +470,7 @@ class ImageTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -500,7 +483,7 @@ class ImageTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -9,7 +9,6 @@ This tool provides logging operations while following:
 
 import logging
 import asyncio
-import time
 import json
 import os
 from typing import Dict, Any, List, Optional, Union, Tuple
@@ -37,7 +36,6 @@ class LogTool(BaseTool):
         self._log_format = config.get('log_format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         self._date_format = config.get('date_format', '%Y-%m-%d %H:%M:%S')
         self._handlers = {}
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
     
     async def initialize(self) -> bool:
@@ -61,7 +59,6 @@ class LogTool(BaseTool):
             for handler in self._handlers.values():
                 handler.close()
             self._handlers.clear()
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up LogTool: {e}")
@@ -126,21 +123,6 @@ class LogTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _get_handler(self, name: str) -> logging.FileHandler:
         """Get or create a file handler.
         
@@ -356,7 +338,7 @@ class LogTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -369,7 +351,7 @@ class LogTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -5,6 +5,10 @@ This tool provides mathematical operations while following:
 - A2A (Agent-to-Agent) protocol for agent collaboration
 - MCP (Multi-Channel Protocol) for unified channel support
 - SmolAgents pattern for minimal, efficient implementation
+
+The 'batch' command evaluates an operation over arrays of operands (or an
+expression over arrays of variables, or many expressions) in one vectorized
+NumPy pass instead of one call per value.
 """
 
 import logging
@@ -12,11 +16,29 @@ import asyncio
 import time
 import math
 import numpy as np
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, Optional, Union, Tuple
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core.expression_evaluator import evaluate, evaluate_many
 
 logger = logging.getLogger(__name__)
 
+# Batch operations expressed as compiled expressions over operand arrays
+_BATCH_EXPRESSIONS = {
+    'basic': {
+        'add': 'a + b',
+        'subtract': 'a - b',
+        'multiply': 'a * b',
+        'divide': 'a / b',
+        'power': 'a ** b',
+        'root': 'a ** (1 / b)'
+    },
+    'trigonometric': {func: f'{func}(angle)' for func in ('sin', 'cos', 'tan', 'asin', 'acos', 'atan')},
+    'logarithmic': {
+        'log': 'log(x, base)',
+        'ln': 'ln(x)'
+    }
+}
+
 class MathTool(BaseTool):
     """Tool for performing mathematical operations."""
     
@@ -34,7 +56,6 @@ class MathTool(BaseTool):
         self._max_precision = config.get('max_precision', 10)
         self._max_matrix_size = config.get('max_matrix_size', 1000)
         self._max_vector_size = config.get('max_vector_size', 1000)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Math cache
         self._cache_duration = config.get('cache_duration', 3600)  # 1 hour
@@ -58,7 +79,6 @@ class MathTool(BaseTool):
         """Clean up resources used by the tool."""
         try:
             self._cache = {}
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up MathTool: {e}")
@@ -77,6 +97,7 @@ class MathTool(BaseTool):
             'statistical': True,
             'matrix': True,
             'vector': True,
+            'batch': True,
             'history': True
         }
         return {**base_capabilities, **tool_capabilities}
@@ -121,6 +142,8 @@ class MathTool(BaseTool):
             return await self._matrix_operation(args)
         elif command == 'vector':
             return await self._vector_operation(args)
+        elif command == 'batch':
+            return await self._batch_operation(args)
         elif command == 'get_history':
             return await self._get_history()
         elif command == 'clear_history':
@@ -128,21 +151,6 @@ class MathTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _get_cache_key(self, operation: str, **kwargs) -> str:
         """Generate a cache key for math operation.
         
@@ -177,48 +185,56 @@ class MathTool(BaseTool):
         cache_time = self._cache[cache_key]['timestamp']
         return time.time() - cache_time < self._cache_duration
     
-    def _validate_matrix(self, matrix: List[List[float]]) -> Tuple[bool, Optional[str]]:
-        """Validate matrix data.
+    def _validate_matrix(self, matrix: Any) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        """Validate matrix data and convert it to an array in one step.
         
         Args:
-            matrix: Matrix data to validate
+            matrix: Matrix data (nested lists or array) to validate
             
         Returns:
-            Tuple[bool, Optional[str]]: (is_valid, error_message)
+            Tuple[Optional[np.ndarray], Optional[str]]: (matrix_array, error_message)
         """
-        if not matrix:
-            return False, 'Matrix is empty'
+        if matrix is None or len(matrix) == 0:
+            return None, 'Matrix is empty'
         
-        rows = len(matrix)
-        if rows > self._max_matrix_size:
-            return False, f'Matrix exceeds maximum size ({self._max_matrix_size})'
+        try:
+            array = np.asarray(matrix, dtype=np.float64)
+        except (ValueError, TypeError):
+            # Ragged rows cannot form a 2-D array
+            return None, 'Matrix is not rectangular'
         
-        cols = len(matrix[0])
-        if cols > self._max_matrix_size:
-            return False, f'Matrix exceeds maximum size ({self._max_matrix_size})'
+        if array.ndim != 2:
+            return None, 'Matrix is not rectangular'
         
-        for row in matrix:
-            if len(row) != cols:
-                return False, 'Matrix is not rectangular'
+        if max(array.shape) > self._max_matrix_size:
+            return None, f'Matrix exceeds maximum size ({self._max_matrix_size})'
         
-        return True, None
+        return array, None
     
-    def _validate_vector(self, vector: List[float]) -> Tuple[bool, Optional[str]]:
-        """Validate vector data.
+    def _validate_vector(self, vector: Any) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        """Validate vector data and convert it to an array in one step.
         
         Args:
-            vector: Vector data to validate
+            vector: Vector data (list or array) to validate
             
         Returns:
-            Tuple[bool, Optional[str]]: (is_valid, error_message)
+            Tuple[Optional[np.ndarray], Optional[str]]: (vector_array, error_message)
         """
-        if not vector:
-            return False, 'Vector is empty'
+        if vector is None or len(vector) == 0:
+            return None, 'Vector is empty'
         
-        if len(vector) > self._max_vector_size:
-            return False, f'Vector exceeds maximum size ({self._max_vector_size})'
+        try:
+            array = np.asarray(vector, dtype=np.float64)
+        except (ValueError, TypeError):
+            return None, 'Vector must contain numbers only'
+        
+        if array.ndim != 1:
+            return None, 'Vector must be one-dimensional'
         
-        return True, None
+        if array.size > self._max_vector_size:
+            return None, f'Vector exceeds maximum size ({self._max_vector_size})'
+        
+        return array, None
     
     async def _process_operation(self, operation: str, **kwargs) -> Dict[str, Any]:
         """Process mathematical operation.
@@ -328,20 +344,18 @@ class MathTool(BaseTool):
                 matrix = kwargs.get('matrix')
                 
                 # Validate matrix
-                is_valid, error = self._validate_matrix(matrix)
-                if not is_valid:
+                matrix, error = self._validate_matrix(matrix)
+                if error:
                     return {'error': error}
                 
                 if func == 'add':
-                    other = kwargs.get('other')
-                    is_valid, error = self._validate_matrix(other)
-                    if not is_valid:
+                    other, error = self._validate_matrix(kwargs.get('other'))
+                    if error:
                         return {'error': error}
                     result = np.add(matrix, other)
                 elif func == 'multiply':
-                    other = kwargs.get('other')
-                    is_valid, error = self._validate_matrix(other)
-                    if not is_valid:
+                    other, error = self._validate_matrix(kwargs.get('other'))
+                    if error:
                         return {'error': error}
                     result = np.matmul(matrix, other)
                 elif func == 'transpose':
@@ -363,26 +377,23 @@ class MathTool(BaseTool):
                 vector = kwargs.get('vector')
                 
                 # Validate vector
-                is_valid, error = self._validate_vector(vector)
-                if not is_valid:
+                vector, error = self._validate_vector(vector)
+                if error:
                     return {'error': error}
                 
                 if func == 'add':
-                    other = kwargs.get('other')
-                    is_valid, error = self._validate_vector(other)
-                    if not is_valid:
+                    other, error = self._validate_vector(kwargs.get('other'))
+                    if error:
                         return {'error': error}
                     result = np.add(vector, other)
                 elif func == 'dot':
-                    other = kwargs.get('other')
-                    is_valid, error = self._validate_vector(other)
-                    if not is_valid:
+                    other, error = self._validate_vector(kwargs.get('other'))
+                    if error:
                         return {'error': error}
                     result = np.dot(vector, other)
                 elif func == 'cross':
-                    other = kwargs.get('other')
-                    is_valid, error = self._validate_vector(other)
-                    if not is_valid:
+                    other, error = self._validate_vector(kwargs.get('other'))
+                    if error:
                         return {'error': error}
                     result = np.cross(vector, other)
                 elif func == 'norm':
@@ -604,6 +615,69 @@ class MathTool(BaseTool):
             logger.error(f"Error performing vector operation: {e}")
             return {'error': str(e)}
     
+    async def _batch_operation(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Evaluate an operation over arrays of operands in one vectorized pass.
+        
+        Either:
+        - 'operation' ('basic', 'trigonometric' or 'logarithmic') with the same
+          arguments as the single operation, given as arrays (scalars broadcast)
+        - 'expression' with 'variables' mapping names to arrays
+        - 'expressions', a list of constant expressions
+        
+        Args:
+            args: Batch arguments
+            
+        Returns:
+            Dict[str, Any]: Results (None where a row failed) and errors by row index
+        """
+        try:
+            if not args:
+                return {'error': 'Missing required arguments'}
+            
+            if 'expressions' in args:
+                values, errors = evaluate_many(args['expressions'])
+            else:
+                if 'expression' in args:
+                    expression = args['expression']
+                    variables = args.get('variables', {})
+                else:
+                    operation = args.get('operation')
+                    func = args.get('op') if operation == 'basic' else args.get('func')
+                    expression = _BATCH_EXPRESSIONS.get(operation, {}).get(func)
+                    if expression is None:
+                        return {'error': f'Unsupported batch operation: {operation} {func}'}
+                    variables = {name: args[name] for name in ('a', 'b', 'angle', 'x') if name in args}
+                    if operation == 'logarithmic':
+                        variables['base'] = args.get('base', math.e)
+                    if operation == 'trigonometric' and not args.get('is_radians', True):
+                        variables['angle'] = np.radians(np.asarray(variables.get('angle'), dtype=np.float64))
+                
+                values = np.atleast_1d(np.asarray(evaluate(expression, variables), dtype=np.float64))
+                errors = {
+                    int(index): 'Result is undefined (e.g. division by zero or invalid domain)'
+                    for index in np.flatnonzero(~np.isfinite(values))
+                }
+            
+            result = np.round(values, self._max_precision).astype(object)
+            if errors:
+                result[list(errors)] = None
+            
+            self._add_to_history('batch', lambda: {
+                'operation': args.get('operation') or 'expression',
+                'count': len(result),
+                'error_count': len(errors)
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'batch',
+                'result': result.tolist(),
+                'errors': errors
+            }
+        except Exception as e:
+            logger.error(f"Error performing batch operation: {e}")
+            return {'error': str(e)}
+    
     async def _get_history(self) -> Dict[str, Any]:
         """Get operation history.
         
@@ -614,7 +688,7 @@ class MathTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -627,7 +701,7 @@ class MathTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
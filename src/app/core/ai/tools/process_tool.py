@@ -29,7 +29,6 @@ class ProcessTool(BaseTool):
         self._max_processes = 100
         self._max_memory = 1024 * 1024 * 1024  # 1GB
         self._max_cpu = 100  # 100%
-        self._operation_history = []
         self._max_history = 100
         self._processes = {}
     
@@ -99,19 +98,12 @@ class ProcessTool(BaseTool):
                 'start_time': time.time()
             }
             
-            self._operation_history.append({
-                'operation': 'start',
-                'details': {
-                    'pid': process.pid,
-                    'command': command,
-                    'args': args
-                },
-                'timestamp': time.time()
+            self._add_to_history('start', {
+                'pid': process.pid,
+                'command': command,
+                'args': args
             })
             
-            if len(self._operation_history) > self._max_history:
-                self._operation_history.pop(0)
-            
             return {
                 "pid": process.pid,
                 "command": command,
@@ -136,17 +128,10 @@ class ProcessTool(BaseTool):
             
             del self._processes[pid]
             
-            self._operation_history.append({
-                'operation': 'stop',
-                'details': {
-                    'pid': pid
-                },
-                'timestamp': time.time()
+            self._add_to_history('stop', {
+                'pid': pid
             })
             
-            if len(self._operation_history) > self._max_history:
-                self._operation_history.pop(0)
-            
             return {
                 "pid": pid,
                 "stopped": True,
@@ -184,12 +169,8 @@ class ProcessTool(BaseTool):
                         'status': 'terminated'
                     })
             
-            self._operation_history.append({
-                'operation': 'list',
-                'details': {
-                    'count': len(processes)
-                },
-                'timestamp': time.time()
+            self._add_to_history('list', {
+                'count': len(processes)
             })
             
             return {
@@ -227,12 +208,8 @@ class ProcessTool(BaseTool):
                 'status': system_process.status()
             }
             
-            self._operation_history.append({
-                'operation': 'status',
-                'details': {
-                    'pid': pid
-                },
-                'timestamp': time.time()
+            self._add_to_history('status', {
+                'pid': pid
             })
             
             return {
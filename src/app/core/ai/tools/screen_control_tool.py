@@ -3,7 +3,9 @@ import pyautogui
 import gettext
 import locale
 import os
-from typing import Dict, Any, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
 from src.app.core.platform_core.platform_manager import PlatformManager
 from src.app.core.ai.tool_base import BaseTool
 from src.app.core.ai.a2a_protocol import A2AProtocol
@@ -13,6 +15,8 @@ from datetime import datetime
 import mss
 import mss.tools
 from PIL import Image
+from src.app.core.vision.screen_matcher import ScreenMatcher
+from src.app.core.vision.screen_change import ScreenChangeTracker, ScreenDiff
 
 """
 Screen Control Tool for Labeeb
@@ -24,7 +28,10 @@ and managing screen dimensions across different platforms.
 Key features:
 - Cross-platform screen control (macOS, Windows, Ubuntu)
 - Screenshot capture with optional region selection
-- Image recognition and location detection
+- Image recognition and location detection (mss capture + OpenCV pyramid
+  matching, restricted to a region of interest, several templates per capture)
+- Change detection: tile diffs against the last frame of the same view report
+  dirty regions (tracked process-wide, since tools are created per call)
 - Screen dimension management
 - Platform-specific configuration
 - Internationalization (i18n) support with RTL layout handling
@@ -38,6 +45,27 @@ See also:
 
 logger = logging.getLogger(__name__)
 
+class _ChangeState:
+    """Change trackers shared by every ScreenControlTool, one per captured view (origin and size)."""
+
+    def __init__(self, max_views: int = 16):
+        self.lock = threading.Lock()
+        self.max_views = max_views
+        self.trackers: "OrderedDict[tuple, ScreenChangeTracker]" = OrderedDict()
+
+    def update(self, frame, origin: Tuple[int, int]) -> ScreenDiff:
+        view = (origin, frame.shape[:2])
+        with self.lock:
+            tracker = self.trackers.get(view)
+            if tracker is None:
+                tracker = self.trackers[view] = ScreenChangeTracker()
+                if len(self.trackers) > self.max_views:
+                    self.trackers.popitem(last=False)
+            self.trackers.move_to_end(view)
+            return tracker.update(frame, origin)
+
+_change_state = _ChangeState()
+
 class ScreenControlTool(BaseTool):
     name = "screen_control"
     description = "Tool for screen control and automation capabilities."
@@ -49,6 +77,7 @@ class ScreenControlTool(BaseTool):
         self.handlers = self.platform_manager.get_handlers()
         self._configure_platform()
         self._setup_translations(language_code)
+        self.matcher = ScreenMatcher(scales=(1.0, 0.8, 1.25))
 
     def _log_protocol_action(self, protocol_name, action, details=None):
         # TODO: Implement real protocol integration for A2A, MCP, SmolAgents
@@ -124,8 +153,13 @@ class ScreenControlTool(BaseTool):
                 'is_rtl': self.is_rtl
             }
 
-    async def take_screenshot(self, region: Tuple[int, int, int, int] = None) -> Dict[str, Any]:
-        """Take a screenshot using pyautogui for compatibility with Wayland and most Linux desktops."""
+    async def take_screenshot(self, region: Tuple[int, int, int, int] = None, as_array: bool = False) -> Dict[str, Any]:
+        """
+        Take a screenshot with mss, falling back to pyautogui (e.g. on Wayland).
+        
+        With as_array=True the capture is returned under 'array' as a BGRA
+        NumPy view of the raw buffer instead of a PIL image under 'image'.
+        """
         try:
             self._log_protocol_action('A2A', 'take_screenshot', {'region': region})
             self._log_protocol_action('MCP', 'take_screenshot', {'region': region})
@@ -138,10 +172,19 @@ class ScreenControlTool(BaseTool):
                 'is_rtl': self.is_rtl
             }
 
-            import pyautogui
-            screenshot = pyautogui.screenshot(region=region)
-            result['image'] = screenshot
-            result['message'] = self._("Screen capture successful (pyautogui)")
+            try:
+                frame = self.matcher.capture(region)
+                if as_array:
+                    result['array'] = frame
+                else:
+                    height, width = frame.shape[:2]
+                    result['image'] = Image.frombuffer('RGB', (width, height), frame, 'raw', 'BGRX', 0, 1)
+                result['message'] = self._("Screen capture successful (mss)")
+            except Exception as capture_error:
+                logger.debug(f"mss capture failed, using pyautogui: {capture_error}")
+                screenshot = pyautogui.screenshot(region=region)
+                result['image'] = screenshot
+                result['message'] = self._("Screen capture successful (pyautogui)")
             self._log_protocol_action('SmolAgents', 'take_screenshot', result)
             return result
         except Exception as e:
@@ -157,8 +200,9 @@ class ScreenControlTool(BaseTool):
                 'is_rtl': self.is_rtl
             }
 
-    async def locate_on_screen(self, image_path: str, confidence: float = 0.9) -> Dict[str, Any]:
-        """Locate an image on screen"""
+    async def locate_on_screen(self, image_path: str, confidence: float = 0.9,
+                               region: Tuple[int, int, int, int] = None) -> Dict[str, Any]:
+        """Locate an image on screen, optionally only within region (left, top, width, height)"""
         try:
             self._log_protocol_action('A2A', 'locate_on_screen', {'image_path': image_path, 'confidence': confidence})
             self._log_protocol_action('MCP', 'locate_on_screen', {'image_path': image_path, 'confidence': confidence})
@@ -171,14 +215,16 @@ class ScreenControlTool(BaseTool):
                 'is_rtl': self.is_rtl
             }
 
-            location = pyautogui.locateOnScreen(image_path, confidence=confidence)
+            try:
+                match = self.matcher.locate(image_path, region=region, confidence=confidence)
+                location = match.to_dict() if match else None
+            except Exception as capture_error:
+                # OpenCV/mss unavailable or capture failed (e.g. Wayland, no X server): pyautogui search
+                logger.debug(f"mss locate failed, using pyautogui: {capture_error}")
+                box = pyautogui.locateOnScreen(image_path, confidence=confidence, region=region)
+                location = {'left': box.left, 'top': box.top, 'width': box.width, 'height': box.height} if box else None
             if location:
-                result['location'] = {
-                    'left': location.left,
-                    'top': location.top,
-                    'width': location.width,
-                    'height': location.height
-                }
+                result['location'] = location
                 result['message'] = self._("Image found on screen")
             else:
                 result['message'] = self._("Image not found on screen")
@@ -198,6 +244,64 @@ class ScreenControlTool(BaseTool):
                 'is_rtl': self.is_rtl
             }
 
+    async def locate_all_on_screen(self, image_paths: List[str], confidence: float = 0.9,
+                                   region: Tuple[int, int, int, int] = None) -> Dict[str, Any]:
+        """Locate several images using a single screen capture"""
+        platform_name = self.platform_info.get('name') or self.platform_info.get('platform') or 'unknown'
+        try:
+            self._log_protocol_action('A2A', 'locate_all_on_screen', {'image_paths': image_paths, 'confidence': confidence})
+            self._log_protocol_action('MCP', 'locate_all_on_screen', {'image_paths': image_paths, 'confidence': confidence})
+            matches = self.matcher.locate_all(image_paths, region=region, confidence=confidence)
+            result = {
+                'platform': platform_name,
+                'action': 'locate_all',
+                'status': 'success',
+                'locations': {path: match.to_dict() if match else None for path, match in matches.items()},
+                'is_rtl': self.is_rtl
+            }
+            self._log_protocol_action('SmolAgents', 'locate_all_on_screen', result)
+            return result
+        except Exception as e:
+            error_msg = self._("Error locating image: {}").format(str(e))
+            self._log_protocol_action('A2A', 'locate_all_on_screen_error', error_msg)
+            logger.error(error_msg)
+            return {
+                'platform': platform_name,
+                'action': 'locate_all',
+                'status': 'error',
+                'error': error_msg,
+                'is_rtl': self.is_rtl
+            }
+
+    async def detect_screen_changes(self, region: Tuple[int, int, int, int] = None) -> Dict[str, Any]:
+        """Report the regions that changed since the previous call for this region, from any tool instance (the first call reports a full change)"""
+        platform_name = self.platform_info.get('name') or self.platform_info.get('platform') or 'unknown'
+        try:
+            self._log_protocol_action('A2A', 'detect_screen_changes', {'region': region})
+            self._log_protocol_action('MCP', 'detect_screen_changes', {'region': region})
+            frame = self.matcher.capture(region)
+            diff = _change_state.update(frame, self.matcher.origin(region))
+            result = {
+                'platform': platform_name,
+                'action': 'detect_changes',
+                'status': 'success',
+                **diff.to_dict(),
+                'is_rtl': self.is_rtl
+            }
+            self._log_protocol_action('SmolAgents', 'detect_screen_changes', result)
+            return result
+        except Exception as e:
+            error_msg = self._("Error detecting screen changes: {}").format(str(e))
+            self._log_protocol_action('A2A', 'detect_screen_changes_error', error_msg)
+            logger.error(error_msg)
+            return {
+                'platform': platform_name,
+                'action': 'detect_changes',
+                'status': 'error',
+                'error': error_msg,
+                'is_rtl': self.is_rtl
+            }
+
     async def check_screen_availability(self) -> bool:
         """Check if screen control is available"""
         try:
@@ -254,6 +358,10 @@ class ScreenControlTool(BaseTool):
         elif action == 'locate_on_screen':
             image_path = args.get('image_path')
             confidence = args.get('confidence', 0.9)
-            return await self.locate_on_screen(image_path, confidence)
+            return await self.locate_on_screen(image_path, confidence, args.get('region'))
+        elif action == 'detect_changes':
+            return await self.detect_screen_changes(args.get('region'))
+        elif action == 'locate_all_on_screen':
+            return await self.locate_all_on_screen(args.get('image_paths', []), args.get('confidence', 0.9), args.get('region'))
         else:
             return {'error': f'Unknown action: {action}'} 
\ No newline at end of file
@@ -35,7 +35,6 @@ class SearchTool(BaseTool):
         self._max_results = config.get('max_results', 10)
         self._cache_duration = config.get('cache_duration', 3600)  # 1 hour
         self._max_requests = config.get('max_requests', 100)  # per hour
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Search cache
         self._session = None
@@ -70,7 +69,6 @@ class SearchTool(BaseTool):
                 self._session = None
             
             self._cache = {}
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up SearchTool: {e}")
@@ -134,21 +132,6 @@ class SearchTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _get_cache_key(self, operation: str, **kwargs) -> str:
         """Generate a cache key for search operation.
         
@@ -451,7 +434,7 @@ class SearchTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -464,7 +447,7 @@ class SearchTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
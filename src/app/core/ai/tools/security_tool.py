@@ -9,7 +9,6 @@ This tool provides security operations while following:
 
 import logging
 import asyncio
-import time
 import hashlib
 import hmac
 import base64
@@ -17,6 +16,8 @@ import secrets
 import re
 from typing import Dict, Any, List, Optional, Union, Tuple
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core import crypto_batch
+from src.app.core.crypto_batch import CryptoPool
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +40,11 @@ class SecurityTool(BaseTool):
         self._hash_algorithm = config.get('hash_algorithm', 'sha256')
         self._salt_length = config.get('salt_length', 16)
         self._token_length = config.get('token_length', 32)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
+        self._kdf = config.get('kdf', 'pbkdf2_sha256')
+        self._kdf_cost = config.get('kdf_cost', {})
+        self._offload_threshold = config.get('offload_threshold', 64 * 1024)
+        self._pool = CryptoPool(config.get('crypto_workers'))
     
     async def initialize(self) -> bool:
         """Initialize the tool.
@@ -53,6 +57,9 @@ class SecurityTool(BaseTool):
             if self._hash_algorithm not in hashlib.algorithms_available:
                 logger.error(f"Invalid hash algorithm: {self._hash_algorithm}")
                 return False
+            if self._kdf not in crypto_batch.DEFAULT_COSTS:
+                logger.error(f"Invalid key derivation function: {self._kdf}")
+                return False
             return await super().initialize()
         except Exception as e:
             logger.error(f"Failed to initialize SecurityTool: {e}")
@@ -61,7 +68,7 @@ class SecurityTool(BaseTool):
     async def cleanup(self) -> None:
         """Clean up resources used by the tool."""
         try:
-            self._operation_history = []
+            self._pool.shutdown(wait=False)
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up SecurityTool: {e}")
@@ -80,6 +87,12 @@ class SecurityTool(BaseTool):
             'decrypt': True,
             'generate_token': True,
             'validate_password': True,
+            'hash_batch': True,
+            'verify_integrity': True,
+            'hash_password': True,
+            'verify_password': True,
+            'migrate_credentials': True,
+            'benchmark': True,
             'history': True
         }
         return {**base_capabilities, **tool_capabilities}
@@ -97,6 +110,9 @@ class SecurityTool(BaseTool):
             'hash_algorithm': self._hash_algorithm,
             'salt_length': self._salt_length,
             'token_length': self._token_length,
+            'kdf': self._kdf,
+            'kdf_cost': crypto_batch.DEFAULT_COSTS.get(self._kdf, {}) | self._kdf_cost,
+            'crypto_workers': self._pool.max_workers,
             'history_size': len(self._operation_history),
             'max_history': self._max_history
         }
@@ -124,6 +140,18 @@ class SecurityTool(BaseTool):
             return await self._generate_token(args)
         elif command == 'validate_password':
             return await self._validate_password(args)
+        elif command == 'hash_batch':
+            return await self._hash_batch(args)
+        elif command == 'verify_integrity':
+            return await self._verify_integrity(args)
+        elif command == 'hash_password':
+            return await self._hash_password(args)
+        elif command == 'verify_password':
+            return await self._verify_password(args)
+        elif command == 'migrate_credentials':
+            return await self._migrate_credentials(args)
+        elif command == 'benchmark':
+            return await self._benchmark(args)
         elif command == 'get_history':
             return await self._get_history()
         elif command == 'clear_history':
@@ -131,21 +159,6 @@ class SecurityTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     async def _hash(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Hash data with specified algorithm.
         
@@ -175,11 +188,11 @@ class SecurityTool(BaseTool):
             if not salt:
                 salt = secrets.token_bytes(self._salt_length)
             
-            # Hash data
-            hash_obj = hashlib.new(algorithm)
-            hash_obj.update(salt)
-            hash_obj.update(data.encode() if isinstance(data, str) else data)
-            hash_value = hash_obj.hexdigest()
+            # Hash data; large payloads are hashed off the event loop
+            if len(data) >= self._offload_threshold:
+                hash_value = await self._pool.run(crypto_batch.digest, data, algorithm, salt)
+            else:
+                hash_value = crypto_batch.digest(data, algorithm, salt)
             
             self._add_to_history('hash', {
                 'algorithm': algorithm,
@@ -223,13 +236,11 @@ class SecurityTool(BaseTool):
                     'error': f'Invalid hash algorithm: {algorithm}'
                 }
             
-            # Generate HMAC
-            hmac_obj = hmac.new(
-                key.encode() if isinstance(key, str) else key,
-                data.encode() if isinstance(data, str) else data,
-                getattr(hashlib, algorithm)
-            )
-            hmac_value = hmac_obj.hexdigest()
+            # Generate HMAC; large payloads are hashed off the event loop
+            if len(data) >= self._offload_threshold:
+                hmac_value = await self._pool.run(crypto_batch.hmac_digest, key, data, algorithm)
+            else:
+                hmac_value = crypto_batch.hmac_digest(key, data, algorithm)
             
             self._add_to_history('hmac', {
                 'algorithm': algorithm,
@@ -378,6 +389,231 @@ class SecurityTool(BaseTool):
             logger.error(f"Error validating password: {e}")
             return {'error': str(e)}
     
+    async def _hash_batch(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Hash (or HMAC) many payloads and files in parallel.
+        
+        Args:
+            args: Batch arguments ('items': data strings/bytes or
+                {'data': ...} / {'path': ...} entries; optional 'algorithm',
+                'key' for HMAC and 'salt' in base64)
+            
+        Returns:
+            Dict[str, Any]: Per-item hashes or errors, in input order
+        """
+        try:
+            if not args or 'items' not in args:
+                return {'error': 'Missing required arguments'}
+            
+            algorithm = args.get('algorithm', self._hash_algorithm)
+            key = args.get('key')
+            salt = base64.b64decode(args['salt']) if args.get('salt') else b''
+            try:
+                crypto_batch.check_algorithm(algorithm)
+            except ValueError as e:
+                return {'status': 'error', 'action': 'hash_batch', 'error': str(e)}
+            
+            results = await self._pool.map(crypto_batch.hash_item,
+                                           [((item, algorithm, key, salt), {}) for item in args['items']])
+            
+            self._add_to_history('hash_batch', {
+                'algorithm': algorithm,
+                'items': len(results),
+                'hmac': key is not None
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'hash_batch',
+                'algorithm': algorithm,
+                'results': [{'hash': value} if ok else {'error': value} for ok, value in results]
+            }
+        except Exception as e:
+            logger.error(f"Error hashing batch: {e}")
+            return {'error': str(e)}
+    
+    async def _verify_integrity(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Check files against expected digests in parallel.
+        
+        Args:
+            args: Verification arguments ('items': [{'path', 'expected'}],
+                optional 'algorithm')
+            
+        Returns:
+            Dict[str, Any]: Per-file result and the number of mismatches
+        """
+        try:
+            if not args or 'items' not in args:
+                return {'error': 'Missing required arguments'}
+            
+            algorithm = args.get('algorithm', self._hash_algorithm)
+            try:
+                crypto_batch.check_algorithm(algorithm)
+            except ValueError as e:
+                return {'status': 'error', 'action': 'verify_integrity', 'error': str(e)}
+            
+            items = args['items']
+            outcomes = await self._pool.map(crypto_batch.file_digest,
+                                            [((item['path'], algorithm), {}) for item in items])
+            results = []
+            for item, (ok, value) in zip(items, outcomes):
+                if ok:
+                    valid = hmac.compare_digest(value, str(item.get('expected', '')).lower())
+                    results.append({'path': item['path'], 'valid': valid, 'hash': value})
+                else:
+                    results.append({'path': item['path'], 'valid': False, 'error': value})
+            failed = sum(not result['valid'] for result in results)
+            
+            self._add_to_history('verify_integrity', {
+                'algorithm': algorithm,
+                'files': len(results),
+                'failed': failed
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'verify_integrity',
+                'algorithm': algorithm,
+                'results': results,
+                'failed': failed
+            }
+        except Exception as e:
+            logger.error(f"Error verifying integrity: {e}")
+            return {'error': str(e)}
+    
+    async def _hash_password(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Hash one or many passwords with a key derivation function on the process pool.
+        
+        Args:
+            args: 'password' or 'passwords', optional 'kdf' and 'cost'
+            
+        Returns:
+            Dict[str, Any]: Encoded hash(es)
+        """
+        try:
+            if not args or ('password' not in args and 'passwords' not in args):
+                return {'error': 'Missing required arguments'}
+            
+            kdf = args.get('kdf', self._kdf)
+            cost = {**self._kdf_cost, **args.get('cost', {})}
+            passwords = args['passwords'] if 'passwords' in args else [args['password']]
+            outcomes = await self._pool.map(crypto_batch.hash_password,
+                                            [((password, kdf, cost), {}) for password in passwords],
+                                            processes=True)
+            hashes = [value if ok else {'error': value} for ok, value in outcomes]
+            
+            self._add_to_history('hash_password', {
+                'kdf': kdf,
+                'count': len(hashes)
+            })
+            
+            result = {
+                'status': 'success',
+                'action': 'hash_password',
+                'kdf': kdf
+            }
+            if 'passwords' in args:
+                result['hashes'] = hashes
+            else:
+                result['hash'] = hashes[0]
+            return result
+        except Exception as e:
+            logger.error(f"Error hashing password: {e}")
+            return {'error': str(e)}
+    
+    async def _verify_password(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Verify a password against an encoded hash.
+        
+        Args:
+            args: 'password' and 'hash'
+            
+        Returns:
+            Dict[str, Any]: Whether it matches and whether the hash should be upgraded
+        """
+        try:
+            if not args or 'password' not in args or 'hash' not in args:
+                return {'error': 'Missing required arguments'}
+            
+            valid = await self._pool.run(crypto_batch.verify_password, args['password'], args['hash'],
+                                         processes=True)
+            
+            self._add_to_history('verify_password', {
+                'valid': valid
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'verify_password',
+                'valid': valid,
+                'needs_rehash': crypto_batch.needs_rehash(args['hash'], self._kdf, self._kdf_cost)
+            }
+        except Exception as e:
+            logger.error(f"Error verifying password: {e}")
+            return {'error': str(e)}
+    
+    async def _migrate_credentials(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Verify and re-hash stored credentials with the configured KDF, on the process pool.
+        
+        Args:
+            args: 'items': [{'password', 'record'}] where record is an
+                encoded hash {'hash'} or a legacy salted digest
+                {'algorithm', 'salt', 'hash'}; optional 'kdf' and 'cost'
+            
+        Returns:
+            Dict[str, Any]: Per-item outcome and counts
+        """
+        try:
+            if not args or 'items' not in args:
+                return {'error': 'Missing required arguments'}
+            
+            kdf = args.get('kdf', self._kdf)
+            cost = {**self._kdf_cost, **args.get('cost', {})}
+            outcomes = await self._pool.map(
+                crypto_batch.migrate_credential,
+                [((item['password'], item['record'], kdf, cost), {}) for item in args['items']],
+                processes=True
+            )
+            results = [value if ok else {'valid': False, 'rehashed': False, 'error': value} for ok, value in outcomes]
+            
+            self._add_to_history('migrate_credentials', {
+                'kdf': kdf,
+                'count': len(results),
+                'rehashed': sum(result['rehashed'] for result in results)
+            })
+            
+            return {
+                'status': 'success',
+                'action': 'migrate_credentials',
+                'kdf': kdf,
+                'results': results,
+                'rehashed': sum(result['rehashed'] for result in results),
+                'invalid': sum(not result['valid'] for result in results)
+            }
+        except Exception as e:
+            logger.error(f"Error migrating credentials: {e}")
+            return {'error': str(e)}
+    
+    async def _benchmark(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Measure hashing and key derivation throughput in a worker process.
+        
+        Args:
+            args: Optional 'algorithms', 'size' (bytes) and 'kdfs' (name -> cost)
+            
+        Returns:
+            Dict[str, Any]: MB/s per digest algorithm and hashes/s per KDF
+        """
+        try:
+            args = args or {}
+            results = await self._pool.run(crypto_batch.benchmark, args.get('algorithms'),
+                                           args.get('size', 8 << 20), args.get('kdfs'), processes=True)
+            return {
+                'status': 'success',
+                'action': 'benchmark',
+                **results
+            }
+        except Exception as e:
+            logger.error(f"Error running benchmark: {e}")
+            return {'error': str(e)}
+    
     async def _get_history(self) -> Dict[str, Any]:
         """Get operation history.
         
@@ -388,7 +624,7 @@ class SecurityTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -401,7 +637,7 @@ class SecurityTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -9,10 +9,10 @@ import logging
 import asyncio
 import time
 import re
-import unicodedata
 import json
 from typing import Dict, Any, List, Optional, Union, Tuple
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core import language_id, text_engine
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,6 @@ class TextTool(BaseTool):
         )
         self._max_text_length = config.get('max_text_length', 1000000)  # 1M characters
         self._allowed_languages = config.get('allowed_languages', ['en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'zh', 'ja', 'ko'])
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Text cache
         self._cache_duration = config.get('cache_duration', 3600)  # 1 hour
@@ -56,7 +55,6 @@ class TextTool(BaseTool):
         """Clean up resources used by the tool."""
         try:
             self._cache = {}
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up TextTool: {e}")
@@ -120,6 +118,10 @@ class TextTool(BaseTool):
                 return self._extract_pattern(**kwargs)
             elif action == "analyze_text":
                 return self._analyze_text(**kwargs)
+            elif action == "process_chain":
+                return self._process_chain(**kwargs)
+            elif action == "batch":
+                return await self._batch(**kwargs)
             else:
                 return self.handle_error(ValueError(f"Unknown action: {action}"))
                 
@@ -137,7 +139,9 @@ class TextTool(BaseTool):
             "format_text": "Format text according to specified rules",
             "parse_json": "Parse JSON text into a Python object",
             "extract_pattern": "Extract text matching a pattern",
-            "analyze_text": "Analyze text for various metrics"
+            "analyze_text": "Analyze text for various metrics",
+            "process_chain": "Run a chain of operations (clean, normalize, tokenize, keywords, ...) in one pass",
+            "batch": "Run an operation chain over many documents in parallel"
         }
     
     def _format_text(self, text: str, case: str = "lower", strip: bool = True, 
@@ -187,7 +191,7 @@ class TextTool(BaseTool):
     def _extract_pattern(self, text: str, pattern: str, flags: int = 0, **kwargs) -> Dict[str, Any]:
         """Extract text matching a pattern."""
         try:
-            matches = re.finditer(pattern, text, flags)
+            matches = text_engine.compile_pattern(pattern, flags).finditer(text)
             results = []
             for match in matches:
                 results.append({
@@ -207,53 +211,31 @@ class TextTool(BaseTool):
     def _analyze_text(self, text: str, **kwargs) -> Dict[str, Any]:
         """Analyze text for various metrics."""
         try:
-            # Basic metrics
-            words = text.split()
-            sentences = re.split(r'[.!?]+', text)
-            paragraphs = text.split('\n\n')
-            
-            # Character analysis
-            char_count = len(text)
-            word_count = len(words)
-            sentence_count = len([s for s in sentences if s.strip()])
-            paragraph_count = len([p for p in paragraphs if p.strip()])
-            
-            # Word length analysis
-            word_lengths = [len(word) for word in words]
-            avg_word_length = sum(word_lengths) / len(word_lengths) if word_lengths else 0
-            
-            # Character frequency
-            char_freq = {}
-            for char in text:
-                char_freq[char] = char_freq.get(char, 0) + 1
-            
+            return text_engine.analyze(text)
+        except Exception as e:
+            return self.handle_error(e)
+    
+    def _process_chain(self, text: str, steps: List[str], **kwargs) -> Dict[str, Any]:
+        """Run a chain of operations on one text without intermediate copies."""
+        try:
             return {
-                "metrics": {
-                    "characters": char_count,
-                    "words": word_count,
-                    "sentences": sentence_count,
-                    "paragraphs": paragraph_count,
-                    "avg_word_length": avg_word_length
-                },
-                "character_frequency": char_freq
+                "steps": list(steps),
+                "result": text_engine.pipeline(tuple(steps)).run(text)
             }
         except Exception as e:
             return self.handle_error(e)
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
+    async def _batch(self, texts: List[str], steps: Optional[List[str]] = None,
+                     max_workers: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        """Run an operation chain over many documents on a process pool, off the event loop."""
+        try:
+            results = await asyncio.to_thread(text_engine.run_batch, texts, steps or ["analyze"], max_workers=max_workers)
+            return {
+                "results": results,
+                "count": len(results)
+            }
+        except Exception as e:
+            return self.handle_error(e)
     
     def _get_cache_key(self, text: str, operation: str, **kwargs) -> str:
         """Generate a cache key for text data.
@@ -328,46 +310,20 @@ class TextTool(BaseTool):
             
             # Process text
             if operation == 'clean':
-                # Remove extra whitespace
-                cleaned_text = re.sub(r'\s+', ' ', text.strip())
-                # Remove special characters
-                cleaned_text = re.sub(r'[^\w\s]', '', cleaned_text)
-                processed_data = cleaned_text
+                # Collapse whitespace and remove special characters
+                processed_data = text_engine.clean(text)
             
             elif operation == 'normalize':
-                # Normalize unicode characters
-                normalized_text = unicodedata.normalize('NFKC', text)
-                # Convert to lowercase
-                normalized_text = normalized_text.lower()
-                processed_data = normalized_text
+                # Normalize unicode characters and convert to lowercase
+                processed_data = text_engine.normalize(text)
             
             elif operation == 'tokenize':
-                # Split into words
-                tokens = text.split()
-                # Remove punctuation
-                tokens = [re.sub(r'[^\w\s]', '', token) for token in tokens]
-                # Remove empty tokens
-                tokens = [token for token in tokens if token]
-                processed_data = tokens
+                # Split into words without punctuation
+                processed_data = text_engine.tokenize(text)
             
             elif operation == 'detect_language':
-                # Simple language detection based on character frequency
-                # This is a basic implementation - in production, use a proper language detection library
-                char_freq = {}
-                for char in text.lower():
-                    if char.isalpha():
-                        char_freq[char] = char_freq.get(char, 0) + 1
-                
-                # Calculate language scores based on character frequency
-                language_scores = {}
-                for lang in self._allowed_languages:
-                    score = 0
-                    # Add language-specific scoring logic here
-                    language_scores[lang] = score
-                
-                # Get the language with the highest score
-                detected_language = max(language_scores.items(), key=lambda x: x[1])[0]
-                processed_data = detected_language
+                # Unicode-block histogram plus character n-gram model (shared engine)
+                processed_data = language_id.detect_language(text)
             
             elif operation == 'translate':
                 target_language = kwargs.get('target_language')
@@ -396,22 +352,12 @@ class TextTool(BaseTool):
             elif operation == 'summarize':
                 # Simple summarization by taking the first sentence
                 # This is a basic implementation - in production, use a proper summarization algorithm
-                sentences = re.split(r'[.!?]+', text)
-                summary = sentences[0].strip() if sentences else ''
-                processed_data = summary
+                processed_data = text_engine.summarize(text)
             
             elif operation == 'extract_keywords':
                 # Simple keyword extraction based on word frequency
                 # This is a basic implementation - in production, use a proper keyword extraction algorithm
-                words = text.lower().split()
-                word_freq = {}
-                for word in words:
-                    if len(word) > 3:  # Ignore short words
-                        word_freq[word] = word_freq.get(word, 0) + 1
-                
-                # Get the most frequent words
-                keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
-                processed_data = [word for word, _ in keywords]
+                processed_data = text_engine.keywords(text)
             
             # Cache result
             self._cache[cache_key] = {
@@ -636,7 +582,7 @@ class TextTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -649,7 +595,7 @@ class TextTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -2,43 +2,115 @@
 Tool Registry for Labeeb AI system.
 
 This module provides the ToolRegistry class for managing all available tools.
+Tools can be registered eagerly with a class, or lazily with a module path so
+that the tool module (and its heavy dependencies) is only imported on first use.
 """
-from typing import Dict, Type, Optional
+import logging
+import threading
+from typing import Dict, List, Tuple, Type, Optional
 from .base_tool import BaseTool
+from src.app.core.lazy_import import import_attribute
+
+logger = logging.getLogger(__name__)
 
 class ToolRegistry:
     """Registry for all available tools."""
-    
+
     _tools: Dict[str, Type[BaseTool]] = {}
-    
+    _deferred: Dict[str, Tuple[str, str]] = {}
+    _lock = threading.RLock()
+
     @classmethod
     def register(cls, tool_class: Type[BaseTool]) -> None:
         """Register a tool class.
-        
+
         Args:
             tool_class: Tool class to register
         """
         # Instantiate the tool to get its name
         tool_instance = tool_class()
-        cls._tools[tool_instance.name] = tool_class
-    
+        with cls._lock:
+            cls._deferred.pop(tool_instance.name, None)
+            cls._tools[tool_instance.name] = tool_class
+
+    @classmethod
+    def register_lazy(cls, tool_name: str, module_path: str, class_name: str) -> None:
+        """Register a tool whose module is imported on first use.
+
+        Args:
+            tool_name: Name the tool is looked up by
+            module_path: Fully qualified module containing the tool class
+            class_name: Name of the tool class inside the module
+        """
+        with cls._lock:
+            cls._tools.pop(tool_name, None)
+            cls._deferred[tool_name] = (module_path, class_name)
+
+    @classmethod
+    def _resolve(cls, tool_name: str) -> Optional[Type[BaseTool]]:
+        """Import a deferred tool and move it into the loaded registry."""
+        with cls._lock:
+            tool_class = cls._tools.get(tool_name)
+            if tool_class is not None:
+                return tool_class
+            target = cls._deferred.get(tool_name)
+            if target is None:
+                return None
+            module_path, class_name = target
+            try:
+                tool_class = import_attribute(module_path, class_name)
+            except ImportError as e:
+                logger.error(f"Failed to load tool '{tool_name}' from {module_path}: {e}")
+                return None
+            cls._deferred.pop(tool_name, None)
+            cls._tools[tool_name] = tool_class
+            logger.debug(f"Loaded deferred tool '{tool_name}' from {module_path}")
+            return tool_class
+
     @classmethod
     def get_tool(cls, tool_name: str) -> Optional[Type[BaseTool]]:
-        """Get a tool class by name.
-        
+        """Get a tool class by name, importing it if it was registered lazily.
+
         Args:
             tool_name: Name of the tool
-            
+
         Returns:
             Optional[Type[BaseTool]]: Tool class if found, None otherwise
         """
-        return cls._tools.get(tool_name)
-    
+        tool_class = cls._tools.get(tool_name)
+        if tool_class is not None:
+            return tool_class
+        return cls._resolve(tool_name)
+
+    @classmethod
+    def is_loaded(cls, tool_name: str) -> bool:
+        """Check whether a tool's module has been imported.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            bool: True if the tool class is loaded, False if deferred or unknown
+        """
+        return tool_name in cls._tools
+
+    @classmethod
+    def list_tool_names(cls) -> List[str]:
+        """List the names of all registered tools without importing any of them.
+
+        Returns:
+            List[str]: Sorted tool names, loaded and deferred
+        """
+        with cls._lock:
+            return sorted(set(cls._tools) | set(cls._deferred))
+
     @classmethod
     def get_all_tools(cls) -> Dict[str, Type[BaseTool]]:
-        """Get all registered tools.
-        
+        """Get all registered tools, importing any deferred ones.
+
         Returns:
             Dict[str, Type[BaseTool]]: Dictionary of tool names to tool classes
         """
-        return cls._tools.copy() 
\ No newline at end of file
+        for tool_name in list(cls._deferred):
+            cls._resolve(tool_name)
+        return cls._tools.copy()
@@ -37,7 +37,6 @@ class TranslationTool(BaseTool):
         self._cache_duration = config.get('cache_duration', 3600)  # 1 hour
         self._max_requests = config.get('max_requests', 100)  # per minute
         self._max_text_length = config.get('max_text_length', 5000)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Translation cache
         self._request_times = []  # Request rate limiting
@@ -68,7 +67,6 @@ class TranslationTool(BaseTool):
         try:
             self._cache = {}
             self._request_times = []
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up TranslationTool: {e}")
@@ -131,21 +129,6 @@ class TranslationTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _check_rate_limit(self) -> bool:
         """Check if the rate limit has been exceeded.
         
@@ -393,7 +376,7 @@ class TranslationTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -406,7 +389,7 @@ class TranslationTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
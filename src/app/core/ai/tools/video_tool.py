@@ -11,10 +11,13 @@ import logging
 import asyncio
 import time
 import io
-import cv2
-import numpy as np
 from typing import Dict, Any, List, Optional, Union, Tuple
 from labeeb.core.ai.tool_base import BaseTool
+from src.app.core.lazy_import import lazy_import
+
+# OpenCV and NumPy are only imported once a video operation actually runs
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +40,6 @@ class VideoTool(BaseTool):
         self._allowed_formats = config.get('allowed_formats', ['MP4', 'AVI', 'MOV', 'MKV'])
         self._max_resolution = config.get('max_resolution', (3840, 2160))  # 4K
         self._max_fps = config.get('max_fps', 60)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Video cache
         self._cache_duration = config.get('cache_duration', 3600)  # 1 hour
@@ -61,7 +63,6 @@ class VideoTool(BaseTool):
         """Clean up resources used by the tool."""
         try:
             self._cache = {}
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up VideoTool: {e}")
@@ -136,21 +137,6 @@ class VideoTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _get_cache_key(self, video_data: bytes, operation: str, **kwargs) -> str:
         """Generate a cache key for video data.
         
@@ -647,7 +633,7 @@ class VideoTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -660,7 +646,7 @@ class VideoTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -1,36 +1,96 @@
-import torch
 from PIL import Image
-from transformers import AutoProcessor, AutoModelForVision2Seq
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
+import threading
+import numpy as np
 from src.app.core.ai.tool_base import BaseTool
+from src.app.core.ai.models.vision.processor import VisionProcessor
+from src.app.core.vision.screen_change import ScreenChangeTracker
+from src.app.core.vision.screen_matcher import ScreenMatcher
 import logging
 import pyautogui
-import tempfile
 
 logger = logging.getLogger(__name__)
 
+class _ScreenState:
+    """
+    Screen-analysis state shared by every VisionTool (tools are created per call).
+
+    Per captured view (origin and size) there is one change tracker; per
+    prompt and view, the base description and a tile mask of everything
+    that changed since the frame it describes.
+    """
+
+    def __init__(self, cache_size: int = 64, max_views: int = 16):
+        self.lock = threading.Lock()
+        self.cache_size = cache_size
+        self.max_views = max_views
+        self.vision = VisionProcessor(max_new_tokens=500)
+        self.trackers: "OrderedDict[tuple, ScreenChangeTracker]" = OrderedDict()
+        self.bases: "OrderedDict[tuple, _BaseDescription]" = OrderedDict()
+        self.descriptions: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    def tracker(self, view: tuple) -> ScreenChangeTracker:
+        tracker = self.trackers.get(view)
+        if tracker is None:
+            tracker = self.trackers[view] = ScreenChangeTracker()
+            if len(self.trackers) > self.max_views:
+                stale, _ = self.trackers.popitem(last=False)
+                for key in [key for key in self.bases if key[1] == stale]:
+                    del self.bases[key]
+        self.trackers.move_to_end(view)
+        return tracker
+
+    def set_base(self, key: tuple, description: str, mask: np.ndarray) -> None:
+        self.bases[key] = _BaseDescription(description, np.zeros_like(mask))
+        self.bases.move_to_end(key)
+        while len(self.bases) > self.cache_size:
+            self.bases.popitem(last=False)
+
+    def cached(self, key: Tuple[str, str]) -> Optional[str]:
+        text = self.descriptions.get(key)
+        if text is not None:
+            self.descriptions.move_to_end(key)
+        return text
+
+    def cache(self, key: Tuple[str, str], text: str) -> None:
+        self.descriptions[key] = text
+        self.descriptions.move_to_end(key)
+        while len(self.descriptions) > self.cache_size:
+            self.descriptions.popitem(last=False)
+
+class _BaseDescription:
+    """Description of a full frame and the tiles changed since it was captured."""
+
+    __slots__ = ('description', 'dirty')
+
+    def __init__(self, description: str, dirty: np.ndarray):
+        self.description = description
+        self.dirty = dirty
+
+_screen_state = _ScreenState()
+
 class VisionTool(BaseTool):
     """
     VisionTool for Labeeb using SmolVLM-256M. All processing is 100% local.
     Do not send any data to the internet unless explicitly requested by the user.
+
+    The model is the process-wide one shared with VisionProcessor, loaded on
+    first use, so creating a tool does not load weights.
+
+    Screen analysis tracks changes between captures: an unchanged screen reuses
+    the previous description, and a partly changed screen only runs the model
+    on the regions changed since the last full description (descriptions are
+    cached by region content). Tracking state is process-wide, so it carries
+    over between tool instances.
     """
+    # Above this fraction of tiles changed since the last full description, the whole screen is re-described
+    full_refresh_fraction = 0.4
+
     def __init__(self):
         super().__init__(name="vision", description="Local vision-language tool using SmolVLM-256M.")
-        self._init_model()
-
-    def _init_model(self):
-        try:
-            self.processor = AutoProcessor.from_pretrained("HuggingFaceTB/SmolVLM-256M-Instruct")
-            self.model = AutoModelForVision2Seq.from_pretrained(
-                "HuggingFaceTB/SmolVLM-256M-Instruct",
-                torch_dtype=torch.bfloat16
-            )
-            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-            self.model = self.model.to(self.device)
-            logger.info("SmolVLM-256M loaded locally on %s", self.device)
-        except Exception as e:
-            logger.error(f"Failed to load SmolVLM-256M: {e}")
-            raise
+        self.vision = _screen_state.vision
+        self.matcher = ScreenMatcher()
 
     def analyze_image(self, image_path: str, prompt: Optional[str] = None) -> str:
         """
@@ -41,45 +101,92 @@ class VisionTool(BaseTool):
         Returns:
             str: Model's description/caption
         """
-        if prompt is None:
-            prompt = "Can you describe this image?"
-        # Ensure the prompt includes <image> for each image
-        if '<image>' not in prompt:
-            prompt = prompt.strip() + ' <image>'
         try:
-            image = Image.open(image_path)
-            inputs = self.processor(
-                text=prompt,
-                images=[image],
-                return_tensors="pt"
-            ).to(self.device)
-            with torch.no_grad():
-                generated_ids = self.model.generate(**inputs, max_new_tokens=500)
-            return self.processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
+            return self._describe(Image.open(image_path), prompt)
         except Exception as e:
             logger.error(f"VisionTool failed to analyze image: {e}")
             return f"[VisionTool error: {e}]"
 
+    def analyze_screen(self, prompt: Optional[str] = None, region: Optional[Tuple[int, int, int, int]] = None) -> dict:
+        """
+        Describe the screen, skipping the model for content that has not changed.
+
+        Args:
+            prompt: Optional prompt/question for the model
+            region: Optional (left, top, width, height) to analyze instead of the whole screen
+
+        Returns:
+            dict: 'result' description, 'cached' flag and per-region 'changes'
+
+        Raises:
+            Exception: If the model fails; nothing is cached then
+        """
+        frame = self.matcher.capture(region)
+        origin = self.matcher.origin(region)
+        prompt_key = prompt or ""
+        view = (origin, frame.shape[:2])
+        state = _screen_state
+        with state.lock:
+            tracker = state.tracker(view)
+            diff = tracker.update(frame, origin)
+            # Every description of this view is now stale where this frame changed
+            for (_, base_view), base in state.bases.items():
+                if base_view == view:
+                    base.dirty |= diff.mask
+            screen_key = (prompt_key, tracker.digest())
+            cached = state.cached(screen_key)
+            if cached is not None:
+                return {"result": cached, "cached": True, "changes": []}
+
+            base = state.bases.get((prompt_key, view))
+            if base is None or base.dirty.mean() > self.full_refresh_fraction:
+                description = self._describe(_frame_to_image(frame), prompt)
+                state.set_base((prompt_key, view), description, diff.mask)
+                state.cache(screen_key, description)
+                return {"result": description, "cached": False, "changes": []}
+
+            changes = []
+            for left, top, width, height in tracker.regions(base.dirty):
+                region_key = (prompt_key, tracker.digest((left, top, width, height)))
+                text = state.cached(region_key)
+                if text is None:
+                    x, y = left - origin[0], top - origin[1]
+                    text = self._describe(_frame_to_image(frame[y:y + height, x:x + width]), prompt)
+                    state.cache(region_key, text)
+                changes.append({"region": {"left": left, "top": top, "width": width, "height": height}, "description": text})
+            description = "\n".join([base.description] + [
+                f"Changed region at ({c['region']['left']}, {c['region']['top']}): {c['description']}" for c in changes
+            ])
+            state.cache(screen_key, description)
+            return {"result": description, "cached": False, "changes": changes}
+
+    def _describe(self, image: Image.Image, prompt: Optional[str] = None) -> str:
+        """Run the shared model on a PIL image; errors propagate so they are never cached."""
+        return self.vision.describe_image(image, prompt or "Can you describe this image?").description
+
     async def _execute_command(self, action: str, args: dict) -> dict:
         if action == "analyze_image":
             image_path = args.get("image_path")
             prompt = args.get("prompt")
             filename = args.get("filename")
             if not image_path:
+                if not filename:
+                    try:
+                        return self.analyze_screen(prompt, args.get("region"))
+                    except Exception as e:
+                        return {"error": str(e)}
                 # Take screenshot using pyautogui
-                if filename:
-                    screenshot = pyautogui.screenshot()
-                    screenshot.save(filename)
-                    image_path = filename
-                else:
-                    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                        screenshot = pyautogui.screenshot()
-                        screenshot.save(tmp.name)
-                        image_path = tmp.name
+                screenshot = pyautogui.screenshot()
+                screenshot.save(filename)
+                image_path = filename
             try:
                 result = self.analyze_image(image_path, prompt)
                 return {"result": result, "image_path": image_path}
             except Exception as e:
                 return {"error": str(e), "image_path": image_path}
         else:
-            return {"error": f"Unknown action: {action}"} 
\ No newline at end of file
+            return {"error": f"Unknown action: {action}"}
+
+def _frame_to_image(frame: np.ndarray) -> Image.Image:
+    """Convert a BGRA capture (or a crop of one) to an RGB PIL image."""
+    return Image.fromarray(np.ascontiguousarray(frame[..., 2::-1]))
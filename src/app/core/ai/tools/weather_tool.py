@@ -38,7 +38,6 @@ class WeatherTool(BaseTool):
         self._language = config.get('language', 'en')
         self._cache_duration = config.get('cache_duration', 300)  # 5 minutes
         self._max_requests = config.get('max_requests', 60)  # per minute
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._cache = {}  # Weather data cache
         self._request_times = []  # Request rate limiting
@@ -69,7 +68,6 @@ class WeatherTool(BaseTool):
         try:
             self._cache = {}
             self._request_times = []
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up WeatherTool: {e}")
@@ -134,21 +132,6 @@ class WeatherTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     def _check_rate_limit(self) -> bool:
         """Check if the rate limit has been exceeded.
         
@@ -449,7 +432,7 @@ class WeatherTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -462,7 +445,7 @@ class WeatherTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
@@ -10,7 +10,6 @@ This tool provides web searching capabilities while following:
 import logging
 import asyncio
 import aiohttp
-import time
 from typing import Dict, Any, List, Optional, Union
 from src.app.core.ai.tool_base import BaseTool
 
@@ -34,7 +33,6 @@ class WebSearchingTool(BaseTool):
         self._search_engine = config.get('search_engine', 'google')
         self._max_results = config.get('max_results', 10)
         self._timeout = config.get('timeout', 30)
-        self._operation_history = []
         self._max_history = config.get('max_history', 100)
         self._session = None
     
@@ -71,7 +69,6 @@ class WebSearchingTool(BaseTool):
                 await self._session.close()
                 self._session = None
             
-            self._operation_history = []
             await super().cleanup()
         except Exception as e:
             logger.error(f"Error cleaning up WebSearchingTool: {e}")
@@ -130,21 +127,6 @@ class WebSearchingTool(BaseTool):
         else:
             return {'error': f'Unknown command: {command}'}
     
-    def _add_to_history(self, operation: str, details: Dict[str, Any]) -> None:
-        """Add an operation to history.
-        
-        Args:
-            operation: Operation performed
-            details: Operation details
-        """
-        self._operation_history.append({
-            'operation': operation,
-            'details': details,
-            'timestamp': time.time()
-        })
-        if len(self._operation_history) > self._max_history:
-            self._operation_history.pop(0)
-    
     async def _perform_search(self, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Perform a web search.
         
@@ -386,7 +368,7 @@ class WebSearchingTool(BaseTool):
             return {
                 'status': 'success',
                 'action': 'get_history',
-                'history': self._operation_history
+                'history': self._operation_history.to_list()
             }
         except Exception as e:
             logger.error(f"Error getting history: {e}")
@@ -399,7 +381,7 @@ class WebSearchingTool(BaseTool):
             Dict[str, Any]: Result of clearing history
         """
         try:
-            self._operation_history = []
+            self._operation_history.clear()
             return {
                 'status': 'success',
                 'action': 'clear_history'
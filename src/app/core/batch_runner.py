@@ -0,0 +1,218 @@
+"""Batch command execution.
+
+Runs a file (or stdin) of commands through a shared agent. Commands are planned
+once per distinct command text (plans are cached), then executed on a bounded
+thread pool. Commands whose plans use tools that drive the UI or mutate shared
+state (keyboard, mouse, screen, clipboard, apps) run on a single ordered lane
+so they never interleave; everything else runs concurrently. One JSON line is
+written per command as soon as it finishes; totals and commands/sec are
+returned in a BatchSummary.
+"""
+
+import sys
+import json
+import time
+import queue
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO
+
+logger = logging.getLogger(__name__)
+
+# Tools that must not run concurrently with each other: they drive the UI or
+# mutate shared state, so commands using them keep their file order.
+SERIAL_TOOLS: Set[str] = {
+    "screen_control",
+    "keyboard_input",
+    "keyboard_control",
+    "mouse",
+    "mouse_control",
+    "app_control",
+    "clipboard_tool",
+    "vision",
+    "file",
+    "file_and_document_organizer",
+    "code_path_updater",
+}
+
+
+@dataclass
+class BatchSummary:
+    """Totals for a batch run."""
+    total: int
+    succeeded: int
+    failed: int
+    elapsed: float
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed_s": round(self.elapsed, 3),
+            "commands_per_sec": round(self.commands_per_second, 1),
+        }
+
+
+def read_commands(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield commands from lines, skipping blank lines and ``#`` comments.
+
+    Args:
+        lines: Lines of a command file (or stdin)
+    """
+    for line in lines:
+        command = line.strip()
+        if command and not command.startswith("#"):
+            yield command
+
+
+class BatchRunner:
+    """Plans and executes a batch of commands with a shared agent."""
+
+    def __init__(self, agent: Any, max_workers: int = 8, plan_cache_size: int = 1024,
+                 serial_tools: Optional[Set[str]] = None):
+        """
+        Initialize the batch runner.
+
+        Args:
+            agent: Agent with async ``plan(command)`` and ``execute(plan)``
+            max_workers: Maximum number of commands executing concurrently
+            plan_cache_size: Maximum number of cached plans
+            serial_tools: Tools whose commands run on the ordered lane
+        """
+        self.agent = agent
+        self.max_workers = max(1, max_workers)
+        self.plan_cache_size = plan_cache_size
+        self.serial_tools = SERIAL_TOOLS if serial_tools is None else serial_tools
+        self._plan_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._plan_loop = asyncio.new_event_loop()
+        self._thread_loops = threading.local()
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._loops_lock = threading.Lock()
+        self.plan_cache_hits = 0
+
+    def plan(self, command: str) -> Any:
+        """
+        Plan a command, reusing the cached plan for repeated commands.
+
+        Args:
+            command: The command to plan
+
+        Returns:
+            Any: The agent's plan
+        """
+        # Only whitespace is normalized: case can matter (file names, typed text)
+        key = " ".join(command.split())
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            self._plan_cache.move_to_end(key)
+            self.plan_cache_hits += 1
+            return plan
+        plan = self._plan_loop.run_until_complete(self.agent.plan(command))
+        self._plan_cache[key] = plan
+        if len(self._plan_cache) > self.plan_cache_size:
+            self._plan_cache.popitem(last=False)
+        return plan
+
+    def is_serial(self, plan: Any) -> bool:
+        """Check whether a plan uses a tool that must stay on the ordered lane."""
+        tools = set(getattr(plan, "required_tools", None) or [])
+        for step in getattr(plan, "steps", None) or []:
+            tools.add(getattr(step, "action", None))
+            tools.update(getattr(step, "required_tools", None) or [])
+        return not tools.isdisjoint(self.serial_tools)
+
+    def run(self, commands: Iterable[str], out: Optional[TextIO] = None) -> BatchSummary:
+        """
+        Run commands and write one JSON result line per command as it finishes.
+
+        Args:
+            commands: Commands to run
+            out: Stream for JSON lines (defaults to stdout)
+
+        Returns:
+            BatchSummary: Totals and throughput
+        """
+        out = out or sys.stdout
+        start = time.perf_counter()
+        finished: "queue.SimpleQueue" = queue.SimpleQueue()
+        submitted = total = succeeded = 0
+
+        def record_result(record: Dict[str, Any]) -> None:
+            nonlocal total, succeeded
+            total += 1
+            succeeded += record["ok"]
+            self._write(out, record)
+
+        def drain(block: bool) -> None:
+            # Results are written from this thread only, as they complete
+            nonlocal submitted
+            while submitted:
+                try:
+                    future = finished.get(block=block)
+                except queue.Empty:
+                    return
+                submitted -= 1
+                record_result(future.result())
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="labeeb-batch") as pool, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="labeeb-batch-serial") as serial_lane:
+            for index, command in enumerate(commands):
+                try:
+                    plan = self.plan(command)
+                except Exception as e:
+                    record_result({"index": index, "command": command, "ok": False,
+                                   "error": f"Planning failed: {e}", "elapsed_ms": 0.0})
+                    continue
+                executor = serial_lane if self.is_serial(plan) else pool
+                executor.submit(self._execute, index, command, plan).add_done_callback(finished.put)
+                submitted += 1
+                drain(block=False)
+            drain(block=True)
+
+        summary = BatchSummary(total, succeeded, total - succeeded, time.perf_counter() - start)
+        logger.info(f"Batch finished: {summary.to_dict()}")
+        return summary
+
+    def close(self) -> None:
+        """Close the planning and worker event loops."""
+        self._plan_loop.close()
+        with self._loops_lock:
+            for loop in self._loops:
+                loop.close()
+            self._loops.clear()
+
+    def _execute(self, index: int, command: str, plan: Any) -> Dict[str, Any]:
+        """Execute one plan on the calling worker thread's event loop."""
+        loop = getattr(self._thread_loops, "loop", None)
+        if loop is None:
+            loop = self._thread_loops.loop = asyncio.new_event_loop()
+            with self._loops_lock:
+                self._loops.append(loop)
+        start = time.perf_counter()
+        record: Dict[str, Any] = {"index": index, "command": command}
+        try:
+            record["result"] = loop.run_until_complete(self.agent.execute(plan))
+            record["ok"] = True
+        except Exception as e:
+            record["ok"] = False
+            record["error"] = str(e)
+        record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return record
+
+    @staticmethod
+    def _write(out: TextIO, record: Dict[str, Any]) -> None:
+        out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        out.flush()
+
+
+__all__ = ["SERIAL_TOOLS", "BatchSummary", "BatchRunner", "read_commands"]
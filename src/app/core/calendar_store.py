@@ -0,0 +1,447 @@
+"""Indexed calendar event storage.
+
+Events are kept with pre-parsed epoch start/end times in start-sorted arrays,
+so a time-range query is two bisections plus a scan of the matching slice.
+Events longer than a week and recurring series (whose spans vary too much
+for one bisect window) are indexed the same way, in separate arrays per
+power-of-two span length.
+Recurrence instances are never stored, they are computed only for the
+window being queried and cannot be changed on their own. Title, description and
+location words are held in an inverted index for text search.
+
+Optionally everything is persisted to SQLite (one row per event, written
+through on every change and loaded in one pass on open).
+"""
+
+import json
+import math
+import re
+import sqlite3
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.app.core.language_id import normalize_arabic
+
+# Events at most this long live in the bisectable arrays; longer ones (and
+# recurring series) go to the span index, which keeps the bisect window tight
+SHORT_EVENT_SECONDS = 7 * 86400
+
+RECURRENCE_PERIODS = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+_TOKEN = re.compile(r"\w+")
+
+def to_epoch(value: str) -> float:
+    """Parse an ISO 8601 time; naive times are treated as UTC so epoch and wall-clock arithmetic agree."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def tokenize(text: str) -> Set[str]:
+    """Lower-cased word tokens of a text; Arabic is normalized so spelling variants and diacritics match."""
+    return set(_TOKEN.findall(normalize_arabic(text.lower()))) if text else set()
+
+def _text(event: Dict[str, Any]) -> str:
+    return f"{event.get('title') or ''} {event.get('description') or ''}"
+
+def _contains(text: str, words: Set[str]) -> bool:
+    """Whether every word is a prefix of some token of text."""
+    tokens = tokenize(text)
+    return all(any(token.startswith(word) for token in tokens) for word in words)
+
+class _Series:
+    """Pre-computed recurrence parameters of an event."""
+
+    __slots__ = ('period', 'delta', 'count', 'duration')
+
+    def __init__(self, recurrence: Dict[str, Any], start: float, end: float):
+        frequency = recurrence.get('frequency', 'weekly')
+        if frequency not in RECURRENCE_PERIODS:
+            raise ValueError(f"Unsupported recurrence frequency: {frequency}")
+        self.delta = RECURRENCE_PERIODS[frequency] * recurrence.get('interval', 1)
+        self.period = self.delta.total_seconds()
+        if self.period <= 0:
+            raise ValueError("Recurrence interval must be positive")
+        self.count = max(1, int(recurrence.get('count', 1)))
+        if recurrence.get('until'):
+            # Instances must start no later than 'until'
+            last = int((to_epoch(recurrence['until']) - start) // self.period) + 1
+            self.count = max(1, min(self.count, last) if 'count' in recurrence else last)
+        self.duration = end - start
+
+    def last_end(self, start: float) -> float:
+        return start + (self.count - 1) * self.period + self.duration
+
+class _SpanIndex:
+    """
+    Long events and recurring series, by the whole span they cover.
+
+    Spans are grouped into length classes (powers of two seconds), each
+    kept in start-sorted arrays. Within a class every span is shorter than
+    the class bound, so the spans overlapping a window start between the
+    window start minus that bound and the window end: one bisection per
+    class, as for short events.
+    """
+
+    def __init__(self):
+        self.spans: Dict[str, Tuple[float, float]] = {}
+        # Length class -> parallel arrays sorted by start time
+        self._classes: Dict[int, Tuple[List[float], List[str]]] = {}
+
+    @staticmethod
+    def _class(start: float, end: float) -> int:
+        return math.ceil(end - start).bit_length()
+
+    def add(self, event_id: str, start: float, end: float) -> None:
+        self.spans[event_id] = (start, end)
+        starts, ids = self._classes.setdefault(self._class(start, end), ([], []))
+        position = bisect_right(starts, start)
+        starts.insert(position, start)
+        ids.insert(position, event_id)
+
+    def discard(self, event_id: str) -> bool:
+        span = self.spans.pop(event_id, None)
+        if span is None:
+            return False
+        length_class = self._class(*span)
+        starts, ids = self._classes[length_class]
+        position = bisect_left(starts, span[0])
+        while ids[position] != event_id:
+            position += 1
+        del starts[position]
+        del ids[position]
+        if not starts:
+            del self._classes[length_class]
+        return True
+
+    def overlapping(self, window_start: float, window_end: float) -> Iterator[str]:
+        """Ids of spans overlapping the window."""
+        spans = self.spans
+        for length_class, (starts, ids) in self._classes.items():
+            lo = 0 if window_start == -math.inf else bisect_left(starts, window_start - 2 ** length_class)
+            hi = len(starts) if window_end == math.inf else bisect_right(starts, window_end)
+            for position in range(lo, hi):
+                event_id = ids[position]
+                if spans[event_id][1] >= window_start:
+                    yield event_id
+
+class _TokenIndex:
+    """Inverted index from word tokens to event ids, with prefix lookup."""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._vocabulary: Optional[List[str]] = None
+
+    def add(self, event_id: str, text: str) -> None:
+        for token in tokenize(text):
+            if token not in self._postings:
+                self._vocabulary = None
+            self._postings[token].add(event_id)
+
+    def discard(self, event_id: str, text: str) -> None:
+        for token in tokenize(text):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(event_id)
+                if not postings:
+                    del self._postings[token]
+                    self._vocabulary = None
+
+    def match(self, text: str) -> Set[str]:
+        """Ids of events containing every word of text, matching words by prefix."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        result: Optional[Set[str]] = None
+        for word in tokenize(text):
+            postings: Set[str] = set()
+            # Tokens starting with word form one contiguous run of the sorted vocabulary
+            position = bisect_left(vocabulary, word)
+            while position < len(vocabulary) and vocabulary[position].startswith(word):
+                postings |= self._postings[vocabulary[position]]
+                position += 1
+            result = postings if result is None else result & postings
+            if not result:
+                return set()
+        return result or set()
+
+class CalendarStore:
+    """Calendar events indexed by time range and text."""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: SQLite database to persist to, or None to keep events in memory only
+        """
+        self._events: Dict[str, Dict[str, Any]] = {}
+        self._times: Dict[str, Tuple[float, float]] = {}
+        self._series: Dict[str, _Series] = {}
+        # Short, non-recurring events: parallel arrays sorted by start time
+        self._starts: List[float] = []
+        self._ids: List[str] = []
+        self._max_short = 0.0
+        # Long events and recurring series: (start, end of last instance)
+        self._spans = _SpanIndex()
+        self._text_index = _TokenIndex()
+        self._location_index = _TokenIndex()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._open(db_path)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def add(self, event: Dict[str, Any]) -> None:
+        """
+        Add or replace an event.
+
+        Args:
+            event: Event with at least 'id', 'start_time' and 'end_time'
+
+        Raises:
+            ValueError: If the times or recurrence rule are invalid
+        """
+        if event['id'] in self._events:
+            self._unindex(event['id'])
+        self._index(event)
+        self._persist(event)
+
+    def get(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an event, or a single recurrence instance by its '<id>_recur_<n>' id.
+
+        Args:
+            event_id: Event or instance ID
+
+        Returns:
+            Optional[Dict[str, Any]]: The event, or None if not found
+        """
+        event = self._events.get(event_id)
+        if event is not None or '_recur_' not in event_id:
+            return event
+        base_id, _, index = event_id.rpartition('_recur_')
+        series = self._series.get(base_id)
+        if series is None or not index.isdigit() or not 0 < int(index) < series.count:
+            return None
+        return self._instance(base_id, int(index))
+
+    def update(self, event_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Update fields of an event and re-index it.
+
+        Args:
+            event_id: Event ID
+            fields: Fields to set
+
+        Returns:
+            Optional[Dict[str, Any]]: The updated event, or None if not found
+
+        Raises:
+            ValueError: If event_id names a single recurrence instance
+        """
+        event = self._events.get(event_id)
+        if event is None:
+            self._check_not_instance(event_id)
+            return None
+        updated = {**event, **fields}
+        self._unindex(event_id)
+        try:
+            self._index(updated)
+        except Exception:
+            self._index(event)
+            raise
+        self._persist(updated)
+        return updated
+
+    def remove(self, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove an event together with all its recurrences.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Optional[Dict[str, Any]]: The removed event, or None if not found
+
+        Raises:
+            ValueError: If event_id names a single recurrence instance
+        """
+        if event_id not in self._events:
+            self._check_not_instance(event_id)
+            return None
+        event = self._unindex(event_id)
+        if self._db is not None:
+            self._db.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        return event
+
+    def _check_not_instance(self, event_id: str) -> None:
+        instance = self.get(event_id)
+        if instance is not None:
+            raise ValueError(f"Cannot modify a single occurrence of a recurring event; "
+                             f"update or delete the series '{instance['recurrence_of']}' instead")
+
+    def search(self, query: str = '', start_time: Optional[str] = None, end_time: Optional[str] = None,
+               location: str = '') -> List[Dict[str, Any]]:
+        """
+        Find events matching all given criteria, ordered by start time.
+
+        Text criteria match words by prefix ("meet" matches "meeting"). With a
+        time range, recurring events contribute the instances that overlap it;
+        without one, only the events themselves are returned.
+
+        Args:
+            query: Words to find in title or description
+            start_time: Only events ending at or after this ISO time
+            end_time: Only events starting at or before this ISO time
+            location: Words to find in the location
+
+        Returns:
+            List[Dict[str, Any]]: Matching events or instances
+        """
+        if start_time is None and end_time is None:
+            candidates = None
+            if query:
+                candidates = self._text_index.match(query)
+            if location:
+                located = self._location_index.match(location)
+                candidates = located if candidates is None else candidates & located
+            ids = self._events.keys() if candidates is None else candidates
+            return sorted((self._events[i] for i in ids), key=lambda e: self._times[e['id']][0])
+
+        # A time window is usually far more selective than words, so check the
+        # words on the events in the window instead of building posting unions
+        words, places = tokenize(query), tokenize(location)
+        window_start = to_epoch(start_time) if start_time else -math.inf
+        window_end = to_epoch(end_time) if end_time else math.inf
+        matches = [
+            (start, event) for start, base_id, event in self._overlapping(window_start, window_end)
+            if (not words or _contains(_text(self._events[base_id]), words))
+            and (not places or _contains(self._events[base_id].get('location') or '', places))
+        ]
+        matches.sort(key=lambda item: item[0])
+        return [event for _, event in matches]
+
+    def clear(self) -> None:
+        """Remove all events (including persisted ones)."""
+        for event_id in list(self._events):
+            self._unindex(event_id)
+        self._max_short = 0.0
+        if self._db is not None:
+            self._db.execute("DELETE FROM events")
+
+    def close(self) -> None:
+        """Close the database; the in-memory index is dropped."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        self.__init__()
+
+    def _open(self, db_path: str) -> None:
+        self._db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "id TEXT PRIMARY KEY, start REAL NOT NULL, end REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        rows = self._db.execute("SELECT data FROM events ORDER BY start").fetchall()
+        for (data,) in rows:
+            # Rows arrive sorted, so index entries can be appended without bisecting
+            self._index(json.loads(data), presorted=True)
+
+    def _persist(self, event: Dict[str, Any]) -> None:
+        if self._db is None:
+            return
+        start, end = self._times[event['id']]
+        self._db.execute(
+            "INSERT OR REPLACE INTO events (id, start, end, data) VALUES (?, ?, ?, ?)",
+            (event['id'], start, end, json.dumps(event, ensure_ascii=False))
+        )
+
+    def _index(self, event: Dict[str, Any], presorted: bool = False) -> None:
+        event_id = event['id']
+        start, end = to_epoch(event['start_time']), to_epoch(event['end_time'])
+        recurrence = event.get('recurrence')
+        series = _Series(recurrence, start, end) if recurrence else None
+
+        self._events[event_id] = event
+        self._times[event_id] = (start, end)
+        if series is not None and series.count > 1:
+            self._series[event_id] = series
+            self._spans.add(event_id, start, series.last_end(start))
+        elif end - start > SHORT_EVENT_SECONDS:
+            self._spans.add(event_id, start, end)
+        else:
+            if presorted:
+                self._starts.append(start)
+                self._ids.append(event_id)
+            else:
+                position = bisect_right(self._starts, start)
+                self._starts.insert(position, start)
+                self._ids.insert(position, event_id)
+            self._max_short = max(self._max_short, end - start)
+
+        self._text_index.add(event_id, _text(event))
+        self._location_index.add(event_id, event.get('location') or '')
+
+    def _unindex(self, event_id: str) -> Dict[str, Any]:
+        event = self._events.pop(event_id)
+        start, _ = self._times.pop(event_id)
+        self._series.pop(event_id, None)
+        if not self._spans.discard(event_id):
+            position = bisect_left(self._starts, start)
+            while self._ids[position] != event_id:
+                position += 1
+            del self._starts[position]
+            del self._ids[position]
+        self._text_index.discard(event_id, _text(event))
+        self._location_index.discard(event_id, event.get('location') or '')
+        return event
+
+    def _overlapping(self, window_start: float, window_end: float) -> Iterator[Tuple[float, str, Dict[str, Any]]]:
+        """Yield (start, base id, event or instance) overlapping the window."""
+        lo = 0 if window_start == -math.inf else bisect_left(self._starts, window_start - self._max_short)
+        hi = len(self._starts) if window_end == math.inf else bisect_right(self._starts, window_end)
+        times = self._times
+        for position in range(lo, hi):
+            event_id = self._ids[position]
+            start, end = times[event_id]
+            if end >= window_start:
+                yield start, event_id, self._events[event_id]
+
+        for event_id in self._spans.overlapping(window_start, window_end):
+            series = self._series.get(event_id)
+            start, end = times[event_id]
+            if series is None:
+                yield start, event_id, self._events[event_id]
+                continue
+            first = 0 if window_start == -math.inf else max(0, math.ceil((window_start - end) / series.period))
+            last = series.count - 1 if window_end == math.inf else \
+                min(series.count - 1, math.floor((window_end - start) / series.period))
+            for index in range(first, last + 1):
+                yield start + index * series.period, event_id, self._instance(event_id, index)
+
+    def _instance(self, event_id: str, index: int) -> Dict[str, Any]:
+        """Build recurrence instance index of an event on demand."""
+        event = self._events[event_id]
+        if index == 0:
+            return event
+        offset = self._series[event_id].delta * index
+        instance = dict(event)
+        instance['id'] = f"{event_id}_recur_{index}"
+        instance['start_time'] = (datetime.fromisoformat(event['start_time']) + offset).isoformat()
+        instance['end_time'] = (datetime.fromisoformat(event['end_time']) + offset).isoformat()
+        instance['recurrence'] = None
+        instance['recurrence_of'] = event_id
+        return instance
+
+__all__ = ["CalendarStore", "RECURRENCE_PERIODS", "to_epoch", "tokenize"]
@@ -18,13 +18,13 @@ Example:
     >>> ollama_url = config.get("ollama_base_url")
 """
 import os
-import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List, TypeVar, cast
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
+from src.app.core.config_store import ConfigFile, ConfigSnapshot, config_service
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -92,6 +92,11 @@ class ConfigManager:
     - Type conversion
     - Value validation
     
+    The file is read through the process-wide config service, so every
+    ConfigManager shares one parsed snapshot and picks up changes (from
+    other instances or on disk) through a subscription instead of re-reading.
+    Values set but not yet saved are kept over such changes.
+    
     Attributes:
         config_dir (Path): Directory for configuration files
         settings_file (Path): Path to the main configuration file
@@ -102,8 +107,12 @@ class ConfigManager:
     def __init__(self, settings_file: str = 'config/labeeb_config.json'):
         self.settings_file = settings_file
         self._ensure_config_file()
+        self._file = self._open_settings()
+        # Keys set() on this instance since its last save, kept over incoming snapshots
+        self._unsaved: Dict[str, Any] = {}
         self.config = self._load_config()
         self._validate_config()
+        self._file.subscribe(self._on_change, weak=True)
         self.valid_keys = {
             'default_ai_provider',
             'ollama_base_url',
@@ -132,20 +141,33 @@ class ConfigManager:
             with open(self.settings_file, 'w') as f:
                 f.write('{}')
     
+    def _open_settings(self) -> ConfigFile:
+        """Open the settings file through the shared config service."""
+        try:
+            return config_service().open(self.settings_file)
+        except ValueError:
+            # If file is invalid, reset to '{}'
+            with open(self.settings_file, 'w') as f:
+                f.write('{}')
+            return config_service().open(self.settings_file)
+    
     def _load_config(self) -> Config:
-        """Load configuration from files."""
-        self._ensure_config_file()
-        with open(self.settings_file, 'r') as f:
-            try:
-                config_dict = json.load(f)
-            except json.JSONDecodeError:
-                # If file is empty or invalid, reset to '{}'
-                with open(self.settings_file, 'w') as fw:
-                    fw.write('{}')
-                config_dict = {}
-        
-        # Convert dict to Config object
-        return self._dict_to_config(config_dict)
+        """Load configuration from the shared snapshot."""
+        return self._dict_to_config(self._file.snapshot.to_dict())
+    
+    def _on_change(self, snapshot: ConfigSnapshot) -> None:
+        """Rebuild the configuration when the file changes, keeping unsaved local values."""
+        try:
+            config = self._dict_to_config(snapshot.to_dict())
+        except Exception as e:
+            logger.error(f"Ignoring invalid configuration update: {e}")
+            return
+        unsaved = dict(self._unsaved)
+        for key, value in unsaved.items():
+            setattr(config, key, value)
+        if unsaved:
+            config.last_updated = self.config.last_updated
+        self.config = config
     
     def _dict_to_config(self, config_dict: Dict[str, Any]) -> Config:
         """Convert dictionary to Config object, filtering out unknown keys."""
@@ -217,28 +239,29 @@ class ConfigManager:
     def get(self, key: str, default: Optional[T] = None) -> Union[T, Any]:
         """Get a configuration value."""
         value = getattr(self.config, key, default)
-        return self._interpolate_value(value)
+        # Plain values need no interpolation: keep the common lookup an attribute read
+        if isinstance(value, str):
+            return self._interpolate_value(value) if '${' in value else value
+        if isinstance(value, (dict, list)):
+            return self._interpolate_value(value)
+        return value
     
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
         if not hasattr(self.config, key):
             raise ValueError(f"Invalid configuration key: {key}")
         setattr(self.config, key, value)
+        self._unsaved[key] = value
         self.config.last_updated = datetime.now()
     
     def save(self) -> None:
         """Save configuration to files."""
         self._validate_config()
         
-        # Convert Config object to dict
-        config_dict = self._config_to_dict(self.config)
-        
-        # Save settings.json
-        config_dir = os.path.dirname(self.settings_file)
-        if config_dir and not os.path.exists(config_dir):
-            os.makedirs(config_dir, exist_ok=True)
-        with open(self.settings_file, 'w') as f:
-            json.dump(config_dict, f, indent=4)
+        # Publish to the shared snapshot; the file write is debounced and atomic
+        data = self._config_to_dict(self.config)
+        self._unsaved.clear()
+        self._file.replace(data)
     
     def _config_to_dict(self, config: Config) -> Dict[str, Any]:
         """Convert Config object to dictionary."""
@@ -309,7 +332,9 @@ class ConfigManager:
             raise ValueError("Invalid logging configuration")
     
     def reload(self) -> None:
-        """Reload configuration from files."""
+        """Reload configuration from files, discarding unsaved values."""
+        self._unsaved.clear()
+        self._file.reload_if_changed()
         self.config = self._load_config()
         self._validate_config()
 
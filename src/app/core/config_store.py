@@ -0,0 +1,506 @@
+"""Process-wide configuration file service.
+
+Each JSON/YAML config file is parsed once into an immutable ConfigSnapshot.
+Lookups are plain dict reads against the current snapshot; nothing touches
+the filesystem on get.
+
+Changes are copy-on-write: update() serializes the new data (so values
+that cannot be written fail right away, in the caller), builds a new
+snapshot, notifies subscribers and schedules a debounced write. Writes
+arriving within the debounce window are coalesced into one atomic
+rename-write (temp file plus os.replace), so readers never see a partial
+file. A background write that fails is logged, kept in write_error and
+retried with backoff.
+
+Files changed by other processes are picked up by a single watcher.
+watchdog (inotify/FSEvents) is used when installed; otherwise a thread
+polls each file's mtime and size. A changed file is re-parsed, its snapshot
+swapped and subscribers notified, so callers subscribe instead of
+re-reading. Keys changed locally and not yet written are re-applied on
+top of the reloaded file, so neither side's edits are lost.
+
+Example:
+    >>> settings = config_service().open('config/settings.json')
+    >>> model = settings.get('default_ollama_model', 'gemma3:4b')
+    >>> settings.update({'output_verbosity': 'quiet'})
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.app.core.lazy_import import lazy_import
+
+yaml = lazy_import("yaml")
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY = 60.0
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed config data (dicts become mappingproxies, lists tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """Mutable, serializable copy of frozen config data."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+class ConfigSnapshot(Mapping):
+    """Immutable view of one version of a config file."""
+
+    __slots__ = ('_data', 'version')
+
+    def __init__(self, data: Dict[str, Any], version: int = 0):
+        self._data = {key: freeze(value) for key, value in data.items()}
+        self.version = version
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable deep copy of the data."""
+        return thaw(self._data)
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(version={self.version}, keys={list(self._data)})"
+
+Subscriber = Callable[[ConfigSnapshot], None]
+
+class ConfigFile:
+    """A config file with an in-memory snapshot, debounced writes and change notifications."""
+
+    def __init__(self, path: str, format: Optional[str] = None, debounce: float = 0.2,
+                 max_size: Optional[int] = None):
+        """
+        Load a config file.
+
+        Args:
+            path: File path; a missing file is an empty config
+            format: 'json' or 'yaml' (default: from the extension)
+            debounce: Seconds to wait to coalesce writes
+            max_size: Maximum file size in bytes
+
+        Raises:
+            ValueError: If the file is too large or cannot be parsed
+        """
+        self.path = os.path.abspath(path)
+        self.format = format or ('yaml' if self.path.endswith(('.yaml', '.yml')) else 'json')
+        self.debounce = debounce
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        self._subscribers: List[Any] = []
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._text: Optional[str] = None
+        # Local edits not yet on disk: set keys, removed keys, or a whole replacement
+        self._changed: Dict[str, Any] = {}
+        self._removed: set = set()
+        self._replaced = False
+        self._failures = 0
+        self.write_error: Optional[Exception] = None
+        self._signature = self._stat()
+        self._snapshot = ConfigSnapshot(self._read(), 0)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Current snapshot."""
+        return self._snapshot
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a top-level key from memory."""
+        return self._snapshot._data.get(key, default)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self) -> Dict[str, Any]:
+        if self._signature is None:
+            return {}
+        if self.max_size is not None and self._signature[1] > self.max_size:
+            raise ValueError(f'Config file too large: {self.path}')
+        with open(self.path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if not text.strip():
+            return {}
+        try:
+            data = yaml.safe_load(text) if self.format == 'yaml' else json.loads(text)
+        except Exception as e:
+            raise ValueError(f'Invalid {self.format} in {self.path}: {e}') from e
+        if data is None:
+            return {}
+        if not isinstance(data, dict):
+            raise ValueError(f'Config root must be a mapping: {self.path}')
+        return data
+
+    def _serialize(self, data: Dict[str, Any]) -> str:
+        try:
+            if self.format == 'yaml':
+                return yaml.safe_dump(data, allow_unicode=True)
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        except Exception as e:
+            raise ValueError(f'Config data cannot be written as {self.format}: {e}') from e
+
+    def subscribe(self, callback: Subscriber, weak: bool = False) -> Callable[[], None]:
+        """
+        Call callback with every new snapshot (local updates and external file changes).
+
+        Args:
+            callback: Receives the new ConfigSnapshot
+            weak: Hold a bound-method callback weakly, so the subscription
+                ends when its object is garbage collected
+
+        Returns:
+            Callable[[], None]: Unsubscribes the callback
+        """
+        entry: Any = weakref.WeakMethod(callback) if weak else callback
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def _publish(self, data: Dict[str, Any]) -> ConfigSnapshot:
+        snapshot = ConfigSnapshot(data, self._snapshot.version + 1)
+        self._snapshot = snapshot
+        return snapshot
+
+    def _notify(self, snapshot: ConfigSnapshot) -> None:
+        for entry in list(self._subscribers):
+            callback = entry() if isinstance(entry, weakref.WeakMethod) else entry
+            if callback is None:
+                with self._lock:
+                    if entry in self._subscribers:
+                        self._subscribers.remove(entry)
+                continue
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"Config subscriber failed for {self.path}: {e}")
+
+    def update(self, changes: Optional[Dict[str, Any]] = None, remove: Iterable[str] = ()) -> ConfigSnapshot:
+        """
+        Set and remove top-level keys.
+
+        Args:
+            changes: Keys to set
+            remove: Keys to delete (missing keys are ignored)
+
+        Returns:
+            ConfigSnapshot: The new snapshot
+
+        Raises:
+            ValueError: If a value cannot be serialized; nothing is changed
+        """
+        changes = changes or {}
+        remove = list(remove)
+        with self._lock:
+            data = dict(self._snapshot._data)
+            data.update(changes)
+            for key in remove:
+                data.pop(key, None)
+            self._text = self._serialize(thaw(data))
+            snapshot = self._publish(data)
+            self._changed.update((key, snapshot[key]) for key in changes if key in snapshot)
+            for key in remove:
+                self._changed.pop(key, None)
+            self._removed.difference_update(changes)
+            self._removed.update(remove)
+            self._schedule_write()
+        self._notify(snapshot)
+        return snapshot
+
+    def replace(self, data: Dict[str, Any]) -> ConfigSnapshot:
+        """
+        Replace the whole config.
+
+        Args:
+            data: New config mapping
+
+        Returns:
+            ConfigSnapshot: The new snapshot
+
+        Raises:
+            ValueError: If data is not a mapping or cannot be serialized
+        """
+        if not isinstance(data, Mapping):
+            raise ValueError('Config root must be a mapping')
+        with self._lock:
+            self._text = self._serialize(thaw(data))
+            self._replaced = True
+            snapshot = self._publish(dict(data))
+            self._schedule_write()
+        self._notify(snapshot)
+        return snapshot
+
+    def _schedule_write(self) -> None:
+        self._dirty = True
+        if self.debounce <= 0:
+            self.flush()
+        elif self._timer is None:
+            # Later updates within the window ride along with this write
+            self._start_timer(self.debounce)
+
+    def _start_timer(self, delay: float) -> None:
+        self._timer = threading.Timer(delay, self._write_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _write_in_background(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            with self._lock:
+                if not self._dirty or self._timer is not None:
+                    return
+                self._failures += 1
+                delay = min(MAX_RETRY_DELAY, max(self.debounce, 0.05) * 2 ** self._failures)
+                self._start_timer(delay)
+            logger.error(f"Failed to write config {self.path}, retrying in {delay:.1f}s: {e}")
+
+    def flush(self) -> None:
+        """
+        Write pending changes now, atomically.
+
+        Raises:
+            OSError: If the file cannot be written; the changes stay pending
+                and write_error is set
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            if self._text is None:
+                self._text = self._serialize(self._snapshot.to_dict())
+            directory = os.path.dirname(self.path)
+            temp_path = None
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(self._text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except BaseException as e:
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                self.write_error = e
+                raise
+            self._dirty = False
+            self._text = None
+            self._changed, self._removed, self._replaced = {}, set(), False
+            self._failures = 0
+            self.write_error = None
+            # Our own write must not look like an external change
+            self._signature = self._stat()
+
+    def reload_if_changed(self) -> bool:
+        """
+        Re-parse the file if its mtime or size changed on disk.
+
+        Keys changed locally but not yet written (for instance because
+        writing failed) are re-applied on top of the file and written with
+        the next flush; a pending replace() wins over the file entirely.
+
+        Returns:
+            bool: Whether a new snapshot was published
+        """
+        with self._lock:
+            signature = self._stat()
+            if signature == self._signature:
+                return False
+            self._signature = signature
+            if self._dirty and self._replaced:
+                return False
+            try:
+                data = self._read()
+            except (OSError, ValueError) as e:
+                # Keep serving the last good snapshot (e.g. a half-written file)
+                logger.error(f"Failed to reload config {self.path}: {e}")
+                return False
+            if self._dirty:
+                data.update(self._changed)
+                for key in self._removed:
+                    data.pop(key, None)
+                self._text = self._serialize(thaw(data))
+            snapshot = self._publish(data)
+        self._notify(snapshot)
+        return True
+
+    def close(self) -> None:
+        """Flush pending writes and drop subscribers."""
+        self.flush()
+        with self._lock:
+            self._subscribers.clear()
+
+if WATCHDOG_AVAILABLE:
+    class _ChangeHandler(FileSystemEventHandler):
+        def __init__(self, service: 'ConfigService'):
+            self._service = service
+
+        def on_any_event(self, event) -> None:
+            for path in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+                config_file = self._service._files.get(os.path.abspath(path)) if path else None
+                if config_file is not None:
+                    config_file.reload_if_changed()
+
+class ConfigService:
+    """Registry of open config files and the watcher that invalidates them."""
+
+    def __init__(self, poll_interval: float = 1.0, debounce: float = 0.2, watch: bool = True):
+        """
+        Initialize the service.
+
+        Args:
+            poll_interval: Seconds between mtime checks when watchdog is not installed
+            debounce: Default write debounce for opened files
+            watch: Watch opened files for external changes
+        """
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.watch = watch
+        self._files: Dict[str, ConfigFile] = {}
+        self._lock = threading.Lock()
+        self._observer = None
+        self._watched_dirs: set = set()
+        self._poller: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def open(self, path: str, format: Optional[str] = None, max_size: Optional[int] = None) -> ConfigFile:
+        """
+        Get the shared ConfigFile for a path, loading it on first use.
+
+        Args:
+            path: File path
+            format: 'json' or 'yaml' (default: from the extension)
+            max_size: Maximum file size in bytes
+
+        Returns:
+            ConfigFile: The config file
+        """
+        key = os.path.abspath(path)
+        config_file = self._files.get(key)
+        if config_file is not None:
+            return config_file
+        with self._lock:
+            config_file = self._files.get(key)
+            if config_file is None:
+                config_file = ConfigFile(key, format, self.debounce, max_size)
+                self._files[key] = config_file
+                if self.watch:
+                    self._watch(config_file)
+        return config_file
+
+    def get(self, path: str, key: str, default: Any = None) -> Any:
+        """Value of a top-level key of a config file."""
+        return self.open(path).get(key, default)
+
+    def _watch(self, config_file: ConfigFile) -> None:
+        if WATCHDOG_AVAILABLE:
+            directory = os.path.dirname(config_file.path)
+            os.makedirs(directory, exist_ok=True)
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+            if directory not in self._watched_dirs:
+                self._observer.schedule(_ChangeHandler(self), directory, recursive=False)
+                self._watched_dirs.add(directory)
+        elif self._poller is None:
+            self._poller = threading.Thread(target=self._poll, name='config-watcher', daemon=True)
+            self._poller.start()
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.check()
+
+    def check(self) -> List[str]:
+        """
+        Reload every open file that changed on disk.
+
+        Returns:
+            List[str]: Paths that were reloaded
+        """
+        return [path for path, config_file in list(self._files.items()) if config_file.reload_if_changed()]
+
+    def flush(self) -> None:
+        """Write all pending changes."""
+        for config_file in list(self._files.values()):
+            try:
+                config_file.flush()
+            except Exception as e:
+                logger.error(f"Failed to write config {config_file.path}: {e}")
+
+    def close(self) -> None:
+        """Flush pending writes and stop watching."""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        self.flush()
+        with self._lock:
+            for config_file in self._files.values():
+                config_file.close()
+            self._files.clear()
+            self._watched_dirs.clear()
+
+_service: Optional[ConfigService] = None
+_service_lock = threading.Lock()
+
+def config_service() -> ConfigService:
+    """The process-wide config service."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = ConfigService()
+                atexit.register(_service.flush)
+    return _service
+
+__all__ = [
+    "ConfigSnapshot", "ConfigFile", "ConfigService", "config_service", "freeze", "thaw",
+    "WATCHDOG_AVAILABLE"
+]
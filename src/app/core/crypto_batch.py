@@ -0,0 +1,354 @@
+"""Batch hashing, HMAC and password key derivation for the security tool.
+
+- digest, hmac_digest and file_digest hash payloads. Files and large
+  buffers stream through incremental hashing in fixed-size chunks, so
+  memory use does not grow with payload size.
+- hash_password, verify_password and migrate_credential use PBKDF2 or
+  scrypt (hashlib) with a tunable cost. Hashes are encoded with all their
+  parameters, so costs can be raised later and old hashes detected with
+  needs_rehash.
+- CryptoPool runs batches off the event loop. Digests go to threads:
+  hashlib releases the GIL for buffers over 2 KiB, and threads avoid
+  copying payloads to another process. Key derivation and credential
+  migration go to a process pool, so large runs never compete with
+  agent work for the interpreter.
+- benchmark measures throughput per digest algorithm and per KDF cost.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+Data = Union[str, bytes, bytearray, memoryview]
+
+CHUNK_SIZE = 1 << 20
+
+# Defaults follow current OWASP guidance
+DEFAULT_COSTS: Dict[str, Dict[str, int]] = {
+    'pbkdf2_sha256': {'iterations': 600_000},
+    'pbkdf2_sha512': {'iterations': 210_000},
+    'scrypt': {'n': 2 ** 15, 'r': 8, 'p': 1},
+}
+
+_KEY_LENGTH = 32
+_SALT_LENGTH = 16
+
+def _bytes(data: Data) -> Union[bytes, bytearray, memoryview]:
+    return data.encode() if isinstance(data, str) else data
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+def check_algorithm(algorithm: str) -> None:
+    """Raise ValueError if hashlib does not provide algorithm."""
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f'Invalid hash algorithm: {algorithm}')
+
+def _update(hasher: Any, data: Data, chunk_size: int = CHUNK_SIZE) -> Any:
+    view = memoryview(_bytes(data)).cast('B')
+    for start in range(0, len(view), chunk_size):
+        hasher.update(view[start:start + chunk_size])
+    return hasher
+
+def _update_from_file(hasher: Any, path: str, chunk_size: int = CHUNK_SIZE) -> Any:
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+    return hasher
+
+def digest(data: Data, algorithm: str = 'sha256', salt: bytes = b'') -> str:
+    """
+    Hex digest of salt + data, hashed incrementally.
+
+    Args:
+        data: Payload
+        algorithm: hashlib algorithm name
+        salt: Optional prefix
+
+    Returns:
+        str: Hex digest
+    """
+    hasher = hashlib.new(algorithm)
+    hasher.update(salt)
+    return _update(hasher, data).hexdigest()
+
+def hmac_digest(key: Data, data: Data, algorithm: str = 'sha256') -> str:
+    """Hex HMAC of data, computed incrementally."""
+    return _update(hmac.new(_bytes(key), digestmod=algorithm), data).hexdigest()
+
+def file_digest(path: str, algorithm: str = 'sha256', key: Optional[Data] = None,
+                chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Hex digest (or HMAC, when key is given) of a file, streamed in chunks.
+
+    Args:
+        path: File path
+        algorithm: hashlib algorithm name
+        key: HMAC key
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        str: Hex digest
+    """
+    hasher = hmac.new(_bytes(key), digestmod=algorithm) if key is not None else hashlib.new(algorithm)
+    return _update_from_file(hasher, path, chunk_size).hexdigest()
+
+def hash_item(item: Union[Data, Dict[str, Any]], algorithm: str = 'sha256', key: Optional[Data] = None,
+              salt: bytes = b'') -> str:
+    """
+    Digest of a batch item: a payload, {'data': payload} or {'path': file}.
+
+    Args:
+        item: Batch item
+        algorithm: hashlib algorithm name
+        key: HMAC key (salt is ignored for HMAC and files)
+        salt: Prefix for plain payload digests
+
+    Returns:
+        str: Hex digest
+    """
+    if isinstance(item, dict):
+        if 'path' in item:
+            return file_digest(item['path'], algorithm, key)
+        item = item.get('data', '')
+    return hmac_digest(key, item, algorithm) if key is not None else digest(item, algorithm, salt)
+
+def _cost(kdf: str, cost: Optional[Dict[str, int]]) -> Dict[str, int]:
+    if kdf not in DEFAULT_COSTS:
+        raise ValueError(f'Unsupported key derivation function: {kdf}')
+    return {**DEFAULT_COSTS[kdf], **(cost or {})}
+
+def derive_key(password: Data, salt: bytes, kdf: str = 'pbkdf2_sha256',
+               cost: Optional[Dict[str, int]] = None, length: int = _KEY_LENGTH) -> bytes:
+    """
+    Derive a key from a password.
+
+    Args:
+        password: Password
+        salt: Salt
+        kdf: 'pbkdf2_sha256', 'pbkdf2_sha512' or 'scrypt'
+        cost: Overrides for the default cost (iterations, or n/r/p)
+        length: Key length in bytes
+
+    Returns:
+        bytes: Derived key
+    """
+    params = _cost(kdf, cost)
+    if kdf == 'scrypt':
+        n, r, p = params['n'], params['r'], params['p']
+        # scrypt needs about 128 * n * r bytes; leave headroom over OpenSSL's 32 MiB default
+        return hashlib.scrypt(_bytes(password), salt=salt, n=n, r=r, p=p,
+                              maxmem=128 * r * (n + p + 2) + (1 << 20), dklen=length)
+    return hashlib.pbkdf2_hmac(kdf.split('_', 1)[1], _bytes(password), salt, params['iterations'], length)
+
+def hash_password(password: Data, kdf: str = 'pbkdf2_sha256', cost: Optional[Dict[str, int]] = None,
+                  salt: Optional[bytes] = None) -> str:
+    """
+    Hash a password into a self-describing string.
+
+    The format is ``pbkdf2_sha256$<iterations>$<salt>$<key>`` or
+    ``scrypt$<n>$<r>$<p>$<salt>$<key>``, with salt and key in base64.
+
+    Args:
+        password: Password
+        kdf: Key derivation function
+        cost: Overrides for the default cost
+        salt: Salt (random by default)
+
+    Returns:
+        str: Encoded hash
+    """
+    params = _cost(kdf, cost)
+    salt = salt or os.urandom(_SALT_LENGTH)
+    key = derive_key(password, salt, kdf, params)
+    fields = [params['n'], params['r'], params['p']] if kdf == 'scrypt' else [params['iterations']]
+    return '$'.join([kdf, *map(str, fields), _b64(salt), _b64(key)])
+
+def parse_password_hash(encoded: str) -> Tuple[str, Dict[str, int], bytes, bytes]:
+    """
+    Split an encoded password hash.
+
+    Returns:
+        Tuple[str, Dict[str, int], bytes, bytes]: kdf, cost, salt and key
+
+    Raises:
+        ValueError: If the string is not a supported encoded hash
+    """
+    parts = encoded.split('$')
+    kdf = parts[0]
+    names = ('n', 'r', 'p') if kdf == 'scrypt' else ('iterations',)
+    if kdf not in DEFAULT_COSTS or len(parts) != len(names) + 3:
+        raise ValueError('Unsupported password hash format')
+    cost = {name: int(value) for name, value in zip(names, parts[1:])}
+    return kdf, cost, base64.b64decode(parts[-2]), base64.b64decode(parts[-1])
+
+def verify_password(password: Data, encoded: str) -> bool:
+    """Whether password matches an encoded hash (constant-time comparison)."""
+    kdf, cost, salt, key = parse_password_hash(encoded)
+    return hmac.compare_digest(derive_key(password, salt, kdf, cost, len(key)), key)
+
+def needs_rehash(encoded: str, kdf: str = 'pbkdf2_sha256', cost: Optional[Dict[str, int]] = None) -> bool:
+    """Whether an encoded hash uses a different KDF or a lower cost than requested."""
+    try:
+        current_kdf, current_cost, _, _ = parse_password_hash(encoded)
+    except ValueError:
+        return True
+    wanted = _cost(kdf, cost)
+    return current_kdf != kdf or any(current_cost[name] < value for name, value in wanted.items())
+
+def migrate_credential(password: Data, record: Dict[str, Any], kdf: str = 'pbkdf2_sha256',
+                       cost: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    Verify a password against a stored record and re-hash it if the record is outdated.
+
+    Args:
+        password: Password presented by the user
+        record: Either {'hash': encoded KDF hash} or a legacy salted digest
+            {'algorithm', 'salt' (base64), 'hash' (hex)} as produced by the
+            security tool's hash command
+        kdf: Target key derivation function
+        cost: Target cost
+
+    Returns:
+        Dict[str, Any]: 'valid', 'rehashed' and 'hash' (the hash to store)
+    """
+    stored = record.get('hash', '')
+    if '$' in stored:
+        valid = verify_password(password, stored)
+    else:
+        algorithm = record.get('algorithm', 'sha256')
+        expected = digest(password, algorithm, base64.b64decode(record.get('salt', '')))
+        valid = hmac.compare_digest(expected, stored)
+    if not valid:
+        return {'valid': False, 'rehashed': False, 'hash': stored}
+    if needs_rehash(stored, kdf, cost):
+        return {'valid': True, 'rehashed': True, 'hash': hash_password(password, kdf, cost)}
+    return {'valid': True, 'rehashed': False, 'hash': stored}
+
+def _call(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+    try:
+        return True, fn(*args, **kwargs)
+    except Exception as e:
+        return False, f'{type(e).__name__}: {e}'
+
+def _run_chunk(fn: Callable, jobs: Sequence[Tuple[Tuple, Dict[str, Any]]]) -> List[Tuple[bool, Any]]:
+    # Module-level so process workers can unpickle it
+    return [_call(fn, args, kwargs) for args, kwargs in jobs]
+
+class CryptoPool:
+    """Executors for batch hashing (threads) and key derivation (processes)."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the pool; executors are created on first use.
+
+        Args:
+            max_workers: Workers per executor (default: CPU count)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def _executor(self, processes: bool) -> Executor:
+        if processes:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='crypto')
+        return self._threads
+
+    async def run(self, fn: Callable, *args, processes: bool = False, **kwargs) -> Any:
+        """Run one call off the event loop."""
+        ok, result = (await self.map(fn, [(args, kwargs)], processes=processes))[0]
+        if not ok:
+            raise ValueError(result)
+        return result
+
+    async def map(self, fn: Callable, jobs: Sequence[Tuple[Tuple, Dict[str, Any]]], processes: bool = False,
+                  chunk_size: Optional[int] = None) -> List[Tuple[bool, Any]]:
+        """
+        Run fn over many (args, kwargs) jobs in parallel chunks.
+
+        Args:
+            fn: Module-level function
+            jobs: Arguments per call
+            processes: Use the process pool instead of threads
+            chunk_size: Jobs per task (default: spread evenly over the workers)
+
+        Returns:
+            List[Tuple[bool, Any]]: Per job, (True, result) or (False, error message), in order
+        """
+        if not jobs:
+            return []
+        chunk_size = chunk_size or max(1, -(-len(jobs) // (self.max_workers * 4)))
+        loop = asyncio.get_running_loop()
+        executor = self._executor(processes)
+        chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+        results = await asyncio.gather(*(loop.run_in_executor(executor, _run_chunk, fn, chunk) for chunk in chunks))
+        return [item for chunk in results for item in chunk]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the executors."""
+        for executor in (self._threads, self._processes):
+            if executor is not None:
+                executor.shutdown(wait=wait, cancel_futures=True)
+        self._threads = self._processes = None
+
+def benchmark(algorithms: Optional[Sequence[str]] = None, size: int = 8 << 20,
+              kdfs: Optional[Dict[str, Dict[str, int]]] = None, min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Measure single-core throughput per digest algorithm and per KDF cost.
+
+    Args:
+        algorithms: Digest algorithms (default: common ones)
+        size: Payload bytes per digest
+        kdfs: KDF name -> cost (default: DEFAULT_COSTS)
+        min_time: Minimum seconds to measure each entry
+
+    Returns:
+        Dict[str, Any]: 'digest' (algorithm -> MB/s) and 'kdf' (name -> hashes/s and ms/hash)
+    """
+    payload = os.urandom(size)
+    results: Dict[str, Any] = {'digest': {}, 'kdf': {}}
+    for algorithm in algorithms or ('md5', 'sha1', 'sha256', 'sha512', 'blake2b', 'sha3_256'):
+        check_algorithm(algorithm)
+        runs, started = 0, time.perf_counter()
+        while True:
+            digest(payload, algorithm)
+            runs += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        results['digest'][algorithm] = round(runs * size / elapsed / 1e6, 1)
+    salt = os.urandom(_SALT_LENGTH)
+    for kdf, cost in (kdfs or DEFAULT_COSTS).items():
+        runs, started = 0, time.perf_counter()
+        while True:
+            derive_key('benchmark', salt, kdf, cost)
+            runs += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        results['kdf'][kdf] = {
+            'cost': _cost(kdf, cost),
+            'hashes_per_second': round(runs / elapsed, 2),
+            'ms_per_hash': round(elapsed / runs * 1000, 2)
+        }
+    return results
+
+__all__ = [
+    "digest", "hmac_digest", "file_digest", "hash_item", "derive_key", "hash_password", "parse_password_hash",
+    "verify_password", "needs_rehash", "migrate_credential", "check_algorithm", "CryptoPool",
+    "benchmark", "DEFAULT_COSTS", "CHUNK_SIZE"
+]
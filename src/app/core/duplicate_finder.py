@@ -0,0 +1,354 @@
+"""Duplicate file detection by size, partial hash and full hash.
+
+Files are compared in stages, each one only on the candidates the previous
+stage left:
+
+- size: files are bucketed by size while the tree is walked (fs_walk, in
+  parallel). Hard links and symlinks to the same inode are counted once,
+  since they take no extra space.
+- partial hash: as soon as a size bucket has two files, their first and
+  last blocks are hashed on a thread pool, overlapping with the walk.
+  Files of up to two blocks are hashed whole here and need no third stage.
+- full hash: only files whose size and partial hash both collide are read
+  in full (streamed in 1 MiB chunks).
+
+Hashes are kept in a SQLite HashCache keyed by path and checked against
+size, mtime and inode, so a rerun only hashes files that changed. Tools
+share one cache per database file for the whole process (shared_cache),
+stored under the app data directory by default, and each search prunes
+rows for files under its roots that no longer exist.
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.app.core.crypto_batch import CryptoPool, check_algorithm, file_digest
+from src.app.core.fs_walk import WalkFilter, iter_entries
+
+PARTIAL_BLOCK = 64 * 1024
+
+DEFAULT_CACHE_PATH = os.path.expanduser("~/Documents/labeeb/cache/file_hashes.db")
+
+_LOOKUP_CHUNK = 500
+
+_shared_caches: Dict[str, 'HashCache'] = {}
+_shared_lock = threading.Lock()
+
+@dataclass
+class FileRecord:
+    """A candidate file and the hashes known for it."""
+    path: str
+    size: int
+    mtime: float
+    inode: Optional[int]
+    partial: Optional[str] = None
+    full: Optional[str] = None
+    dirty: bool = False
+
+@dataclass
+class DuplicateGroup:
+    """Files with identical content."""
+    size: int
+    digest: str
+    paths: List[str]
+
+    @property
+    def wasted_bytes(self) -> int:
+        return self.size * (len(self.paths) - 1)
+
+@dataclass
+class DuplicateReport:
+    """Result of a duplicate search, with per-stage counts."""
+    groups: List[DuplicateGroup] = field(default_factory=list)
+    files_scanned: int = 0
+    partial_hashed: int = 0
+    full_hashed: int = 0
+    cache_hits: int = 0
+    errors: List[Dict[str, str]] = field(default_factory=list)
+
+    @property
+    def wasted_bytes(self) -> int:
+        return sum(group.wasted_bytes for group in self.groups)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'groups': [{'size': group.size, 'digest': group.digest, 'paths': group.paths,
+                        'wasted_bytes': group.wasted_bytes} for group in self.groups],
+            'files_scanned': self.files_scanned,
+            'partial_hashed': self.partial_hashed,
+            'full_hashed': self.full_hashed,
+            'cache_hits': self.cache_hits,
+            'wasted_bytes': self.wasted_bytes,
+            'errors': self.errors
+        }
+
+class HashCache:
+    """SQLite cache of partial and full file hashes, valid while size, mtime and inode are unchanged."""
+
+    def __init__(self, db_path: str = ':memory:'):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite database file, or ':memory:'
+        """
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ':memory:':
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL, inode INTEGER,"
+            " partial TEXT, full TEXT) WITHOUT ROWID;"
+        )
+
+    def use_scheme(self, scheme: str) -> None:
+        """Drop cached hashes made with a different algorithm or block size."""
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'scheme'").fetchone()
+            if row is not None and row[0] == scheme:
+                return
+            with self._db:
+                self._db.execute("DELETE FROM files")
+                self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('scheme', ?)", (scheme,))
+
+    def lookup(self, records: Sequence[FileRecord]) -> int:
+        """
+        Fill in cached hashes for records whose file is unchanged.
+
+        Args:
+            records: Candidate files
+
+        Returns:
+            int: Number of records served from the cache
+        """
+        by_path = {record.path: record for record in records}
+        paths = list(by_path)
+        hits = 0
+        for start in range(0, len(paths), _LOOKUP_CHUNK):
+            chunk = paths[start:start + _LOOKUP_CHUNK]
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT path, size, mtime, inode, partial, full FROM files"
+                    f" WHERE path IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+            for path, size, mtime, inode, partial, full in rows:
+                record = by_path[path]
+                if (size, mtime, inode) == (record.size, record.mtime, record.inode):
+                    record.partial, record.full = partial, full
+                    hits += 1
+        return hits
+
+    def store(self, records: Iterable[FileRecord]) -> int:
+        """
+        Save the hashes of records computed since they were loaded.
+
+        Returns:
+            int: Number of records written
+        """
+        rows = [(record.path, record.size, record.mtime, record.inode, record.partial, record.full)
+                for record in records if record.dirty]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime, inode, partial, full)"
+                " VALUES (?, ?, ?, ?, ?, ?)", rows)
+        for record in records:
+            record.dirty = False
+        return len(rows)
+
+    def prune(self, roots: Optional[Iterable[str]] = None) -> int:
+        """
+        Delete cached hashes of files that no longer exist.
+
+        Args:
+            roots: Only check files under these directories (default: all)
+
+        Returns:
+            int: Number of rows deleted
+        """
+        if roots is None:
+            query = [("SELECT path FROM files", ())]
+        else:
+            # Range scan over the primary key: every path starting with root + separator
+            query = [("SELECT path FROM files WHERE path > ? AND path < ?",
+                      (root.rstrip(os.sep) + os.sep, root.rstrip(os.sep) + chr(ord(os.sep) + 1)))
+                     for root in map(os.path.abspath, roots)]
+        with self._lock:
+            paths = [row[0] for sql, params in query for row in self._db.execute(sql, params)]
+        missing = [(path,) for path in paths if not os.path.isfile(path)]
+        if missing:
+            with self._lock, self._db:
+                self._db.executemany("DELETE FROM files WHERE path = ?", missing)
+        return len(missing)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+def shared_cache(db_path: Optional[str] = None) -> HashCache:
+    """
+    The process-wide HashCache for a database file, opened on first use.
+
+    Args:
+        db_path: SQLite database file (default: DEFAULT_CACHE_PATH)
+
+    Returns:
+        HashCache: The same instance for every caller using db_path
+    """
+    db_path = db_path or DEFAULT_CACHE_PATH
+    if db_path != ':memory:':
+        db_path = os.path.abspath(os.path.expanduser(db_path))
+    with _shared_lock:
+        cache = _shared_caches.get(db_path)
+        if cache is None:
+            if db_path != ':memory:':
+                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            cache = _shared_caches[db_path] = HashCache(db_path)
+        return cache
+
+def partial_digest(path: str, size: int, algorithm: str = 'blake2b', block_size: int = PARTIAL_BLOCK) -> str:
+    """
+    Hex digest of a file's first and last block (of the whole file, if it
+    is no longer than two blocks).
+
+    Args:
+        path: File path
+        size: File size, as seen by the walk
+        algorithm: hashlib algorithm name
+        block_size: Bytes hashed at each end
+
+    Returns:
+        str: Hex digest
+    """
+    hasher = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        if size <= 2 * block_size:
+            hasher.update(f.read())
+        else:
+            hasher.update(f.read(block_size))
+            f.seek(-block_size, 2)
+            hasher.update(f.read(block_size))
+    return hasher.hexdigest()
+
+def _collisions(records: Iterable[FileRecord], attribute: str) -> List[List[FileRecord]]:
+    groups: Dict[Tuple[int, str], List[FileRecord]] = {}
+    for record in records:
+        value = getattr(record, attribute)
+        if value is not None:
+            groups.setdefault((record.size, value), []).append(record)
+    return [group for group in groups.values() if len(group) > 1]
+
+async def find_duplicates(roots: Union[str, Sequence[str]], min_size: int = 1, cache: Optional[HashCache] = None,
+                          algorithm: str = 'blake2b', block_size: int = PARTIAL_BLOCK,
+                          max_workers: Optional[int] = None, include_hidden: bool = False,
+                          batch_size: int = 512) -> DuplicateReport:
+    """
+    Find files with identical content under one or more directories.
+
+    Args:
+        roots: Directories to search
+        min_size: Ignore smaller files (0 includes empty files)
+        cache: Hash cache to read and update (default: a fresh in-memory one)
+        algorithm: hashlib algorithm for partial and full hashes
+        block_size: Bytes hashed at each end of a file in the partial stage
+        max_workers: Hashing threads (default: CPU count)
+        include_hidden: Include hidden files and directories
+        batch_size: Candidates per partial-hash batch sent while walking
+
+    Returns:
+        DuplicateReport: Groups sorted by wasted space, largest first
+    """
+    check_algorithm(algorithm)
+    if isinstance(roots, str):
+        roots = [roots]
+    cache = cache if cache is not None else HashCache()
+    cache.use_scheme(f'{algorithm}:{block_size}')
+    report = DuplicateReport()
+    pool = CryptoPool(max_workers)
+
+    async def hash_records(records: List[FileRecord], stage: str) -> None:
+        if stage == 'partial':
+            report.cache_hits += cache.lookup(records)
+            todo = [record for record in records if record.partial is None]
+            jobs = [((record.path, record.size, algorithm, block_size), {}) for record in todo]
+            fn = partial_digest
+        else:
+            todo = [record for record in records if record.full is None]
+            jobs = [((record.path, algorithm), {}) for record in todo]
+            fn = file_digest
+        for record, (ok, value) in zip(todo, await pool.map(fn, jobs)):
+            if not ok:
+                record.partial = record.full = None
+                report.errors.append({'path': record.path, 'error': value})
+                continue
+            record.dirty = True
+            if stage == 'partial':
+                report.partial_hashed += 1
+                record.partial = value
+                if record.size <= 2 * block_size:
+                    record.full = value
+            else:
+                report.full_hashed += 1
+                record.full = value
+
+    try:
+        buckets: Dict[int, Dict[Tuple[Optional[int], Optional[int]], FileRecord]] = {}
+        batch: List[FileRecord] = []
+        tasks = []
+        spec = WalkFilter(kind='file', min_size=max(0, min_size), include_hidden=include_hidden)
+        for root in roots:
+            async for entry in iter_entries(root, spec):
+                report.files_scanned += 1
+                bucket = buckets.setdefault(entry.size, {})
+                key = (entry.device, entry.inode)
+                if key in bucket:
+                    # Another name for a file already seen
+                    continue
+                record = FileRecord(entry.path, entry.size, entry.mtime, entry.inode)
+                bucket[key] = record
+                if len(bucket) == 2:
+                    batch.extend(bucket.values())
+                elif len(bucket) > 2:
+                    batch.append(record)
+                if len(batch) >= batch_size:
+                    tasks.append(asyncio.ensure_future(hash_records(batch, 'partial')))
+                    batch = []
+        if batch:
+            tasks.append(asyncio.ensure_future(hash_records(batch, 'partial')))
+        await asyncio.gather(*tasks)
+
+        candidates = [record for bucket in buckets.values() if len(bucket) > 1 for record in bucket.values()]
+        buckets.clear()
+        colliding = [record for group in _collisions(candidates, 'partial') for record in group]
+        await hash_records(colliding, 'full')
+        cache.store(candidates)
+        await asyncio.get_running_loop().run_in_executor(None, cache.prune, roots)
+
+        for group in _collisions(colliding, 'full'):
+            report.groups.append(DuplicateGroup(group[0].size, group[0].full,
+                                                sorted(record.path for record in group)))
+        report.groups.sort(key=lambda group: (-group.wasted_bytes, group.paths[0]))
+        return report
+    finally:
+        pool.shutdown(wait=False)
+
+__all__ = [
+    'PARTIAL_BLOCK',
+    'DEFAULT_CACHE_PATH',
+    'FileRecord',
+    'DuplicateGroup',
+    'DuplicateReport',
+    'HashCache',
+    'shared_cache',
+    'partial_digest',
+    'find_duplicates',
+]
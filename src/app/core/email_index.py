@@ -0,0 +1,532 @@
+"""IMAP mailbox synchronization with a local message index.
+
+Messages are listed from header data only: ENVELOPE, BODYSTRUCTURE, FLAGS
+and RFC822.SIZE, fetched in UID-range batches. One UID FETCH is outstanding at a time on
+the logged-in connection; the next batch is requested before the current
+one is parsed, so parsing overlaps the server's work. The results go into a SQLite index
+keyed by (folder, UID) together with the folder's UIDVALIDITY. A later sync
+therefore fetches only UIDs above the highest one already indexed, and it
+starts over only when the server reports a new UIDVALIDITY. Message bodies
+are fetched only on request, and then only the text part the
+BODYSTRUCTURE points at. They are cached in the index.
+
+The IMAP client is passed in, and must offer the aioimaplib-style
+coroutines ``select``, ``uid``, ``uid_search`` and ``expunge``. Each returns
+a ``(result, lines)`` response.
+"""
+
+import asyncio
+import base64
+import json
+import quopri
+import re
+import sqlite3
+from email.header import decode_header, make_header
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+HEADER_ITEMS = '(UID FLAGS RFC822.SIZE ENVELOPE BODYSTRUCTURE)'
+
+_TOKEN = re.compile(
+    rb'(\()|(\))|"((?:[^"\\]|\\.)*)"|\{(\d+)\+?\}(?:\r\n)?|([^\s()"{\[]+(?:\[[^\]]*\][^\s()"]*)?)'
+)
+_ESCAPE = re.compile(rb'\\(.)')
+
+def _parse_values(data: bytes) -> List[Any]:
+    """Parse IMAP response data into nested lists of str, int, bytes and None."""
+    stack: List[List[Any]] = [[]]
+    current = stack[0]
+    position, end = 0, len(data)
+    while position < end:
+        # finditer skips whitespace itself; it is restarted only after a literal
+        for token in _TOKEN.finditer(data, position):
+            opened, closed, quoted, literal, atom = token.groups()
+            if atom is not None:
+                if atom.isdigit():
+                    current.append(int(atom))
+                else:
+                    current.append(None if atom.upper() == b'NIL' else atom.decode('ascii', 'replace'))
+            elif opened:
+                current = []
+                stack.append(current)
+            elif closed:
+                if len(stack) > 1:
+                    done = stack.pop()
+                    current = stack[-1]
+                    current.append(done)
+            elif quoted is not None:
+                if b'\\' in quoted:
+                    quoted = _ESCAPE.sub(rb'\1', quoted)
+                current.append(quoted.decode('utf-8', 'replace'))
+            else:
+                position = token.end() + int(literal)
+                current.append(bytes(data[token.end():position]))
+                break
+        else:
+            break
+    while len(stack) > 1:
+        done = stack.pop()
+        stack[-1].append(done)
+    return stack[0]
+
+def _join(lines: Iterable[Any]) -> bytes:
+    # Literal data arrives as its own line right after the line ending in {size}
+    return b'\r\n'.join(line.encode() if isinstance(line, str) else bytes(line) for line in lines)
+
+def parse_fetch_response(lines: Sequence[Any]) -> List[Dict[str, Any]]:
+    """
+    Parse the lines of a FETCH response.
+
+    Args:
+        lines: Response lines; literals may be separate items
+
+    Returns:
+        List[Dict[str, Any]]: Data items (upper-cased names) per message
+    """
+    values = _parse_values(_join(lines[:-1]))
+    messages = []
+    for i in range(1, len(values) - 1):
+        if isinstance(values[i], str) and values[i].upper() == 'FETCH' and isinstance(values[i + 1], list):
+            items = values[i + 1]
+            messages.append({
+                str(items[k]).upper(): items[k + 1] for k in range(0, len(items) - 1, 2)
+            })
+    return messages
+
+def parse_mailbox_status(lines: Sequence[Any]) -> Dict[str, int]:
+    """Extract UIDVALIDITY, UIDNEXT and EXISTS from a SELECT response."""
+    text = _join(lines)
+    status = {}
+    for name, pattern in (('UIDVALIDITY', rb'\[UIDVALIDITY (\d+)\]'),
+                          ('UIDNEXT', rb'\[UIDNEXT (\d+)\]'),
+                          ('EXISTS', rb'(?:^|\s)(\d+) EXISTS')):
+        match = re.search(pattern, text)
+        if match:
+            status[name] = int(match.group(1))
+    return status
+
+def parse_search_response(lines: Sequence[Any]) -> List[int]:
+    """Extract UIDs from a SEARCH response (the final status line is skipped)."""
+    return [int(uid) for uid in re.findall(rb'\d+', _join(lines[:-1]))]
+
+def sequence_set(uids: Sequence[int]) -> str:
+    """Compress sorted UIDs into an IMAP sequence set like '1:5,9,12:14'."""
+    ranges = []
+    start = previous = uids[0]
+    for uid in uids[1:]:
+        if uid != previous + 1:
+            ranges.append(f"{start}:{previous}" if previous != start else str(start))
+            start = uid
+        previous = uid
+    ranges.append(f"{start}:{previous}" if previous != start else str(start))
+    return ','.join(ranges)
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bytes):
+        value = value.decode('utf-8', 'replace')
+    value = str(value)
+    if '=?' not in value:
+        return value
+    # RFC 2047 encoded words, e.g. =?utf-8?b?...?=
+    try:
+        return str(make_header(decode_header(value)))
+    except Exception:
+        return value
+
+def _addresses(value: Any) -> str:
+    if not isinstance(value, list):
+        return ''
+    formatted = []
+    for address in value:
+        if not isinstance(address, list) or len(address) < 4 or address[2] is None:
+            continue
+        mailbox = f"{_text(address[2])}@{_text(address[3])}" if address[3] else _text(address[2])
+        name = _text(address[0])
+        formatted.append(f"{name} <{mailbox}>" if name else mailbox)
+    return ', '.join(formatted)
+
+def _params(value: Any) -> Dict[str, str]:
+    if not isinstance(value, list):
+        return {}
+    return {_text(value[k]).lower(): _text(value[k + 1]) for k in range(0, len(value) - 1, 2)}
+
+def _walk(structure: List[Any], prefix: str = ''):
+    """Yield (part number, single-part structure) for each leaf part."""
+    if structure and isinstance(structure[0], list):
+        for index, child in enumerate(c for c in structure if isinstance(c, list)):
+            yield from _walk(child, f"{prefix}.{index + 1}" if prefix else str(index + 1))
+    else:
+        yield prefix or '1', structure
+
+def summarize_structure(structure: Any) -> Dict[str, Any]:
+    """
+    Find the plain text part and the attachments of a BODYSTRUCTURE.
+
+    Args:
+        structure: Parsed BODYSTRUCTURE
+
+    Returns:
+        Dict[str, Any]: 'text_part' ([part, encoding, charset] or None) and
+        'attachments' (filename, content type and approximate decoded size)
+    """
+    text_part = None
+    attachments = []
+    if not isinstance(structure, list):
+        return {'text_part': None, 'attachments': []}
+    for number, part in _walk(structure):
+        if len(part) < 7:
+            continue
+        maintype, subtype = _text(part[0]).lower(), _text(part[1]).lower()
+        params = _params(part[2])
+        encoding = _text(part[5]).lower()
+        size = part[6] if isinstance(part[6], int) else 0
+        # The disposition follows the type-specific extension fields
+        position = {'text': 9, 'message': 11}.get(maintype, 8)
+        disposition = part[position] if len(part) > position and isinstance(part[position], list) else None
+        is_attachment = bool(disposition) and _text(disposition[0]).lower() == 'attachment'
+        if maintype == 'text' and subtype == 'plain' and not is_attachment and text_part is None:
+            text_part = [number, encoding, params.get('charset', 'utf-8')]
+        elif is_attachment or maintype == 'application':
+            filename = _params(disposition[1]).get('filename') if disposition and len(disposition) > 1 else None
+            attachments.append({
+                'filename': filename or params.get('name'),
+                'content_type': f"{maintype}/{subtype}",
+                'size': size * 3 // 4 if encoding == 'base64' else size
+            })
+    return {'text_part': text_part, 'attachments': attachments}
+
+def decode_part(data: bytes, encoding: str, charset: str) -> str:
+    """Decode a fetched body part from its transfer encoding and charset."""
+    if encoding == 'base64':
+        data = base64.b64decode(data)
+    elif encoding == 'quoted-printable':
+        data = quopri.decodestring(data)
+    try:
+        return data.decode(charset or 'utf-8', 'replace')
+    except LookupError:
+        return data.decode('utf-8', 'replace')
+
+class MessageIndex:
+    """SQLite index of message headers per folder, with cached bodies."""
+
+    def __init__(self, db_path: str = ':memory:'):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: SQLite database file, or ':memory:'
+        """
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ':memory:':
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS folders ("
+            " name TEXT PRIMARY KEY, uidvalidity INTEGER NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " folder TEXT NOT NULL, uid INTEGER NOT NULL, sender TEXT, recipients TEXT,"
+            " subject TEXT, date TEXT, size INTEGER, flags TEXT, text_part TEXT,"
+            " attachments TEXT, body TEXT, PRIMARY KEY (folder, uid)) WITHOUT ROWID;"
+        )
+
+    def uidvalidity(self, folder: str) -> Optional[int]:
+        row = self._db.execute("SELECT uidvalidity FROM folders WHERE name = ?", (folder,)).fetchone()
+        return row[0] if row else None
+
+    def reset_folder(self, folder: str, uidvalidity: int) -> None:
+        """Drop all messages of a folder and record its new UIDVALIDITY."""
+        with self._db:
+            self._db.execute("DELETE FROM messages WHERE folder = ?", (folder,))
+            self._db.execute("INSERT OR REPLACE INTO folders (name, uidvalidity) VALUES (?, ?)",
+                             (folder, uidvalidity))
+
+    def max_uid(self, folder: str) -> int:
+        row = self._db.execute("SELECT MAX(uid) FROM messages WHERE folder = ?", (folder,)).fetchone()
+        return row[0] or 0
+
+    def count(self, folder: str) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM messages WHERE folder = ?", (folder,)).fetchone()[0]
+
+    def add(self, folder: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Index parsed FETCH records, keeping any cached bodies.
+
+        Args:
+            folder: Folder name
+            records: FETCH data items with UID, ENVELOPE and BODYSTRUCTURE
+
+        Returns:
+            int: Number of records indexed
+        """
+        rows = []
+        for record in records:
+            envelope = record.get('ENVELOPE') or [None] * 10
+            structure = summarize_structure(record.get('BODYSTRUCTURE'))
+            rows.append((
+                folder, record['UID'], _addresses(envelope[2]), _addresses(envelope[5]),
+                _text(envelope[1]), _text(envelope[0]), record.get('RFC822.SIZE'),
+                ' '.join(map(str, record.get('FLAGS') or [])),
+                json.dumps(structure['text_part']), json.dumps(structure['attachments'], ensure_ascii=False)
+            ))
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO messages (folder, uid, sender, recipients, subject, date, size, flags,"
+                " text_part, attachments) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (folder, uid) DO UPDATE SET sender = excluded.sender,"
+                " recipients = excluded.recipients, subject = excluded.subject, date = excluded.date,"
+                " size = excluded.size, flags = excluded.flags, text_part = excluded.text_part,"
+                " attachments = excluded.attachments",
+                rows
+            )
+        return len(rows)
+
+    def latest(self, folder: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """The most recent messages of a folder, oldest first."""
+        rows = self._db.execute(
+            f"SELECT {self._COLUMNS} FROM messages WHERE folder = ? ORDER BY uid DESC LIMIT ?", (folder, limit)
+        ).fetchall()
+        return [self._message(row) for row in reversed(rows)]
+
+    def get(self, folder: str, uids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Indexed messages with the given UIDs, in UID order."""
+        messages = []
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(uids), 500):
+            chunk = list(uids[start:start + 500])
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._db.execute(
+                f"SELECT {self._COLUMNS} FROM messages WHERE folder = ? AND uid IN ({placeholders})",
+                (folder, *chunk)
+            ).fetchall()
+            messages.extend(self._message(row) for row in rows)
+        return sorted(messages, key=lambda m: m['uid'])
+
+    def text_part(self, folder: str, uid: int) -> Optional[List[str]]:
+        row = self._db.execute("SELECT text_part FROM messages WHERE folder = ? AND uid = ?",
+                               (folder, uid)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def set_bodies(self, folder: str, bodies: Dict[int, str]) -> None:
+        with self._db:
+            self._db.executemany("UPDATE messages SET body = ? WHERE folder = ? AND uid = ?",
+                                 [(body, folder, uid) for uid, body in bodies.items()])
+
+    def remove(self, folder: str, uids: Iterable[int]) -> None:
+        with self._db:
+            self._db.executemany("DELETE FROM messages WHERE folder = ? AND uid = ?",
+                                 [(folder, uid) for uid in uids])
+
+    def retain(self, folder: str, uids: Iterable[int]) -> None:
+        """Remove indexed messages of a folder whose UIDs are not in uids."""
+        with self._db:
+            self._db.execute("CREATE TEMP TABLE IF NOT EXISTS live_uids (uid INTEGER PRIMARY KEY)")
+            self._db.execute("DELETE FROM live_uids")
+            self._db.executemany("INSERT OR IGNORE INTO live_uids (uid) VALUES (?)", ((uid,) for uid in uids))
+            self._db.execute("DELETE FROM messages WHERE folder = ? AND uid NOT IN (SELECT uid FROM live_uids)",
+                             (folder,))
+
+    def close(self) -> None:
+        self._db.close()
+
+    _COLUMNS = "uid, sender, recipients, subject, date, size, flags, attachments, body"
+
+    @staticmethod
+    def _message(row) -> Dict[str, Any]:
+        uid, sender, recipients, subject, date, size, flags, attachments, body = row
+        return {
+            'id': str(uid),
+            'uid': uid,
+            'from': sender,
+            'to': recipients,
+            'subject': subject,
+            'date': date,
+            'size': size,
+            'flags': flags.split() if flags else [],
+            'body': body,
+            'attachments': json.loads(attachments) if attachments else []
+        }
+
+class ImapMailbox:
+    """Synchronizes IMAP folders into a MessageIndex over one connection."""
+
+    def __init__(self, client: Any, index: MessageIndex, batch_size: int = 500):
+        """
+        Initialize the mailbox.
+
+        Args:
+            client: Logged-in IMAP client
+            index: Local message index
+            batch_size: Messages per UID FETCH command
+        """
+        self.client = client
+        self.index = index
+        self.batch_size = batch_size
+        self._selected: Optional[str] = None
+
+    async def select(self, folder: str, refresh: bool = False) -> Dict[str, int]:
+        """
+        Select a folder unless it is already selected.
+
+        Args:
+            folder: Folder name
+            refresh: Re-select to pick up new messages
+
+        Returns:
+            Dict[str, int]: UIDVALIDITY, UIDNEXT and EXISTS when re-selected
+        """
+        if self._selected == folder and not refresh:
+            return {}
+        result, lines = await self.client.select(folder)
+        if result != 'OK':
+            raise RuntimeError(f"Cannot select folder {folder}: {_join(lines[-1:]).decode(errors='replace')}")
+        self._selected = folder
+        return parse_mailbox_status(lines)
+
+    async def sync(self, folder: str) -> int:
+        """
+        Index messages that arrived since the last sync.
+
+        Args:
+            folder: Folder name
+
+        Returns:
+            int: Number of newly indexed messages
+        """
+        status = await self.select(folder, refresh=True)
+        validity = status.get('UIDVALIDITY')
+        if validity is not None and validity != self.index.uidvalidity(folder):
+            # UIDs from the old validity period are meaningless now
+            self.index.reset_folder(folder, validity)
+
+        last = self.index.max_uid(folder)
+        added = 0
+        uidnext = status.get('UIDNEXT')
+        if uidnext is None or uidnext - 1 > last:
+            new_uids = [uid for uid in await self.search(folder, f'UID {last + 1}:*') if uid > last]
+            records = await self.fetch(folder, new_uids, HEADER_ITEMS)
+            added = self.index.add(folder, records)
+
+        # Messages were expunged elsewhere when the counts disagree
+        exists = status.get('EXISTS')
+        if exists is not None and self.index.count(folder) != exists:
+            self.index.retain(folder, await self.search(folder, 'ALL'))
+        return added
+
+    async def search(self, folder: str, criteria: str) -> List[int]:
+        """
+        Run a UID SEARCH in a folder.
+
+        Args:
+            folder: Folder name
+            criteria: IMAP search criteria
+
+        Returns:
+            List[int]: Matching UIDs in ascending order
+        """
+        await self.select(folder)
+        result, lines = await self.client.uid_search(criteria)
+        if result != 'OK':
+            raise RuntimeError(f"Search failed: {_join(lines[-1:]).decode(errors='replace')}")
+        return sorted(parse_search_response(lines))
+
+    async def fetch(self, folder: str, uids: Sequence[int], items: str) -> List[Dict[str, Any]]:
+        """
+        Fetch data items for UIDs in batches.
+
+        aioimaplib runs FETCH commands one at a time (their untagged replies
+        cannot be told apart), so batches are requested in order; each
+        batch is parsed while the next one is being answered.
+
+        Args:
+            folder: Folder name
+            uids: UIDs to fetch
+            items: FETCH data items, e.g. HEADER_ITEMS
+
+        Returns:
+            List[Dict[str, Any]]: Parsed data items per message
+        """
+        if not uids:
+            return []
+        await self.select(folder)
+        uids = sorted(uids)
+        batches = [uids[start:start + self.batch_size] for start in range(0, len(uids), self.batch_size)]
+
+        async def request(batch: Sequence[int]) -> List[Any]:
+            result, lines = await self.client.uid('fetch', sequence_set(batch), items)
+            if result != 'OK':
+                raise RuntimeError(f"Fetch failed: {_join(lines[-1:]).decode(errors='replace')}")
+            return lines
+
+        records: List[Dict[str, Any]] = []
+        pending = asyncio.ensure_future(request(batches[0]))
+        try:
+            for number in range(len(batches)):
+                lines = await pending
+                if number + 1 < len(batches):
+                    pending = asyncio.ensure_future(request(batches[number + 1]))
+                    # Let the next command go out before parsing this batch
+                    await asyncio.sleep(0)
+                records.extend(parse_fetch_response(lines))
+        finally:
+            if not pending.done():
+                pending.cancel()
+        return records
+
+    async def load_bodies(self, folder: str, uids: Sequence[int]) -> Dict[int, str]:
+        """
+        Get the plain text bodies of messages, fetching only those not cached.
+
+        Args:
+            folder: Folder name
+            uids: Message UIDs
+
+        Returns:
+            Dict[int, str]: Body per UID ('' when a message has no text part)
+        """
+        bodies = {message['uid']: message['body'] for message in self.index.get(folder, uids)}
+        missing: Dict[str, List[int]] = {}
+        parts: Dict[int, List[str]] = {}
+        for uid, body in bodies.items():
+            if body is not None:
+                continue
+            part = self.index.text_part(folder, uid)
+            if part is None:
+                bodies[uid] = ''
+                continue
+            parts[uid] = part
+            missing.setdefault(part[0], []).append(uid)
+
+        fetched: Dict[int, str] = {}
+        for number, part_uids in missing.items():
+            for record in await self.fetch(folder, part_uids, f'(UID BODY.PEEK[{number}])'):
+                uid = record.get('UID')
+                if uid in parts:
+                    data = record.get(f'BODY[{number}]') or b''
+                    if isinstance(data, str):
+                        data = data.encode()
+                    _, encoding, charset = parts[uid]
+                    fetched[uid] = decode_part(data, encoding, charset)
+        if fetched:
+            self.index.set_bodies(folder, fetched)
+        bodies.update(fetched)
+        return bodies
+
+    async def delete(self, folder: str, uids: Sequence[int]) -> None:
+        """
+        Delete messages by UID and drop them from the index.
+
+        Args:
+            folder: Folder name
+            uids: Message UIDs
+        """
+        await self.select(folder)
+        result, lines = await self.client.uid('store', sequence_set(sorted(uids)), '+FLAGS', '(\\Deleted)')
+        if result != 'OK':
+            raise RuntimeError(f"Delete failed: {_join(lines[-1:]).decode(errors='replace')}")
+        await self.client.expunge()
+        self.index.remove(folder, uids)
+
+__all__ = [
+    "MessageIndex", "ImapMailbox", "HEADER_ITEMS", "parse_fetch_response", "parse_mailbox_status",
+    "parse_search_response", "sequence_set", "summarize_structure", "decode_part"
+]
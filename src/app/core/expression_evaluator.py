@@ -0,0 +1,297 @@
+"""Safe, compiled arithmetic expression evaluation.
+
+Expressions are parsed once into a Python AST, checked against a whitelist of
+node types, functions and constants, and turned into a tree of closures that
+work equally on Python scalars and NumPy arrays. Compiled expressions are
+cached, so repeated evaluation skips parsing entirely, and passing arrays as
+variables evaluates an expression over many operand rows in one vectorized
+pass.
+
+For many different expression strings, evaluate_many strips the numeric
+literals out of each one; expressions with the same shape (e.g. ``"2 + 3*4"``
+and ``"7 + 1*9"``) share one compiled template evaluated over a column of
+literals per slot.
+"""
+
+import ast
+import math
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+_CONSTANTS = {
+    'pi': math.pi,
+    'e': math.e,
+    'tau': math.tau,
+    'inf': math.inf,
+}
+
+def _log(x, base=None):
+    return np.log(x) if base is None else np.log(x) / np.log(base)
+
+_FUNCTIONS = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+    'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan, 'atan2': np.arctan2,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+    'sqrt': np.sqrt, 'exp': np.exp, 'log': _log, 'ln': np.log, 'log10': np.log10, 'log2': np.log2,
+    'abs': np.abs, 'fabs': np.abs, 'floor': np.floor, 'ceil': np.ceil, 'round': np.round,
+    'radians': np.radians, 'degrees': np.degrees, 'hypot': np.hypot,
+    'min': np.minimum, 'max': np.maximum,
+}
+
+# math.pow always works in floats, like the stdlib; bare pow is exact like **
+_MATH_FUNCTIONS = {'pow': np.float_power}
+
+_TRIG = {'sin', 'cos', 'tan'}
+_INVERSE_TRIG = {'asin', 'acos', 'atan', 'atan2'}
+
+# Exact int powers with huge results can run for minutes (and nest, as in
+# (9**1000)**1000); above this many result bits, fall back to floats
+_MAX_INT_BITS = 1 << 16
+
+# Numeric literals that are not part of a name (log10, x1) or of another number
+_NUMBER = re.compile(r"(\d(?<![\w.]\d)\d*\.?\d*(?:[eE][+-]?\d+)?)")
+_SLOT = "\x01"
+_SEPARATOR = "\x00"
+
+def _power(base, exponent):
+    if isinstance(exponent, int) and isinstance(base, int) and base.bit_length() * abs(exponent) > _MAX_INT_BITS:
+        try:
+            return float(base) ** exponent
+        except OverflowError:
+            raise OverflowError("Result too large") from None
+    return base ** exponent
+
+_FUNCTIONS['pow'] = _power
+
+class CompiledExpression:
+    """A validated expression ready to evaluate on scalars or arrays."""
+
+    def __init__(self, source: str, evaluator: Evaluator, variables: frozenset):
+        self.source = source
+        self.variables = variables
+        self._evaluator = evaluator
+
+    def evaluate(self, variables: Optional[Mapping[str, Any]] = None) -> Any:
+        """
+        Evaluate the expression.
+
+        Args:
+            variables: Values for the expression's free names (scalars or arrays)
+
+        Returns:
+            The result, a scalar or a NumPy array when any variable is an array
+        """
+        variables = variables or {}
+        missing = self.variables.difference(variables)
+        if missing:
+            raise NameError(f"Undefined variable(s): {', '.join(sorted(missing))}")
+        return self._evaluator(variables)
+
+    __call__ = evaluate
+
+class _Compiler:
+    """Turns a whitelisted AST into nested closures."""
+
+    def __init__(self, angle_mode: str):
+        if angle_mode not in ('radians', 'degrees'):
+            raise ValueError(f"Invalid angle mode: {angle_mode}")
+        self.degrees = angle_mode == 'degrees'
+        self.variables = set()
+
+    def compile(self, node: ast.AST) -> Evaluator:
+        if isinstance(node, ast.Expression):
+            return self.compile(node.body)
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            value = node.value
+            return lambda env: value
+        if isinstance(node, ast.Name):
+            return self._name(node.id)
+        if isinstance(node, ast.BinOp):
+            left, right = self.compile(node.left), self.compile(node.right)
+            if isinstance(node.op, ast.Pow):
+                return lambda env: _power(left(env), right(env))
+            op = _BINARY_OPERATORS.get(type(node.op))
+            if op is None:
+                raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+            return lambda env: op(left(env), right(env))
+        if isinstance(node, ast.UnaryOp):
+            op = _UNARY_OPERATORS.get(type(node.op))
+            if op is None:
+                raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+            operand = self.compile(node.operand)
+            return lambda env: op(operand(env))
+        if isinstance(node, ast.Call):
+            return self._call(node)
+        if isinstance(node, ast.Attribute):
+            return self._attribute(node)
+        raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+    def _name(self, name: str) -> Evaluator:
+        if name in _CONSTANTS:
+            value = _CONSTANTS[name]
+            return lambda env: value
+        if name in _FUNCTIONS or name == 'math':
+            raise ValueError(f"Function used as a value: {name}")
+        self.variables.add(name)
+        return lambda env: env[name]
+
+    def _attribute(self, node: ast.Attribute) -> Evaluator:
+        # Only math.<constant>, e.g. math.pi
+        if not (isinstance(node.value, ast.Name) and node.value.id == 'math'):
+            raise ValueError("Unsupported expression element: Attribute")
+        if node.attr not in _CONSTANTS:
+            raise ValueError(f"Unsupported constant: math.{node.attr}")
+        value = _CONSTANTS[node.attr]
+        return lambda env: value
+
+    def _call(self, node: ast.Call) -> Evaluator:
+        func = node.func
+        # Accept both sin(x) and math.sin(x)
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == 'math':
+            name = func.attr
+            function = _MATH_FUNCTIONS.get(name) or _FUNCTIONS.get(name)
+        elif isinstance(func, ast.Name):
+            name = func.id
+            function = _FUNCTIONS.get(name)
+        else:
+            raise ValueError("Unsupported function call")
+        if function is None:
+            raise ValueError(f"Unsupported function: {name}")
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported")
+        args = [self.compile(arg) for arg in node.args]
+
+        if self.degrees and name in _TRIG:
+            return lambda env: function(*(np.radians(arg(env)) for arg in args))
+        if self.degrees and name in _INVERSE_TRIG:
+            return lambda env: np.degrees(function(*(arg(env) for arg in args)))
+        if len(args) == 1:
+            arg = args[0]
+            return lambda env: function(arg(env))
+        return lambda env: function(*(arg(env) for arg in args))
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str, angle_mode: str = 'radians') -> CompiledExpression:
+    """
+    Compile an expression, cached by source and angle mode.
+
+    Args:
+        expression: Arithmetic expression, e.g. ``"sqrt(x**2 + y**2)"``
+        angle_mode: 'radians' or 'degrees' for trigonometric functions
+
+    Returns:
+        CompiledExpression: The compiled expression
+
+    Raises:
+        ValueError: If the expression contains anything outside the whitelist
+        SyntaxError: If the expression cannot be parsed
+    """
+    tree = ast.parse(expression.strip(), mode='eval')
+    compiler = _Compiler(angle_mode)
+    evaluator = compiler.compile(tree)
+    return CompiledExpression(expression, evaluator, frozenset(compiler.variables))
+
+def evaluate(expression: str, variables: Optional[Mapping[str, Any]] = None, angle_mode: str = 'radians') -> Any:
+    """
+    Evaluate an expression, optionally over arrays of operands.
+
+    Args:
+        expression: Arithmetic expression
+        variables: Values for free names; lists are converted to float arrays
+        angle_mode: 'radians' or 'degrees'
+
+    Returns:
+        A scalar, or a NumPy array when any variable is a sequence
+    """
+    env = {
+        name: np.asarray(value, dtype=np.float64) if isinstance(value, (list, tuple, np.ndarray)) else value
+        for name, value in (variables or {}).items()
+    }
+    with np.errstate(all='ignore'):
+        return compile_expression(expression, angle_mode).evaluate(env)
+
+def _numbered_template(shape: str) -> str:
+    """Replace each literal slot of a shape with a distinct variable name."""
+    parts = shape.split(_SLOT)
+    return "".join(
+        part + (f"__n{i}" if i < len(parts) - 1 else "")
+        for i, part in enumerate(parts)
+    )
+
+def evaluate_many(expressions: Iterable[str], angle_mode: str = 'radians') -> Tuple[np.ndarray, Dict[int, str]]:
+    """
+    Evaluate many independent constant expressions.
+
+    Args:
+        expressions: Expressions without free variables
+        angle_mode: 'radians' or 'degrees'
+
+    Returns:
+        Tuple[np.ndarray, Dict[int, str]]: float64 results (NaN where an
+        expression failed) and an error message per failed index
+    """
+    expressions = list(expressions)
+    if not expressions:
+        return np.zeros(0), {}
+    # Tokenize everything in one regex pass over a joined string instead of
+    # one pass per expression
+    joined = _SEPARATOR.join(expressions)
+    if joined.count(_SEPARATOR) != len(expressions) - 1 or _SLOT in joined:
+        raise ValueError("Expressions must not contain control characters")
+    parts = _NUMBER.split(joined)
+    shapes = _SLOT.join(parts[0::2]).split(_SEPARATOR)
+    literals = np.array(parts[1::2], dtype=np.float64)
+
+    groups: Dict[str, List[int]] = {}
+    offsets = np.zeros(len(shapes), dtype=np.int64)
+    offset = 0
+    for index, shape in enumerate(shapes):
+        offsets[index] = offset
+        offset += shape.count(_SLOT)
+        group = groups.get(shape)
+        if group is None:
+            group = groups[shape] = []
+        group.append(index)
+
+    results = np.full(len(shapes), np.nan)
+    errors: Dict[int, str] = {}
+    for shape, indices in groups.items():
+        try:
+            compiled = compile_expression(_numbered_template(shape), angle_mode)
+            unknown = sorted(name for name in compiled.variables if not name.startswith("__n"))
+            if unknown:
+                raise NameError(f"Undefined variable(s): {', '.join(unknown)}")
+            starts = offsets[indices]
+            env = {f"__n{slot}": literals[starts + slot] for slot in range(shape.count(_SLOT))}
+            with np.errstate(all='ignore'):
+                results[indices] = np.broadcast_to(compiled.evaluate(env), (len(indices),))
+        except Exception as e:
+            for index in indices:
+                errors[index] = str(e)
+    for index in np.flatnonzero(~np.isfinite(results)):
+        errors.setdefault(int(index), 'Result is undefined (e.g. division by zero)')
+    if errors:
+        results[list(errors)] = np.nan
+    return results, errors
+
+__all__ = ["CompiledExpression", "compile_expression", "evaluate", "evaluate_many"]
@@ -0,0 +1,322 @@
+"""Large-file reads, writes, copies and moves for the file system tool.
+
+- map_range maps a byte range of a file with mmap and hands out a
+  memoryview, so callers can scan or hash part of a large file without
+  reading it. read_range returns the range as bytes, reading small ranges
+  directly and mapping large ones.
+- write_chunks streams str/bytes chunks to a file (optionally at an offset
+  or appended), encoding text incrementally, so content never has to be
+  joined into one buffer first.
+- copy_file copies inside the kernel where it can: copy_file_range (which
+  may also reflink or copy server-side), then sendfile, and only then a
+  user-space loop over one reused buffer. Memory use is constant whatever
+  the file size, and progress is reported per chunk.
+- move_file renames within a filesystem. Across devices it copies into a
+  temporary file next to the destination, fsyncs, renames it into place
+  and only then removes the source, so the destination is never partial.
+- copy_many runs many copies concurrently on a thread pool; the copy
+  syscalls release the GIL, which keeps the disk busy with small files.
+"""
+
+import asyncio
+import codecs
+import errno
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+Chunk = Union[str, bytes, bytearray, memoryview]
+Progress = Callable[[int, int], None]
+
+MMAP_THRESHOLD = 1 << 20
+COPY_CHUNK = 64 << 20
+BUFFER_SIZE = 1 << 20
+
+# Errors meaning "this copy method is not supported here", not "the copy failed"
+_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP,
+                errno.EBADF, errno.ETXTBSY, errno.ENOTSOCK}
+
+@contextmanager
+def map_range(path: str, offset: int = 0, length: Optional[int] = None) -> Iterator[memoryview]:
+    """
+    Memory-map a byte range of a file.
+
+    The view is only valid inside the with block and must not be kept
+    (or sliced into objects that outlive it).
+
+    Args:
+        path: File to map
+        offset: First byte
+        length: Number of bytes (None for the rest of the file)
+
+    Yields:
+        memoryview: Read-only view of the range (empty past end of file)
+
+    Raises:
+        ValueError: If offset or length is negative
+    """
+    if offset < 0 or (length is not None and length < 0):
+        raise ValueError(f"Invalid range: offset={offset}, length={length}")
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if length is None else min(size, offset + length)
+        if offset >= end:
+            yield memoryview(b'')
+            return
+        # mmap offsets must be aligned to the allocation granularity
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(f.fileno(), end - start, offset=start, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                with view[offset - start:] as window:
+                    yield window
+            finally:
+                view.release()
+
+def read_range(path: str, offset: int = 0, length: Optional[int] = None) -> bytes:
+    """
+    Read a byte range of a file.
+
+    Args:
+        path: File to read
+        offset: First byte
+        length: Number of bytes (None for the rest of the file)
+
+    Returns:
+        bytes: The range (shorter than length at end of file)
+    """
+    if offset < 0 or (length is not None and length < 0):
+        raise ValueError(f"Invalid range: offset={offset}, length={length}")
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if length is None else min(size, offset + length)
+        if end - offset < MMAP_THRESHOLD:
+            f.seek(offset)
+            return f.read(max(0, end - offset))
+    with map_range(path, offset, length) as view:
+        return view.tobytes()
+
+def write_chunks(path: str, chunks: Union[Chunk, Iterable[Chunk]], offset: Optional[int] = None,
+                 append: bool = False, encoding: str = 'utf-8', fsync: bool = False) -> int:
+    """
+    Write str/bytes chunks to a file as they are produced.
+
+    Args:
+        path: File to write
+        chunks: One chunk or an iterable of chunks; str chunks are encoded
+            incrementally with encoding
+        offset: Write at this position in an existing file instead of
+            replacing it
+        append: Append to the file instead of replacing it
+        encoding: Encoding for str chunks
+        fsync: Flush to disk before returning
+
+    Returns:
+        int: Bytes written
+    """
+    if isinstance(chunks, (str, bytes, bytearray, memoryview)):
+        chunks = (chunks,)
+    if append:
+        mode = 'ab'
+    elif offset is not None:
+        mode = 'r+b' if os.path.exists(path) else 'wb'
+    else:
+        mode = 'wb'
+    encoder = codecs.getincrementalencoder(encoding)()
+    written = 0
+    with open(path, mode) as f:
+        if offset is not None and not append:
+            f.seek(offset)
+        for chunk in chunks:
+            data = encoder.encode(chunk) if isinstance(chunk, str) else chunk
+            f.write(data)
+            written += data.nbytes if isinstance(data, memoryview) else len(data)
+        tail = encoder.encode('', final=True)
+        if tail:
+            f.write(tail)
+            written += len(tail)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    return written
+
+def _copy_file_range(src: int, dst: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src, dst, count, offset, offset)
+
+def _sendfile(src: int, dst: int, offset: int, count: int) -> int:
+    os.lseek(dst, offset, os.SEEK_SET)
+    return os.sendfile(dst, src, offset, count)
+
+_KERNEL_METHODS: List[Callable[[int, int, int, int], int]] = []
+if hasattr(os, 'copy_file_range'):
+    _KERNEL_METHODS.append(_copy_file_range)
+# Only Linux sendfile accepts a regular file as output
+if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+    _KERNEL_METHODS.append(_sendfile)
+
+def _buffered(src: int, dst: int, offset: int, progress: Optional[Progress], total: int) -> int:
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    os.lseek(src, offset, os.SEEK_SET)
+    os.lseek(dst, offset, os.SEEK_SET)
+    copied = offset
+    while True:
+        size = os.readv(src, [buffer])
+        if not size:
+            return copied
+        written = 0
+        while written < size:
+            written += os.write(dst, view[written:size])
+        copied += size
+        if progress:
+            progress(copied, total)
+
+def _copy_fd(src: int, dst: int, total: int, progress: Optional[Progress], chunk_size: int) -> int:
+    copied = 0
+    # Pseudo-files report size 0 but have content the kernel paths would skip
+    methods = _KERNEL_METHODS if total else []
+    for method in methods:
+        try:
+            while True:
+                size = method(src, dst, copied, chunk_size)
+                if not size:
+                    break
+                copied += size
+                if progress:
+                    progress(copied, total)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            continue
+        if copied >= total:
+            return copied
+        # Some filesystems report 0 before EOF; finish with plain reads
+        break
+    return _buffered(src, dst, copied, progress, total)
+
+def copy_file(source: str, destination: str, progress: Optional[Progress] = None, chunk_size: int = COPY_CHUNK,
+              preserve: bool = True, fsync: bool = False) -> int:
+    """
+    Copy a file without staging its content in user space where possible.
+
+    Args:
+        source: File to copy
+        destination: Target path (replaced if it exists)
+        progress: Called with (bytes copied, total bytes) after each chunk
+        chunk_size: Bytes per kernel copy call (and per progress report)
+        preserve: Copy permission bits and timestamps, like shutil.copy2
+        fsync: Flush the copy to disk before returning
+
+    Returns:
+        int: Bytes copied
+
+    Raises:
+        shutil.SameFileError: If source and destination are the same file
+    """
+    with open(source, 'rb') as fsrc:
+        stat = os.fstat(fsrc.fileno())
+        # Opening the destination truncates it, so refuse before that, like shutil.copy2
+        try:
+            target = os.stat(destination)
+        except FileNotFoundError:
+            target = None
+        if target is not None and (target.st_dev, target.st_ino) == (stat.st_dev, stat.st_ino):
+            raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+        with open(destination, 'wb') as fdst:
+            copied = _copy_fd(fsrc.fileno(), fdst.fileno(), stat.st_size, progress, chunk_size)
+            if fsync:
+                os.fsync(fdst.fileno())
+    if preserve:
+        shutil.copystat(source, destination)
+    return copied
+
+def move_file(source: str, destination: str, progress: Optional[Progress] = None) -> str:
+    """
+    Move a file, atomically replacing destination.
+
+    Args:
+        source: File to move
+        destination: Target path
+        progress: Progress callback for cross-device moves (see copy_file)
+
+    Returns:
+        str: 'rename' for a same-filesystem move, 'copy' otherwise
+    """
+    try:
+        os.replace(source, destination)
+        return 'rename'
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    directory, name = os.path.split(os.path.abspath(destination))
+    fd, temp = tempfile.mkstemp(prefix=f'.{name}.', suffix='.part', dir=directory)
+    os.close(fd)
+    try:
+        copy_file(source, temp, progress, fsync=True)
+        os.replace(temp, destination)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+    os.unlink(source)
+    return 'copy'
+
+def _copy_job(source: str, destination: str, overwrite: bool) -> Tuple[bool, Any]:
+    try:
+        if not overwrite and os.path.exists(destination):
+            raise FileExistsError(f"Destination already exists: {destination}")
+        os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+        return True, copy_file(source, destination)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+async def copy_many(pairs: Sequence[Tuple[str, str]], max_workers: int = 8, overwrite: bool = False,
+                    progress: Optional[Progress] = None) -> List[Tuple[bool, Any]]:
+    """
+    Copy many files concurrently.
+
+    Args:
+        pairs: (source, destination) paths
+        max_workers: Copies in flight at once
+        overwrite: Replace existing destinations
+        progress: Called on the event loop with (files done, total files)
+
+    Returns:
+        List[Tuple[bool, Any]]: Per pair, in order, (True, bytes copied) or
+        (False, error message)
+    """
+    loop = asyncio.get_running_loop()
+    done = 0
+
+    def finished(_: asyncio.Future) -> None:
+        nonlocal done
+        done += 1
+        if progress:
+            progress(done, len(pairs))
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='fs-copy')
+    try:
+        futures = []
+        for source, destination in pairs:
+            future = loop.run_in_executor(pool, _copy_job, source, destination, overwrite)
+            future.add_done_callback(finished)
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+    finally:
+        pool.shutdown(wait=False)
+
+__all__ = [
+    'map_range',
+    'read_range',
+    'write_chunks',
+    'copy_file',
+    'move_file',
+    'copy_many',
+]
@@ -0,0 +1,376 @@
+"""Streaming directory walker for the file system tool.
+
+- Directories are read with os.scandir. Entry type comes from the
+  directory listing itself, and each entry is stat'ed at most once, through
+  the DirEntry cache.
+- WalkFilter pushes name, type, size and mtime filters into the walk.
+  Name and type checks run before any stat call, and hidden directories
+  are pruned instead of walked and discarded.
+- iter_entries is an async generator. The root's subdirectories are walked
+  in parallel on a thread pool, each into a bounded channel, and drained in
+  order, so results arrive as soon as the first batch is ready and memory
+  stays bounded by the prefetch window instead of by the tree size.
+- Order is deterministic (depth-first, names sorted per directory), so a
+  cursor naming the last returned path resumes a walk without replaying or
+  buffering earlier results. list_page returns one page plus the cursor for
+  the next.
+"""
+
+import asyncio
+import base64
+import binascii
+import fnmatch
+import logging
+import os
+import re
+import stat
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+KINDS = ('file', 'directory')
+
+_DONE = object()
+
+class WalkEntry(NamedTuple):
+    """One file or directory found by the walker."""
+    path: str
+    name: str
+    is_dir: bool
+    size: Optional[int]
+    mtime: Optional[float]
+    inode: Optional[int] = None
+    device: Optional[int] = None
+
+@dataclass(frozen=True)
+class WalkFilter:
+    """
+    Conditions an entry must meet to be returned.
+
+    Size conditions only match files. Entries that fail a condition are
+    not returned, but directories are still descended into; only hidden
+    directories (when include_hidden is False) and directories deeper than
+    max_depth are pruned.
+
+    Attributes:
+        pattern: Glob matched against the entry name (case-sensitive)
+        contains: Substring the entry name must contain
+        kind: 'file' or 'directory'
+        min_size: Minimum file size in bytes
+        max_size: Maximum file size in bytes
+        modified_after: Minimum mtime (epoch seconds)
+        modified_before: Maximum mtime (epoch seconds)
+        include_hidden: Include names starting with '.'
+        max_depth: Deepest level to descend to (0 lists only the root)
+    """
+    pattern: Optional[str] = None
+    contains: Optional[str] = None
+    kind: Optional[str] = None
+    min_size: Optional[int] = None
+    max_size: Optional[int] = None
+    modified_after: Optional[float] = None
+    modified_before: Optional[float] = None
+    include_hidden: bool = False
+    max_depth: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.kind is not None and self.kind not in KINDS:
+            raise ValueError(f"Invalid entry type: {self.kind}")
+
+def encode_cursor(root: str, path: str) -> str:
+    """
+    Opaque cursor resuming a walk of root after path.
+
+    Args:
+        root: Walk root
+        path: Last path returned
+
+    Returns:
+        str: Cursor token
+    """
+    relative = os.path.relpath(path, root)
+    return base64.urlsafe_b64encode(os.fsencode(relative)).decode('ascii')
+
+def decode_cursor(cursor: str) -> Tuple[str, ...]:
+    """
+    Path components (relative to the walk root) stored in a cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        relative = os.fsdecode(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    parts = tuple(relative.split(os.sep))
+    if not relative or os.path.isabs(relative) or any(part in ('', '.', '..') for part in parts):
+        raise ValueError("Invalid cursor")
+    return parts
+
+class _Walker:
+    """Depth-first scandir walk for one WalkFilter, stoppable from another thread."""
+
+    def __init__(self, spec: WalkFilter, stop: threading.Event):
+        self.spec = spec
+        self.stop = stop
+        self._glob = re.compile(fnmatch.translate(spec.pattern)).match if spec.pattern else None
+        self._needs_stat = any(value is not None for value in (
+            spec.min_size, spec.max_size, spec.modified_after, spec.modified_before))
+
+    def children(self, path: str, after: Tuple[str, ...]) -> Iterator[Tuple[os.DirEntry, Optional[Tuple[str, ...]]]]:
+        """
+        Sorted entries of path still due after the cursor components.
+
+        Each entry comes with its own resume point: None when the entry is
+        still to be returned, or the remaining cursor components when it
+        was returned already and only part of its subtree is due.
+        """
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        head = after[0] if after else None
+        for entry in entries:
+            if head is None or entry.name > head:
+                yield entry, None
+            elif entry.name == head:
+                yield entry, after[1:]
+
+    def descends(self, entry: os.DirEntry, depth: int) -> bool:
+        """Whether the walk goes below entry, found at depth."""
+        if self.spec.max_depth is not None and depth >= self.spec.max_depth:
+            return False
+        if not self.spec.include_hidden and entry.name.startswith('.'):
+            return False
+        try:
+            return entry.is_dir(follow_symlinks=False)
+        except OSError:
+            return False
+
+    def visit(self, entry: os.DirEntry, depth: int, after: Optional[Tuple[str, ...]]) -> Iterator[WalkEntry]:
+        """Yield entry (unless the cursor is past it) and then its matching descendants."""
+        if after is None:
+            found = self._match(entry)
+            if found is not None:
+                yield found
+        if not self.descends(entry, depth):
+            return
+        try:
+            children = self.children(entry.path, after or ())
+            for child, child_after in children:
+                if self.stop.is_set():
+                    return
+                yield from self.visit(child, depth + 1, child_after)
+        except OSError as e:
+            # Unreadable subdirectories are skipped, as os.walk does
+            logger.debug(f"Skipping {entry.path}: {e}")
+
+    def _match(self, entry: os.DirEntry) -> Optional[WalkEntry]:
+        spec = self.spec
+        name = entry.name
+        if not spec.include_hidden and name.startswith('.'):
+            return None
+        if spec.contains is not None and spec.contains not in name:
+            return None
+        if self._glob is not None and not self._glob(name):
+            return None
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if spec.kind is not None and spec.kind != ('directory' if is_dir else 'file'):
+            return None
+        if is_dir and (spec.min_size is not None or spec.max_size is not None):
+            return None
+        try:
+            st = entry.stat()
+        except OSError:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                st = None
+        if st is None:
+            if self._needs_stat:
+                return None
+            return WalkEntry(entry.path, name, is_dir, None, None)
+        size = st.st_size if stat.S_ISREG(st.st_mode) else None
+        if spec.min_size is not None and (size is None or size < spec.min_size):
+            return None
+        if spec.max_size is not None and (size is None or size > spec.max_size):
+            return None
+        if spec.modified_after is not None and st.st_mtime < spec.modified_after:
+            return None
+        if spec.modified_before is not None and st.st_mtime > spec.modified_before:
+            return None
+        return WalkEntry(entry.path, name, is_dir, size, st.st_mtime, st.st_ino, st.st_dev)
+
+class _Channel:
+    """Bounded hand-off of result batches from a worker thread to the event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, stop: threading.Event, capacity: int):
+        self._loop = loop
+        self._stop = stop
+        self._slots = threading.Semaphore(capacity)
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def send(self, item: object) -> bool:
+        """Block until the consumer has room for item; False once the walk is stopped."""
+        while not self._slots.acquire(timeout=0.1):
+            if self._stop.is_set():
+                return False
+        if self._stop.is_set():
+            return False
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # The consumer's event loop is closed; nobody is listening
+            self._stop.set()
+            return False
+        return True
+
+    async def receive(self) -> object:
+        item = await self._queue.get()
+        self._slots.release()
+        return item
+
+def _produce(walker: _Walker, channel: _Channel, jobs: List[Tuple[os.DirEntry, Optional[Tuple[str, ...]]]],
+             batch_size: int) -> None:
+    """Walk one segment of the root on a worker thread, sending batches to channel."""
+    batch: List[WalkEntry] = []
+    try:
+        for entry, after in jobs:
+            for found in walker.visit(entry, 0, after):
+                batch.append(found)
+                if len(batch) >= batch_size:
+                    if not channel.send(batch):
+                        return
+                    batch = []
+            if walker.stop.is_set():
+                return
+        if batch and not channel.send(batch):
+            return
+        channel.send(_DONE)
+    except Exception as e:
+        channel.send(e)
+
+def _segments(walker: _Walker, jobs: List[Tuple[os.DirEntry, Optional[Tuple[str, ...]]]],
+              batch_size: int) -> Iterator[List[Tuple[os.DirEntry, Optional[Tuple[str, ...]]]]]:
+    """Split the root's entries into units of parallel work: one per subdirectory, files grouped."""
+    files: List[Tuple[os.DirEntry, Optional[Tuple[str, ...]]]] = []
+    for job in jobs:
+        if walker.descends(job[0], 0):
+            if files:
+                yield files
+                files = []
+            yield [job]
+        else:
+            files.append(job)
+            if len(files) >= batch_size:
+                yield files
+                files = []
+    if files:
+        yield files
+
+async def iter_entries(root: str, spec: Optional[WalkFilter] = None, cursor: Optional[str] = None,
+                       max_workers: int = 4, batch_size: int = 256, prefetch: int = 4) -> AsyncIterator[WalkEntry]:
+    """
+    Stream the entries under root that match spec.
+
+    Up to max_workers subdirectories of root are walked at once, each
+    buffering at most prefetch batches of batch_size entries ahead of the
+    consumer. Closing the generator early stops the workers.
+
+    Args:
+        root: Directory to walk
+        spec: Filter; defaults to every non-hidden entry, recursively
+        cursor: Resume after the entry this cursor was made for
+        max_workers: Subtrees walked in parallel
+        batch_size: Entries per hand-off to the event loop
+        prefetch: Batches buffered per subtree
+
+    Yields:
+        WalkEntry: Matching entries, depth-first with names sorted
+
+    Raises:
+        OSError: If root cannot be listed
+        ValueError: If the cursor is malformed
+    """
+    root = os.path.abspath(root)
+    spec = spec or WalkFilter()
+    after = decode_cursor(cursor) if cursor else ()
+    stop = threading.Event()
+    walker = _Walker(spec, stop)
+    loop = asyncio.get_running_loop()
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='fs-walk')
+    try:
+        jobs = await loop.run_in_executor(pool, lambda: list(walker.children(root, after)))
+        segments = _segments(walker, jobs, batch_size)
+        pending: deque = deque()
+
+        def start_next() -> None:
+            jobs = next(segments, None)
+            if jobs is not None:
+                channel = _Channel(loop, stop, max(1, prefetch))
+                pool.submit(_produce, walker, channel, jobs, batch_size)
+                pending.append(channel)
+
+        for _ in range(max(1, max_workers)):
+            start_next()
+        while pending:
+            channel = pending[0]
+            while True:
+                batch = await channel.receive()
+                if batch is _DONE:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                for found in batch:
+                    yield found
+            pending.popleft()
+            start_next()
+    finally:
+        stop.set()
+        pool.shutdown(wait=False)
+
+async def list_page(root: str, spec: Optional[WalkFilter] = None, limit: int = 1000,
+                    cursor: Optional[str] = None, **options) -> Tuple[List[WalkEntry], Optional[str]]:
+    """
+    One page of iter_entries and the cursor for the next.
+
+    Args:
+        root: Directory to walk
+        spec: Filter
+        limit: Maximum entries to return
+        cursor: Cursor from the previous page
+        **options: Passed to iter_entries
+
+    Returns:
+        Tuple[List[WalkEntry], Optional[str]]: Entries and the next cursor
+        (None when the walk is complete)
+    """
+    if limit < 1:
+        raise ValueError(f"Invalid limit: {limit}")
+    entries: List[WalkEntry] = []
+    more = False
+    walk = iter_entries(root, spec, cursor, **options)
+    try:
+        async for found in walk:
+            if len(entries) == limit:
+                more = True
+                break
+            entries.append(found)
+    finally:
+        await walk.aclose()
+    next_cursor = encode_cursor(os.path.abspath(root), entries[-1].path) if more else None
+    return entries, next_cursor
+
+__all__ = [
+    'WalkEntry',
+    'WalkFilter',
+    'encode_cursor',
+    'decode_cursor',
+    'iter_entries',
+    'list_page',
+]
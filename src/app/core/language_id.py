@@ -0,0 +1,235 @@
+"""Arabic/English language identification and Arabic normalization.
+
+- detect classifies text as Arabic or English in two steps. First a
+  histogram of Unicode blocks (Arabic letters, Latin letters, digits),
+  built with one str.translate through a precomputed table. Then, within
+  the dominant script, a small character-trigram model.
+  The model scores Arabizi (Arabic written in Latin letters and digits such
+  as "7abibi") against English, and sets the confidence. Results are
+  cached by text.
+- normalize_arabic removes diacritics and tatweel and folds alef and yaa
+  variants in one str.translate call, cached by text. It is used for
+  search tokens and intent matching.
+- intent_pattern compiles planner regexes so Arabic letters in a pattern
+  also match their variant spellings, optionally diacritized.
+  match_intent skips patterns whose script cannot appear in the command.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
+
+# Harakat, Quranic marks and superscript alef, plus tatweel
+_ARABIC_MARKS = [*range(0x064B, 0x0660), 0x0670, *range(0x06D6, 0x06EE), 0x0640]
+_ARABIC_FOLDS = {'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ى': 'ي'}
+
+_NORMALIZE_TABLE = str.maketrans({
+    **{chr(code): None for code in _ARABIC_MARKS},
+    **_ARABIC_FOLDS
+})
+
+# Script classes: 'a' Arabic letter, 'l' Latin letter, 'd' digit; everything else dropped
+_ARABIC_LETTERS = [code for code in range(0x0621, 0x064B) if code != 0x0640] + \
+    list(range(0x0671, 0x06D4)) + list(range(0xFB50, 0xFDFC)) + list(range(0xFE70, 0xFEFD))
+_LATIN_LETTERS = list(range(0x41, 0x5B)) + list(range(0x61, 0x7B)) + \
+    [code for code in range(0xC0, 0x250) if chr(code).isalpha()]
+
+def _script_table() -> list:
+    # Indexed by code point (a list beats a dict for translate); None deletes the character
+    table = [None] * 0x10000
+    digits = [*range(0x30, 0x3A), *range(0x0660, 0x066A)]
+    for script, codes in (('a', _ARABIC_LETTERS), ('l', _LATIN_LETTERS), ('d', digits)):
+        for code in codes:
+            table[code] = script
+    return table
+
+_SCRIPT_TABLE = _script_table()
+
+# Frequent trigrams (after normalization); '_' marks a word boundary
+_ENGLISH_TRIGRAMS = frozenset(
+    '_th the he_ _an and nd_ ing ng_ _of of_ _to to_ ion tio _in in_ ent is_ _is ed_ er_ '
+    're_ es_ _wh _co _be hat tha ere for _fo _ha his ter ati ate _it it_ ver all _re _on on_ '
+    'ons _wi wit ith _yo you ou_ our are _ar ly_ ted _pr pro _se _ma _me men nce ese ase _op '
+    'ope pen _fi fil ile le_ _sh sho how _cr cre rea _sa ave sav _sc scr _cl clo ose'.split()
+)
+_ARABIC_TRIGRAMS = frozenset(
+    '_ال ال_ _في في_ _من من_ _عل علي لي_ _ان ان_ _ما ما_ _لا لا_ _هذ هذا _او _كا كان ات_ '
+    'ين_ ون_ ية_ _اك اكت كتب _مل ملف لف_ _اف افت فتح _شا شاش اشة _صو صور _حل حلل _اح احس '
+    'حسب _تر ترج _اس اسم سمه مه_ _يا'.split()
+)
+# Arabizi: frequent function words, and words using digits for Arabic letters (3 = ع, 7 = ح, ...)
+_ARABIZI_WORDS = frozenset(
+    'ana enta enti inta inti shu esh ya wallah inshallah habibi yalla mafi fi kif kifak keef '
+    'shlonak shukran marhaba ahlan bas aywa eh'.split()
+)
+_ARABIZI_DIGITS = re.compile(r'[a-z][235679]|[235679][a-z]')
+_WORD = re.compile(r'[^\W_]+')
+_ARABIC_CHAR = re.compile('[\u0600-\u06FF\u0750-\u077F\uFB50-\uFDFF\uFE70-\uFEFF]')
+_LATIN_CHAR = re.compile('[A-Za-z]')
+
+class LanguageGuess(NamedTuple):
+    """Result of language identification."""
+    language: str
+    confidence: float
+    script: str
+
+@lru_cache(maxsize=4096)
+def normalize_arabic(text: str) -> str:
+    """
+    Normalize Arabic text for matching.
+
+    Removes diacritics and tatweel, maps alef variants (أ إ آ ٱ) to ا and
+    alef maqsura (ى) to ي. Other characters are unchanged.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        str: Normalized text
+    """
+    return text.translate(_NORMALIZE_TABLE)
+
+def _trigram_rate(words: List[str], model: frozenset) -> float:
+    """Share of word trigrams (words padded with '_') that appear in model."""
+    padded = f"_{'_'.join(words)}_"
+    # A word of n characters has n trigrams; the ones spanning two words never match
+    total = len(padded) - len(words) - 1
+    return sum([padded[i:i + 3] in model for i in range(len(padded) - 2)]) / total if total > 0 else 0.0
+
+@lru_cache(maxsize=4096)
+def detect(text: str) -> LanguageGuess:
+    """
+    Identify whether text is Arabic or English.
+
+    Args:
+        text: Text to classify
+
+    Returns:
+        LanguageGuess: language ('ar', 'en' or 'unknown'), confidence in
+        [0, 1] and the dominant script ('arabic', 'latin' or 'none')
+    """
+    classes = text.translate(_SCRIPT_TABLE)
+    arabic = classes.count('a')
+    latin = classes.count('l')
+    letters = arabic + latin
+    if not letters:
+        return LanguageGuess('unknown', 0.0, 'none')
+
+    if arabic >= latin:
+        share = arabic / letters
+        rate = _trigram_rate(_WORD.findall(normalize_arabic(text)), _ARABIC_TRIGRAMS)
+        return LanguageGuess('ar', round(share * (0.6 + 0.4 * min(1.0, rate * 4)), 3), 'arabic')
+
+    share = latin / letters
+    words = _WORD.findall(text.lower())
+    arabizi = sum(word in _ARABIZI_WORDS or (not word.isalpha() and _ARABIZI_DIGITS.search(word) is not None)
+                  for word in words) / max(1, len(words))
+    english = _trigram_rate(words, _ENGLISH_TRIGRAMS)
+    if arabizi > 0.3 and arabizi > english:
+        return LanguageGuess('ar', round(share * min(1.0, 0.5 + arabizi / 2), 3), 'latin')
+    return LanguageGuess('en', round(share * (0.6 + 0.4 * min(1.0, english * 4)), 3), 'latin')
+
+def detect_language(text: str) -> str:
+    """Language code ('ar', 'en' or 'unknown') of text."""
+    return detect(text).language
+
+def has_arabic(text: str) -> bool:
+    """Whether text contains any Arabic-script character."""
+    return _ARABIC_CHAR.search(text) is not None
+
+# Per Arabic letter: what it also matches in a folded pattern
+_LETTER_VARIANTS = {
+    'ا': '[اأإآٱ]', 'أ': '[اأإآٱ]', 'إ': '[اأإآٱ]', 'آ': '[اأإآٱ]', 'ٱ': '[اأإآٱ]',
+    'ي': '[يى]', 'ى': '[يى]'
+}
+_OPTIONAL_MARKS = '[\u064B-\u065F\u0670\u0640]*'
+
+def _fold_pattern(pattern: str) -> str:
+    """Rewrite Arabic letters outside character classes to match variants and optional marks."""
+    out = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern):
+            out.append(pattern[index:index + 2])
+            index += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+            out.append(char)
+        elif char == '[':
+            in_class = True
+            out.append(char)
+            # A leading ']' (or '^]') is literal inside the class
+            for literal in ('^]', ']', '^'):
+                if pattern.startswith(literal, index + 1):
+                    out.append(literal)
+                    index += len(literal)
+                    break
+        elif '\u064B' <= char <= '\u065F' or char in '\u0670\u0640':
+            pass  # Marks in the pattern become optional via the preceding letter
+        elif '\u0621' <= char <= '\u064A' or char in _LETTER_VARIANTS:
+            folded = _LETTER_VARIANTS.get(char, char) + _OPTIONAL_MARKS
+            # Keep a following quantifier applying to the whole letter
+            quantified = index + 1 < len(pattern) and pattern[index + 1] in '?*+{'
+            out.append(f'(?:{folded})' if quantified else folded)
+        else:
+            out.append(char)
+        index += 1
+    return ''.join(out)
+
+@lru_cache(maxsize=1024)
+def intent_pattern(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """
+    Compile a command pattern so Arabic words match their common spellings.
+
+    Each Arabic letter also matches its alef/yaa variants and may be
+    followed by diacritics or tatweel, so "انشئ" matches "أنشئ" and
+    "صوّر" matches "صور". Captured text is returned as the user wrote it.
+
+    Args:
+        pattern: Regular expression
+        flags: re flags
+
+    Returns:
+        re.Pattern: Compiled pattern
+    """
+    return re.compile(_fold_pattern(pattern) if has_arabic(pattern) else pattern, flags)
+
+@lru_cache(maxsize=1024)
+def _pattern_scripts(pattern: str) -> tuple:
+    # Only literal letters outside classes and escapes count
+    literal = re.sub(r'\\.|\[[^\]]*\]', '', pattern)
+    return has_arabic(literal), _LATIN_CHAR.search(literal) is not None
+
+@lru_cache(maxsize=256)
+def _command_scripts(command: str) -> tuple:
+    return has_arabic(command), _LATIN_CHAR.search(command) is not None
+
+def match_intent(pattern: str, command: str, flags: int = re.IGNORECASE) -> Optional[re.Match]:
+    """
+    Search command for a planner pattern.
+
+    Patterns written in only one script are skipped without running the
+    regex when the command has no letters of that script.
+
+    Args:
+        pattern: Regular expression
+        command: User command
+        flags: re flags
+
+    Returns:
+        Optional[re.Match]: The match, or None
+    """
+    pattern_arabic, pattern_latin = _pattern_scripts(pattern)
+    command_arabic, command_latin = _command_scripts(command)
+    # Mixed-script patterns (e.g. Arabic|English alternations) always run
+    if pattern_arabic != pattern_latin and not (command_arabic if pattern_arabic else command_latin):
+        return None
+    return intent_pattern(pattern, flags).search(command)
+
+__all__ = [
+    "LanguageGuess", "detect", "detect_language", "normalize_arabic", "has_arabic",
+    "intent_pattern", "match_intent"
+]
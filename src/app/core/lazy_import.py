@@ -0,0 +1,109 @@
+"""
+Lazy import utilities for Labeeb.
+
+Heavy optional dependencies (spaCy, transformers, selenium, OpenCV, ...) are only
+needed by a handful of tools. This module defers importing them until the first
+attribute access, so simple commands do not pay their import cost at startup.
+"""
+import importlib
+import sys
+import threading
+import types
+from typing import Any, List, Optional
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        """
+        Initialize the lazy module proxy.
+
+        Args:
+            name (str): Fully qualified name of the module to import
+        """
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        """Import the wrapped module if it has not been imported yet."""
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._load(), item)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        setattr(self._load(), key, value)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "deferred"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Return a module whose import is deferred until first use.
+
+    If the module has already been imported it is returned directly.
+
+    Args:
+        name (str): Fully qualified module name, e.g. ``"selenium.webdriver"``
+
+    Returns:
+        types.ModuleType: The real module or a :class:`LazyModule` proxy
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """
+    Check whether a module returned by :func:`lazy_import` has been imported.
+
+    Args:
+        module (types.ModuleType): Module or lazy proxy
+
+    Returns:
+        bool: True if the underlying module has been imported
+    """
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_module"] is not None
+    return True
+
+
+def import_attribute(module_path: str, attribute: str, package: Optional[str] = None) -> Any:
+    """
+    Import ``module_path`` and return one of its attributes.
+
+    Args:
+        module_path (str): Module to import (absolute or relative to ``package``)
+        attribute (str): Name of the attribute to fetch from the module
+        package (Optional[str]): Anchor package for relative imports
+
+    Returns:
+        Any: The requested attribute
+
+    Raises:
+        ImportError: If the module cannot be imported or lacks the attribute
+    """
+    module = importlib.import_module(module_path, package)
+    try:
+        return getattr(module, attribute)
+    except AttributeError as e:
+        raise ImportError(f"Module '{module.__name__}' has no attribute '{attribute}'") from e
+
+
+__all__ = ["LazyModule", "lazy_import", "is_loaded", "import_attribute"]
@@ -1,5 +1,5 @@
-import langdetect
 from typing import Dict, Any, List, Optional
+from src.app.core import language_id
 
 class MultilingualCommands:
     def __init__(self):
@@ -49,18 +49,18 @@ class MultilingualCommands:
         
     def detect_language(self, text: str) -> Dict[str, Any]:
         """Detect the language of a text."""
-        try:
-            lang = langdetect.detect(text)
-            return {
-                "status": "success",
-                "text": text,
-                "detected_language": lang
-            }
-        except:
+        guess = language_id.detect(text)
+        if guess.language == 'unknown':
             return {
                 "status": "error",
                 "message": "Could not detect language"
             }
+        return {
+            "status": "success",
+            "text": text,
+            "detected_language": guess.language,
+            "confidence": guess.confidence
+        }
             
     def translate_text(self, text: str, target_language: str) -> Dict[str, Any]:
         """Translate text to target language."""
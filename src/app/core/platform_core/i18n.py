@@ -3,10 +3,19 @@ Internationalization support for platform core.
 
 This module provides internationalization support for platform-specific messages
 and system information labels, with special handling for RTL languages.
+
+Translations come from ``translations/*.json`` and the gettext ``locales/``
+tree. Both can be precompiled into a single marshalled catalog (see
+:func:`compile_catalog`) which is loaded with one read instead of parsing every
+source file. Lookups for the current language go straight to a bound dict.
 """
 import os
+import re
 import json
-from typing import Dict, Any, Optional, Tuple
+import marshal
+import sys
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 # Default language
@@ -60,11 +69,28 @@ SUPPORTED_LANGUAGES = {
     'hi': 'हिन्दी'
 }
 
-# Translation cache
+# Translation sources and compiled catalog
+_TRANSLATIONS_DIR = Path(__file__).parent / 'translations'
+_LOCALES_DIR = Path(__file__).resolve().parents[4] / 'locales'
+_CATALOG_PATH = _TRANSLATIONS_DIR / 'catalog.marshal'
+_CATALOG_FORMAT = 1
+
+# Raw source catalogs: {'json': {lang: {...}}, 'po': {lang: {...}}}
+_sources: Optional[Dict[str, Dict[str, Dict[str, str]]]] = None
+
+# Translation cache, keyed by normalized language code
 _translations: Dict[str, Dict[str, str]] = {}
 
+# Resolved catalogs keyed by the language string callers pass in, so repeat
+# lookups skip language-code normalization entirely
+_resolved: Dict[str, Dict[str, str]] = {}
+
+# Missing-key statistics: (language, key) -> count
+_missing: Counter = Counter()
+
 # Current language settings
 _current_language = DEFAULT_LANGUAGE
+_current_catalog: Optional[Dict[str, str]] = None
 _is_rtl = False
 
 def _normalize_language_code(language: str) -> Tuple[str, str]:
@@ -88,6 +114,129 @@ def _normalize_language_code(language: str) -> Tuple[str, str]:
     
     return base_lang, base_lang
 
+_PO_ESCAPE = re.compile(r'\\(.)')
+_PO_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+def _parse_po(po_file: Path) -> Dict[str, str]:
+    """Parse msgid/msgstr pairs from a gettext .po file.
+    
+    Args:
+        po_file: Path to the .po file
+        
+    Returns:
+        Dict[str, str]: Translated messages (header and untranslated entries skipped)
+    """
+    entries: Dict[str, str] = {}
+    msgid: Optional[List[str]] = None
+    msgstr: Optional[List[str]] = None
+    current: Optional[List[str]] = None
+    
+    def flush() -> None:
+        if msgid is not None and msgstr is not None:
+            key, value = ''.join(msgid), ''.join(msgstr)
+            if key and value:
+                entries[key] = value
+    
+    with open(po_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('msgid '):
+                flush()
+                msgid, msgstr = [], None
+                current = msgid
+                line = line[len('msgid '):]
+            elif line.startswith('msgstr '):
+                msgstr = []
+                current = msgstr
+                line = line[len('msgstr '):]
+            elif not line.startswith('"'):
+                continue
+            if current is not None and len(line) >= 2:
+                current.append(_PO_ESCAPE.sub(lambda m: _PO_ESCAPES.get(m.group(1), m.group(1)), line[1:-1]))
+    flush()
+    return entries
+
+def _source_files() -> List[Path]:
+    """List translation source files (JSON catalogs and .po files)."""
+    files = sorted(_TRANSLATIONS_DIR.glob('*.json'))
+    if _LOCALES_DIR.is_dir():
+        files.extend(sorted(_LOCALES_DIR.glob('*/LC_MESSAGES/*.po')))
+    return files
+
+def _source_signature(files: List[Path]) -> Dict[str, Tuple[int, int]]:
+    """Map each source file to its (mtime_ns, size) for staleness checks."""
+    signature = {}
+    for path in files:
+        stat = path.stat()
+        signature[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return signature
+
+def _parse_sources(files: List[Path]) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Parse all translation sources into raw per-language catalogs."""
+    sources: Dict[str, Dict[str, Dict[str, str]]] = {'json': {}, 'po': {}}
+    for path in files:
+        try:
+            if path.suffix == '.json':
+                with open(path, 'r', encoding='utf-8') as f:
+                    sources['json'][path.stem] = json.load(f)
+            else:
+                # locales/<lang>/LC_MESSAGES/<domain>.po
+                language = path.parent.parent.name
+                sources['po'].setdefault(language, {}).update(_parse_po(path))
+        except Exception:
+            continue
+    return sources
+
+def _read_catalog(signature: Dict[str, Tuple[int, int]]) -> Optional[Dict[str, Dict[str, Dict[str, str]]]]:
+    """Load the compiled catalog if it exists and matches the current sources."""
+    try:
+        with open(_CATALOG_PATH, 'rb') as f:
+            catalog = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (not isinstance(catalog, dict)
+            or catalog.get('format') != _CATALOG_FORMAT
+            or catalog.get('python') != tuple(sys.version_info[:2])
+            or catalog.get('sources') != signature):
+        return None
+    return catalog['catalogs']
+
+def _get_sources() -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Return raw catalogs, from the compiled catalog when it is up to date."""
+    global _sources
+    if _sources is None:
+        files = _source_files()
+        signature = _source_signature(files)
+        _sources = _read_catalog(signature) or _parse_sources(files)
+    return _sources
+
+def compile_catalog(output_path: Optional[Path] = None) -> Path:
+    """Compile translation JSON files and .po files into one marshalled catalog.
+    
+    The catalog records the mtime and size of every source, so edits to a
+    source file make the runtime fall back to parsing sources until the
+    catalog is rebuilt.
+    
+    Args:
+        output_path: Where to write the catalog (defaults to translations/catalog.marshal)
+        
+    Returns:
+        Path: The written catalog path
+    """
+    files = _source_files()
+    catalog = {
+        'format': _CATALOG_FORMAT,
+        'python': tuple(sys.version_info[:2]),
+        'sources': _source_signature(files),
+        'catalogs': _parse_sources(files),
+    }
+    output_path = Path(output_path) if output_path else _CATALOG_PATH
+    tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(catalog, f)
+    os.replace(tmp_path, output_path)
+    return output_path
+
 def _load_translations(language: str) -> Dict[str, str]:
     """Load translations for a specific language.
     
@@ -108,26 +257,40 @@ def _load_translations(language: str) -> Dict[str, str]:
     if normalized_lang in _translations:
         return _translations[normalized_lang]
     
-    # Try loading specific variant first
-    translations_file = Path(__file__).parent / 'translations' / f'{normalized_lang}.json'
+    json_catalogs = _get_sources()['json']
+    po_catalogs = _get_sources()['po']
     
-    if not translations_file.exists() and normalized_lang != base_lang:
-        # Fallback to base language
-        translations_file = Path(__file__).parent / 'translations' / f'{base_lang}.json'
+    # Try specific variant first, then base language, then default language
+    for candidate in (normalized_lang, base_lang, DEFAULT_LANGUAGE):
+        if candidate in json_catalogs:
+            translations = dict(json_catalogs[candidate])
+            break
+    else:
+        translations = {}
     
-    if not translations_file.exists():
-        # Fallback to default language
-        if normalized_lang != DEFAULT_LANGUAGE:
-            return _load_translations(DEFAULT_LANGUAGE)
-        return {}
+    # Merge gettext (.po) messages; platform JSON keys take precedence
+    for candidate in (base_lang, normalized_lang):
+        for key, value in po_catalogs.get(candidate, {}).items():
+            translations.setdefault(key, value)
     
-    try:
-        with open(translations_file, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
-            _translations[normalized_lang] = translations
-            return translations
-    except Exception:
-        return {}
+    _translations[normalized_lang] = translations
+    return translations
+
+def _catalog_for(language: str) -> Dict[str, str]:
+    """Return the resolved catalog for a caller-supplied language string."""
+    catalog = _resolved.get(language)
+    if catalog is None:
+        catalog = _load_translations(language)
+        _resolved[language] = catalog
+    return catalog
+
+def reload_translations() -> None:
+    """Drop all cached catalogs so the next lookup re-reads translation sources."""
+    global _sources, _current_catalog
+    _sources = None
+    _current_catalog = None
+    _translations.clear()
+    _resolved.clear()
 
 def setup_language(language: str) -> None:
     """Set up language settings for the application.
@@ -147,8 +310,9 @@ def setup_language(language: str) -> None:
     _current_language = normalized_lang
     _is_rtl = normalized_lang in RTL_LANGUAGES
     
-    # Load translations
-    _load_translations(normalized_lang)
+    # Bind the current language's catalog for direct lookups
+    global _current_catalog
+    _current_catalog = _catalog_for(normalized_lang)
     
     # Set environment variables
     os.environ['LANG'] = normalized_lang
@@ -180,10 +344,34 @@ def gettext(key: str, language: Optional[str] = None) -> str:
         str: Translated text or key if translation not found
     """
     if language is None:
+        global _current_catalog
+        catalog = _current_catalog
+        if catalog is None:
+            catalog = _current_catalog = _catalog_for(_current_language)
         language = _current_language
+    else:
+        catalog = _resolved.get(language) or _catalog_for(language)
+    
+    value = catalog.get(key)
+    if value is None:
+        _missing[(language, key)] += 1
+        return key
+    return value
+
+def get_missing_stats() -> Dict[str, Dict[str, int]]:
+    """Get counts of lookups for keys that had no translation.
     
-    translations = _load_translations(language)
-    return translations.get(key, key)
+    Returns:
+        Dict[str, Dict[str, int]]: Language code -> {key: number of misses}
+    """
+    stats: Dict[str, Dict[str, int]] = {}
+    for (language, key), count in _missing.items():
+        stats.setdefault(language, {})[key] = count
+    return stats
+
+def reset_missing_stats() -> None:
+    """Clear missing-key statistics."""
+    _missing.clear()
 
 def get_supported_languages() -> Dict[str, str]:
     """Get dictionary of supported languages.
@@ -11,6 +11,12 @@ The module includes:
 - Prompt preparation with system information
 - Error handling and logging
 
+Ollama requests reuse the ``context`` token array returned by the previous turn,
+so each turn only sends the new user message instead of re-sending the system
+info and full history. Requests go through a pooled HTTP session and set
+``keep_alive`` so the model stays loaded between turns. When no context is
+available, the prompt is rebuilt from history trimmed to a token budget.
+
 Example:
     >>> config = ConfigManager()
     >>> model_manager = ModelManager(config)
@@ -20,6 +26,7 @@ Example:
 import logging
 from typing import Optional, Dict, Any, List, Tuple, Union, TypeVar, Protocol
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -66,6 +73,23 @@ class QueryResult:
     error_message: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
 
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of model tokens in text.
+    
+    Uses about four characters per token for Latin text; non-ASCII text
+    (e.g. Arabic) tokenizes less efficiently, so it is counted at two.
+    
+    Args:
+        text (str): Text to estimate
+        
+    Returns:
+        int: Estimated token count
+    """
+    if text.isascii():
+        return len(text) // 4 + 1
+    return len(text) // 2 + 1
+
 class QueryProcessor:
     """
     A class to process AI queries and manage responses.
@@ -95,6 +119,29 @@ class QueryProcessor:
         self.config: ConfigManager = config
         self.quiet_mode: bool = config.get("quiet_mode", False)
         self.conversation_history: List[ConversationMessage] = []
+        
+        # Ollama context reuse: the token array from the last turn, and the
+        # model/system info it was built with (a change invalidates it)
+        self._context: Optional[List[int]] = None
+        self._context_key: Optional[Tuple[str, str]] = None
+        self._session: Optional[requests.Session] = None
+    
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session used for Ollama requests (created on first use)."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
     
     def process_query(self, query: str, system_info: str) -> QueryResult:
         """
@@ -133,9 +180,11 @@ class QueryProcessor:
         Process a query using Ollama.
         
         This method:
-        1. Prepares the prompt with system info and conversation history
-        2. Makes a request to the Ollama API
-        3. Processes the response
+        1. Prepares the prompt: only the new query when the previous turn's
+           context can be reused, otherwise system info plus history trimmed
+           to the token budget
+        2. Makes a request to the Ollama API over the pooled session
+        3. Processes the response and stores the returned context
         4. Updates conversation history
         5. Returns the response
         
@@ -147,18 +196,24 @@ class QueryProcessor:
             QueryResult: A dataclass containing the query result
         """
         try:
-            # Prepare the prompt
-            prompt: str = self._prepare_prompt(query, system_info)
-            
             if not self.model_manager.base_url or not self.model_manager.ollama_model_name:
                 raise ValueError("Ollama base URL or model name not set")
             
+            # Prepare the prompt, continuing from the previous turn when possible
+            context_key = (self.model_manager.ollama_model_name, system_info)
+            context = self._reusable_context(context_key)
+            if context is not None:
+                prompt: str = f"User: {query}\nAssistant:"
+            else:
+                prompt = self._prepare_prompt(query, system_info)
+            
             # Prepare the request
             url: str = f"{self.model_manager.base_url}/api/generate"
             data: Dict[str, Any] = {
                 "model": self.model_manager.ollama_model_name,
                 "prompt": prompt,
                 "stream": False,
+                "keep_alive": self.config.get("ollama_keep_alive", "30m"),
                 "options": {
                     "temperature": self.config.get("temperature", 0.1),
                     "top_p": self.config.get("top_p", 0.95),
@@ -166,20 +221,30 @@ class QueryProcessor:
                     "num_predict": self.config.get("max_output_tokens", 1024)
                 }
             }
+            if context is not None:
+                data["context"] = context
             
             # Make the request
-            response = requests.post(url, json=data, timeout=30)
+            response = self.session.post(url, json=data, timeout=30)
             response.raise_for_status()
             
             # Parse response
             result: Dict[str, Any] = response.json()
             if "error" in result:
+                self._reset_context()
                 return QueryResult(
                     success=False,
                     response="",
                     error_message=f"Ollama error: {result['error']}"
                 )
             
+            # Keep the context for the next turn
+            if self.config.get("ollama_context_reuse", True) and isinstance(result.get("context"), list):
+                self._context = result["context"]
+                self._context_key = context_key
+            else:
+                self._reset_context()
+            
             # Extract the actual response content
             response_text = result.get("response", "").strip()
             
@@ -203,14 +268,13 @@ class QueryProcessor:
             self.conversation_history.append(ConversationMessage(role="user", content=query))
             self.conversation_history.append(ConversationMessage(role="assistant", content=response_text))
             
-            # Trim history if needed
-            max_history = self.config.get("max_history", 10)
-            if len(self.conversation_history) > max_history * 2:
-                self.conversation_history = self.conversation_history[-max_history * 2:]
+            # Trim history to the token budget used when no context is available
+            self._trim_history(self.config.get("max_history_tokens", 2048))
             
             return QueryResult(success=True, response=response_text)
             
         except Exception as e:
+            self._reset_context()
             error_msg = f"Error in Ollama query: {str(e)}"
             self._log(error_msg)
             logger.error(error_msg)
@@ -236,7 +300,8 @@ class QueryProcessor:
         # Start with system information
         prompt_parts: List[str] = [f"System: {system_info}\n"]
         
-        # Add conversation history
+        # Add conversation history, trimmed to the token budget
+        self._trim_history(self.config.get("max_history_tokens", 2048))
         for msg in self.conversation_history:
             prompt_parts.append(f"{msg.role.capitalize()}: {msg.content}\n")
         
@@ -246,8 +311,56 @@ class QueryProcessor:
         return "".join(prompt_parts)
     
     def clear_history(self) -> None:
-        """Clear the conversation history."""
+        """Clear the conversation history and the reusable Ollama context."""
         self.conversation_history.clear()
+        self._reset_context()
+    
+    def _reusable_context(self, context_key: Tuple[str, str]) -> Optional[List[int]]:
+        """
+        Get the previous turn's context if it can be continued.
+        
+        The context is dropped when the model or system info changed, and when
+        it has grown past ``ollama_max_context_tokens``; the next prompt is then
+        rebuilt from the budget-trimmed history, which keeps per-turn prompt
+        evaluation cost bounded in long conversations.
+        
+        Args:
+            context_key (Tuple[str, str]): Model name and system info of this turn
+            
+        Returns:
+            Optional[List[int]]: The context to send, or None to send a full prompt
+        """
+        if self._context is None or not self.config.get("ollama_context_reuse", True):
+            return None
+        if self._context_key != context_key:
+            self._reset_context()
+            return None
+        if len(self._context) > self.config.get("ollama_max_context_tokens", 3072):
+            self._reset_context()
+            return None
+        return self._context
+    
+    def _reset_context(self) -> None:
+        """Forget the reusable Ollama context."""
+        self._context = None
+        self._context_key = None
+    
+    def _trim_history(self, max_tokens: int) -> None:
+        """
+        Drop the oldest messages until the history fits the token budget.
+        
+        Args:
+            max_tokens (int): Maximum estimated tokens kept in history
+        """
+        total = 0
+        keep = 0
+        for msg in reversed(self.conversation_history):
+            total += estimate_tokens(msg.content)
+            if total > max_tokens:
+                break
+            keep += 1
+        if keep < len(self.conversation_history):
+            self.conversation_history = self.conversation_history[len(self.conversation_history) - keep:]
     
     def _log(self, message: str) -> None:
         """
@@ -12,14 +12,16 @@ import time
 
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import spacy
-from transformers import pipeline
-import networkx as nx
+from src.app.core.lazy_import import lazy_import
+
+# Heavy dependencies are imported on first use, not when this module is imported
+webdriver = lazy_import("selenium.webdriver")
+selenium_by = lazy_import("selenium.webdriver.common.by")
+selenium_ui = lazy_import("selenium.webdriver.support.ui")
+EC = lazy_import("selenium.webdriver.support.expected_conditions")
+spacy = lazy_import("spacy")
+transformers = lazy_import("transformers")
+nx = lazy_import("networkx")
 from labeeb.platform_core.platform_utils import get_input_handler, get_platform_name, is_mac
 
 logger = logging.getLogger(__name__)
@@ -37,15 +39,43 @@ class ResearchScraper:
     """Handles web scraping and content extraction for research topics."""
     
     def __init__(self):
-        self.chrome_options = Options()
-        self.chrome_options.add_argument('--headless')
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        
-        # Initialize NLP models
-        self.nlp = spacy.load("en_core_web_sm")
-        self.summarizer = pipeline("summarization")
-        self.ner = pipeline("ner")
+        self._chrome_options = None
+        # NLP models are loaded on first access
+        self._nlp = None
+        self._summarizer = None
+        self._ner = None
+
+    @property
+    def chrome_options(self):
+        """Headless Chrome options, built on first use."""
+        if self._chrome_options is None:
+            options = webdriver.ChromeOptions()
+            options.add_argument('--headless')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            self._chrome_options = options
+        return self._chrome_options
+
+    @property
+    def nlp(self):
+        """spaCy English pipeline, loaded on first use."""
+        if self._nlp is None:
+            self._nlp = spacy.load("en_core_web_sm")
+        return self._nlp
+
+    @property
+    def summarizer(self):
+        """Transformers summarization pipeline, loaded on first use."""
+        if self._summarizer is None:
+            self._summarizer = transformers.pipeline("summarization")
+        return self._summarizer
+
+    @property
+    def ner(self):
+        """Transformers NER pipeline, loaded on first use."""
+        if self._ner is None:
+            self._ner = transformers.pipeline("ner")
+        return self._ner
         
     def scrape_topic(self, url: str, topic: str) -> Dict[str, Any]:
         """Scrape content from the given URL for the specified topic."""
@@ -55,8 +85,8 @@ class ResearchScraper:
             driver.get(url)
             
             # Wait for content to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            selenium_ui.WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((selenium_by.By.TAG_NAME, "body"))
             )
             
             # Get page content
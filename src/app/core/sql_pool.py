@@ -0,0 +1,300 @@
+"""SQL helpers for the database tool.
+
+- prepare_statement validates a query once, pushes the result limit down
+  into SELECTs as a LIMIT clause, and caches the outcome by query text.
+- stream_rows reads a cursor with fetchmany and stops after max_rows, so
+  nothing beyond the limit is materialized.
+- MeasuredPool wraps a connection pool and records acquire waits and latency.
+- SQLitePool provides the same async pool/connection/cursor interface as
+  aiomysql on top of sqlite3, for local use and tests.
+"""
+
+import asyncio
+import re
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Basic SQL injection prevention
+DANGEROUS_KEYWORDS = (
+    'DROP', 'DELETE', 'TRUNCATE', 'ALTER', 'CREATE', 'INSERT',
+    'UPDATE', 'GRANT', 'REVOKE', 'SHUTDOWN', '--', ';'
+)
+
+_SELECT = re.compile(r'^\s*(SELECT|WITH)\b', re.IGNORECASE)
+_TRAILING_LIMIT = re.compile(r'\bLIMIT\s+\d+(\s*(,|OFFSET)\s*\d+)?\s*$', re.IGNORECASE)
+# Locking clauses must stay after LIMIT
+_TRAILING_LOCK = re.compile(
+    r'\s+(FOR\s+(UPDATE|SHARE)(\s+OF\s+[\w.]+(\s*,\s*[\w.]+)*)?(\s+(NOWAIT|SKIP\s+LOCKED))?'
+    r'|LOCK\s+IN\s+SHARE\s+MODE)\s*$',
+    re.IGNORECASE
+)
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+@dataclass(frozen=True)
+class PreparedStatement:
+    """A validated query ready to execute."""
+    sql: str
+    error: Optional[str] = None
+    is_select: bool = False
+
+@lru_cache(maxsize=512)
+def prepare_statement(query: str, max_rows: Optional[int] = None) -> PreparedStatement:
+    """
+    Validate a query and push the row limit into it, cached by query text.
+
+    SELECTs without a trailing LIMIT get ``LIMIT max_rows + 1``, placed
+    before any ``FOR UPDATE``/``LOCK IN SHARE MODE`` clause; the extra row
+    tells the caller whether the result was truncated.
+
+    Args:
+        query: SQL query
+        max_rows: Maximum rows the caller will read, or None
+
+    Returns:
+        PreparedStatement: The statement, with error set if it is rejected
+    """
+    query_upper = query.upper()
+    for keyword in DANGEROUS_KEYWORDS:
+        if keyword in query_upper:
+            return PreparedStatement(query, f'Query contains dangerous keyword: {keyword}')
+    is_select = bool(_SELECT.match(query))
+    sql = query
+    if is_select and max_rows is not None:
+        lock = _TRAILING_LOCK.search(query)
+        body, suffix = (query[:lock.start()], query[lock.start():]) if lock else (query.rstrip(), "")
+        if not _TRAILING_LIMIT.search(body):
+            sql = f"{body} LIMIT {int(max_rows) + 1}{suffix}"
+    return PreparedStatement(sql, None, is_select)
+
+async def stream_rows(cursor: Any, max_rows: int, batch_size: int = 500) -> Tuple[List[tuple], bool]:
+    """
+    Read at most max_rows rows from an executed cursor in fetchmany batches.
+
+    Args:
+        cursor: Executed (server-side) cursor
+        max_rows: Maximum rows to return
+        batch_size: Rows per fetchmany call
+
+    Returns:
+        Tuple[List[tuple], bool]: The rows and whether more rows were available
+    """
+    rows: List[tuple] = []
+    while len(rows) <= max_rows:
+        batch = await cursor.fetchmany(min(batch_size, max_rows + 1 - len(rows)))
+        if not batch:
+            break
+        rows.extend(batch)
+    return rows[:max_rows], len(rows) > max_rows
+
+def to_columns(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> List[List[Any]]:
+    """Transpose rows into one value list per column."""
+    if not rows:
+        return [[] for _ in columns]
+    return [list(values) for values in zip(*rows)]
+
+def insert_statement(table: str, columns: Sequence[str], paramstyle: str = 'format', quote: str = '`') -> str:
+    """
+    Build a parameterized INSERT for validated identifiers.
+
+    Args:
+        table: Table name
+        columns: Column names
+        paramstyle: 'format' (%s) or 'qmark' (?)
+        quote: Identifier quote character
+
+    Returns:
+        str: The INSERT statement
+
+    Raises:
+        ValueError: If an identifier is not a plain name
+    """
+    for name in (table, *columns):
+        if not isinstance(name, str) or not _IDENTIFIER.match(name):
+            raise ValueError(f'Invalid identifier: {name}')
+    if not columns:
+        raise ValueError('No columns given')
+    placeholder = '?' if paramstyle == 'qmark' else '%s'
+    column_list = ', '.join(f'{quote}{column}{quote}' for column in columns)
+    values = ', '.join(placeholder for _ in columns)
+    return f'INSERT INTO {quote}{table}{quote} ({column_list}) VALUES ({values})'
+
+class PoolMetrics:
+    """Counters for connection acquisition."""
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'acquisitions': self.acquisitions,
+            'waits': self.waits,
+            'avg_acquire_ms': round(self.total_wait / self.acquisitions * 1000, 3) if self.acquisitions else 0.0,
+            'max_acquire_ms': round(self.max_wait * 1000, 3),
+            'in_use': self.in_use,
+            'peak_in_use': self.peak_in_use
+        }
+
+class MeasuredPool:
+    """Connection pool wrapper recording acquire waits and latency."""
+
+    def __init__(self, pool: Any, paramstyle: str = 'format', quote: str = '`'):
+        """
+        Initialize the wrapper.
+
+        Args:
+            pool: aiomysql pool or SQLitePool
+            paramstyle: Placeholder style of the driver ('format' or 'qmark')
+            quote: Identifier quote character of the SQL dialect
+        """
+        self.pool = pool
+        self.paramstyle = paramstyle
+        self.quote = quote
+        self.metrics = PoolMetrics()
+        self._outstanding = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        # Every connection is held (or being opened) by an earlier acquire: this one queues
+        would_wait = self._outstanding >= self.pool.maxsize
+        self._outstanding += 1
+        metrics = self.metrics
+        started = time.perf_counter()
+        try:
+            async with self.pool.acquire() as conn:
+                waited = time.perf_counter() - started
+                metrics.acquisitions += 1
+                metrics.waits += would_wait
+                metrics.total_wait += waited
+                metrics.max_wait = max(metrics.max_wait, waited)
+                metrics.in_use += 1
+                metrics.peak_in_use = max(metrics.peak_in_use, metrics.in_use)
+                try:
+                    yield conn
+                finally:
+                    metrics.in_use -= 1
+        finally:
+            self._outstanding -= 1
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'size': self.pool.size,
+            'free': self.pool.freesize,
+            'max_size': self.pool.maxsize,
+            **self.metrics.to_dict()
+        }
+
+    def close(self) -> None:
+        self.pool.close()
+
+    async def wait_closed(self) -> None:
+        await self.pool.wait_closed()
+
+class _SQLiteCursor:
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    async def execute(self, query: str, params: Sequence[Any] = ()) -> None:
+        await asyncio.to_thread(self._cursor.execute, query, params or ())
+
+    async def executemany(self, query: str, params_list: Sequence[Sequence[Any]]) -> None:
+        await asyncio.to_thread(self._cursor.executemany, query, params_list)
+
+    async def fetchmany(self, size: int) -> List[tuple]:
+        return await asyncio.to_thread(self._cursor.fetchmany, size)
+
+    async def fetchall(self) -> List[tuple]:
+        return await asyncio.to_thread(self._cursor.fetchall)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._cursor.close()
+
+class _SQLiteConnection:
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def cursor(self, *_) -> _SQLiteCursor:
+        return _SQLiteCursor(self._conn.cursor())
+
+    async def begin(self) -> None:
+        await asyncio.to_thread(self._conn.execute, 'BEGIN')
+
+    async def commit(self) -> None:
+        await asyncio.to_thread(self._conn.commit)
+
+    async def rollback(self) -> None:
+        await asyncio.to_thread(self._conn.rollback)
+
+class SQLitePool:
+    """Async connection pool over sqlite3 with the aiomysql pool interface."""
+
+    def __init__(self, path: str, maxsize: int = 10):
+        """
+        Initialize the pool.
+
+        Args:
+            path: Database file (each ':memory:' connection would be a separate database)
+            maxsize: Maximum number of connections
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self._free: List[sqlite3.Connection] = []
+        self._size = 0
+        self._semaphore = asyncio.Semaphore(maxsize)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def freesize(self) -> int:
+        return len(self._free)
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._semaphore:
+            conn = self._free.pop() if self._free else await asyncio.to_thread(self._connect)
+            try:
+                yield _SQLiteConnection(conn)
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._free.append(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit like the MySQL pool; BEGIN starts explicit transactions
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, cached_statements=256)
+        self._size += 1
+        return conn
+
+    def close(self) -> None:
+        while self._free:
+            self._free.pop().close()
+            self._size -= 1
+
+    async def wait_closed(self) -> None:
+        return None
+
+__all__ = [
+    "PreparedStatement", "prepare_statement", "stream_rows", "to_columns", "insert_statement",
+    "PoolMetrics", "MeasuredPool", "SQLitePool", "DANGEROUS_KEYWORDS"
+]
@@ -0,0 +1,201 @@
+"""Startup orchestration.
+
+Labeeb start-up is a set of init steps (platform handlers, settings, the Ollama
+probe, model selection, handler construction) of which only a few depend on
+each other. This module lets callers declare those steps with their
+dependencies, runs independent steps concurrently on a thread pool, defers
+optional subsystems until first use, and records per-phase timings so
+time-to-prompt regressions are visible.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StartupTask:
+    """A named init step and the steps it depends on."""
+    name: str
+    func: Callable[..., Any]
+    depends_on: Sequence[str] = field(default_factory=tuple)
+
+
+@dataclass
+class PhaseTiming:
+    """Wall-clock timing of a startup phase, relative to orchestrator start."""
+    name: str
+    start: float
+    end: float
+    thread: str
+    deferred: bool = False
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class StartupOrchestrator:
+    """
+    Runs startup tasks in dependency order, concurrently where possible.
+
+    Each task function receives the results of its dependencies as keyword
+    arguments named after those tasks. Deferred subsystems are built on the
+    first ``get`` call and their build time is added to the report.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            max_workers: Maximum number of tasks running at the same time
+        """
+        self.max_workers = max_workers
+        self.results: Dict[str, Any] = {}
+        self.timings: List[PhaseTiming] = []
+        self._tasks: Dict[str, StartupTask] = {}
+        self._deferred: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.RLock()
+        self._origin = time.perf_counter()
+        self._total = 0.0
+
+    def add(self, name: str, func: Callable[..., Any], depends_on: Sequence[str] = ()) -> None:
+        """
+        Declare a startup task.
+
+        Args:
+            name: Unique task name; its result is stored under this name
+            func: Callable receiving dependency results as keyword arguments
+            depends_on: Names of tasks that must finish first
+        """
+        if name in self._tasks:
+            raise ValueError(f"Duplicate startup task: {name}")
+        self._tasks[name] = StartupTask(name, func, tuple(depends_on))
+
+    def defer(self, name: str, factory: Callable[[], Any]) -> None:
+        """
+        Declare an optional subsystem that is only built on first use.
+
+        Args:
+            name: Name used with ``get``
+            factory: Callable building the subsystem
+        """
+        self._deferred[name] = factory
+
+    def get(self, name: str) -> Any:
+        """
+        Get a task result, building a deferred subsystem if needed.
+
+        Args:
+            name: Task or deferred subsystem name
+
+        Returns:
+            Any: The result
+        """
+        if name in self.results:
+            return self.results[name]
+        with self._lock:
+            if name not in self.results:
+                if name not in self._deferred:
+                    raise KeyError(f"Unknown startup task: {name}")
+                self.results[name] = self._timed(name, self._deferred.pop(name), {}, deferred=True)
+            return self.results[name]
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run all declared tasks.
+
+        Returns:
+            Dict[str, Any]: Task results keyed by task name
+
+        Raises:
+            Exception: The first task failure is re-raised unchanged; tasks not
+                yet started are skipped
+            ValueError: If a dependency is unknown or the graph has a cycle
+        """
+        self._validate()
+        self._origin = time.perf_counter()
+        pending = dict(self._tasks)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="labeeb-startup") as executor:
+            while pending or running:
+                for name, task in list(pending.items()):
+                    if all(dep in self.results for dep in task.depends_on):
+                        kwargs = {dep: self.results[dep] for dep in task.depends_on}
+                        running[executor.submit(self._timed, name, task.func, kwargs)] = name
+                        del pending[name]
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Startup task '{name}' failed: {str(e)}")
+                        for other in running:
+                            other.cancel()
+                        raise
+
+        self._total = time.perf_counter() - self._origin
+        logger.info(self.report())
+        return self.results
+
+    def report(self) -> str:
+        """
+        Format the per-phase timing report.
+
+        Returns:
+            str: One line per phase, in start order, plus the total
+        """
+        lines = [f"Startup timing (total {self._total * 1000:.1f} ms):"]
+        for timing in sorted(self.timings, key=lambda t: t.start):
+            suffix = " (deferred)" if timing.deferred else ""
+            lines.append(
+                f"  {timing.name:<20} {timing.duration * 1000:8.1f} ms  "
+                f"[{timing.start * 1000:8.1f} -> {timing.end * 1000:8.1f}] {timing.thread}{suffix}"
+            )
+        return "\n".join(lines)
+
+    def _timed(self, name: str, func: Callable[..., Any], kwargs: Dict[str, Any],
+               deferred: bool = False) -> Any:
+        """Run func and record its timing."""
+        start = time.perf_counter() - self._origin
+        try:
+            return func(**kwargs)
+        finally:
+            end = time.perf_counter() - self._origin
+            with self._lock:
+                self.timings.append(PhaseTiming(name, start, end, threading.current_thread().name, deferred))
+
+    def _validate(self) -> None:
+        """Check that every dependency exists and that there are no cycles."""
+        for task in self._tasks.values():
+            for dep in task.depends_on:
+                if dep not in self._tasks:
+                    raise ValueError(f"Startup task '{task.name}' depends on unknown task '{dep}'")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup dependency cycle involving '{name}'")
+            visiting.add(name)
+            for dep in self._tasks[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._tasks:
+            visit(name)
+
+
+__all__ = ["StartupTask", "PhaseTiming", "StartupOrchestrator"]
@@ -0,0 +1,243 @@
+"""Text processing engine for the text tool.
+
+- analyze computes every text metric from one NumPy array of code points.
+  Word, sentence and paragraph boundaries come from vectorized masks.
+  Character frequencies come from a single np.unique over the array. The
+  text is never split into intermediate lists.
+- TextPipeline compiles an operation chain (clean, normalize, tokenize,
+  keywords, ...) into the fewest passes. Whitespace collapsing is skipped
+  when a tokenize step follows, for example, and tokenize uses one regex
+  pass over the whole text instead of one per token.
+- compile_pattern is a bounded LRU of compiled user regexes.
+- run_batch spreads many documents over a process pool.
+"""
+
+import unicodedata
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+_SENTENCE_END = re.compile(r'[.!?]+')
+
+# Every whitespace code point is at or below U+3000 (ideographic space);
+# larger code points are clipped to the final (False) table slot
+_SPACE_LIMIT = 0x3001
+_SPACE_TABLE = np.array([chr(c).isspace() for c in range(_SPACE_LIMIT)] + [False])
+_NEWLINE = ord('\n')
+_TERMINATORS = np.array([ord('.'), ord('!'), ord('?')], dtype=np.uint32)
+
+# Below this many documents a process pool costs more than it saves
+_MIN_PARALLEL_BATCH = 64
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regular expression, keeping the most recent 256 compiled.
+
+    Args:
+        pattern: Regular expression
+        flags: re flags
+
+    Returns:
+        re.Pattern: Compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern, flags)
+
+def _count_groups(segment: np.ndarray, content: np.ndarray) -> int:
+    """Number of distinct segment ids that contain at least one content position."""
+    ids = segment[content]
+    return int(ids.size and 1 + np.count_nonzero(np.diff(ids)))
+
+def analyze(text: str, character_frequency: bool = True) -> Dict[str, Any]:
+    """
+    Compute text metrics from a single code-point array.
+
+    Matches the results of splitting on whitespace (words), on runs of
+    '.', '!' and '?' (sentences) and on blank lines (paragraphs), counting
+    only non-blank pieces.
+
+    Args:
+        text: Text to analyze
+        character_frequency: Also count each character
+
+    Returns:
+        Dict[str, Any]: 'metrics' and optionally 'character_frequency'
+    """
+    codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    space = _SPACE_TABLE[np.minimum(codes, _SPACE_LIMIT)]
+    content = ~space
+
+    # A word starts at every non-space character preceded by a space (or the start)
+    word_starts = content.copy()
+    word_starts[1:] &= space[:-1]
+    words = int(np.count_nonzero(word_starts))
+    word_chars = int(np.count_nonzero(content))
+
+    # Each run of terminators opens a new sentence segment
+    terminator = np.isin(codes, _TERMINATORS)
+    run_start = terminator.copy()
+    run_start[1:] &= ~terminator[:-1]
+    sentences = _count_groups(np.cumsum(run_start), content & ~terminator)
+
+    # Blank lines ("\n\n") separate paragraphs
+    newline = codes == _NEWLINE
+    blank_line = np.zeros_like(newline)
+    blank_line[1:] = newline[1:] & newline[:-1]
+    paragraphs = _count_groups(np.cumsum(blank_line), content)
+
+    result: Dict[str, Any] = {
+        'metrics': {
+            'characters': len(text),
+            'words': words,
+            'sentences': sentences,
+            'paragraphs': paragraphs,
+            'avg_word_length': word_chars / words if words else 0
+        }
+    }
+    if character_frequency:
+        unique, counts = np.unique(codes, return_counts=True)
+        result['character_frequency'] = dict(zip(map(chr, unique.tolist()), counts.tolist()))
+    return result
+
+def clean(text: str, collapse: bool = True) -> str:
+    """Strip, collapse whitespace to single spaces and drop punctuation."""
+    text = text.strip()
+    if collapse:
+        text = _WHITESPACE.sub(' ', text)
+    return _PUNCTUATION.sub('', text)
+
+def normalize(text: str) -> str:
+    """NFKC-normalize and lowercase."""
+    return unicodedata.normalize('NFKC', text).lower()
+
+def tokenize(text: str) -> List[str]:
+    """Whitespace tokens with punctuation removed, empty tokens dropped."""
+    # Punctuation never touches whitespace, so one substitution over the whole
+    # text followed by one split equals stripping each token separately
+    return _PUNCTUATION.sub('', text).split()
+
+def keywords(tokens: Union[str, Sequence[str]], limit: int = 5, min_length: int = 4) -> List[str]:
+    """The most frequent tokens of at least min_length characters."""
+    if isinstance(tokens, str):
+        tokens = tokens.lower().split()
+    counts = Counter(token for token in tokens if len(token) >= min_length)
+    return [word for word, _ in counts.most_common(limit)]
+
+def summarize(text: str) -> str:
+    """The first sentence."""
+    return _SENTENCE_END.split(text, 1)[0].strip()
+
+STEPS = ('clean', 'normalize', 'tokenize', 'keywords', 'summarize', 'analyze')
+
+class TextPipeline:
+    """A compiled chain of text operations."""
+
+    def __init__(self, steps: Sequence[str]):
+        """
+        Compile a chain of operations.
+
+        Args:
+            steps: Operation names from STEPS, applied in order
+
+        Raises:
+            ValueError: If a step is unknown or cannot follow the previous one
+        """
+        unknown = [step for step in steps if step not in STEPS]
+        if unknown:
+            raise ValueError(f"Unknown text operation(s): {', '.join(unknown)}")
+        self.steps = tuple(steps)
+        self._plan = self._compile(self.steps)
+
+    @staticmethod
+    def _compile(steps: Tuple[str, ...]) -> List[Tuple[str, Dict[str, Any]]]:
+        plan = []
+        produces_tokens = False
+        for index, step in enumerate(steps):
+            if produces_tokens and step not in ('keywords',):
+                raise ValueError(f"'{step}' cannot follow 'tokenize'")
+            options: Dict[str, Any] = {}
+            if step == 'clean':
+                # Token splitting makes whitespace collapsing redundant
+                options['collapse'] = 'tokenize' not in steps[index + 1:]
+            elif step == 'keywords' and not produces_tokens:
+                step = 'keywords_text'
+            plan.append((step, options))
+            produces_tokens = produces_tokens or step == 'tokenize'
+        return plan
+
+    def run(self, text: str) -> Any:
+        """
+        Run the chain on a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            The output of the last step (text, tokens, keywords or metrics)
+        """
+        value: Any = text
+        for step, options in self._plan:
+            if step == 'clean':
+                value = clean(value, **options)
+            elif step == 'normalize':
+                value = normalize(value)
+            elif step == 'tokenize':
+                value = tokenize(value)
+            elif step == 'keywords':
+                value = keywords([token.lower() for token in value])
+            elif step == 'keywords_text':
+                value = keywords(value)
+            elif step == 'summarize':
+                value = summarize(value)
+            elif step == 'analyze':
+                value = analyze(value)
+        return value
+
+    __call__ = run
+
+@lru_cache(maxsize=64)
+def pipeline(steps: Tuple[str, ...]) -> TextPipeline:
+    """Compiled pipeline for a chain of steps, cached."""
+    return TextPipeline(steps)
+
+def _run_chunk(steps: Tuple[str, ...], texts: List[str]) -> List[Any]:
+    run = pipeline(steps).run
+    return [run(text) for text in texts]
+
+def run_batch(texts: Sequence[str], steps: Sequence[str], max_workers: Optional[int] = None,
+              chunk_size: int = 32) -> List[Any]:
+    """
+    Run a pipeline over many documents, on a process pool for large batches.
+
+    Args:
+        texts: Documents
+        steps: Operation chain
+        max_workers: Worker processes (default: CPU count); 1 runs inline
+        chunk_size: Documents per task sent to a worker
+
+    Returns:
+        List[Any]: Output per document, in input order
+    """
+    steps = tuple(steps)
+    pipeline(steps)  # Validate before starting workers
+    texts = list(texts)
+    if max_workers == 1 or len(texts) < _MIN_PARALLEL_BATCH:
+        return _run_chunk(steps, texts)
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_run_chunk, [steps] * len(chunks), chunks)
+        return [output for chunk in results for output in chunk]
+
+__all__ = [
+    "analyze", "clean", "normalize", "tokenize", "keywords", "summarize", "compile_pattern",
+    "TextPipeline", "pipeline", "run_batch", "STEPS"
+]
@@ -0,0 +1,197 @@
+"""
+Screen change tracking for Labeeb.
+
+Keeps a downsampled grayscale copy of the last captured frame and compares
+each new frame against it tile by tile with NumPy. Only tiles whose pixels
+changed are reported, merged into rectangular dirty regions, so callers can
+skip vision analysis when the screen is unchanged or limit it to the parts
+that changed. Tile contents are hashed so descriptions of regions can be
+cached and reused while their content stays the same. Each diff also carries
+its tile mask, so callers can OR masks together to track everything that
+changed since an earlier frame, not just since the last one.
+"""
+import hashlib
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+import numpy as np
+
+Region = Tuple[int, int, int, int]
+
+@dataclass
+class ScreenDiff:
+    """Result of comparing a frame with the previous one."""
+    regions: List[Region] = field(default_factory=list)
+    dirty_tiles: int = 0
+    total_tiles: int = 0
+    full: bool = False
+    # Dirty flag per tile (rows x columns)
+    mask: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @property
+    def changed(self) -> bool:
+        return self.full or self.dirty_tiles > 0
+
+    @property
+    def changed_fraction(self) -> float:
+        if self.full:
+            return 1.0
+        return self.dirty_tiles / self.total_tiles if self.total_tiles else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            'changed': self.changed,
+            'full': self.full,
+            'changed_fraction': round(self.changed_fraction, 4),
+            'regions': [
+                {'left': left, 'top': top, 'width': width, 'height': height}
+                for left, top, width, height in self.regions
+            ]
+        }
+
+class ScreenChangeTracker:
+    """
+    Detects which parts of the screen changed between captures.
+
+    Frames are reduced to grayscale at 1/``downsample`` resolution by strided
+    slicing (no full-resolution copy), split into ``tile_size`` pixel tiles, and
+    a tile is dirty when any of its pixels differs from the previous frame by
+    more than ``threshold`` gray levels.
+    """
+
+    def __init__(self, tile_size: int = 64, downsample: int = 4, threshold: int = 16):
+        if tile_size % downsample:
+            raise ValueError("tile_size must be a multiple of downsample")
+        self.tile_size = tile_size
+        self.downsample = downsample
+        self.threshold = threshold
+        self._previous: Optional[np.ndarray] = None
+        self._frame_shape: Optional[Tuple[int, int]] = None
+        self._offset: Tuple[int, int] = (0, 0)
+
+    def reset(self) -> None:
+        """Forget the last frame; the next update reports a full change."""
+        self._previous = None
+        self._frame_shape = None
+
+    def update(self, frame: np.ndarray, offset: Tuple[int, int] = (0, 0)) -> ScreenDiff:
+        """
+        Compare a frame with the previous one and remember it.
+
+        Args:
+            frame: BGRA, BGR or grayscale frame
+            offset: Screen position of the frame's top-left corner
+
+        Returns:
+            ScreenDiff: Dirty regions in screen coordinates
+        """
+        small = self._reduce(frame)
+        rows, cols = small.shape[0] // self._tile_px, small.shape[1] // self._tile_px
+        shape = frame.shape[:2]
+        previous = self._previous
+        self._previous = small
+        if previous is None or self._frame_shape != shape or self._offset != offset:
+            self._frame_shape = shape
+            self._offset = offset
+            return ScreenDiff(
+                regions=[(offset[0], offset[1], shape[1], shape[0])],
+                dirty_tiles=rows * cols,
+                total_tiles=rows * cols,
+                full=True,
+                mask=np.ones((rows, cols), dtype=bool)
+            )
+
+        delta = np.abs(small.astype(np.int16) - previous)
+        tile_delta = delta.reshape(rows, self._tile_px, cols, self._tile_px).max(axis=(1, 3))
+        dirty = tile_delta > self.threshold
+        return ScreenDiff(
+            regions=self.regions(dirty),
+            dirty_tiles=int(dirty.sum()),
+            total_tiles=rows * cols,
+            mask=dirty
+        )
+
+    def regions(self, mask: np.ndarray) -> List[Region]:
+        """
+        Merge a tile mask of the current frame (e.g. several diffs' masks OR-ed together) into regions.
+
+        Args:
+            mask: Dirty flag per tile, shaped like ScreenDiff.mask
+
+        Returns:
+            List[Region]: Regions in screen coordinates
+        """
+        return [self._to_screen(box) for box in _merge_tiles(mask)]
+
+    def digest(self, region: Optional[Region] = None) -> str:
+        """
+        Hash the content of the last frame, or of a region of it.
+
+        Args:
+            region: Region in screen coordinates, or None for the whole frame
+
+        Returns:
+            str: Content hash, suitable as a cache key
+        """
+        if self._previous is None:
+            raise ValueError("No frame has been captured yet")
+        small = self._previous
+        if region is not None:
+            left, top, width, height = region
+            x0 = (left - self._offset[0]) // self.downsample
+            y0 = (top - self._offset[1]) // self.downsample
+            small = small[max(0, y0):y0 + -(-height // self.downsample), max(0, x0):x0 + -(-width // self.downsample)]
+        return hashlib.blake2b(np.ascontiguousarray(small).tobytes(), digest_size=16).hexdigest()
+
+    @property
+    def _tile_px(self) -> int:
+        return self.tile_size // self.downsample
+
+    def _reduce(self, frame: np.ndarray) -> np.ndarray:
+        """Downsample to grayscale, padded to a whole number of tiles."""
+        step = self.downsample
+        if frame.ndim == 2:
+            small = frame[::step, ::step].astype(np.int16)
+        else:
+            # Integer BT.601 luma from the B, G, R channels of the strided view
+            view = frame[::step, ::step, :3].astype(np.int32)
+            small = ((29 * view[..., 0] + 150 * view[..., 1] + 77 * view[..., 2]) >> 8).astype(np.int16)
+        pad_y = -small.shape[0] % self._tile_px
+        pad_x = -small.shape[1] % self._tile_px
+        if pad_y or pad_x:
+            small = np.pad(small, ((0, pad_y), (0, pad_x)), mode="edge")
+        return small
+
+    def _to_screen(self, box: Tuple[int, int, int, int]) -> Region:
+        """Convert a (row0, col0, row1, col1) tile box to a clipped screen region."""
+        row0, col0, row1, col1 = box
+        height, width = self._frame_shape
+        left = col0 * self.tile_size
+        top = row0 * self.tile_size
+        right = min(width, (col1 + 1) * self.tile_size)
+        bottom = min(height, (row1 + 1) * self.tile_size)
+        return (left + self._offset[0], top + self._offset[1], right - left, bottom - top)
+
+def _merge_tiles(dirty: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """Group dirty tiles into bounding boxes of 8-connected components."""
+    seen = np.zeros_like(dirty)
+    boxes = []
+    rows, cols = dirty.shape
+    for start in zip(*np.nonzero(dirty)):
+        if seen[start]:
+            continue
+        seen[start] = True
+        stack = [start]
+        row0, col0 = row1, col1 = start
+        while stack:
+            r, c = stack.pop()
+            row0, row1 = min(row0, r), max(row1, r)
+            col0, col1 = min(col0, c), max(col1, c)
+            for nr in range(max(0, r - 1), min(rows, r + 2)):
+                for nc in range(max(0, c - 1), min(cols, c + 2)):
+                    if dirty[nr, nc] and not seen[nr, nc]:
+                        seen[nr, nc] = True
+                        stack.append((nr, nc))
+        boxes.append((int(row0), int(col0), int(row1), int(col1)))
+    return boxes
+
+__all__ = ["ScreenDiff", "ScreenChangeTracker"]
@@ -0,0 +1,244 @@
+"""
+Screen template matching for Labeeb.
+
+Captures the screen (or a region of it) with mss straight into a NumPy view of
+the raw BGRA buffer, converts it to grayscale once, and matches any number of
+templates against that single frame with OpenCV. Matching runs coarse-to-fine:
+templates are first located on a downscaled pyramid level, then the best
+candidate is refined at full resolution inside a small window around it.
+Templates are loaded from disk once and cached by path and modification time.
+"""
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+import numpy as np
+from src.app.core.lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+mss = lazy_import("mss")
+
+Region = Tuple[int, int, int, int]
+
+@dataclass
+class TemplateMatch:
+    """Location of a template on screen, in screen coordinates."""
+    left: int
+    top: int
+    width: int
+    height: int
+    score: float
+    scale: float = 1.0
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        return self.left + self.width // 2, self.top + self.height // 2
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'left': self.left,
+            'top': self.top,
+            'width': self.width,
+            'height': self.height,
+            'score': round(self.score, 4),
+            'scale': self.scale
+        }
+
+@lru_cache(maxsize=128)
+def _load_template(path: str, mtime_ns: int) -> np.ndarray:
+    template = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if template is None:
+        raise FileNotFoundError(f"Cannot read template image: {path}")
+    return template
+
+def load_template(path: str) -> np.ndarray:
+    """
+    Load a template as grayscale, cached until the file changes.
+
+    Args:
+        path: Path to the template image
+
+    Returns:
+        np.ndarray: Grayscale template
+    """
+    return _load_template(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+def to_gray(frame: np.ndarray) -> np.ndarray:
+    """Convert a BGRA/BGR/gray frame to a single-channel grayscale image."""
+    if frame.ndim == 2:
+        return frame
+    code = cv2.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    return cv2.cvtColor(frame, code)
+
+def match_template(frame: np.ndarray, template: np.ndarray, confidence: float = 0.9,
+                   scales: Sequence[float] = (1.0,), pyramid_levels: int = 2,
+                   offset: Tuple[int, int] = (0, 0)) -> Optional[TemplateMatch]:
+    """
+    Find the best match of a template in a grayscale frame.
+
+    Args:
+        frame: Grayscale frame
+        template: Grayscale template
+        confidence: Minimum normalized correlation score (0-1)
+        scales: Template scale factors to try (e.g. for different DPI)
+        pyramid_levels: Number of 2x downscales used for the coarse search
+        offset: Screen position of the frame's top-left corner
+
+    Returns:
+        Optional[TemplateMatch]: The best match above confidence, or None
+    """
+    best: Optional[TemplateMatch] = None
+    for scale in scales:
+        scaled = template if scale == 1.0 else cv2.resize(
+            template, None, fx=scale, fy=scale,
+            interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        )
+        th, tw = scaled.shape[:2]
+        if th > frame.shape[0] or tw > frame.shape[1] or th < 2 or tw < 2:
+            continue
+        found = _coarse_to_fine(frame, scaled, pyramid_levels)
+        if found is None:
+            continue
+        x, y, score = found
+        if score >= confidence and (best is None or score > best.score):
+            best = TemplateMatch(x + offset[0], y + offset[1], tw, th, score, scale)
+    return best
+
+def _coarse_to_fine(frame: np.ndarray, template: np.ndarray, levels: int) -> Optional[Tuple[int, int, float]]:
+    """Locate the template on a downscaled level, then refine around the candidate."""
+    th, tw = template.shape[:2]
+    # Do not shrink the template below a size where matching becomes unreliable
+    while levels > 0 and min(th, tw) >> levels < 8:
+        levels -= 1
+
+    if levels == 0:
+        result = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(result)
+        return x, y, float(score)
+
+    factor = 1 << levels
+    small_frame = cv2.resize(frame, (frame.shape[1] // factor, frame.shape[0] // factor), interpolation=cv2.INTER_AREA)
+    small_template = cv2.resize(template, (tw // factor, th // factor), interpolation=cv2.INTER_AREA)
+    if small_template.shape[0] > small_frame.shape[0] or small_template.shape[1] > small_frame.shape[1]:
+        return None
+    coarse = cv2.matchTemplate(small_frame, small_template, cv2.TM_CCOEFF_NORMED)
+    _, _, _, (cx, cy) = cv2.minMaxLoc(coarse)
+
+    # Refine at full resolution in a window of +/- factor pixels around the candidate
+    margin = factor * 2
+    x0 = max(0, cx * factor - margin)
+    y0 = max(0, cy * factor - margin)
+    x1 = min(frame.shape[1], cx * factor + tw + margin)
+    y1 = min(frame.shape[0], cy * factor + th + margin)
+    result = cv2.matchTemplate(frame[y0:y1, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+    _, score, _, (x, y) = cv2.minMaxLoc(result)
+    return x0 + x, y0 + y, float(score)
+
+class ScreenMatcher:
+    """Captures screen regions with mss and matches templates against them."""
+
+    def __init__(self, scales: Sequence[float] = (1.0,), pyramid_levels: int = 2):
+        """
+        Initialize the matcher.
+
+        Args:
+            scales: Template scale factors to try
+            pyramid_levels: Number of 2x downscales for the coarse search
+        """
+        self.scales = tuple(scales)
+        self.pyramid_levels = pyramid_levels
+        self._local = threading.local()
+
+    @property
+    def _sct(self):
+        # mss handles are not thread-safe; keep one per thread
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = self._local.sct = mss.mss()
+        return sct
+
+    def capture(self, region: Optional[Region] = None) -> np.ndarray:
+        """
+        Capture the screen or a region as a BGRA array without a PIL round-trip.
+
+        Args:
+            region: (left, top, width, height), or None for the whole virtual screen
+
+        Returns:
+            np.ndarray: Array of shape (height, width, 4) viewing the raw buffer
+        """
+        if region is None:
+            monitor = self._sct.monitors[0]
+        else:
+            left, top, width, height = region
+            monitor = {"left": left, "top": top, "width": width, "height": height}
+        shot = self._sct.grab(monitor)
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def locate(self, template_path: str, region: Optional[Region] = None,
+               confidence: float = 0.9) -> Optional[TemplateMatch]:
+        """
+        Locate one template on screen.
+
+        Args:
+            template_path: Path to the template image
+            region: Region of interest to search, or None for the whole screen
+            confidence: Minimum match score (0-1)
+
+        Returns:
+            Optional[TemplateMatch]: The match in screen coordinates, or None
+        """
+        return self.locate_all([template_path], region, confidence)[template_path]
+
+    def locate_all(self, template_paths: Iterable[str], region: Optional[Region] = None,
+                   confidence: float = 0.9) -> Dict[str, Optional[TemplateMatch]]:
+        """
+        Locate several templates in a single capture.
+
+        Args:
+            template_paths: Paths to the template images
+            region: Region of interest to search, or None for the whole screen
+            confidence: Minimum match score (0-1)
+
+        Returns:
+            Dict[str, Optional[TemplateMatch]]: Match (or None) per template path
+        """
+        frame = self.capture(region)
+        return self.match_frame(frame, template_paths, confidence, self.origin(region))
+
+    def origin(self, region: Optional[Region] = None) -> Tuple[int, int]:
+        """Screen position of the top-left corner of a capture of region."""
+        if region is None:
+            monitor = self._sct.monitors[0]
+            return monitor["left"], monitor["top"]
+        return region[0], region[1]
+
+    def match_frame(self, frame: np.ndarray, template_paths: Iterable[str], confidence: float = 0.9,
+                    offset: Tuple[int, int] = (0, 0)) -> Dict[str, Optional[TemplateMatch]]:
+        """
+        Match templates against an already captured frame.
+
+        Args:
+            frame: BGRA, BGR or grayscale frame
+            template_paths: Paths to the template images
+            confidence: Minimum match score (0-1)
+            offset: Screen position of the frame's top-left corner
+
+        Returns:
+            Dict[str, Optional[TemplateMatch]]: Match (or None) per template path
+        """
+        gray = to_gray(frame)
+        return {
+            path: match_template(gray, load_template(path), confidence, self.scales, self.pyramid_levels, offset)
+            for path in template_paths
+        }
+
+    def close(self) -> None:
+        """Release this thread's mss handle."""
+        sct = getattr(self._local, "sct", None)
+        if sct is not None:
+            sct.close()
+            self._local.sct = None
+
+__all__ = ["TemplateMatch", "ScreenMatcher", "match_template", "load_template", "to_gray"]
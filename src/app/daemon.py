@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Labeeb daemon mode.
+
+Keeps a fully initialized Labeeb instance (platform manager, Ollama model
+selection, AI handler, command processor and tools) alive in a long-running
+process and serves commands over a Unix domain socket. Clients
+(see ``daemon_client``) send a command and get its output streamed back, so the
+start-up cost is paid once per daemon instead of once per command.
+
+Commands are executed one at a time: the command processor and the process-wide
+stdout/cwd are shared state. Control requests (``ping``, ``shutdown``) are
+answered immediately, even while a command is running.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import logging
+import threading
+import socketserver
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, Optional
+
+from src.app.daemon_client import default_socket_path, encode_message
+
+logger = logging.getLogger(__name__)
+
+
+class _StreamingOutput(io.TextIOBase):
+    """Text stream that forwards complete lines to the client as output messages."""
+
+    def __init__(self, send: Callable[[Dict[str, Any]], None]) -> None:
+        self._send = send
+        self._buffer = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        if "\n" in self._buffer:
+            complete, _, self._buffer = self._buffer.rpartition("\n")
+            self._send({"type": "output", "text": complete + "\n"})
+        return len(text)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._send({"type": "output", "text": self._buffer})
+            self._buffer = ""
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request per connection and streams the reply."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        self.server.labeeb_daemon.handle_request(line, self._send)
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        try:
+            self.wfile.write(encode_message(message))
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; the command still runs to completion
+            pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class LabeebDaemon:
+    """Serves commands to thin clients from a single warm Labeeb instance."""
+
+    def __init__(self, labeeb_factory: Callable[[], Any], socket_path: Optional[str] = None) -> None:
+        """
+        Initialize the daemon.
+
+        Args:
+            labeeb_factory: Builds the Labeeb instance; called once in ``start``
+            socket_path: Socket to listen on (defaults to ``default_socket_path()``)
+        """
+        self.labeeb_factory = labeeb_factory
+        self.socket_path = socket_path or default_socket_path()
+        self.labeeb = None
+        self.started_at = None
+        self.commands_processed = 0
+        self._server = None
+        self._command_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Build the Labeeb instance and bind the socket."""
+        self._remove_stale_socket()
+        self.labeeb = self.labeeb_factory()
+        # Create the socket owner-only: anyone who can connect can run commands
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.labeeb_daemon = self
+        self.started_at = time.time()
+        logger.info(f"Labeeb daemon listening on {self.socket_path}")
+
+    def serve_forever(self) -> None:
+        """Start (if needed) and serve requests until shut down."""
+        if self._server is None:
+            self.start()
+        self._install_signal_handlers()
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """Stop serving; safe to call from any thread, including a request handler."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self) -> None:
+        """Release the socket and clean up the Labeeb instance."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        cleanup = getattr(self.labeeb, "cleanup", None)
+        if callable(cleanup):
+            cleanup()
+        logger.info("Labeeb daemon stopped")
+
+    def handle_request(self, line: bytes, send: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Dispatch a single protocol request.
+
+        Args:
+            line: The raw JSON request line
+            send: Sends one protocol message to the client
+        """
+        try:
+            request = json.loads(line)
+            op = request.get("op", "command")
+        except (ValueError, AttributeError):
+            send({"type": "error", "error": "Malformed request"})
+            return
+
+        if op == "ping":
+            send({"type": "result", "result": self.status()})
+        elif op == "shutdown":
+            send({"type": "result", "result": "shutting down"})
+            self.shutdown()
+        elif op == "command":
+            self._run_command(request, send)
+        else:
+            send({"type": "error", "error": f"Unknown operation: {op}"})
+
+    def status(self) -> Dict[str, Any]:
+        """Get daemon status information."""
+        return {
+            "pid": os.getpid(),
+            "socket": self.socket_path,
+            "uptime": time.time() - self.started_at if self.started_at else 0.0,
+            "commands_processed": self.commands_processed,
+            "busy": self._command_lock.locked()
+        }
+
+    def _run_command(self, request: Dict[str, Any], send: Callable[[Dict[str, Any]], None]) -> None:
+        """Run a command with stdout streamed to the client."""
+        command = (request.get("command") or "").strip()
+        if not command:
+            send({"type": "error", "error": "Empty command"})
+            return
+
+        with self._command_lock:
+            stream = _StreamingOutput(send)
+            previous_cwd = os.getcwd()
+            try:
+                cwd = request.get("cwd")
+                if cwd and os.path.isdir(cwd):
+                    os.chdir(cwd)
+                with redirect_stdout(stream):
+                    result = self.labeeb.command_processor.process_command(command)
+                    sys.stdout.flush()
+                self.commands_processed += 1
+                send({"type": "result", "result": result})
+            except Exception as e:
+                stream.flush()
+                logger.error(f"Daemon command failed: {str(e)}", exc_info=True)
+                send({"type": "error", "error": str(e)})
+            finally:
+                os.chdir(previous_cwd)
+
+    def _remove_stale_socket(self) -> None:
+        """Remove a socket file left behind by a daemon that is no longer running."""
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"A Labeeb daemon is already running on {self.socket_path}")
+
+    def _install_signal_handlers(self) -> None:
+        """Shut down cleanly on SIGTERM/SIGINT when running in the main thread."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: self.shutdown())
+
+
+__all__ = ["LabeebDaemon"]
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Thin client for the Labeeb daemon.
+
+Sends a command to a running daemon over its Unix domain socket and streams the
+output back. Only the standard library is imported here, so a client call costs
+a Python start-up plus one socket round trip instead of a full Labeeb start-up.
+
+Protocol: newline-delimited JSON in both directions. The client sends a single
+request object (``{"op": "command", "command": ...}``, ``{"op": "ping"}`` or
+``{"op": "shutdown"}``); the daemon replies with zero or more
+``{"type": "output", "text": ...}`` messages followed by exactly one
+``{"type": "result", ...}`` or ``{"type": "error", "error": ...}`` message.
+"""
+
+import os
+import sys
+import json
+import socket
+import argparse
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+# Exit codes used by the client entry point
+EXIT_OK = 0
+EXIT_COMMAND_FAILED = 1
+EXIT_NO_DAEMON = 2
+
+
+class DaemonUnavailableError(ConnectionError):
+    """Raised when no daemon is listening on the socket."""
+
+
+def default_socket_path() -> str:
+    """
+    Get the socket path shared by the daemon and the client.
+
+    ``LABEEB_SOCKET`` overrides it; otherwise a per-user path under
+    ``XDG_RUNTIME_DIR`` (or the temp directory) is used.
+    """
+    path = os.environ.get("LABEEB_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(runtime_dir, f"labeeb-{uid}.sock")
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a protocol message as one JSON line."""
+    return (json.dumps(message, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def send_request(request: Dict[str, Any], socket_path: Optional[str] = None,
+                 on_output: Optional[Callable[[str], None]] = None,
+                 timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Send a request to the daemon and wait for its final message.
+
+    Args:
+        request: Request object, e.g. ``{"op": "command", "command": "..."}``
+        socket_path: Daemon socket (defaults to ``default_socket_path()``)
+        on_output: Called with each streamed output chunk as it arrives
+        timeout: Socket timeout in seconds (None waits indefinitely)
+
+    Returns:
+        Dict[str, Any]: The final ``result`` or ``error`` message
+
+    Raises:
+        DaemonUnavailableError: If no daemon is listening on the socket
+    """
+    socket_path = socket_path or default_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailableError(f"No Labeeb daemon listening on {socket_path}") from e
+        sock.sendall(encode_message(request))
+        with sock.makefile("r", encoding="utf-8") as reader:
+            for line in reader:
+                message = json.loads(line)
+                if message.get("type") == "output":
+                    if on_output:
+                        on_output(message.get("text", ""))
+                    continue
+                return message
+        return {"type": "error", "error": "Daemon closed the connection without a result"}
+    finally:
+        sock.close()
+
+
+def send_command(command: str, socket_path: Optional[str] = None,
+                 on_output: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Run a command in the daemon.
+
+    Args:
+        command: The command to process
+        socket_path: Daemon socket (defaults to ``default_socket_path()``)
+        on_output: Called with each streamed output chunk as it arrives
+
+    Returns:
+        Dict[str, Any]: The final ``result`` or ``error`` message
+    """
+    request = {"op": "command", "command": command, "cwd": os.getcwd()}
+    return send_request(request, socket_path, on_output)
+
+
+def main(argv=None) -> int:
+    """Client entry point: send a command (or control request) and print the output."""
+    parser = argparse.ArgumentParser(description="Send a command to a running Labeeb daemon")
+    parser.add_argument("command", nargs="*", help="Command to execute")
+    parser.add_argument("--socket", default=None, help="Daemon socket path")
+    parser.add_argument("--ping", action="store_true", help="Check whether the daemon is running")
+    parser.add_argument("--shutdown", action="store_true", help="Stop the daemon")
+    args = parser.parse_args(argv)
+
+    def write(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    try:
+        if args.ping or args.shutdown:
+            reply = send_request({"op": "ping" if args.ping else "shutdown"}, args.socket, timeout=5)
+            print(json.dumps(reply, ensure_ascii=False))
+            return EXIT_OK if reply.get("type") == "result" else EXIT_COMMAND_FAILED
+
+        command = " ".join(args.command) if args.command else sys.stdin.read().strip()
+        reply = send_command(command, args.socket, on_output=write)
+    except DaemonUnavailableError as e:
+        print(f"{e}. Start it with: python src/app/main.py --daemon", file=sys.stderr)
+        return EXIT_NO_DAEMON
+
+    if reply.get("type") == "error":
+        print(f"Error: {reply.get('error')}", file=sys.stderr)
+        return EXIT_COMMAND_FAILED
+    result = reply.get("result")
+    if result not in (None, ""):
+        print(result)
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
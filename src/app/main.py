@@ -39,6 +39,8 @@ from src.app.core.file_operations import process_file_flag_request
 from src.app.health_check.ollama_health_check import check_ollama_server, check_model_available
 from src.app.core.model_manager import ModelManager
 from src.app.core.config_manager import ConfigManager
+from src.app.core.config_store import config_service
+from src.app.core.startup import StartupOrchestrator
 from src.app.core.ai.agent import LabeebAgent
 from app.agent_tools.base_tool import BaseAgentTool
 from src.app.core.ai.workflows.base_workflow import LabeebWorkflow
@@ -64,7 +66,7 @@ class Labeeb:
         Args:
             config: Optional configuration dictionary
             debug: Boolean to enable debug output
-            mode: The mode of operation (interactive, command, or file)
+            mode: The mode of operation (interactive, command, file, or daemon)
             fast_mode: Boolean to enable fast mode (minimal prompts, quick exit)
         """
         try:
@@ -76,77 +78,109 @@ class Labeeb:
             self.arabic_support = True
             self.rtl_support = True
             
+            # Independent init steps run concurrently (e.g. the Ollama probe
+            # alongside platform handler init); see _declare_startup_tasks
+            self.startup = StartupOrchestrator()
+            self._declare_startup_tasks(config)
+            results = self.startup.run()
+            
+            self.platform_manager = results['platform']
+            self.config = results['config']
+            self.ai_handler = results['ai_handler']
+            self.command_processor = results['command_processor']
+            self.welcome_message = results['welcome']
+            if self.debug:
+                print(self.startup.report())
+            
+            logger.info("Labeeb initialized successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to initialize Labeeb: {str(e)}")
+            raise
+    
+    def _declare_startup_tasks(self, config: Optional[Dict[str, Any]]) -> None:
+        """
+        Declare the init steps and their dependencies on the startup orchestrator.
+        
+        Args:
+            config: Optional configuration dictionary passed to __init__
+        """
+        def init_platform():
             # Initialize platform manager with mode awareness if needed
-            self.platform_manager = PlatformManager()
-            if not self.platform_manager.is_platform_supported():
-                raise ConfigurationError(f"Unsupported platform: {self.platform_manager.platform_name}")
+            platform_manager = PlatformManager()
+            if not platform_manager.is_platform_supported():
+                raise ConfigurationError(f"Unsupported platform: {platform_manager.platform_name}")
             
             # Initialize platform components
             logger.info("Initializing platform components...")
-            self.platform_manager.initialize()
-            
+            platform_manager.initialize()
+            return platform_manager
+        
+        def load_config():
             # Load configuration from file if not provided
-            if config is None:
-                config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'settings.json')
-                if os.path.exists(config_path):
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        self.config = json.load(f)
-                else:
-                    self.config = {}
-            else:
-                self.config = config
-            
+            if config is not None:
+                return config
+            config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'settings.json')
+            # Mutable copy of the shared snapshot (a missing file is an empty config)
+            return config_service().open(config_path).snapshot.to_dict()
+        
+        def configure_output(config):
             # Configure output facade with verbosity settings and RTL support
-            output_verbosity = self.config.get('output_verbosity', 'normal')
+            output_verbosity = config.get('output_verbosity', 'normal')
             output.set_verbosity(output_verbosity)
             output.set_rtl_support(self.rtl_support)
             
-            # Initialize shell handler and command processor
-            self.shell_handler = ShellHandler(fast_mode=fast_mode)
-            
-            # Initialize AI handler with caching and Arabic support
-            model_type = self.config.get('default_ai_provider', 'ollama')
-            ollama_base_url = self.config.get('ollama_base_url', 'http://localhost:11434')
-            
+            # Optionally move output I/O to a background writer; JSON lines for non-TTY sinks
+            output_format = config.get('output_format', 'text')
+            if config.get('output_buffered', False) or output_format == 'jsonl':
+                output.enable_buffered_output(json_lines=(output_format == 'jsonl'))
+        
+        def probe_ollama(config):
+            if config.get('default_ai_provider', 'ollama') != 'ollama':
+                return None
+            return check_ollama_server()
+        
+        def select_model(config, ollama_probe):
             # --- Automated Ollama model selection ---
-            default_model = self.config.get('default_ollama_model', 'gemma:2b')
-            selected_model = default_model
-            if model_type == 'ollama':
-                ok, tags_json = check_ollama_server()
-                if ok:
-                    ok, selected_model = check_model_available(tags_json, default_model)
-                    if ok:
-                        print(f"[Labeeb] Using Ollama model: {selected_model}")
-                        # Update the config with the selected model
-                        if self.update_config(selected_model):
-                            self.config['default_ollama_model'] = selected_model
-                        else:
-                            print("[Labeeb] Warning: Failed to update configuration with selected model")
-                    else:
-                        print("[Labeeb] No available Ollama model found. Exiting.")
-                        raise RuntimeError("No available Ollama model found.")
-            else:
-                selected_model = default_model
-                
+            default_model = config.get('default_ollama_model', 'gemma:2b')
+            if ollama_probe is None:
+                return default_model
+            ok, tags_json = ollama_probe
+            if not ok:
+                return default_model
+            ok, selected_model = check_model_available(tags_json, default_model)
+            if not ok:
+                print("[Labeeb] No available Ollama model found. Exiting.")
+                raise RuntimeError("No available Ollama model found.")
+            print(f"[Labeeb] Using Ollama model: {selected_model}")
+            config['default_ollama_model'] = selected_model
+            return selected_model
+        
+        def save_model(model):
+            # Persisting the selection is off the critical path to the prompt
+            if not self.update_config(model):
+                print("[Labeeb] Warning: Failed to update configuration with selected model")
+        
+        def build_ai_handler(config, model):
             # Initialize AIHandler with only supported arguments
             config_manager = ConfigManager()
-            config_manager.set("default_ollama_model", selected_model)
-            config_manager.set("ollama_base_url", ollama_base_url)
+            config_manager.set("default_ollama_model", model)
+            config_manager.set("ollama_base_url", config.get('ollama_base_url', 'http://localhost:11434'))
             config_manager.set("arabic_support", self.arabic_support)
             config_manager.set("rtl_support", self.rtl_support)
             
-            self.ai_handler = AIHandler(
+            ai_handler = AIHandler(
                 model_manager=ModelManager(config_manager)
             )
             
             # Patch the model name for Ollama if needed
-            if model_type == 'ollama':
-                setattr(self.ai_handler, 'ollama_model_name', selected_model)
-            
-            self.command_processor = CommandProcessor(self.ai_handler)
-            
+            if config.get('default_ai_provider', 'ollama') == 'ollama':
+                setattr(ai_handler, 'ollama_model_name', model)
+            return ai_handler
+        
+        def build_welcome(platform):
             # Welcome message with platform info and RTL support
-            platform_info = self.platform_manager.get_platform_info()
+            platform_info = platform.get_platform_info()
             welcome_text = f"""
 🤖 مرحباً بك في لبيب!
 أنا مساعدك الذكي، جاهز لمساعدتك في مهامك.
@@ -155,13 +189,25 @@ class Labeeb:
 """
             if self.rtl_support:
                 welcome_text = get_display(arabic_reshaper.reshape(welcome_text))
-            self.welcome_message = welcome_text
-            
-            logger.info("Labeeb initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize Labeeb: {str(e)}")
-            raise
+            return welcome_text
+        
+        self.startup.add('platform', init_platform)
+        self.startup.add('config', load_config)
+        self.startup.add('output', configure_output, depends_on=['config'])
+        self.startup.add('ollama_probe', probe_ollama, depends_on=['config'])
+        self.startup.add('model', select_model, depends_on=['config', 'ollama_probe'])
+        self.startup.add('save_model', save_model, depends_on=['model'])
+        self.startup.add('ai_handler', build_ai_handler, depends_on=['config', 'model'])
+        self.startup.add('command_processor', lambda ai_handler: CommandProcessor(ai_handler), depends_on=['ai_handler'])
+        self.startup.add('welcome', build_welcome, depends_on=['platform'])
+        
+        # Optional subsystems are only built when first used
+        self.startup.defer('shell_handler', lambda: ShellHandler(fast_mode=self.fast_mode))
+    
+    @property
+    def shell_handler(self) -> ShellHandler:
+        """Shell handler, built on first use."""
+        return self.startup.get('shell_handler')
     
     def start(self) -> None:
         """Start the Labeeb interactive session."""
@@ -306,6 +352,7 @@ class Labeeb:
     def cleanup(self) -> None:
         """Clean up resources."""
         try:
+            output.flush()
             self.platform_manager.cleanup()
             logger.info("Resources cleaned up successfully")
         except Exception as e:
@@ -346,22 +393,8 @@ class Labeeb:
             config_dir = os.path.join(project_root, 'config')
             config_path = os.path.join(config_dir, 'settings.json')
             
-            # Create config directory if it doesn't exist
-            os.makedirs(config_dir, exist_ok=True)
-            
-            # Load existing config or create new one
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-            else:
-                config = {}
-            
-            # Update the model setting
-            config['default_ollama_model'] = selected_model
-            
-            # Write the updated config
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Update the model setting; the write is debounced and atomic
+            config_service().open(config_path).update({'default_ollama_model': selected_model})
             
             logger.info(f"Updated configuration with model: {selected_model}")
             return True
@@ -413,8 +446,7 @@ class Labeeb:
                 
             # Save config to file
             config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'settings.json')
-            with open(config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            config_service().open(config_path).replace(self.config)
                 
             # Re-initialize AI handler
             self.ai_handler = AIHandler(
@@ -424,6 +456,55 @@ class Labeeb:
         else:
             output.error("Invalid model selection.")
 
+def run_daemon(socket_path: Optional[str] = None, debug: bool = False) -> None:
+    """
+    Run Labeeb as a long-lived daemon serving commands over a Unix domain socket.
+    
+    Args:
+        socket_path: Socket to listen on (defaults to the per-user socket)
+        debug: Boolean to enable debug output
+    """
+    from src.app.daemon import LabeebDaemon
+    
+    def build_labeeb() -> Labeeb:
+        labeeb = Labeeb(debug=debug, mode='daemon', fast_mode=True)
+        # Output is streamed to each client as it is printed
+        output.disable_buffered_output()
+        return labeeb
+    
+    daemon = LabeebDaemon(build_labeeb, socket_path)
+    daemon.start()
+    print(f"[Labeeb] Daemon listening on {daemon.socket_path}")
+    daemon.serve_forever()
+
+def run_batch(source: str, jobs: int = 8, output_path: Optional[str] = None):
+    """
+    Run a file of commands through one shared agent and stream JSON line results.
+    
+    Args:
+        source: Path to the command file, or '-' for stdin
+        jobs: Maximum number of commands executing concurrently
+        output_path: File for the JSON lines (defaults to stdout)
+        
+    Returns:
+        BatchSummary: Totals and throughput; also printed to stderr as JSON
+    """
+    from src.app.core.batch_runner import BatchRunner, read_commands
+    
+    runner = BatchRunner(LabeebAgent(), max_workers=jobs)
+    source_file = sys.stdin if source == '-' else open(source, 'r', encoding='utf-8')
+    out = open(output_path, 'w', encoding='utf-8') if output_path else sys.stdout
+    try:
+        summary = runner.run(read_commands(source_file), out)
+    finally:
+        runner.close()
+        if source_file is not sys.stdin:
+            source_file.close()
+        if out is not sys.stdout:
+            out.close()
+    print(json.dumps(summary.to_dict()), file=sys.stderr)
+    return summary
+
 async def main():
     """Main CLI entry point."""
     print("Labeeb CLI")
@@ -458,9 +539,22 @@ async def main():
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Labeeb CLI")
     parser.add_argument('--fast', action='store_true', help='Enable fast mode (single input/output)')
+    parser.add_argument('--daemon', action='store_true', help='Run as a daemon serving commands over a Unix socket')
+    parser.add_argument('--socket', default=None, help='Daemon socket path (with --daemon)')
+    parser.add_argument('--batch', metavar='FILE', default=None, help="Run commands from FILE ('-' for stdin), one per line")
+    parser.add_argument('--jobs', type=int, default=8, help='Concurrent commands in batch mode')
+    parser.add_argument('--output', default=None, help='Write batch JSON lines to this file instead of stdout')
     parser.add_argument('command', nargs='*', help='Command to execute (in fast mode)')
     args = parser.parse_args()
 
+    if args.daemon:
+        run_daemon(args.socket)
+        sys.exit(0)
+
+    if args.batch:
+        summary = run_batch(args.batch, args.jobs, args.output)
+        sys.exit(0 if summary.failed == 0 else 1)
+
     async def process_command_and_log(command: str):
         agent = LabeebAgent()
         sequence = [f"input: {command}"]
@@ -19,11 +19,9 @@ import os
 from typing import Optional, Any, Dict, Union, List
 from src.app.logging_config import get_logger
 from pathlib import Path
-import arabic_reshaper
-from bidi.algorithm import get_display
 
 # Import the OutputHandler as our implementation class
-from src.app.utils.output_handler import OutputHandler
+from src.app.utils.output_handler import OutputHandler, reshape_rtl
 
 logger = get_logger(__name__)
 
@@ -95,12 +93,7 @@ class OutputFacade:
         """
         if not self._rtl_support:
             return text
-            
-        # Check if text contains Arabic characters
-        if any('\u0600' <= c <= '\u06FF' for c in text):
-            text = arabic_reshaper.reshape(text)
-            text = get_display(text)
-        return text
+        return reshape_rtl(text)
     
     def _set_verbosity(self, verbosity: str) -> None:
         """
@@ -315,6 +308,26 @@ class OutputFacade:
     def set_verbosity(self, verbosity: str) -> None:
         """Set the verbosity level."""
         self._set_verbosity(verbosity)
+    
+    # -- Buffered output --
+    
+    def enable_buffered_output(self, json_lines: bool = False, stream: Optional[Any] = None) -> None:
+        """
+        Write output from a background thread instead of printing inline.
+        
+        Args:
+            json_lines: Emit JSON lines instead of plain text (for non-TTY sinks)
+            stream: Target stream (defaults to stdout)
+        """
+        self._handler.enable_buffered_output(json_lines=json_lines, stream=stream)
+    
+    def disable_buffered_output(self) -> None:
+        """Flush buffered output and return to synchronous printing."""
+        self._handler.disable_buffered_output()
+    
+    def flush(self) -> None:
+        """Wait until all buffered output has been written."""
+        self._handler.flush()
 
 # Create a global instance for easy access
 output = OutputFacade.get_instance()
@@ -12,19 +12,19 @@ Output Philosophy & Flow:
 - Only show AI explanation if user asks for it or no direct command is possible.
 - Never show duplicate outputs of any type.
 - Support RTL languages (Arabic) with proper text reshaping and display.
+- Optionally hand output to a background writer so callers never block on I/O.
 """
 
 import sys
 import re
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Union, Tuple, TextIO
 from pathlib import Path
-import arabic_reshaper
-from bidi.algorithm import get_display
 
 # Import the style manager
-from src.app.utils.output_style_manager import OutputStyleManager
+from src.app.utils.output_style_manager import OutputStyleManager, reshape_rtl
+from src.app.utils.output_writer import OutputWriter, TextSink, JsonLinesSink
 from src.app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -63,6 +63,9 @@ class OutputHandler:
         self.debug_mode = False    # When True, shows debugging information
         self.verbosity = 'normal'  # Default verbosity level
         self.rtl_support = False   # RTL language support
+        
+        # Background writer; None means output is printed synchronously
+        self._writer: Optional[OutputWriter] = None
     
     def set_rtl_support(self, enabled: bool) -> None:
         """
@@ -85,12 +88,33 @@ class OutputHandler:
         """
         if not self.rtl_support:
             return text
-            
-        # Check if text contains Arabic characters
-        if any('\u0600' <= c <= '\u06FF' for c in text):
-            text = arabic_reshaper.reshape(text)
-            text = get_display(text)
-        return text
+        return reshape_rtl(text)
+    
+    def enable_buffered_output(self, json_lines: bool = False, stream: Optional[TextIO] = None,
+                               max_queue: int = 10000, batch_size: int = 256) -> None:
+        """
+        Route output through a background writer instead of printing inline.
+        
+        Args:
+            json_lines: Write JSON lines (for non-TTY consumers) instead of plain text
+            stream: Target stream (defaults to stdout)
+            max_queue: Maximum number of pending output records
+            batch_size: Maximum number of records written per batch
+        """
+        self.disable_buffered_output()
+        sink = JsonLinesSink(stream) if json_lines else TextSink(stream)
+        self._writer = OutputWriter(sink, max_queue=max_queue, batch_size=batch_size)
+    
+    def disable_buffered_output(self) -> None:
+        """Flush pending output and go back to synchronous printing."""
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+    
+    def flush(self) -> None:
+        """Wait until all buffered output has been written."""
+        if self._writer is not None:
+            self._writer.flush()
     
     def start_capture(self) -> None:
         """Start capturing output for later retrieval."""
@@ -113,11 +137,14 @@ class OutputHandler:
         
         Args:
             *args: Standard print arguments
-            **kwargs: Standard print keyword arguments
+            **kwargs: Standard print keyword arguments, plus ``kind`` which
+                labels the record for structured (JSON lines) output
             
         Returns:
             str: The string that was printed
         """
+        kind = kwargs.pop('kind', 'text')
+        
         # Process RTL text in args
         if self.rtl_support:
             args = [self._process_rtl_text(str(arg)) for arg in args]
@@ -126,7 +153,12 @@ class OutputHandler:
         
         if self.capture_mode:
             self.captured_output.append(output)
+        elif self._writer is not None and not kwargs:
+            self._writer.write(output, kind)
         else:
+            if self._writer is not None:
+                # print() options bypass the writer; keep it behind earlier buffered lines
+                self._writer.flush()
             print(output, **kwargs)
         
         return output
@@ -158,7 +190,7 @@ class OutputHandler:
         emoji = self.style_mgr.get_emoji("thinking", "🤔")
         output = f"{emoji} {formatted_box}"
         
-        return self.capture_print(output)
+        return self.capture_print(output, kind="thinking")
     
     def command(self, cmd: str) -> Optional[str]:
         """
@@ -182,7 +214,7 @@ class OutputHandler:
         prefix = "Executing" if not self.rtl_support else "جاري التنفيذ"
         output = f"{emoji} {prefix}: {cmd}"
         
-        return self.capture_print(output)
+        return self.capture_print(output, kind="command")
     
     def result(self, success: bool, message: str) -> Optional[str]:
         """
@@ -207,7 +239,7 @@ class OutputHandler:
         emoji = self.style_mgr.get_emoji(status_key)
         output = f"{emoji} {message}"
         
-        return self.capture_print(output)
+        return self.capture_print(output, kind=status_key)
     
     def explanation(self, message: str) -> str:
         """
@@ -225,7 +257,7 @@ class OutputHandler:
         emoji = self.style_mgr.get_emoji("info", "💬")
         output = f"{emoji} {message}"
         
-        return self.capture_print(output)
+        return self.capture_print(output, kind="explanation")
     
     def status(self, message: str, status_key: str = "info") -> str:
         """
@@ -242,7 +274,7 @@ class OutputHandler:
         message = self._process_rtl_text(message)
         
         return self.capture_print(
-            self.style_mgr.format_status_line(message, status_key)
+            self.style_mgr.format_status_line(message, status_key), kind=status_key
         )
     
     def header(self, text: str, emoji_key: Optional[str] = None) -> str:
@@ -260,7 +292,7 @@ class OutputHandler:
         text = self._process_rtl_text(text)
         
         return self.capture_print(
-            self.style_mgr.format_header(text, emoji_key)
+            self.style_mgr.format_header(text, emoji_key), kind="header"
         )
     
     def box(self, content: str, title: Optional[str] = None, width: Optional[int] = None) -> str:
@@ -281,7 +313,7 @@ class OutputHandler:
             title = self._process_rtl_text(title)
         
         return self.capture_print(
-            self.style_mgr.format_box(content, title, width)
+            self.style_mgr.format_box(content, title, width), kind="box"
         )
     
     def divider(self, style: str = "partial") -> str:
@@ -295,7 +327,7 @@ class OutputHandler:
             str: The formatted divider
         """
         return self.capture_print(
-            self.style_mgr.create_divider(style)
+            self.style_mgr.create_divider(style), kind="divider"
         )
         
     def table(self, headers: List[str], rows: List[List[Any]], 
@@ -319,7 +351,7 @@ class OutputHandler:
                 title = self._process_rtl_text(title)
         
         return self.capture_print(
-            self.style_mgr.format_table(headers, rows, title)
+            self.style_mgr.format_table(headers, rows, title), kind="table"
         )
     
     def list_items(self, items: List[str], 
@@ -343,7 +375,7 @@ class OutputHandler:
                 title = self._process_rtl_text(title)
         
         return self.capture_print(
-            self.style_mgr.format_list(items, bullet_type, title)
+            self.style_mgr.format_list(items, bullet_type, title), kind="list"
         )
     
     def reset(self) -> None:
@@ -7,17 +7,186 @@ and system capabilities. This provides a centralized way to manage appearance
 across the application.
 
 Supports RTL languages (Arabic, Hebrew, etc.) with proper text reshaping and display.
+
+Glyph lookups go through a precomputed render theme that is rebuilt only when
+the theme or settings change, border strings are cached per width, and the
+terminal size is re-queried only after SIGWINCH.
 """
 
 import os
+import re
 import json
+import time
 import shutil
+import signal
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import arabic_reshaper
 from bidi.algorithm import get_display
 from ..core.platform_core import get_platform_name, get_system_info
 
+_ARABIC_CHARS = re.compile('[\u0600-\u06FF]')
+
+@lru_cache(maxsize=2048)
+def reshape_rtl(text: str) -> str:
+    """
+    Reshape and reorder Arabic text for terminal display.
+
+    Results are memoized: status lines, prompts and box titles repeat a lot,
+    and reshaping + bidi reordering is far more expensive than a cache hit.
+
+    Args:
+        text: The text to process
+
+    Returns:
+        str: The display-ready text (unchanged if it has no Arabic characters)
+    """
+    if not _ARABIC_CHARS.search(text):
+        return text
+    return get_display(arabic_reshaper.reshape(text))
+
+# Characters that occupy no terminal cell: combining marks (including Arabic
+# harakat), bidi/format controls, variation selectors and emoji skin tones
+_ZERO_WIDTH = re.compile(
+    '[\u0300-\u036F\u0483-\u0489\u0591-\u05BD\u05BF\u05C1\u05C2\u05C4\u05C5\u05C7'
+    '\u0610-\u061A\u061C\u064B-\u065F\u0670\u06D6-\u06DC\u06DF-\u06E4\u06E7\u06E8'
+    '\u06EA-\u06ED\u08D3-\u08FF\u200B-\u200F\u202A-\u202E\u2060-\u2064\u20D0-\u20FF'
+    '\uFE00-\uFE0F\uFE20-\uFE2F\uFEFF\U0001F3FB-\U0001F3FF\U000E0100-\U000E01EF]'
+)
+
+# Characters that occupy two terminal cells: East Asian wide/fullwidth and emoji
+_WIDE = re.compile(
+    '[\u1100-\u115F\u231A\u231B\u23E9-\u23EC\u23F0\u23F3\u25FD\u25FE\u2614\u2615'
+    '\u2648-\u2653\u267F\u2693\u26A1\u26AA\u26AB\u26BD\u26BE\u26C4\u26C5\u26CE\u26D4'
+    '\u26EA\u26F2\u26F3\u26F5\u26FA\u26FD\u2705\u270A\u270B\u2728\u274C\u274E'
+    '\u2753-\u2755\u2757\u2795-\u2797\u27B0\u27BF\u2B1B\u2B1C\u2B50\u2B55'
+    '\u2E80-\u303E\u3041-\u33FF\u3400-\u4DBF\u4E00-\u9FFF\uA000-\uA4CF\uAC00-\uD7A3'
+    '\uF900-\uFAFF\uFE30-\uFE4F\uFF00-\uFF60\uFFE0-\uFFE6'
+    '\U0001F004\U0001F0CF\U0001F18E\U0001F191-\U0001F19A\U0001F200-\U0001F251'
+    '\U0001F300-\U0001F64F\U0001F680-\U0001F6FF\U0001F7E0-\U0001F7EB'
+    '\U0001F900-\U0001F9FF\U0001FA70-\U0001FAFF\U00020000-\U0002FFFD\U00030000-\U0003FFFD]'
+)
+
+# A text-style symbol followed by VS16 is rendered as a two-cell emoji (e.g. "⚠️")
+_EMOJI_PRESENTATION = re.compile('[\u2000-\u2BFF]\uFE0F')
+
+def display_width(text: str) -> int:
+    """
+    Number of terminal cells needed to display text.
+
+    Combining marks (e.g. Arabic diacritics) take no cell, wide characters and
+    emoji take two. Counting is done by C-level regex scans, not a Python loop.
+
+    Args:
+        text: The text to measure (a single line)
+
+    Returns:
+        int: Display width in cells
+    """
+    if text.isascii():
+        return len(text)
+    return (len(text)
+            - len(_ZERO_WIDTH.findall(text))
+            + len(_WIDE.findall(text))
+            + len(_EMOJI_PRESENTATION.findall(text)))
+
+def display_widths(lines: Iterable[str]) -> List[int]:
+    """
+    Display widths for many lines at once.
+
+    Args:
+        lines: Lines to measure
+
+    Returns:
+        List[int]: Display width of each line
+    """
+    return [len(line) if line.isascii() else display_width(line) for line in lines]
+
+def truncate_to_width(text: str, width: int, ellipsis: str = "...") -> str:
+    """
+    Truncate text so that it fits in ``width`` cells, appending an ellipsis.
+
+    Args:
+        text: The text to truncate
+        width: Maximum display width in cells
+        ellipsis: Suffix added when text is cut
+
+    Returns:
+        str: Text that fits within width
+    """
+    if display_width(text) <= width:
+        return text
+    limit = max(0, width - len(ellipsis))
+    if text.isascii():
+        return text[:limit] + ellipsis
+    used = 0
+    for index, char in enumerate(text):
+        char_width = display_width(char)
+        if used + char_width > limit:
+            return text[:index] + ellipsis
+        used += char_width
+    return text + ellipsis
+
+class _TerminalSize:
+    """Process-wide terminal size cache, invalidated by SIGWINCH."""
+
+    _columns: Optional[int] = None
+    _queried_at = 0.0
+    _watching = False
+    _lock = threading.Lock()
+    # Without SIGWINCH (e.g. Windows) re-query at most this often
+    POLL_INTERVAL = 1.0
+
+    @classmethod
+    def columns(cls) -> int:
+        columns = cls._columns
+        if columns is None or (not cls._watching and time.monotonic() - cls._queried_at > cls.POLL_INTERVAL):
+            columns = cls.refresh()
+        return columns
+
+    @classmethod
+    def refresh(cls) -> int:
+        try:
+            columns = shutil.get_terminal_size().columns
+        except Exception:
+            columns = 80
+        cls._columns = columns
+        cls._queried_at = time.monotonic()
+        return columns
+
+    @classmethod
+    def watch(cls) -> None:
+        """Install a SIGWINCH handler that invalidates the cached size."""
+        with cls._lock:
+            if cls._watching or not hasattr(signal, "SIGWINCH"):
+                return
+            if threading.current_thread() is not threading.main_thread():
+                return
+            try:
+                previous = signal.getsignal(signal.SIGWINCH)
+
+                def on_resize(signum, frame):
+                    cls._columns = None
+                    if callable(previous):
+                        previous(signum, frame)
+
+                signal.signal(signal.SIGWINCH, on_resize)
+                cls._watching = True
+            except (ValueError, OSError):
+                pass
+
+@dataclass
+class RenderTheme:
+    """Glyph tables resolved once for a theme and the current settings."""
+    name: str
+    emojis: Dict[str, str] = field(default_factory=dict)
+    box: Dict[str, str] = field(default_factory=dict)
+    use_emojis: bool = True
+    use_boxes: bool = True
+
 class OutputStyleManager:
     """Manages output styling preferences for Labeeb."""
     
@@ -32,7 +201,8 @@ class OutputStyleManager:
             auto_detect (bool): If True, auto-detects terminal capabilities.
         """
         self.config_path = config_path
-        self.theme = theme
+        self.theme_name = theme
+        self.theme = {}
         self.auto_detect = auto_detect
         self.style_settings = {}
         
@@ -43,7 +213,17 @@ class OutputStyleManager:
         # RTL support
         self.rtl_support = False
         
+        # Render caches, rebuilt whenever the theme or settings change
+        self._render_theme = RenderTheme(name=theme)
+        self._border_cache: Dict[int, Tuple[str, str]] = {}
+        
         self._init_style_settings()
+        self._load_config()
+        if self.auto_detect:
+            self._detect_terminal_capabilities()
+            _TerminalSize.watch()
+        self.theme = self.style_settings.get("themes", {}).get(theme, {})
+        self._build_render_theme()
         
     def set_rtl_support(self, enabled: bool) -> None:
         """
@@ -66,12 +246,7 @@ class OutputStyleManager:
         """
         if not self.rtl_support:
             return text
-            
-        # Check if text contains Arabic characters
-        if any('\u0600' <= c <= '\u06FF' for c in text):
-            text = arabic_reshaper.reshape(text)
-            text = get_display(text)
-        return text
+        return reshape_rtl(text)
         
     def _init_style_settings(self):
         """Initialize style settings based on platform capabilities."""
@@ -97,6 +272,36 @@ class OutputStyleManager:
                 self.style_settings = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             self.style_settings = {}
+        
+        # Flags such as use_emojis/use_boxes live under "output_styles" in the file
+        for key, value in self.style_settings.get("output_styles", {}).items():
+            self.style_settings.setdefault(key, value)
+    
+    def _build_render_theme(self):
+        """Resolve emoji and box glyph tables for the current theme and settings."""
+        use_emojis = self.style_settings.get("use_emojis", True)
+        use_boxes = self.style_settings.get("use_boxes", True)
+        
+        if use_emojis:
+            emojis = dict(self._get_emoji_set())
+        else:
+            # If emojis are disabled, use plain text symbols
+            emojis = dict(self.style_settings.get("default_symbols", {}))
+        
+        if use_boxes:
+            box = dict(self._get_box_style())
+        else:
+            # If fancy boxes are disabled, use ASCII
+            box = dict(self.style_settings.get("box_styles", {}).get("ascii", {}))
+        
+        self._render_theme = RenderTheme(
+            name=self.theme_name,
+            emojis=emojis,
+            box=box,
+            use_emojis=use_emojis,
+            use_boxes=use_boxes
+        )
+        self._border_cache.clear()
             
     def _get_emoji_set(self):
         """Get the emoji set for the current theme."""
@@ -114,12 +319,9 @@ class OutputStyleManager:
         try:
             is_tty = os.isatty(1)  # 1 = stdout
             if is_tty:
-                # Get terminal size
-                columns, _ = shutil.get_terminal_size()
-                # Only update if set to auto
-                if self.style_settings.get("terminal_width") == "auto":
-                    self.style_settings["terminal_width"] = columns
-                    
+                # Width stays "auto" so get_terminal_width follows resizes via
+                # the SIGWINCH-invalidated cache instead of pinning it here
+                
                 # Check if we're in Windows command prompt (limited emoji support)
                 if self.platform_name == 'windows' and "TERM" not in os.environ:
                     # Using cmd.exe or PowerShell with limited capabilities
@@ -146,11 +348,7 @@ class OutputStyleManager:
         Returns:
             str: The emoji or fallback character
         """
-        if not self.style_settings.get("use_emojis", True):
-            # If emojis are disabled, use plain text symbols
-            return self.style_settings.get("default_symbols", {}).get(key, fallback)
-            
-        return self._get_emoji_set().get(key, fallback)
+        return self._render_theme.emojis.get(key, fallback)
         
     def get_box_char(self, key, fallback=""):
         """
@@ -163,22 +361,14 @@ class OutputStyleManager:
         Returns:
             str: The box drawing character
         """
-        if not self.style_settings.get("use_boxes", True):
-            # If fancy boxes are disabled, use ASCII
-            return self.style_settings.get("box_styles", {}).get("ascii", {}).get(key, fallback)
-            
-        return self._get_box_style().get(key, fallback)
+        return self._render_theme.box.get(key, fallback)
         
     def get_terminal_width(self):
         """Get the terminal width to use for formatting."""
         width = self.style_settings.get("terminal_width", "auto")
         if width == "auto" or not isinstance(width, int):
-            # If not set or invalid, get from terminal or use default
-            try:
-                columns, _ = shutil.get_terminal_size()
-                return columns
-            except Exception:
-                return 80
+            # If not set or invalid, use the cached terminal size (refreshed on SIGWINCH)
+            return _TerminalSize.columns()
         return width
         
     def set_theme(self, theme_name):
@@ -193,8 +383,21 @@ class OutputStyleManager:
         """
         if theme_name in self.style_settings.get("themes", {}):
             self.theme = self.style_settings["themes"][theme_name]
+            self.theme_name = theme_name
+            self._build_render_theme()
             return True
         return False
+    
+    def _borders(self, width):
+        """Get the untitled top and the bottom border for a box width (cached)."""
+        borders = self._border_cache.get(width)
+        if borders is None:
+            box = self._render_theme.box
+            h = box.get("horizontal", "-")
+            top = box.get("top_left", "+") + h * width + box.get("top_right", "+")
+            bottom = box.get("bottom_left", "+") + h * width + box.get("bottom_right", "+")
+            borders = self._border_cache[width] = (top, bottom)
+        return borders
         
     def format_box(self, content, title=None, width=None):
         """
@@ -214,40 +417,35 @@ class OutputStyleManager:
             title = self._process_rtl_text(title)
             
         # Skip box formatting if boxes are disabled
-        if not self.style_settings.get("use_boxes", True):
+        if not self._render_theme.use_boxes:
             if title:
-                return f"{title}\n{'-' * len(title)}\n{content}"
+                return f"{title}\n{'-' * display_width(title)}\n{content}"
             return content
             
-        # Get box characters
-        tl = self.get_box_char("top_left", "+")
-        tr = self.get_box_char("top_right", "+")
-        bl = self.get_box_char("bottom_left", "+")
-        br = self.get_box_char("bottom_right", "+")
-        h = self.get_box_char("horizontal", "-")
-        v = self.get_box_char("vertical", "|")
+        box = self._render_theme.box
+        v = box.get("vertical", "|")
         
         # Determine width
         term_width = width or (self.get_terminal_width() - 4)
+        inner_width = term_width - 2
         lines = content.split('\n')
         
         # Create the box
+        top, bottom = self._borders(term_width)
         if title:
+            h = box.get("horizontal", "-")
             title_str = f" {title} "
-            top = f"{tl}{h}{title_str}" + h * (term_width - len(title_str) - 2) + f"{tr}"
-        else:
-            top = f"{tl}" + h * term_width + f"{tr}"
-            
-        bottom = f"{bl}" + h * term_width + f"{br}"
+            top = (box.get("top_left", "+") + h + title_str
+                   + h * (term_width - display_width(title_str) - 1) + box.get("top_right", "+"))
         
-        # Format the content
+        # Format the content, padding by display width so Arabic and emoji line up
         formatted_lines = []
-        for line in lines:
-            # Handle long lines by truncating or wrapping
-            if len(line) > term_width - 2:
-                # Simple truncation for now - could be enhanced with actual wrapping
-                line = line[:term_width-5] + "..."
-            formatted_lines.append(f"{v} {line:<{term_width-2}} {v}")
+        for line, line_width in zip(lines, display_widths(lines)):
+            # Handle long lines by truncating
+            if line_width > inner_width:
+                line = truncate_to_width(line, inner_width)
+                line_width = display_width(line)
+            formatted_lines.append(f"{v} {line}{' ' * (inner_width - line_width)} {v}")
                 
         # Combine everything
         return top + "\n" + "\n".join(formatted_lines) + "\n" + bottom
@@ -270,7 +468,7 @@ class OutputStyleManager:
         if emoji_key:
             emoji = self.get_emoji(emoji_key) + " "
             
-        return f"{emoji}{text}\n{'-' * (len(text) + (1 if emoji else 0))}\n"
+        return f"{emoji}{text}\n{'-' * (display_width(text) + (1 if emoji else 0))}\n"
         
     def format_status_line(self, label, status_key=None, message=None):
         """
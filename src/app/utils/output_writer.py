@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Buffered output writer for Labeeb
+
+Moves terminal I/O off the caller's thread. Output records are put on a bounded
+queue and a background thread drains them in batches, writing each batch to the
+sink with a single write/flush. Sinks decide the wire format: plain text for a
+terminal, or JSON lines for pipes, log collectors and other non-TTY consumers.
+"""
+
+import sys
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OutputRecord:
+    """A single unit of output queued for writing."""
+    text: str
+    kind: str = "text"
+    timestamp: float = field(default_factory=time.time)
+
+
+class TextSink:
+    """Writes records as plain lines to a text stream (default: stdout)."""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            stream: Target stream; resolved to ``sys.stdout`` at write time if None
+        """
+        self._stream = stream
+
+    @property
+    def stream(self) -> TextIO:
+        return self._stream if self._stream is not None else sys.stdout
+
+    def write_batch(self, records: List[OutputRecord]) -> None:
+        """Write a batch of records with a single write call."""
+        self.stream.write("".join(record.text + "\n" for record in records))
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class JsonLinesSink(TextSink):
+    """Writes one JSON object per record, for non-TTY consumers."""
+
+    def write_batch(self, records: List[OutputRecord]) -> None:
+        """Write a batch of records as JSON lines."""
+        self.stream.write("".join(
+            json.dumps(
+                {"ts": record.timestamp, "kind": record.kind, "text": record.text},
+                ensure_ascii=False
+            ) + "\n"
+            for record in records
+        ))
+
+
+class OutputWriter:
+    """
+    Background writer that batches output records into a sink.
+
+    ``write`` only enqueues, so callers never wait on terminal I/O unless the
+    queue is full, in which case they block until the writer catches up
+    (back-pressure instead of unbounded memory growth).
+    """
+
+    _STOP = object()
+
+    def __init__(self, sink: Optional[TextSink] = None,
+                 max_queue: int = 10000, batch_size: int = 256) -> None:
+        """
+        Initialize and start the writer thread.
+
+        Args:
+            sink: Where batches are written (defaults to a stdout TextSink)
+            max_queue: Maximum number of pending records
+            batch_size: Maximum number of records written per batch
+        """
+        self.sink = sink or TextSink()
+        self.batch_size = max(1, batch_size)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="labeeb-output-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, text: str, kind: str = "text") -> None:
+        """
+        Queue text for output.
+
+        Args:
+            text: The text to write (a trailing newline is added by the sink)
+            kind: Record type, e.g. ``info``/``error``/``command``; used by structured sinks
+        """
+        if self._closed:
+            self.sink.write_batch([OutputRecord(text, kind)])
+            self.sink.flush()
+            return
+        self._queue.put(OutputRecord(text, kind))
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if not self._closed:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending output and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be written."""
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        """Drain the queue in batches until stopped."""
+        while True:
+            item = self._queue.get()
+            batch = []
+            stop = item is self._STOP
+            if not stop:
+                batch.append(item)
+            # Grab whatever else is already queued, up to batch_size
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self.sink.write_batch(batch)
+                    self.sink.flush()
+            except Exception as e:
+                logger.error(f"Output writer failed to write {len(batch)} records: {e}")
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+            if stop:
+                return
+
+
+__all__ = ["OutputRecord", "TextSink", "JsonLinesSink", "OutputWriter"]
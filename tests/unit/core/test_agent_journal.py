@@ -0,0 +1,69 @@
+import asyncio
+import json
+import time
+from src.app.core.ai.agent_journal import INDEX_STRIDE, AgentJournal
+from src.app.core.ai.smol_agent import SmolAgent
+
+class EchoTool:
+    name = 'echo'
+    description = 'Returns its parameters'
+
+    async def execute(self, **kwargs):
+        return kwargs
+
+def test_journal_pages_old_entries_from_disk(tmp_path):
+    """Test that only the tail stays in memory and any slice is readable."""
+    journal = AgentJournal(str(tmp_path / 'h.jsonl'), max_memory=10, flush_interval=60)
+    journal.extend({'n': i} for i in range(3 * INDEX_STRIDE + 5))
+    assert len(journal) == 3 * INDEX_STRIDE + 5 and len(journal._recent) == 10
+    assert journal[3]['n'] == 3 and journal[-1]['n'] == 3 * INDEX_STRIDE + 4
+    assert [e['n'] for e in journal[INDEX_STRIDE - 2:INDEX_STRIDE + 2]] == list(range(INDEX_STRIDE - 2, INDEX_STRIDE + 2))
+    assert [e['n'] for e in journal.page(0, 3)] == [3 * INDEX_STRIDE + 4, 3 * INDEX_STRIDE + 3, 3 * INDEX_STRIDE + 2]
+    assert [e['n'] for e in journal] == list(range(3 * INDEX_STRIDE + 5))
+    journal.close()
+
+def test_journal_flushes_in_background_and_recovers_torn_writes(tmp_path):
+    """Test timer-driven batch flushes and reopening after a partial last line."""
+    path = tmp_path / 'h.jsonl'
+    snapshots = []
+
+    def snapshot():
+        snapshots.append(1)
+        return {'v': len(snapshots)}
+
+    journal = AgentJournal(str(path), str(tmp_path / 's.json'), snapshot, flush_interval=0.05)
+    for i in range(5):
+        journal.append({'n': i})
+    journal.mark_dirty()
+    time.sleep(0.3)
+    assert len(path.read_text().splitlines()) == 5 and snapshots == [1]
+    assert json.loads((tmp_path / 's.json').read_text()) == {'v': 1}
+    with open(path, 'a') as f:
+        f.write('{"n": 5')
+    reopened = AgentJournal(str(path), max_memory=2)
+    assert len(reopened) == 5 and reopened[0] == {'n': 0} and reopened[-1] == {'n': 4}
+    assert path.read_text().endswith('}\n')
+
+def test_smol_agent_persists_history_without_rewriting_it(tmp_path):
+    """Test that tool calls are journaled, reloaded, and a legacy state file is migrated."""
+    agent = SmolAgent('worker', str(tmp_path), history_limit=5, flush_interval=60)
+    agent.register_tool(EchoTool())
+
+    async def run():
+        for i in range(20):
+            await agent.execute_tool('echo', i=i)
+
+    asyncio.run(run())
+    agent.flush_state()
+    state = json.loads((tmp_path / 'worker.json').read_text())
+    assert 'history' not in state and state['tools'] == ['echo']
+    reloaded = SmolAgent('worker', str(tmp_path))
+    assert len(reloaded.state.history) == 20 and reloaded.state.history[0]['params'] == {'i': 0}
+    assert [e['params']['i'] for e in reloaded.get_history(0, 3)] == [19, 18, 17]
+    (tmp_path / 'legacy.json').write_text(json.dumps({
+        'name': 'legacy', 'created_at': 'a', 'updated_at': 'b', 'tools': [], 'context': {'k': 1},
+        'history': [{'tool': 'echo'}]}, indent=2))
+    legacy = SmolAgent('legacy', str(tmp_path))
+    assert list(legacy.state.history) == [{'tool': 'echo'}] and legacy.state.context == {'k': 1}
+    assert 'history' not in json.loads((tmp_path / 'legacy.json').read_text())
+    assert legacy.get_state()['history'] == [{'tool': 'echo'}]
@@ -0,0 +1,56 @@
+import numpy as np
+from src.app.core.ai.models.audio.streaming import (
+    SAMPLE_RATE, PCMDecoder, VoiceActivitySegmenter, merge_overlap
+)
+
+def tone(seconds, amplitude=0.3):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+def silence(seconds):
+    return np.full(int(seconds * SAMPLE_RATE), 0.001, dtype=np.float32)
+
+def feed_in_chunks(segmenter, samples, chunk_seconds=0.1):
+    step = int(chunk_seconds * SAMPLE_RATE)
+    windows = []
+    for start in range(0, len(samples), step):
+        windows.extend(segmenter.feed(samples[start:start + step]))
+    return windows + segmenter.flush()
+
+def test_pcm_decoder_handles_odd_splits():
+    """Test that a sample split across chunks is reassembled."""
+    pcm = np.array([0, 16384, -16384], dtype="<i2").tobytes()
+    decoder = PCMDecoder()
+    samples = np.concatenate([decoder.decode(pcm[:3]), decoder.decode(pcm[3:])])
+    assert np.allclose(samples, [0.0, 0.5, -0.5])
+
+def test_segments_split_at_pauses():
+    """Test that speech separated by silence becomes separate windows."""
+    audio = np.concatenate([silence(1.0), tone(1.0), silence(1.0), tone(0.5), silence(0.2)])
+    windows = feed_in_chunks(VoiceActivitySegmenter(), audio)
+    assert len(windows) == 2
+    assert 0.7 < windows[0].start < 1.0
+    assert 2.7 < windows[1].start < 3.0
+    assert all(w.overlap == 0 for w in windows)
+
+def test_long_speech_is_cut_with_overlap():
+    """Test forced cuts at max_window with overlap carried into the next window."""
+    windows = feed_in_chunks(VoiceActivitySegmenter(max_window=2.0, overlap=0.5), tone(5.0))
+    assert len(windows) == 3
+    assert all(len(w.samples) <= 2.0 * SAMPLE_RATE for w in windows)
+    assert abs(windows[1].start - (windows[0].end - 0.5)) < 0.05
+    assert windows[1].overlap > 0
+
+def test_silence_uses_bounded_memory():
+    """Test that a long silent stream neither emits windows nor accumulates frames."""
+    segmenter = VoiceActivitySegmenter()
+    for _ in range(100):
+        assert segmenter.feed(silence(1.0)) == []
+    assert len(segmenter._frames) <= segmenter.pre_roll_frames
+    assert segmenter.flush() == []
+
+def test_merge_overlap():
+    """Test removal of words repeated across overlapping windows."""
+    assert merge_overlap("we will meet on", "meet on Monday morning") == "Monday morning"
+    assert merge_overlap("hello there.", "Hello there, friend") == "friend"
+    assert merge_overlap("nothing shared", "new words") == "new words"
@@ -0,0 +1,95 @@
+import io
+import json
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+from src.app.core.batch_runner import BatchRunner, read_commands
+
+@dataclass
+class Step:
+    action: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class Plan:
+    steps: List[Step]
+    required_tools: List[str] = field(default_factory=list)
+
+class FakeAgent:
+    """Plans 'type ...' commands onto keyboard_input and everything else onto echo."""
+
+    def __init__(self):
+        self.planned = []
+        self.serial_order = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    async def plan(self, command):
+        self.planned.append(command)
+        tool = "keyboard_input" if command.startswith("type") else "echo"
+        return Plan(steps=[Step(action=tool, params={"text": command})], required_tools=[tool])
+
+    async def execute(self, plan):
+        step = plan.steps[0]
+        if step.params["text"] == "fail":
+            raise ValueError("boom")
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        if step.action == "keyboard_input":
+            self.serial_order.append(step.params["text"])
+        return step.params["text"].upper()
+
+def run_batch(commands, **kwargs):
+    agent = FakeAgent()
+    runner = BatchRunner(agent, **kwargs)
+    out = io.StringIO()
+    try:
+        summary = runner.run(commands, out)
+    finally:
+        runner.close()
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    return agent, runner, summary, records
+
+def test_read_commands_skips_blanks_and_comments():
+    """Test command file parsing."""
+    assert list(read_commands(["# header\n", "\n", " ls \n", "date\n"])) == ["ls", "date"]
+
+def test_results_and_summary():
+    """Test that every command yields one JSON line and failures are counted."""
+    agent, runner, summary, records = run_batch(["a", "fail", "b"])
+    assert sorted(r["index"] for r in records) == [0, 1, 2]
+    by_command = {r["command"]: r for r in records}
+    assert by_command["a"] == {**by_command["a"], "ok": True, "result": "A"}
+    assert by_command["fail"]["ok"] is False and by_command["fail"]["error"] == "boom"
+    assert (summary.total, summary.succeeded, summary.failed) == (3, 2, 1)
+    assert summary.commands_per_second > 0
+
+def test_independent_commands_run_concurrently():
+    """Test that non-UI commands overlap on the pool."""
+    agent, _, summary, _ = run_batch([f"cmd {i}" for i in range(8)], max_workers=4)
+    assert agent.max_active > 1
+    assert summary.succeeded == 8
+
+def test_ui_commands_stay_ordered():
+    """Test that commands using serial tools run one at a time in file order."""
+    commands = [f"type {i}" for i in range(6)]
+    agent, _, _, _ = run_batch(commands, max_workers=4)
+    assert agent.serial_order == commands
+    assert agent.max_active == 1
+    runner = BatchRunner(agent)
+    assert runner.is_serial(Plan(steps=[Step(action="file")]))
+    assert runner.is_serial(Plan(steps=[Step(action="mouse")], required_tools=["mouse"]))
+    runner.close()
+
+def test_plans_are_cached():
+    """Test that repeated commands are planned once, but commands differing in case are not merged."""
+    agent, runner, summary, _ = run_batch(["cmd", "CMD", " cmd ", "type  Hello"])
+    assert agent.planned == ["cmd", "CMD", "type  Hello"]
+    assert runner.plan_cache_hits == 1
+    assert summary.total == 4
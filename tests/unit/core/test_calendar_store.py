@@ -0,0 +1,121 @@
+import time
+from datetime import datetime, timedelta
+from src.app.core.calendar_store import CalendarStore
+
+BASE = datetime(2024, 1, 1, 9, 0)
+
+def make_event(event_id, day, hours=1, **fields):
+    start = BASE + timedelta(days=day)
+    return {
+        'id': event_id,
+        'title': fields.pop('title', f'Event {event_id}'),
+        'description': fields.pop('description', ''),
+        'start_time': start.isoformat(),
+        'end_time': (start + timedelta(hours=hours)).isoformat(),
+        'location': fields.pop('location', ''),
+        **fields
+    }
+
+def iso(day, hour=9):
+    return (BASE + timedelta(days=day, hours=hour - 9)).isoformat()
+
+def test_range_query_returns_overlapping_events_in_order():
+    """Test that only events overlapping the window are returned, sorted by start."""
+    store = CalendarStore()
+    store.add(make_event('b', 3))
+    store.add(make_event('a', 1))
+    store.add(make_event('c', 10))
+    store.add(make_event('long', 0, hours=24 * 30))
+    ids = [e['id'] for e in store.search(start_time=iso(1), end_time=iso(5))]
+    assert ids == ['long', 'a', 'b']
+    # An event that ended exactly at the window start still overlaps
+    assert [e['id'] for e in store.search(start_time=iso(3, 10), end_time=iso(4))] == ['long', 'b']
+
+def test_recurrence_is_expanded_lazily_within_window():
+    """Test that weekly instances are produced only for the queried window."""
+    store = CalendarStore()
+    store.add(make_event('standup', 0, recurrence={'count': 52}))
+    assert len(store) == 1
+    instances = store.search(start_time=iso(14), end_time=iso(28))
+    assert [e['id'] for e in instances] == ['standup_recur_2', 'standup_recur_3', 'standup_recur_4']
+    assert instances[0]['start_time'] == iso(14)
+    assert instances[0]['recurrence_of'] == 'standup'
+    assert store.get('standup_recur_51')['start_time'] == iso(7 * 51)
+    assert store.get('standup_recur_52') is None
+    daily = CalendarStore()
+    daily.add(make_event('gym', 0, recurrence={'frequency': 'daily', 'until': iso(4)}))
+    assert len(daily.search(start_time=iso(0))) == 5
+
+def test_text_index_matches_word_prefixes():
+    """Test title/description and location search through the inverted index."""
+    store = CalendarStore()
+    store.add(make_event('1', 0, title='Team meeting', location='Room 4'))
+    store.add(make_event('2', 1, title='Lunch', description='with the team', location='Cafe'))
+    store.add(make_event('3', 2, title='اجتماع الفريق', location='Room 5'))
+    assert [e['id'] for e in store.search(query='team')] == ['1', '2']
+    assert [e['id'] for e in store.search(query='meet')] == ['1']
+    assert [e['id'] for e in store.search(query='الفريق')] == ['3']
+    assert [e['id'] for e in store.search(location='room')] == ['1', '3']
+    assert [e['id'] for e in store.search(query='team', location='cafe')] == ['2']
+    store.update('2', {'title': 'Dinner', 'description': ''})
+    assert [e['id'] for e in store.search(query='team')] == ['1']
+    store.remove('1')
+    assert store.search(query='team') == []
+
+def test_sqlite_round_trip(tmp_path):
+    """Test that events persist across store instances."""
+    db = str(tmp_path / 'calendar.db')
+    store = CalendarStore(db)
+    store.add(make_event('a', 1, title='Review'))
+    store.add(make_event('r', 0, recurrence={'count': 4}))
+    store.add(make_event('gone', 2))
+    store.remove('gone')
+    store.close()
+
+    reopened = CalendarStore(db)
+    assert len(reopened) == 2
+    assert reopened.get('a')['title'] == 'Review'
+    assert [e['id'] for e in reopened.search(start_time=iso(6), end_time=iso(8))] == ['r_recur_1']
+    reopened.close()
+
+def test_range_query_over_100k_events_is_fast():
+    """Test that a narrow range query does not scan all events."""
+    store = CalendarStore()
+    for i in range(100_000):
+        store.add(make_event(str(i), i / 24, hours=0.5))
+    started = time.perf_counter()
+    for _ in range(100):
+        events = store.search(start_time=iso(1000), end_time=iso(1000, 14))
+    elapsed = (time.perf_counter() - started) / 100
+    assert len(events) == 6
+    assert elapsed < 0.005
+
+def test_single_occurrences_cannot_be_modified():
+    """Test that updating or removing one recurrence instance is rejected with a clear error."""
+    store = CalendarStore()
+    store.add(make_event('standup', 0, recurrence={'count': 10}))
+    for change in (lambda: store.update('standup_recur_3', {'title': 'Moved'}),
+                   lambda: store.remove('standup_recur_3')):
+        try:
+            change()
+        except ValueError as e:
+            assert 'single occurrence' in str(e) and "'standup'" in str(e)
+        else:
+            raise AssertionError('instance was modified')
+    assert store.update('standup_recur_99', {'title': 'x'}) is None and store.remove('missing') is None
+    assert store.get('standup')['title'] == 'Event standup' and len(store) == 1
+
+def test_range_query_over_100k_series_is_fast():
+    """Test that recurring series are found through their span bounds, not a scan of every series."""
+    store = CalendarStore()
+    for i in range(100_000):
+        store.add(make_event(f's{i}', i / 10, recurrence={'frequency': 'daily', 'count': 10}))
+    store.add(make_event('long', 0, hours=24 * 20000))
+    started = time.perf_counter()
+    for _ in range(20):
+        events = store.search(start_time=iso(5000), end_time=iso(5000, 10))
+    elapsed = (time.perf_counter() - started) / 20
+    assert len(events) == 11 and events[0]['id'] == 'long'
+    assert elapsed < 0.003
+    store.remove('s50000')
+    assert len(store.search(start_time=iso(5000), end_time=iso(5000, 10))) == 10
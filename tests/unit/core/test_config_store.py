@@ -0,0 +1,118 @@
+import errno
+import json
+import os
+import time
+from src.app.core import config_store
+from src.app.core.config_manager import ConfigManager
+from src.app.core.config_store import ConfigFile, ConfigService
+
+def test_snapshot_is_immutable_and_served_from_memory(tmp_path):
+    """Test that a file is parsed once into a read-only snapshot."""
+    path = tmp_path / 'settings.json'
+    path.write_text(json.dumps({'model': 'gemma', 'languages': ['en', 'ar'], 'ui': {'rtl': True}}))
+    config = ConfigFile(str(path))
+    os.remove(path)
+    assert config.get('model') == 'gemma'
+    snapshot = config.snapshot
+    assert snapshot['languages'] == ('en', 'ar')
+    try:
+        snapshot['ui']['rtl'] = False
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('snapshot was mutated')
+    assert snapshot.to_dict() == {'model': 'gemma', 'languages': ['en', 'ar'], 'ui': {'rtl': True}}
+
+def test_writes_are_debounced_and_atomic(tmp_path):
+    """Test that several updates produce one atomic write with the final state."""
+    path = tmp_path / 'app.yaml'
+    config = ConfigFile(str(path), debounce=0.05)
+    seen = []
+    config.subscribe(lambda snapshot: seen.append(snapshot.version))
+    for i in range(10):
+        config.update({'count': i})
+    config.update(remove=['missing'])
+    assert not path.exists()
+    assert seen == list(range(1, 12))
+    time.sleep(0.2)
+    assert ConfigFile(str(path)).snapshot.to_dict() == {'count': 9}
+    assert [p.name for p in tmp_path.iterdir()] == ['app.yaml']
+
+def test_external_changes_invalidate_and_notify(tmp_path):
+    """Test that an mtime change reloads the snapshot and notifies subscribers."""
+    path = tmp_path / 'settings.json'
+    path.write_text('{"a": 1}')
+    service = ConfigService(watch=False)
+    config = service.open(str(path))
+    assert service.open(str(path)) is config
+    received = []
+    config.subscribe(received.append)
+    assert service.check() == []
+    path.write_text('{"a": 2, "b": 3}')
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert service.check() == [str(path)]
+    assert config.get('a') == 2 and received[-1]['b'] == 3
+    path.write_text('{broken')
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 2 * 10**9))
+    assert service.check() == []
+    assert config.get('a') == 2
+
+def test_config_manager_shares_snapshot(tmp_path):
+    """Test that ConfigManager instances see each other's saves without re-reading."""
+    path = str(tmp_path / 'labeeb_config.json')
+    first, second = ConfigManager(path), ConfigManager(path)
+    first.set('output_verbosity', 'quiet')
+    first.save()
+    assert second.get('output_verbosity') == 'quiet'
+    first._file.flush()
+    with open(path) as f:
+        assert json.load(f)['output_verbosity'] == 'quiet'
+
+def test_config_manager_keeps_unsaved_values(tmp_path):
+    """Test that another instance's save does not drop values set but not yet saved."""
+    path = str(tmp_path / 'labeeb_config.json')
+    first, second = ConfigManager(path), ConfigManager(path)
+    first.set('default_ollama_model', 'llama3')
+    second.set('output_verbosity', 'quiet')
+    second.save()
+    assert first.get('default_ollama_model') == 'llama3'
+    assert first.get('output_verbosity') == 'quiet'
+    first.save()
+    assert second.get('default_ollama_model') == 'llama3'
+
+def test_unserializable_values_fail_in_the_caller(tmp_path):
+    """Test that update() rejects values that cannot be written, leaving the config unchanged."""
+    config = ConfigFile(str(tmp_path / 'settings.json'), debounce=0.05)
+    config.update({'a': 1})
+    try:
+        config.update({'bad': object()})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('unserializable value was accepted')
+    assert config.snapshot.to_dict() == {'a': 1}
+    config.flush()
+    assert json.loads((tmp_path / 'settings.json').read_text()) == {'a': 1}
+
+def test_failed_writes_retry_and_merge_external_edits(tmp_path, monkeypatch):
+    """Test that a failed background write is retried and does not hide or overwrite external edits."""
+    path = tmp_path / 'settings.json'
+    path.write_text('{"a": 1, "b": 1}')
+    config = ConfigFile(str(path), debounce=0.02)
+    real_mkstemp = config_store.tempfile.mkstemp
+
+    def full_disk(*args, **kwargs):
+        raise OSError(errno.ENOSPC, 'No space left on device')
+
+    monkeypatch.setattr(config_store.tempfile, 'mkstemp', full_disk)
+    config.update({'a': 2})
+    time.sleep(0.1)
+    assert isinstance(config.write_error, OSError) and config.get('a') == 2
+    path.write_text('{"a": 1, "b": 5, "c": 7}')
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert config.reload_if_changed()
+    assert config.snapshot.to_dict() == {'a': 2, 'b': 5, 'c': 7}
+    monkeypatch.setattr(config_store.tempfile, 'mkstemp', real_mkstemp)
+    time.sleep(0.5)
+    assert config.write_error is None
+    assert json.loads(path.read_text()) == {'a': 2, 'b': 5, 'c': 7}
@@ -0,0 +1,67 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from src.app.core.crypto_batch import (
+    CryptoPool, benchmark, digest, file_digest, hash_item, hash_password, hmac_digest,
+    migrate_credential, needs_rehash, verify_password
+)
+
+FAST = {'iterations': 1000}
+
+def test_incremental_digests_match_one_shot(tmp_path):
+    """Test that chunked hashing of buffers and files equals hashing in one call."""
+    payload = os.urandom(3 * 1024 + 17)
+    assert digest(payload, 'sha256', b'salt') == hashlib.sha256(b'salt' + payload).hexdigest()
+    assert hmac_digest('key', payload, 'sha512') == hmac.new(b'key', payload, 'sha512').hexdigest()
+    path = tmp_path / 'blob.bin'
+    path.write_bytes(payload)
+    assert file_digest(str(path), 'blake2b', chunk_size=1000) == hashlib.blake2b(payload).hexdigest()
+    assert hash_item({'path': str(path)}, 'sha1', key=b'k') == hmac.new(b'k', payload, 'sha1').hexdigest()
+    assert hash_item('text') == hashlib.sha256(b'text').hexdigest()
+
+def test_password_hashing_and_rehash_detection():
+    """Test KDF encoding, verification and cost upgrades."""
+    encoded = hash_password('secret', 'pbkdf2_sha256', FAST)
+    assert encoded.startswith('pbkdf2_sha256$1000$')
+    assert verify_password('secret', encoded) and not verify_password('wrong', encoded)
+    assert needs_rehash(encoded, 'pbkdf2_sha256', {'iterations': 2000})
+    assert not needs_rehash(encoded, 'pbkdf2_sha256', FAST)
+    scrypt_hash = hash_password('secret', 'scrypt', {'n': 1024, 'r': 8, 'p': 1})
+    assert verify_password('secret', scrypt_hash)
+    assert needs_rehash(scrypt_hash, 'pbkdf2_sha256', FAST)
+
+def test_migrate_legacy_salted_digest():
+    """Test that a legacy salted digest is verified and upgraded to a KDF hash."""
+    salt = b'0123456789abcdef'
+    legacy = {'algorithm': 'sha256', 'salt': base64.b64encode(salt).decode(),
+              'hash': hashlib.sha256(salt + b'secret').hexdigest()}
+    migrated = migrate_credential('secret', legacy, 'pbkdf2_sha256', FAST)
+    assert migrated['valid'] and migrated['rehashed']
+    assert verify_password('secret', migrated['hash'])
+    assert migrate_credential('wrong', legacy, 'pbkdf2_sha256', FAST) == {'valid': False, 'rehashed': False,
+                                                                         'hash': legacy['hash']}
+
+def test_pool_batches_keep_order_and_isolate_errors():
+    """Test thread and process batches, including a failing item."""
+    async def run():
+        pool = CryptoPool(max_workers=2)
+        try:
+            digests = await pool.map(hash_item, [((f'item {i}',), {}) for i in range(50)] + [(({'path': '/missing'},), {})])
+            hashes = await pool.map(hash_password, [((f'pw{i}', 'pbkdf2_sha256', FAST), {}) for i in range(6)],
+                                    processes=True)
+            return digests, hashes
+        finally:
+            pool.shutdown()
+
+    digests, hashes = asyncio.run(run())
+    assert [value for _, value in digests[:50]] == [hashlib.sha256(f'item {i}'.encode()).hexdigest() for i in range(50)]
+    assert digests[50][0] is False and 'FileNotFoundError' in digests[50][1]
+    assert all(ok and verify_password(f'pw{i}', value) for i, (ok, value) in enumerate(hashes))
+
+def test_benchmark_reports_throughput():
+    """Test that the benchmark reports a rate per algorithm and KDF."""
+    results = benchmark(['sha256', 'blake2b'], size=1 << 16, kdfs={'pbkdf2_sha256': FAST}, min_time=0.01)
+    assert set(results['digest']) == {'sha256', 'blake2b'} and all(rate > 0 for rate in results['digest'].values())
+    assert results['kdf']['pbkdf2_sha256']['hashes_per_second'] > 0
@@ -0,0 +1,72 @@
+import asyncio
+import os
+from src.app.core.duplicate_finder import HashCache, find_duplicates, partial_digest, shared_cache
+
+def _tree(root):
+    big = os.urandom(300 * 1024)
+    for name, data in (('a/one.bin', big), ('b/two.bin', big), ('c/three.bin', big),
+                       ('a/same_ends.bin', big[:150000] + b'x' + big[150001:]), ('b/small.txt', b'hello'),
+                       ('c/small.txt', b'hello'), ('c/other.txt', b'world'), ('empty1', b''), ('empty2', b'')):
+        os.makedirs(root / os.path.dirname(name), exist_ok=True)
+        (root / name).write_bytes(data)
+    os.link(root / 'a' / 'one.bin', root / 'a' / 'link.bin')
+
+def test_staged_detection_groups_identical_content(tmp_path):
+    """Test that only true duplicates are grouped and each stage narrows the candidates."""
+    _tree(tmp_path)
+    report = asyncio.run(find_duplicates(str(tmp_path), max_workers=2))
+    groups = [[os.path.relpath(p, tmp_path) for p in group.paths] for group in report.groups]
+    # link.bin and one.bin are one file (the first name walked is kept); same_ends.bin differs mid-file
+    assert groups == [['a/link.bin', 'b/two.bin', 'c/three.bin'], ['b/small.txt', 'c/small.txt']]
+    assert report.files_scanned == 8 and report.partial_hashed == 7 and report.full_hashed == 4
+    assert report.wasted_bytes == 2 * 300 * 1024 + 5
+    with_empty = asyncio.run(find_duplicates(str(tmp_path), min_size=0))
+    assert len(with_empty.groups) == 3
+
+def test_partial_digest_covers_both_ends(tmp_path):
+    """Test that a change in the first or last block changes the partial hash."""
+    data = bytearray(os.urandom(200 * 1024))
+    path = tmp_path / 'f'
+    path.write_bytes(data)
+    base = partial_digest(str(path), len(data))
+    data[-1] ^= 1
+    path.write_bytes(data)
+    assert partial_digest(str(path), len(data)) != base
+    data[-1] ^= 1
+    data[100 * 1024] ^= 1
+    path.write_bytes(data)
+    assert partial_digest(str(path), len(data)) == base
+
+def test_cache_makes_reruns_hash_only_changed_files(tmp_path):
+    """Test that a rerun is served from the cache and a modified file is rehashed."""
+    root = tmp_path / 'tree'
+    _tree(root)
+    cache = HashCache(str(tmp_path / 'hashes.db'))
+    first = asyncio.run(find_duplicates(str(root), cache=cache))
+    cache.close()
+    cache = HashCache(str(tmp_path / 'hashes.db'))
+    second = asyncio.run(find_duplicates(str(root), cache=cache))
+    assert second.partial_hashed == second.full_hashed == 0 and second.cache_hits == 7
+    assert [g.paths for g in second.groups] == [g.paths for g in first.groups]
+    (root / 'c' / 'small.txt').write_bytes(b'HELLO')
+    third = asyncio.run(find_duplicates(str(root), cache=cache))
+    assert third.partial_hashed == 1 and third.full_hashed == 0
+    assert len(third.groups) == 1
+    asyncio.run(find_duplicates(str(root), cache=cache, algorithm='sha256'))
+    assert cache.count() == 7
+
+def test_shared_cache_is_reused_and_pruned(tmp_path):
+    """Test that callers share one cache per database and deleted files are pruned."""
+    root = tmp_path / 'tree'
+    _tree(root)
+    db_path = str(tmp_path / 'cache' / 'hashes.db')
+    cache = shared_cache(db_path)
+    assert shared_cache(db_path) is cache
+    asyncio.run(find_duplicates(str(root), cache=cache))
+    assert cache.count() == 7
+    os.remove(root / 'c' / 'three.bin')
+    assert cache.prune([str(root / 'a')]) == 0
+    asyncio.run(find_duplicates(str(root / 'a'), cache=cache))
+    assert cache.count() == 7
+    asyncio.run(find_duplicates(str(root), cache=cache))
+    assert cache.count() == 6 and cache.prune() == 0
@@ -0,0 +1,146 @@
+import asyncio
+import base64
+from src.app.core import email_index
+from src.app.core.email_index import (
+    ImapMailbox, MessageIndex, parse_fetch_response, sequence_set, summarize_structure
+)
+
+class FakeImap:
+    """Local IMAP stand-in answering with aioimaplib-style (result, lines) responses."""
+
+    def __init__(self, uidvalidity=1):
+        self.uidvalidity = uidvalidity
+        self.messages = {}
+        self.fetches = []
+
+    def add(self, uid, subject, text, attachment=None):
+        self.messages[uid] = (subject, text, attachment)
+
+    async def select(self, folder):
+        uidnext = max(self.messages, default=0) + 1
+        return 'OK', [f'{len(self.messages)} EXISTS'.encode(), f'OK [UIDVALIDITY {self.uidvalidity}] UIDs valid'.encode(),
+                      f'OK [UIDNEXT {uidnext}] Predicted next UID'.encode(), b'[READ-WRITE] Select completed.']
+
+    async def uid_search(self, criteria):
+        uids = sorted(self.messages)
+        if criteria.startswith('UID '):
+            low = int(criteria[4:].split(':')[0])
+            uids = [u for u in uids if u >= low] or uids[-1:]
+        return 'OK', [' '.join(map(str, uids)).encode(), b'Search completed (0.001 secs).']
+
+    async def uid(self, command, sequence, *items):
+        self.fetches.append(items[0])
+        wanted = set()
+        for part in sequence.split(','):
+            low, _, high = part.partition(':')
+            wanted.update(range(int(low), int(high or low) + 1))
+        lines = []
+        for uid in sorted(wanted & set(self.messages)):
+            subject, text, attachment = self.messages[uid]
+            if 'BODY.PEEK' in items[0]:
+                data = text.encode()
+                lines += [f'{uid} FETCH (UID {uid} BODY[1] {{{len(data)}}}'.encode(), bytearray(data), b')']
+                continue
+            plain = '("text" "plain" ("charset" "utf-8") NIL NIL "7bit" 5 1 NIL NIL NIL)'
+            if attachment:
+                structure = (f'({plain}("application" "pdf" ("name" "{attachment}") NIL NIL "base64" 400 NIL '
+                             f'("attachment" ("filename" "{attachment}")) NIL) "mixed" NIL NIL NIL)')
+            else:
+                structure = plain
+            envelope = (f'("Mon, 1 Jan 2024 09:00:00 +0000" "{subject}" (("Ann" NIL "ann" "example.com")) NIL NIL '
+                        f'((NIL NIL "bob" "example.com")) NIL NIL NIL "<{uid}@example.com>")')
+            lines.append(f'{uid} FETCH (UID {uid} FLAGS (\\Seen) RFC822.SIZE 900 ENVELOPE {envelope} '
+                         f'BODYSTRUCTURE {structure})'.encode())
+        return 'OK', lines + [b'UID FETCH completed.']
+
+    async def expunge(self):
+        return 'OK', [b'EXPUNGE completed.']
+
+def test_sequence_set_and_fetch_parsing():
+    """Test UID range compression and parsing of literals in FETCH responses."""
+    assert sequence_set([1, 2, 3, 7, 9, 10]) == '1:3,7,9:10'
+    records = parse_fetch_response([b'1 FETCH (UID 4 BODY[1] {5}', bytearray(b'he)lo'), b')', b'Done'])
+    assert records == [{'UID': 4, 'BODY[1]': b'he)lo'}]
+
+def test_structure_summary_finds_text_part_and_attachment():
+    """Test BODYSTRUCTURE walking for a multipart message."""
+    structure = parse_fetch_response([
+        b'1 FETCH (BODYSTRUCTURE (("text" "plain" ("charset" "utf-8") NIL NIL "quoted-printable" 10 1 NIL NIL NIL)'
+        b'("application" "pdf" NIL NIL NIL "base64" 400 NIL ("attachment" ("filename" "a.pdf")) NIL) "mixed"))',
+        b'Done'
+    ])[0]['BODYSTRUCTURE']
+    summary = summarize_structure(structure)
+    assert summary['text_part'] == ['1', 'quoted-printable', 'utf-8']
+    assert summary['attachments'] == [{'filename': 'a.pdf', 'content_type': 'application/pdf', 'size': 300}]
+
+def test_sync_lists_headers_without_bodies_and_fetches_only_new_uids():
+    """Test incremental header-only sync and lazy, cached body loading."""
+    imap = FakeImap()
+    for uid in range(1, 1201):
+        imap.add(uid, f'Message {uid}', f'body {uid}', attachment='r.pdf' if uid % 2 else None)
+    mailbox = ImapMailbox(imap, MessageIndex(), batch_size=500)
+
+    assert asyncio.run(mailbox.sync('INBOX')) == 1200
+    assert len(imap.fetches) == 3 and all('BODY.PEEK' not in items for items in imap.fetches)
+    latest = mailbox.index.latest('INBOX', 2)
+    assert [m['uid'] for m in latest] == [1199, 1200]
+    assert latest[0]['from'] == 'Ann <ann@example.com>' and latest[0]['to'] == 'bob@example.com'
+    assert latest[0]['attachments'][0]['filename'] == 'r.pdf'
+    assert latest[0]['body'] is None
+
+    imap.add(1201, 'New', 'fresh')
+    assert asyncio.run(mailbox.sync('INBOX')) == 1
+    assert imap.fetches[-1] == '(UID FLAGS RFC822.SIZE ENVELOPE BODYSTRUCTURE)'
+    assert asyncio.run(mailbox.sync('INBOX')) == 0
+
+    assert asyncio.run(mailbox.load_bodies('INBOX', [1200, 1201])) == {1200: 'body 1200', 1201: 'fresh'}
+    fetch_count = len(imap.fetches)
+    asyncio.run(mailbox.load_bodies('INBOX', [1200]))
+    assert len(imap.fetches) == fetch_count
+
+def test_uidvalidity_change_and_expunge_reconcile_index(tmp_path):
+    """Test that a new UIDVALIDITY resets the folder and expunged messages are dropped."""
+    db = str(tmp_path / 'mail.db')
+    imap = FakeImap(uidvalidity=1)
+    for uid in range(1, 6):
+        imap.add(uid, f'M{uid}', base64.b64encode(b'x').decode())
+    mailbox = ImapMailbox(imap, MessageIndex(db))
+    asyncio.run(mailbox.sync('INBOX'))
+    del imap.messages[2]
+    asyncio.run(mailbox.sync('INBOX'))
+    assert [m['uid'] for m in mailbox.index.latest('INBOX', 10)] == [1, 3, 4, 5]
+    mailbox.index.close()
+
+    imap.uidvalidity = 2
+    imap.messages = {1: ('Only', 'one', None)}
+    reopened = ImapMailbox(imap, MessageIndex(db))
+    assert asyncio.run(reopened.sync('INBOX')) == 1
+    assert [m['subject'] for m in reopened.index.latest('INBOX', 10)] == ['Only']
+    reopened.index.close()
+
+def test_fetch_sends_next_batch_before_parsing_and_keeps_one_in_flight(monkeypatch):
+    """Test that each batch is parsed while the next is requested, with one FETCH outstanding at a time."""
+    events, in_flight = [], []
+
+    class SlowImap(FakeImap):
+        async def uid(self, command, sequence, *items):
+            in_flight.append(1)
+            assert len(in_flight) == 1, 'two FETCH commands in flight'
+            events.append(('request', sequence.split(':')[0]))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return await super().uid(command, sequence, *items)
+
+    def parse(lines):
+        events.append(('parse', lines[0].split()[0].decode()))
+        return parse_fetch_response(lines)
+
+    imap = SlowImap()
+    for uid in range(1, 31):
+        imap.add(uid, f'M{uid}', 'x')
+    monkeypatch.setattr(email_index, 'parse_fetch_response', parse)
+    mailbox = ImapMailbox(imap, MessageIndex(), batch_size=10)
+    records = asyncio.run(mailbox.fetch('INBOX', list(range(30, 0, -1)), '(UID)'))
+    assert [record['UID'] for record in records] == list(range(1, 31))
+    assert events == [('request', '1'), ('request', '11'), ('parse', '1'), ('request', '21'),
+                      ('parse', '11'), ('parse', '21')]
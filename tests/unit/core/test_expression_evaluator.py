@@ -0,0 +1,64 @@
+import math
+import numpy as np
+import pytest
+from src.app.core.expression_evaluator import compile_expression, evaluate, evaluate_many
+
+def test_scalar_evaluation_and_cache():
+    """Test scalar results, math.* names, angle modes and compile caching."""
+    assert evaluate("2**10 + math.sqrt(16)") == 1028.0
+    assert evaluate("log(8, 2)") == pytest.approx(3.0)
+    assert evaluate("sin(90)", angle_mode="degrees") == pytest.approx(1.0)
+    assert evaluate("asin(1)", angle_mode="degrees") == pytest.approx(90.0)
+    assert compile_expression("x + 1") is compile_expression("x + 1")
+    assert compile_expression("x + 1").variables == frozenset({"x"})
+
+@pytest.mark.parametrize("expression", [
+    "__import__('os')", "x.y", "math.sqrt", "math.factorial(5)", "(lambda: 1)()", "[1, 2]", "'a' * 3", "sin", "open('f')",
+])
+def test_rejects_unsafe_expressions(expression):
+    """Test that anything outside the arithmetic whitelist is rejected."""
+    with pytest.raises(ValueError):
+        compile_expression(expression)
+
+def test_vectorized_variables():
+    """Test evaluating one expression over arrays of operands."""
+    x = np.linspace(0.1, 10, 100_000)
+    result = evaluate("a * x**2 + sin(x) - log(x)", {"a": 2, "x": x})
+    assert result.shape == x.shape
+    assert result[-1] == pytest.approx(2 * 100 + math.sin(10) - math.log(10))
+    with pytest.raises(NameError):
+        evaluate("x + y", {"x": [1, 2]})
+
+def test_evaluate_many_groups_by_shape():
+    """Test many expressions, including failures, in one call."""
+    expressions = ["1 + 2", "3 + 4.5", "sqrt(16) / 2", "1 / 0", "x + 1", "log10(100) + 1e2", "2 +"]
+    values, errors = evaluate_many(expressions)
+    assert values[:3].tolist() == [3.0, 7.5, 2.0]
+    assert values[5] == pytest.approx(102.0)
+    assert set(errors) == {3, 4, 6}
+    assert np.isnan(values[[3, 4, 6]]).all()
+
+def test_evaluate_many_large_batch():
+    """Test that a large batch of same-shaped expressions evaluates correctly."""
+    expressions = [f"{i} * 2 + {i % 7}" for i in range(50_000)]
+    values, errors = evaluate_many(expressions)
+    assert not errors
+    expected = np.arange(50_000) * 2 + np.arange(50_000) % 7
+    assert np.array_equal(values, expected)
+
+def test_huge_powers_fail_fast():
+    """Test that powers with huge results, nested or not, are bounded instead of computed exactly."""
+    assert evaluate("2**100") == 2 ** 100
+    assert evaluate("1**(10**9)") == 1.0 and evaluate("2**-5000") == 0.0
+    for expression in ("9**(10**9)", "((9**1000)**1000)**1000"):
+        with pytest.raises(OverflowError):
+            evaluate(expression)
+
+def test_pow_and_math_constants():
+    """Test that pow is exact like ** and math.pow works in floats, and math constants resolve."""
+    assert evaluate("pow(3, 41)") == 3 ** 41
+    assert evaluate("math.pow(2, 64)") == 2.0 ** 64
+    with pytest.raises(OverflowError):
+        evaluate("pow(9, 10**9)")
+    assert evaluate("math.pi * 2") == pytest.approx(math.tau)
+    assert evaluate("math.e") == math.e
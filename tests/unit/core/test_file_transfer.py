@@ -0,0 +1,99 @@
+import asyncio
+import errno
+import os
+import shutil
+import pytest
+from src.app.core import file_transfer
+from src.app.core.file_transfer import copy_file, copy_many, map_range, move_file, read_range, write_chunks
+
+def test_ranged_reads_match_slices(tmp_path):
+    """Test small and memory-mapped ranged reads, including unaligned offsets."""
+    payload = os.urandom(3 * file_transfer.MMAP_THRESHOLD + 123)
+    path = tmp_path / 'blob.bin'
+    path.write_bytes(payload)
+    assert read_range(str(path), 10, 20) == payload[10:30]
+    assert read_range(str(path), 5000) == payload[5000:]
+    assert read_range(str(path), len(payload) - 3, 100) == payload[-3:]
+    assert read_range(str(path), len(payload) + 1) == b''
+    with map_range(str(path), 70001, 1 << 20) as view:
+        assert view.nbytes == 1 << 20 and view[:16].tobytes() == payload[70001:70017]
+
+def test_streaming_writes_encode_incrementally(tmp_path):
+    """Test chunked text writes, appends and writes at an offset."""
+    path = str(tmp_path / 'out.txt')
+    text = 'مرحبا بالعالم ' * 100
+    written = write_chunks(path, (text[i:i + 7] for i in range(0, len(text), 7)))
+    assert written == len(text.encode()) and open(path, encoding='utf-8').read() == text
+    write_chunks(path, [b'!', memoryview(b'??')], append=True)
+    write_chunks(path, 'AB', offset=0)
+    data = open(path, 'rb').read()
+    assert data.startswith(b'AB') and data.endswith(b'!??') and len(data) == written + 3
+
+def test_copy_reports_progress_and_falls_back(tmp_path, monkeypatch):
+    """Test that copies are exact with every copy method, even one stopping short, and cross-device moves stay atomic."""
+    payload = os.urandom(5 * 1024 * 1024 + 7)
+    source = tmp_path / 'source.bin'
+    source.write_bytes(payload)
+    os.chmod(source, 0o640)
+    seen = []
+    assert copy_file(str(source), str(tmp_path / 'fast.bin'), lambda done, total: seen.append(done),
+                     chunk_size=1 << 20) == len(payload)
+    assert (tmp_path / 'fast.bin').read_bytes() == payload and seen[-1] == len(payload)
+    assert os.stat(tmp_path / 'fast.bin').st_mode & 0o777 == 0o640
+
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, 'cross-device')
+
+    monkeypatch.setattr(file_transfer, '_KERNEL_METHODS', [unsupported])
+    assert copy_file(str(source), str(tmp_path / 'slow.bin')) == len(payload)
+    assert (tmp_path / 'slow.bin').read_bytes() == payload
+
+    def stops_early(src, dst, offset, count):
+        return 0 if offset >= 1 << 20 else file_transfer._copy_file_range(src, dst, offset, min(count, 4096))
+
+    monkeypatch.setattr(file_transfer, '_KERNEL_METHODS', [stops_early])
+    assert copy_file(str(source), str(tmp_path / 'short.bin')) == len(payload)
+    assert (tmp_path / 'short.bin').read_bytes() == payload
+
+    real_replace = os.replace
+    calls = []
+
+    def replace(src, dst):
+        calls.append(src)
+        if len(calls) == 1:
+            raise OSError(errno.EXDEV, 'cross-device')
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(file_transfer.os, 'replace', replace)
+    assert move_file(str(source), str(tmp_path / 'moved.bin')) == 'copy'
+    assert not source.exists() and (tmp_path / 'moved.bin').read_bytes() == payload
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['fast.bin', 'moved.bin', 'short.bin', 'slow.bin']
+
+def test_copy_many_keeps_order_and_isolates_errors(tmp_path):
+    """Test concurrent copies with a missing source and an existing destination."""
+    pairs = []
+    for i in range(30):
+        (tmp_path / f'{i}.txt').write_text(str(i) * (i + 1))
+        pairs.append((str(tmp_path / f'{i}.txt'), str(tmp_path / 'out' / f'{i}.txt')))
+    pairs.append((str(tmp_path / 'missing.txt'), str(tmp_path / 'out' / 'missing.txt')))
+    pairs.append((str(tmp_path / '0.txt'), str(tmp_path / '1.txt')))
+    progress = []
+    results = asyncio.run(copy_many(pairs, max_workers=4, progress=lambda done, total: progress.append((done, total))))
+    assert [value for _, value in results[:30]] == [len(str(i) * (i + 1)) for i in range(30)]
+    assert results[30][0] is False and 'FileNotFoundError' in results[30][1]
+    assert results[31][0] is False and 'FileExistsError' in results[31][1]
+    assert (tmp_path / 'out' / '29.txt').read_text() == '29' * 30
+    assert progress[-1] == (32, 32)
+
+def test_copy_onto_itself_is_refused(tmp_path):
+    """Test that copying a file onto itself, directly or through a link, raises and leaves it intact."""
+    path = tmp_path / 'a.txt'
+    path.write_text('keep me')
+    os.link(path, tmp_path / 'b.txt')
+    for destination in (path, tmp_path / '.' / 'a.txt', tmp_path / 'b.txt'):
+        with pytest.raises(shutil.SameFileError):
+            copy_file(str(path), str(destination))
+    assert path.read_text() == 'keep me'
+    results = asyncio.run(copy_many([(str(path), str(path))], overwrite=True))
+    assert results[0][0] is False and 'SameFileError' in results[0][1]
+    assert path.read_text() == 'keep me'
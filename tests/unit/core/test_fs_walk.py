@@ -0,0 +1,82 @@
+import asyncio
+import os
+import threading
+import time
+from src.app.core.fs_walk import WalkFilter, decode_cursor, iter_entries, list_page
+
+def _make_tree(root):
+    for name in ('b', 'a/x', 'a/.hidden', 'c/deep/er'):
+        os.makedirs(root / name, exist_ok=True)
+    for name, size in (('top.txt', 1), ('a/one.py', 10), ('a/x/two.py', 200), ('a/.hidden/secret.py', 5),
+                       ('b/three.txt', 3000), ('c/deep/er/four.py', 40), ('.dotfile', 1)):
+        (root / name).write_bytes(b'x' * size)
+
+def _walk(root, spec=None, **options):
+    async def run():
+        return [entry async for entry in iter_entries(str(root), spec, **options)]
+    return asyncio.run(run())
+
+def test_walk_is_depth_first_sorted_and_prunes_hidden(tmp_path):
+    """Test walk order, hidden pruning, max depth and stat data."""
+    _make_tree(tmp_path)
+    paths = [os.path.relpath(entry.path, tmp_path) for entry in _walk(tmp_path, max_workers=3, batch_size=2)]
+    assert paths == ['a', 'a/one.py', 'a/x', 'a/x/two.py', 'b', 'b/three.txt',
+                     'c', 'c/deep', 'c/deep/er', 'c/deep/er/four.py', 'top.txt']
+    top = _walk(tmp_path, WalkFilter(max_depth=0))
+    assert [entry.name for entry in top] == ['a', 'b', 'c', 'top.txt']
+    assert top[0].is_dir and top[0].size is None and top[3].size == 1 and top[3].mtime > 0
+    hidden = _walk(tmp_path, WalkFilter(include_hidden=True, kind='file'))
+    assert {entry.name for entry in hidden} >= {'.dotfile', 'secret.py'}
+
+def test_filters_are_pushed_into_the_walk(tmp_path):
+    """Test glob, substring, type, size and mtime filters."""
+    _make_tree(tmp_path)
+    old = tmp_path / 'a' / 'one.py'
+    os.utime(old, (1000, 1000))
+    names = lambda spec: [entry.name for entry in _walk(tmp_path, spec)]
+    assert names(WalkFilter(pattern='*.py')) == ['one.py', 'two.py', 'four.py']
+    assert names(WalkFilter(contains='e', kind='directory')) == ['deep', 'er']
+    assert names(WalkFilter(min_size=10, max_size=200)) == ['one.py', 'two.py', 'four.py']
+    assert names(WalkFilter(pattern='*.py', modified_after=time.time() - 3600)) == ['two.py', 'four.py']
+    assert names(WalkFilter(modified_before=2000)) == ['one.py']
+
+def test_cursor_pages_cover_the_tree_exactly_once(tmp_path):
+    """Test that following cursors returns every entry once, in order."""
+    _make_tree(tmp_path)
+    expected = [entry.path for entry in _walk(tmp_path)]
+
+    async def pages(limit):
+        seen, cursor = [], None
+        while True:
+            entries, cursor = await list_page(str(tmp_path), limit=limit, cursor=cursor, max_workers=2)
+            seen.extend(entry.path for entry in entries)
+            if cursor is None:
+                return seen
+
+    for limit in (1, 3, 100):
+        assert asyncio.run(pages(limit)) == expected
+    assert decode_cursor(asyncio.run(list_page(str(tmp_path), limit=2))[1]) == ('a', 'one.py')
+
+def test_closing_early_stops_workers(tmp_path):
+    """Test that the walk starts streaming at once and stops when abandoned."""
+    for i in range(20):
+        os.makedirs(tmp_path / f'd{i:02}')
+        for j in range(200):
+            (tmp_path / f'd{i:02}' / f'f{j}').touch()
+
+    async def first_five():
+        walk = iter_entries(str(tmp_path), batch_size=8, prefetch=1)
+        found = []
+        async for entry in walk:
+            found.append(entry)
+            if len(found) == 5:
+                break
+        await walk.aclose()
+        return found
+
+    before = threading.active_count()
+    assert len(asyncio.run(first_five())) == 5
+    deadline = time.time() + 2
+    while threading.active_count() > before and time.time() < deadline:
+        time.sleep(0.01)
+    assert threading.active_count() <= before
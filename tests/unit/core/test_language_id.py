@@ -0,0 +1,34 @@
+import timeit
+from src.app.core.calendar_store import tokenize
+from src.app.core.language_id import detect, detect_language, intent_pattern, match_intent, normalize_arabic
+
+def test_detect_arabic_english_and_arabizi():
+    """Test script histogram and n-gram classification."""
+    assert detect_language("open the file and save it") == 'en'
+    assert detect_language("افتح الملف واحفظه") == 'ar'
+    assert detect_language("مَرْحَباً بِكُمْ") == 'ar'
+    guess = detect("kifak 7abibi, shu 3am ta3mil")
+    assert guess.language == 'ar' and guess.script == 'latin'
+    assert detect("1234 !!").language == 'unknown'
+    assert 0 < detect("create file test.txt في المجلد").confidence < 1
+
+def test_normalize_arabic_folds_variants_and_marks():
+    """Test removal of diacritics and tatweel and folding of alef/yaa variants."""
+    assert normalize_arabic("أَهْلاً وسهـــلاً إلى مستشفى آمن") == "اهلا وسهلا الي مستشفي امن"
+    assert normalize_arabic("hello") == "hello"
+    assert tokenize("اجتماع مع أحمد") == tokenize("اجتماع مع احمد")
+
+def test_intent_pattern_matches_spelling_variants():
+    """Test that Arabic planner patterns match variant spellings and keep captured text."""
+    pattern = intent_pattern(r"انشئ ملف باسم ([^ ]+) في ([^ ]+) واكتب فيه ['\"]?([^'\"]+)['\"]?")
+    match = pattern.search("أنشئ ملفّ باسم a.txt في dir واكتب فيه 'إلى اللقاء'")
+    assert match.groups() == ('a.txt', 'dir', 'إلى اللقاء')
+    assert match_intent(r"calculate (.+)", "احسب 2+2") is None
+    assert match_intent(r"(?:اكتب|contains) (\w+)", "file contains data").group(1) == 'data'
+    assert match_intent(r"صوّر الشاشة", "صور الشاشة")
+
+def test_detection_takes_microseconds():
+    """Benchmark uncached per-string detection."""
+    texts = ["open the file and save it", "افتح الملف واحفظه واكتب فيه شيئا مهما"]
+    per_call = timeit.timeit(lambda: [detect.__wrapped__(text) for text in texts], number=2000) / 4000
+    assert per_call < 500e-6
@@ -0,0 +1,84 @@
+import sys
+import types
+import pytest
+from src.app.core.lazy_import import LazyModule, lazy_import, is_loaded, import_attribute
+from src.app.core.ai.tools.tool_registry import ToolRegistry
+
+@pytest.fixture
+def fake_module(monkeypatch):
+    """Provide an importable module that records when it is imported."""
+    imported = []
+
+    class Finder:
+        def find_spec(self, name, path=None, target=None):
+            if name != "labeeb_fake_heavy":
+                return None
+            from importlib.machinery import ModuleSpec
+
+            class Loader:
+                def create_module(self, spec):
+                    return None
+
+                def exec_module(self, module):
+                    imported.append(module.__name__)
+                    module.VALUE = 42
+
+                    class FakeTool:
+                        name = "fake_heavy"
+
+                    module.FakeTool = FakeTool
+
+            return ModuleSpec(name, Loader())
+
+    finder = Finder()
+    monkeypatch.setattr(sys, "meta_path", [finder] + sys.meta_path)
+    sys.modules.pop("labeeb_fake_heavy", None)
+    yield imported
+    sys.modules.pop("labeeb_fake_heavy", None)
+
+def test_lazy_import_defers_until_attribute_access(fake_module):
+    """Test that the module is only imported on first attribute access."""
+    module = lazy_import("labeeb_fake_heavy")
+    assert isinstance(module, LazyModule)
+    assert not is_loaded(module)
+    assert fake_module == []
+
+    assert module.VALUE == 42
+    assert is_loaded(module)
+    assert fake_module == ["labeeb_fake_heavy"]
+
+def test_lazy_import_returns_already_imported_module():
+    """Test that modules already in sys.modules are returned as-is."""
+    module = lazy_import("json")
+    assert isinstance(module, types.ModuleType)
+    assert not isinstance(module, LazyModule)
+    assert is_loaded(module)
+
+def test_import_attribute_missing_raises_import_error():
+    """Test that a missing attribute is reported as ImportError."""
+    with pytest.raises(ImportError):
+        import_attribute("json", "does_not_exist")
+
+def test_tool_registry_resolves_lazy_tool_on_first_use(fake_module):
+    """Test that lazily registered tools import their module on lookup."""
+    ToolRegistry.register_lazy("fake_heavy", "labeeb_fake_heavy", "FakeTool")
+    try:
+        assert "fake_heavy" in ToolRegistry.list_tool_names()
+        assert not ToolRegistry.is_loaded("fake_heavy")
+        assert fake_module == []
+
+        tool_class = ToolRegistry.get_tool("fake_heavy")
+        assert tool_class.name == "fake_heavy"
+        assert ToolRegistry.is_loaded("fake_heavy")
+        assert fake_module == ["labeeb_fake_heavy"]
+    finally:
+        ToolRegistry._tools.pop("fake_heavy", None)
+        ToolRegistry._deferred.pop("fake_heavy", None)
+
+def test_tool_registry_unknown_lazy_module_returns_none():
+    """Test that a deferred tool whose module is missing is not returned."""
+    ToolRegistry.register_lazy("missing_tool", "labeeb_missing_module", "MissingTool")
+    try:
+        assert ToolRegistry.get_tool("missing_tool") is None
+    finally:
+        ToolRegistry._deferred.pop("missing_tool", None)
@@ -0,0 +1,62 @@
+import gc
+import json
+from src.app.core.ai.operation_history import JsonLinesSink, OperationHistory
+
+def test_ring_buffer_keeps_latest_records():
+    """Test that a tool history is bounded and drops the oldest records."""
+    history = OperationHistory().for_tool("text", max_history=3)
+    for i in range(5):
+        history.append("op", {"i": i})
+    assert len(history) == 3
+    assert [r["details"]["i"] for r in history.to_list()] == [2, 3, 4]
+    history.clear()
+    assert len(history) == 0
+
+def test_details_are_formatted_lazily():
+    """Test that callable details are evaluated once, on first read."""
+    calls = []
+    history = OperationHistory().for_tool("cache")
+    record = history.append("get", lambda: calls.append(1) or {"value_size": 42})
+    assert calls == []
+    assert record.details == {"value_size": 42}
+    assert record.details == {"value_size": 42}
+    assert calls == [1]
+
+def test_query_across_tools():
+    """Test filtering by tool, operation and time range, merged in time order."""
+    hub = OperationHistory()
+    math_history, text_history = hub.for_tool("math"), hub.for_tool("text")
+    for i, history in enumerate([math_history, text_history, math_history, text_history]):
+        history.append("add" if i < 2 else "clean", {"i": i}).timestamp = 100.0 + i
+    assert [r.details["i"] for r in hub.query()] == [0, 1, 2, 3]
+    assert [r.details["i"] for r in hub.query(tool="math")] == [0, 2]
+    assert [r.details["i"] for r in hub.query(operation="clean")] == [2, 3]
+    assert [r.details["i"] for r in hub.query(since=101.0, until=103.0)] == [1, 2]
+    assert [r.details["i"] for r in hub.query(limit=1)] == [3]
+
+def test_sampled_sink(tmp_path):
+    """Test that the sink receives all records at rate 1 and none at rate 0."""
+    hub = OperationHistory()
+    path = tmp_path / "history.jsonl"
+    sink = JsonLinesSink(str(path))
+    history = hub.for_tool("security")
+    hub.set_sink(sink, sample_rate=1.0)
+    history.append("hash", {"algorithm": "sha256"})
+    hub.set_sink(sink, sample_rate=0.0)
+    history.append("hash", {"algorithm": "md5"})
+    sink.close()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["details"]["algorithm"] for line in lines] == ["sha256"]
+    assert lines[0]["tool"] == "security"
+
+def test_history_is_owned_by_the_hub():
+    """Test that instances of a tool share one buffer that outlives them."""
+    hub = OperationHistory()
+    first = hub.for_tool("file_system", max_history=2)
+    first.append("read", {"i": 0})
+    del first
+    gc.collect()
+    second = hub.for_tool("file_system", max_history=3)
+    second.append("write", {"i": 1})
+    assert [r.details["i"] for r in hub.query(tool="file_system")] == [0, 1]
+    assert second.max_history == 3 and hub.for_tool("file_system", max_history=1).max_history == 3
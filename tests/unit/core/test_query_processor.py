@@ -0,0 +1,87 @@
+import pytest
+from src.app.core.query_processor import QueryProcessor, ConversationMessage, estimate_tokens
+
+class FakeConfig(dict):
+    def get(self, key, default=None):
+        return super().get(key, default)
+
+class FakeModelManager:
+    model_type = "ollama"
+    model = None
+    base_url = "http://localhost:11434"
+    ollama_model_name = "gemma:2b"
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+class FakeSession:
+    """Records posted payloads and returns a growing context."""
+
+    def __init__(self):
+        self.requests = []
+
+    def post(self, url, json=None, timeout=None):
+        self.requests.append(json)
+        context = list(json.get("context", [])) + [len(self.requests)] * 10
+        return FakeResponse({"response": f"answer {len(self.requests)}", "context": context})
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def processor():
+    query_processor = QueryProcessor(FakeModelManager(), FakeConfig(quiet_mode=True))
+    query_processor._session = FakeSession()
+    return query_processor
+
+def test_context_is_reused_between_turns(processor):
+    """Test that follow-up turns send only the new query plus the context."""
+    assert processor.process_query("first", "linux").success
+    assert processor.process_query("second", "linux").response == "answer 2"
+
+    first, second = processor.session.requests
+    assert "System: linux" in first["prompt"] and "context" not in first
+    assert second["prompt"] == "User: second\nAssistant:"
+    assert second["context"] == [1] * 10
+    assert second["keep_alive"] == "30m"
+
+def test_context_dropped_when_system_info_changes(processor):
+    """Test that a different system info starts a full prompt again."""
+    processor.process_query("first", "linux")
+    processor.process_query("second", "darwin")
+    second = processor.session.requests[1]
+    assert "context" not in second
+    assert "System: darwin" in second["prompt"]
+    assert "User: first" in second["prompt"]
+
+def test_oversized_context_falls_back_to_trimmed_history(processor):
+    """Test that a context past the limit is replaced by a budgeted prompt."""
+    processor.config["ollama_max_context_tokens"] = 15
+    processor.process_query("first", "linux")
+    processor.process_query("second", "linux")
+    processor.process_query("third", "linux")
+    assert "context" in processor.session.requests[1]
+    assert "context" not in processor.session.requests[2]
+
+def test_history_trimmed_to_token_budget(processor):
+    """Test that history keeps the newest messages within the token budget."""
+    processor.conversation_history = [
+        ConversationMessage(role="user", content="x" * 400) for _ in range(10)
+    ]
+    processor._trim_history(350)
+    assert len(processor.conversation_history) == 3
+    assert estimate_tokens("x" * 400) == 101
+
+def test_clear_history_resets_context(processor):
+    """Test that clearing history also forgets the context."""
+    processor.process_query("first", "linux")
+    processor.clear_history()
+    processor.process_query("second", "linux")
+    assert "context" not in processor.session.requests[1]
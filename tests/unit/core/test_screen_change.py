@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from src.app.core.vision.screen_change import ScreenChangeTracker
+
+def blank_frame(height=480, width=640):
+    frame = np.zeros((height, width, 4), dtype=np.uint8)
+    frame[...] = (40, 40, 40, 255)
+    return frame
+
+def test_first_frame_is_full_change():
+    """Test that the first update reports the whole frame as changed."""
+    diff = ScreenChangeTracker().update(blank_frame(), offset=(100, 50))
+    assert diff.full and diff.changed_fraction == 1.0
+    assert diff.regions == [(100, 50, 640, 480)]
+
+def test_unchanged_frame_has_no_regions():
+    """Test that an identical frame produces no dirty regions."""
+    tracker = ScreenChangeTracker()
+    tracker.update(blank_frame())
+    diff = tracker.update(blank_frame())
+    assert not diff.changed
+    assert diff.regions == []
+
+def test_changed_tiles_merge_into_regions():
+    """Test that changed areas are reported as separate tile-aligned regions."""
+    tracker = ScreenChangeTracker(tile_size=64)
+    tracker.update(blank_frame(), offset=(10, 20))
+    frame = blank_frame()
+    frame[70:150, 70:100] = (255, 255, 255, 255)   # tiles (1,1) and (2,1)
+    frame[460:470, 600:620] = (0, 0, 200, 255)     # tile (7,9), clipped at the edge
+    diff = tracker.update(frame, offset=(10, 20))
+    assert sorted(diff.regions) == [(74, 84, 64, 128), (586, 468, 64, 32)]
+    assert diff.dirty_tiles == 3
+    assert 0 < diff.changed_fraction < 0.05
+
+def test_small_noise_is_ignored():
+    """Test that differences below the threshold do not mark tiles dirty."""
+    tracker = ScreenChangeTracker(threshold=16)
+    tracker.update(blank_frame())
+    frame = blank_frame()
+    frame[..., :3] += 5
+    assert not tracker.update(frame).changed
+
+def test_region_digest_tracks_content():
+    """Test that region digests change only when that region's content changes."""
+    tracker = ScreenChangeTracker()
+    tracker.update(blank_frame())
+    top_left, bottom_right = (0, 0, 64, 64), (576, 384, 64, 64)
+    before = tracker.digest(top_left), tracker.digest(bottom_right)
+    frame = blank_frame()
+    frame[10:20, 10:20] = 255
+    tracker.update(frame)
+    assert tracker.digest(top_left) != before[0]
+    assert tracker.digest(bottom_right) == before[1]
+    with pytest.raises(ValueError):
+        ScreenChangeTracker().digest()
+
+def test_masks_accumulate_changes_across_frames():
+    """Test that OR-ed diff masks cover every change since an earlier frame."""
+    tracker = ScreenChangeTracker(tile_size=64)
+    dirty = np.zeros_like(tracker.update(blank_frame()).mask)
+    frame = blank_frame()
+    frame[0:10, 0:10] = 255
+    dirty |= tracker.update(frame).mask
+    frame[400:410, 600:610] = 255
+    diff = tracker.update(frame)
+    dirty |= diff.mask
+    assert diff.regions == [(576, 384, 64, 64)]
+    assert sorted(tracker.regions(dirty)) == [(0, 0, 64, 64), (576, 384, 64, 64)]
@@ -0,0 +1,69 @@
+import os
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from src.app.core.vision.screen_matcher import ScreenMatcher, load_template, match_template
+
+def make_pattern(seed, height=40, width=60):
+    rng = np.random.default_rng(seed)
+    pattern = rng.integers(0, 256, (height // 4, width // 4), dtype=np.uint8)
+    return cv2.resize(pattern, (width, height), interpolation=cv2.INTER_NEAREST)
+
+def make_frame(*placements, height=480, width=640):
+    frame = np.full((height, width), 40, dtype=np.uint8)
+    for pattern, (x, y) in placements:
+        frame[y:y + pattern.shape[0], x:x + pattern.shape[1]] = pattern
+    return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGRA)
+
+@pytest.fixture
+def templates(tmp_path):
+    paths = []
+    for seed in range(2):
+        path = str(tmp_path / f"template_{seed}.png")
+        cv2.imwrite(path, make_pattern(seed))
+        paths.append(path)
+    return paths
+
+def test_locates_template_in_frame(templates):
+    """Test that a pasted template is found at its exact position."""
+    frame = make_frame((make_pattern(0), (333, 217)))
+    match = ScreenMatcher().match_frame(frame, templates[:1])[templates[0]]
+    assert (match.left, match.top, match.width, match.height) == (333, 217, 60, 40)
+    assert match.score > 0.99
+    assert match.center == (363, 237)
+
+def test_region_offset_and_missing_template(templates):
+    """Test screen coordinates for a region capture and None below confidence."""
+    frame = make_frame((make_pattern(0), (10, 20)), height=120, width=160)
+    matches = ScreenMatcher().match_frame(frame, templates, offset=(500, 300))
+    assert (matches[templates[0]].left, matches[templates[0]].top) == (510, 320)
+    assert matches[templates[1]] is None
+
+def test_multiple_templates_in_one_frame(templates):
+    """Test that all templates are matched against a single frame."""
+    frame = make_frame((make_pattern(0), (50, 60)), (make_pattern(1), (400, 300)))
+    matches = ScreenMatcher().match_frame(frame, templates)
+    assert (matches[templates[0]].left, matches[templates[0]].top) == (50, 60)
+    assert (matches[templates[1]].left, matches[templates[1]].top) == (400, 300)
+
+def test_scaled_template():
+    """Test matching a template rendered at a different scale."""
+    pattern = make_pattern(0)
+    larger = cv2.resize(pattern, None, fx=1.25, fy=1.25, interpolation=cv2.INTER_NEAREST)
+    frame = cv2.cvtColor(make_frame((larger, (200, 100))), cv2.COLOR_BGRA2GRAY)
+    assert match_template(frame, pattern, confidence=0.8) is None
+    match = match_template(frame, pattern, confidence=0.8, scales=(1.0, 1.25))
+    assert match.scale == 1.25
+    assert abs(match.left - 200) <= 2 and abs(match.top - 100) <= 2
+
+def test_template_cache_invalidated_on_change(templates):
+    """Test that templates are cached until the file is modified."""
+    path = templates[0]
+    first = load_template(path)
+    assert load_template(path) is first
+    cv2.imwrite(path, make_pattern(5))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_template(path) is not first
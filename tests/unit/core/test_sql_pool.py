@@ -0,0 +1,76 @@
+import asyncio
+from src.app.core.sql_pool import (
+    MeasuredPool, SQLitePool, insert_statement, prepare_statement, stream_rows, to_columns
+)
+
+def test_prepare_statement_pushes_limit_down_and_caches():
+    """Test LIMIT push-down, rejection of dangerous queries and the statement cache."""
+    statement = prepare_statement("SELECT id FROM items WHERE price > ?", 100)
+    assert statement.sql == "SELECT id FROM items WHERE price > ? LIMIT 101"
+    assert statement.is_select and statement.error is None
+    assert prepare_statement("SELECT id FROM items LIMIT 5", 100).sql == "SELECT id FROM items LIMIT 5"
+    assert prepare_statement("SHOW TABLES", 100).sql == "SHOW TABLES"
+    assert prepare_statement("SELECT id FROM items FOR SHARE", 100).sql == "SELECT id FROM items LIMIT 101 FOR SHARE"
+    assert (prepare_statement("SELECT id FROM items lock in share mode ", 9).sql
+            == "SELECT id FROM items LIMIT 10 lock in share mode ")
+    assert prepare_statement("SELECT id FROM items LIMIT 5 FOR SHARE", 100).sql == "SELECT id FROM items LIMIT 5 FOR SHARE"
+    assert prepare_statement("SELECT 1; DROP TABLE items", 100).error.startswith('Query contains dangerous keyword')
+    hits = prepare_statement.cache_info().hits
+    prepare_statement("SELECT id FROM items WHERE price > ?", 100)
+    assert prepare_statement.cache_info().hits == hits + 1
+
+def test_insert_statement_validates_identifiers():
+    """Test that only plain identifiers are accepted for generated INSERTs."""
+    assert insert_statement('items', ['id', 'name'], 'qmark', '"') == 'INSERT INTO "items" ("id", "name") VALUES (?, ?)'
+    assert insert_statement('items', ['id']) == 'INSERT INTO `items` (`id`) VALUES (%s)'
+    for table, columns in (('items; DROP', ['id']), ('items', ['id`x']), ('items', [])):
+        try:
+            insert_statement(table, columns)
+        except ValueError:
+            continue
+        raise AssertionError(f'{table} {columns} accepted')
+
+def test_bulk_insert_and_streamed_query(tmp_path):
+    """Test batched inserts and limited, streamed reads through the SQLite pool."""
+    async def run():
+        pool = MeasuredPool(SQLitePool(str(tmp_path / 'test.db'), maxsize=2), paramstyle='qmark', quote='"')
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)')
+                await conn.begin()
+                await cur.executemany(insert_statement('items', ['id', 'name'], 'qmark', '"'),
+                                      [(i, f'item {i}') for i in range(5000)])
+                await conn.commit()
+        statement = prepare_statement('SELECT id, name FROM items ORDER BY id', 10)
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(statement.sql)
+                columns = [d[0] for d in cur.description]
+                rows, truncated = await stream_rows(cur, 10, batch_size=4)
+        pool.close()
+        return columns, rows, truncated, pool.metrics.to_dict()
+
+    columns, rows, truncated, metrics = asyncio.run(run())
+    assert rows == [(i, f'item {i}') for i in range(10)] and truncated
+    assert to_columns(columns, rows)[0] == list(range(10))
+    assert to_columns(columns, []) == [[], []]
+    assert metrics['acquisitions'] == 2 and metrics['in_use'] == 0
+
+def test_pool_metrics_count_waits(tmp_path):
+    """Test that acquires on an exhausted pool are counted as waits."""
+    async def run():
+        pool = MeasuredPool(SQLitePool(str(tmp_path / 'test.db'), maxsize=1))
+
+        async def hold():
+            async with pool.acquire():
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(hold(), hold(), hold())
+        pool.close()
+        return pool.metrics.to_dict()
+
+    metrics = asyncio.run(run())
+    assert metrics['acquisitions'] == 3
+    assert metrics['waits'] == 2
+    assert metrics['max_acquire_ms'] >= 15
+    assert metrics['peak_in_use'] == 1
@@ -0,0 +1,76 @@
+import time
+import threading
+import pytest
+from src.app.core.startup import StartupOrchestrator
+
+def test_independent_tasks_run_concurrently():
+    """Test that tasks without mutual dependencies overlap in time."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def waiting_task(result):
+        # Each task waits for the other; this only completes if both run at once
+        barrier.wait()
+        return result
+
+    startup = StartupOrchestrator()
+    startup.add("platform", lambda: waiting_task("platform"))
+    startup.add("ollama_probe", lambda: waiting_task("probe"))
+    results = startup.run()
+    assert results == {"platform": "platform", "ollama_probe": "probe"}
+
+def test_dependencies_receive_results():
+    """Test that dependency results are passed as keyword arguments in order."""
+    order = []
+    startup = StartupOrchestrator()
+    startup.add("config", lambda: order.append("config") or {"model": "gemma:2b"})
+    startup.add("model", lambda config: order.append("model") or config["model"], depends_on=["config"])
+    startup.add("handler", lambda config, model: f"{model}@{len(config)}", depends_on=["config", "model"])
+    results = startup.run()
+    assert order == ["config", "model"]
+    assert results["handler"] == "gemma:2b@1"
+
+def test_failure_is_reraised_and_dependents_skipped():
+    """Test that the original error propagates and dependents never run."""
+    ran = []
+    startup = StartupOrchestrator()
+
+    def fail():
+        raise RuntimeError("No available Ollama model found.")
+
+    startup.add("model", fail)
+    startup.add("ai_handler", lambda model: ran.append(model), depends_on=["model"])
+    with pytest.raises(RuntimeError, match="No available Ollama model"):
+        startup.run()
+    assert ran == []
+
+def test_invalid_graphs_are_rejected():
+    """Test unknown dependencies and cycles."""
+    startup = StartupOrchestrator()
+    startup.add("a", lambda: None, depends_on=["missing"])
+    with pytest.raises(ValueError):
+        startup.run()
+
+    startup = StartupOrchestrator()
+    startup.add("a", lambda b: None, depends_on=["b"])
+    startup.add("b", lambda a: None, depends_on=["a"])
+    with pytest.raises(ValueError):
+        startup.run()
+
+def test_deferred_subsystem_and_report():
+    """Test that deferred subsystems are built once on first use and reported."""
+    built = []
+    startup = StartupOrchestrator()
+    startup.add("config", lambda: time.sleep(0.01) or {})
+    startup.defer("shell_handler", lambda: built.append(1) or "shell")
+    startup.run()
+    assert built == []
+
+    assert startup.get("shell_handler") == "shell"
+    assert startup.get("shell_handler") == "shell"
+    assert built == [1]
+
+    report = startup.report()
+    assert "config" in report
+    assert "shell_handler" in report and "(deferred)" in report
+    with pytest.raises(KeyError):
+        startup.get("unknown")
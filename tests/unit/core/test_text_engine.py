@@ -0,0 +1,53 @@
+import re
+from src.app.core.text_engine import TextPipeline, analyze, compile_pattern, keywords, run_batch, tokenize
+
+def _reference_metrics(text):
+    words = text.split()
+    return {
+        "characters": len(text),
+        "words": len(words),
+        "sentences": len([s for s in re.split(r'[.!?]+', text) if s.strip()]),
+        "paragraphs": len([p for p in text.split('\n\n') if p.strip()]),
+        "avg_word_length": sum(len(w) for w in words) / len(words) if words else 0
+    }
+
+def test_analyze_matches_split_based_metrics():
+    """Test that the single-pass metrics equal the split-based definitions."""
+    samples = [
+        "", "   ", "Hello world.", "Hi!! How are you?? Fine...\n\nNew para.\n\n\n\nLast one",
+        "no terminator\n\n \n\n", "...!?", "مرحبا بالعالم. كيف حالك؟　end\x1c!", "a\n\n\nb  c\t.d"
+    ]
+    for text in samples:
+        result = analyze(text)
+        assert result["metrics"] == _reference_metrics(text), text
+        expected = {}
+        for char in text:
+            expected[char] = expected.get(char, 0) + 1
+        assert result["character_frequency"] == expected
+
+def test_pipeline_fuses_steps_with_same_results():
+    """Test that a chain equals running each operation separately."""
+    text = "  The quick, brown fox!  The QUICK dog;  quick quick brown.  "
+    assert tokenize(text) == [t for t in (re.sub(r'[^\w\s]', '', t) for t in text.split()) if t]
+    chain = TextPipeline(["clean", "normalize", "tokenize", "keywords"])
+    assert chain.run(text) == ["quick", "brown"]
+    assert TextPipeline(["keywords"]).run(text) == keywords(text)
+    for steps in (["tokenize", "clean"], ["unknown"]):
+        try:
+            TextPipeline(steps)
+        except ValueError:
+            continue
+        raise AssertionError(f"{steps} accepted")
+
+def test_compile_pattern_is_cached():
+    """Test that repeated user patterns reuse the compiled regex."""
+    first = compile_pattern(r"\d+-test", re.IGNORECASE)
+    assert compile_pattern(r"\d+-test", re.IGNORECASE) is first
+    assert compile_pattern.cache_info().maxsize == 256
+
+def test_run_batch_preserves_order_across_processes():
+    """Test that pooled batches return results in input order."""
+    texts = [f"doc {i}. " * (i % 5 + 1) for i in range(100)]
+    results = run_batch(texts, ["analyze"], max_workers=2, chunk_size=16)
+    assert [r["metrics"]["sentences"] for r in results] == [i % 5 + 1 for i in range(100)]
+    assert run_batch(texts[:3], ["tokenize"]) == [t.replace('.', '').split() for t in texts[:3]]
@@ -0,0 +1,74 @@
+import pytest
+from PIL import Image
+from src.app.core.ai.models.vision.processor import (
+    VisionProcessor, VisionResult, _ResultCache, downscale, image_digest
+)
+
+class FakeVisionProcessor(VisionProcessor):
+    """VisionProcessor with generation replaced, recording batch sizes."""
+
+    def __init__(self, **kwargs):
+        super().__init__(device="cpu", **kwargs)
+        self.batches = []
+
+    def _native_size(self):
+        return 64
+
+    def _generate(self, images, prompt, max_new_tokens):
+        self.batches.append([image.size for image in images])
+        return [f"{prompt} {image.size}" for image in images]
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i, size in enumerate([(200, 100), (32, 32), (100, 400)]):
+        path = tmp_path / f"image_{i}.png"
+        Image.new("RGBA", size, (i * 50, 0, 0, 255)).save(path)
+        paths.append(str(path))
+    return paths
+
+def test_downscale_limits_longest_edge():
+    """Test that large images are shrunk and converted to RGB."""
+    image = downscale(Image.new("RGBA", (1920, 1080)), 512)
+    assert image.mode == "RGB"
+    assert image.size == (512, 288)
+    assert downscale(Image.new("RGB", (100, 50)), 512).size == (100, 50)
+
+def test_result_cache_is_lru():
+    """Test eviction of the least recently used entry."""
+    cache = _ResultCache(max_size=2)
+    cache.put(("a",), VisionResult("a"))
+    cache.put(("b",), VisionResult("b"))
+    assert cache.get(("a",)).description == "a"
+    cache.put(("c",), VisionResult("c"))
+    assert cache.get(("b",)) is None
+    assert len(cache) == 2
+
+def test_process_images_batches_and_downscales(images):
+    """Test batching, input order and downscaling to the native size."""
+    processor = FakeVisionProcessor()
+    results = processor.process_images(images, prompt="describe", batch_size=2)
+    assert [r.description for r in results] == [
+        "describe (64, 32)", "describe (32, 32)", "describe (16, 64)"
+    ]
+    assert [len(batch) for batch in processor.batches] == [2, 1]
+
+def test_results_cached_by_content_and_prompt(images):
+    """Test that repeated images are served from the cache."""
+    processor = FakeVisionProcessor()
+    processor.process_images(images[:2], prompt="describe")
+    processor.process_images(images[:2], prompt="describe")
+    assert len(processor.batches) == 1
+
+    processor.process_image(images[0], prompt="other prompt")
+    assert len(processor.batches) == 2
+    assert image_digest(b"x") == image_digest(b"x") != image_digest(b"y")
+
+def test_describe_image_caches_in_memory_images():
+    """Test that captures are described once per pixel content."""
+    processor = FakeVisionProcessor()
+    first = processor.describe_image(Image.new("RGB", (128, 64), (1, 2, 3)), prompt="screen")
+    again = processor.describe_image(Image.new("RGB", (128, 64), (1, 2, 3)), prompt="screen")
+    other = processor.describe_image(Image.new("RGB", (128, 64), (9, 2, 3)), prompt="screen")
+    assert first is again and first.description == "screen (64, 32)" and other is not first
+    assert processor.batches == [[(64, 32)], [(64, 32)]]
@@ -0,0 +1,83 @@
+"""
+Tests for compiled i18n catalogs, bound lookups and missing-key statistics.
+"""
+import json
+import pytest
+from src.app.core.platform_core import i18n
+
+@pytest.fixture
+def translation_sources(tmp_path, monkeypatch):
+    """Point the i18n module at temporary JSON and .po sources."""
+    translations_dir = tmp_path / "translations"
+    translations_dir.mkdir()
+    (translations_dir / "en.json").write_text(
+        json.dumps({"platform_info": "Platform Information"}), encoding="utf-8")
+    (translations_dir / "ar.json").write_text(
+        json.dumps({"platform_info": "معلومات النظام"}), encoding="utf-8")
+
+    po_dir = tmp_path / "locales" / "fr" / "LC_MESSAGES"
+    po_dir.mkdir(parents=True)
+    (po_dir / "labeeb.po").write_text(
+        'msgid ""\nmsgstr ""\n"Language: fr\\n"\n\n'
+        'msgid "Help"\nmsgstr "Aide"\n\n'
+        'msgid "Untranslated"\nmsgstr ""\n\n'
+        'msgid "Multi "\n"line"\nmsgstr "Sur "\n"plusieurs \\"lignes\\""\n',
+        encoding="utf-8")
+
+    monkeypatch.setattr(i18n, "_TRANSLATIONS_DIR", translations_dir)
+    monkeypatch.setattr(i18n, "_LOCALES_DIR", tmp_path / "locales")
+    monkeypatch.setattr(i18n, "_CATALOG_PATH", translations_dir / "catalog.marshal")
+    i18n.reload_translations()
+    i18n.reset_missing_stats()
+    yield translations_dir
+    i18n.reload_translations()
+    i18n.reset_missing_stats()
+
+def test_po_entries_are_merged(translation_sources):
+    """Test that .po messages are available alongside JSON fallbacks."""
+    assert i18n.gettext("Help", "fr") == "Aide"
+    assert i18n.gettext("Multi line", "fr") == 'Sur plusieurs "lignes"'
+    assert i18n.gettext("Untranslated", "fr") == "Untranslated"
+    # fr has no JSON catalog, so platform keys fall back to English
+    assert i18n.gettext("platform_info", "fr") == "Platform Information"
+
+def test_compiled_catalog_is_used(translation_sources):
+    """Test that a compiled catalog is loaded instead of parsing sources."""
+    catalog_path = i18n.compile_catalog()
+    assert catalog_path.exists()
+
+    i18n.reload_translations()
+    signature = i18n._source_signature(i18n._source_files())
+    assert i18n._read_catalog(signature) is not None
+    assert i18n.gettext("platform_info", "ar") == "معلومات النظام"
+
+def test_stale_catalog_is_ignored(translation_sources):
+    """Test that editing a source invalidates the compiled catalog."""
+    i18n.compile_catalog()
+    (translation_sources / "ar.json").write_text(
+        json.dumps({"platform_info": "معلومات المنصة", "extra": "إضافي"}), encoding="utf-8")
+
+    i18n.reload_translations()
+    assert i18n.gettext("extra", "ar") == "إضافي"
+
+def test_current_language_binding(translation_sources):
+    """Test that setup_language binds the catalog used by default lookups."""
+    i18n.setup_language("ar-SA")
+    try:
+        assert i18n.gettext("platform_info") == "معلومات النظام"
+    finally:
+        i18n.setup_language(i18n.DEFAULT_LANGUAGE)
+    assert i18n.gettext("platform_info") == "Platform Information"
+
+def test_missing_key_statistics(translation_sources):
+    """Test that missing keys are counted per language."""
+    i18n.gettext("no_such_key", "ar")
+    i18n.gettext("no_such_key", "ar")
+    i18n.gettext("other_key", "en")
+
+    stats = i18n.get_missing_stats()
+    assert stats["ar"]["no_such_key"] == 2
+    assert stats["en"]["other_key"] == 1
+
+    i18n.reset_missing_stats()
+    assert i18n.get_missing_stats() == {}
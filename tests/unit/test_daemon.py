@@ -0,0 +1,69 @@
+import threading
+import pytest
+from src.app.daemon import LabeebDaemon
+from src.app.daemon_client import send_command, send_request, DaemonUnavailableError
+
+class FakeCommandProcessor:
+    """Command processor that prints progress and echoes the command."""
+
+    def process_command(self, command):
+        if command == "fail":
+            raise ValueError("boom")
+        print("working on", command)
+        return f"done: {command}"
+
+class FakeLabeeb:
+    def __init__(self):
+        self.command_processor = FakeCommandProcessor()
+        self.cleaned_up = False
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """Run a daemon with a fake Labeeb on a temporary socket."""
+    labeeb = FakeLabeeb()
+    daemon = LabeebDaemon(lambda: labeeb, str(tmp_path / "labeeb.sock"))
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    thread.join(timeout=5)
+
+def test_command_output_is_streamed(running_daemon):
+    """Test that printed output is streamed before the final result."""
+    chunks = []
+    reply = send_command("list files", running_daemon.socket_path, on_output=chunks.append)
+    assert chunks == ["working on list files\n"]
+    assert reply == {"type": "result", "result": "done: list files"}
+    assert running_daemon.commands_processed == 1
+
+def test_command_error_is_reported(running_daemon):
+    """Test that a failing command produces an error message."""
+    reply = send_command("fail", running_daemon.socket_path)
+    assert reply == {"type": "error", "error": "boom"}
+
+def test_ping_and_shutdown(tmp_path):
+    """Test status reporting and shutdown over the socket."""
+    labeeb = FakeLabeeb()
+    daemon = LabeebDaemon(lambda: labeeb, str(tmp_path / "labeeb.sock"))
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    status = send_request({"op": "ping"}, daemon.socket_path, timeout=5)["result"]
+    assert status["commands_processed"] == 0
+    assert send_request({"op": "shutdown"}, daemon.socket_path, timeout=5)["result"] == "shutting down"
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert labeeb.cleaned_up
+    with pytest.raises(DaemonUnavailableError):
+        send_command("anything", daemon.socket_path)
+
+def test_second_daemon_refuses_live_socket(running_daemon):
+    """Test that a second daemon does not steal a live socket."""
+    with pytest.raises(RuntimeError):
+        LabeebDaemon(FakeLabeeb, running_daemon.socket_path).start()
@@ -0,0 +1,64 @@
+import json
+import pytest
+from src.app.utils.output_style_manager import (
+    OutputStyleManager, display_width, display_widths, truncate_to_width
+)
+
+@pytest.fixture
+def style_config(tmp_path):
+    """Write a minimal style configuration with two themes."""
+    config = {
+        "output_styles": {"use_emojis": True, "use_boxes": True, "terminal_width": 40},
+        "themes": {
+            "default": {"emoji_set": "default", "box_style": "default"},
+            "minimal": {"emoji_set": "minimal", "box_style": "ascii"}
+        },
+        "emoji_sets": {
+            "default": {"success": "✅", "error": "❌"},
+            "minimal": {"success": "+", "error": "x"}
+        },
+        "box_styles": {
+            "default": {"top_left": "┌", "top_right": "┐", "bottom_left": "└",
+                        "bottom_right": "┘", "horizontal": "─", "vertical": "│"},
+            "ascii": {"top_left": "+", "top_right": "+", "bottom_left": "+",
+                      "bottom_right": "+", "horizontal": "-", "vertical": "|"}
+        },
+        "default_symbols": {"success": "[OK]", "error": "[ERROR]"}
+    }
+    path = tmp_path / "output_styles.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return str(path)
+
+def test_display_width():
+    """Test cell widths for ASCII, Arabic with harakat, CJK and emoji."""
+    assert display_width("hello") == 5
+    assert display_width("مَرْحَبًا") == 5
+    assert display_width("日本") == 4
+    assert display_width("✅ ok") == 5
+    assert display_width("⚠️") == 2
+    assert display_widths(["ab", "日"]) == [2, 2]
+
+def test_truncate_to_width():
+    """Test truncation by display width rather than code points."""
+    assert truncate_to_width("short", 10) == "short"
+    assert truncate_to_width("abcdefghij", 6) == "abc..."
+    truncated = truncate_to_width("日本語の文章", 7)
+    assert display_width(truncated) <= 7
+
+def test_render_theme_follows_set_theme(style_config):
+    """Test that glyph lookups use the theme resolved by set_theme."""
+    style_mgr = OutputStyleManager(config_path=style_config, auto_detect=False)
+    assert style_mgr.get_emoji("success") == "✅"
+    assert style_mgr.get_box_char("vertical") == "│"
+
+    assert style_mgr.set_theme("minimal")
+    assert style_mgr.get_emoji("success") == "+"
+    assert style_mgr.get_box_char("vertical") == "|"
+    assert not style_mgr.set_theme("missing")
+
+def test_format_box_aligns_wide_text(style_config):
+    """Test that box rows have equal display width with Arabic and emoji content."""
+    style_mgr = OutputStyleManager(config_path=style_config, auto_detect=False)
+    box = style_mgr.format_box("plain\nمَرْحَبًا\n✅ done\n" + "x" * 100, title="Title", width=20)
+    widths = {display_width(line) for line in box.split("\n")}
+    assert widths == {22}
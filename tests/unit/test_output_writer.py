@@ -0,0 +1,55 @@
+import io
+import json
+import pytest
+from src.app.utils.output_writer import OutputWriter, TextSink, JsonLinesSink
+
+class RecordingSink(TextSink):
+    """TextSink that records the size of each written batch."""
+
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.batches = []
+
+    def write_batch(self, records):
+        self.batches.append(len(records))
+        super().write_batch(records)
+
+def test_writer_preserves_order_and_flushes():
+    """Test that all queued lines are written in order after flush."""
+    stream = io.StringIO()
+    writer = OutputWriter(TextSink(stream))
+    for i in range(500):
+        writer.write(f"line {i}")
+    writer.flush()
+    assert stream.getvalue().splitlines() == [f"line {i}" for i in range(500)]
+    writer.close()
+
+def test_writer_batches_records():
+    """Test that batches never exceed batch_size."""
+    stream = io.StringIO()
+    sink = RecordingSink(stream)
+    writer = OutputWriter(sink, batch_size=16)
+    for i in range(200):
+        writer.write(str(i))
+    writer.close()
+    assert sum(sink.batches) == 200
+    assert max(sink.batches) <= 16
+
+def test_json_lines_sink():
+    """Test that the JSON lines sink emits one object per record."""
+    stream = io.StringIO()
+    writer = OutputWriter(JsonLinesSink(stream))
+    writer.write("مرحبا", kind="info")
+    writer.write("done", kind="success")
+    writer.close()
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(r["kind"], r["text"]) for r in records] == [("info", "مرحبا"), ("success", "done")]
+    assert all("ts" in r for r in records)
+
+def test_write_after_close_is_synchronous():
+    """Test that writes after close still reach the sink."""
+    stream = io.StringIO()
+    writer = OutputWriter(TextSink(stream))
+    writer.close()
+    writer.write("late")
+    assert stream.getvalue() == "late\n"